@@ -0,0 +1,59 @@
+# [benchmarks/audio_decode_benchmark.py]
+# Opus(Ogg / WebM) 입력 디코딩 검증 + 비용 측정
+#
+# 실행: python -m benchmarks.audio_decode_benchmark tests/fixtures/sine_1s.webm tests/fixtures/sine_1s.ogg --sessions 40
+#
+# 샘플 파일 : tests/fixtures의 1초 샘플 (python -m tests.fixtures.generate_opus_fixtures) 또는
+#   브라우저 MediaRecorder 녹음 파일 / ffmpeg -i input.wav -c:a libopus -b:a 24k sample.ogg 로 만든 긴 파일
+# 파일을 MediaRecorder처럼 작은 청크로 잘라 세션 수만큼 동시에 디코딩한다.
+# 측정 항목
+#   - audio    : 디코딩된 오디오 길이 (원본 길이와 비교해 손실 여부 확인)
+#   - decode   : 오디오 1초당 디코딩 CPU 시간 (ms)
+#   - realtime : 공용 디코딩 풀 기준 실시간 대비 처리 배수
+import argparse
+import asyncio
+import time
+from src.app.modules.audio import audio_decoder
+from src.app.modules.audio.audio_decoder import OpusStreamDecoder, AUDIO_DECODE_WORKERS
+
+
+async def decode_file(data: bytes, chunk_size: int) -> OpusStreamDecoder:
+    decoder = OpusStreamDecoder()
+    for offset in range(0, len(data), chunk_size):
+        await decoder.decode_async(data[offset:offset + chunk_size])
+    return decoder
+
+
+async def run(path: str, sessions: int, chunk_size: int):
+    with open(path, "rb") as f:
+        data = f.read()
+
+    started = time.perf_counter()
+    decoders = await asyncio.gather(*(decode_file(data, chunk_size) for _ in range(sessions)))
+    elapsed = time.perf_counter() - started
+
+    stats = decoders[0].get_stats()
+    audio_seconds = sum(decoder.audio_seconds for decoder in decoders)
+    print(f"{path}")
+    print(f"  container : {stats['container']} packets={stats['packets']} errors={stats['errors']}")
+    print(f"  audio     : {stats['audio_seconds']:.2f} s/session ({len(data) * 8 / 1000 / max(stats['audio_seconds'], 1e-9):.1f} kbit/s 입력)")
+    print(f"  decode    : {stats['decode_ms_per_audio_second']:.2f} ms/audio-second")
+    print(f"  realtime  : x{audio_seconds / elapsed:.1f} ({sessions} sessions, {AUDIO_DECODE_WORKERS} workers)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="opus input decode benchmark")
+    parser.add_argument("files", nargs="+", help="Ogg/Opus 또는 WebM/Opus 샘플 파일")
+    parser.add_argument("--sessions", type=int, default=1, help="동시 디코딩 세션 수")
+    parser.add_argument("--chunk-size", type=int, default=4096, help="WebSocket 청크 크기 (bytes)")
+    args = parser.parse_args()
+
+    if audio_decoder.av is None:
+        print("av(PyAV) 패키지가 설치되지 않았습니다")
+        return
+    for path in args.files:
+        asyncio.run(run(path, args.sessions, args.chunk_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+# [benchmarks/outbound_scheduler_benchmark.py]
+# 느린 클라이언트 상황에서 결과 전송 방식 비교
+#
+# 실행: python -m benchmarks.outbound_scheduler_benchmark --send-delay 0.1
+#
+# 비교 대상
+#   - fifo      : 기존 방식 (asyncio.Queue + 결과 1건당 send_json 1회, 도착 순서대로)
+#   - scheduler : BoundedResultQueue + OutboundScheduler (최종 결과 우선)
+#   - batch     : scheduler + batch 프레임 묶음 전송
+# 측정 항목 : 초당 프레임 수, 전달된 결과 수, 최종 결과 지연 (큐 저장 -> 전송 완료) p50 / p99
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import time
+from src.app.core.metrics import LatencyRecorder
+from src.app.core.outbound_scheduler import OutboundScheduler
+from src.app.core.result_queue import BoundedResultQueue
+
+
+class SlowWebSocket:
+    """send_json 한 번에 send_delay 초가 걸리는 느린 클라이언트"""
+    def __init__(self, send_delay: float):
+        self.send_delay = send_delay
+        self.frames = 0
+        self.items = 0
+        self.final_latency = LatencyRecorder(max_samples=100000)
+
+    async def send_json(self, frame: dict):
+        await asyncio.sleep(self.send_delay)
+        self._record(frame)
+
+    async def send_text(self, text: str):
+        await asyncio.sleep(self.send_delay)
+        self._record(json.loads(text))
+
+    def _record(self, frame: dict):
+        now = time.perf_counter()
+        self.frames += 1
+        for item in frame['items'] if frame.get('type') == 'batch' else [frame]:
+            self.items += 1
+            if item['is_final']:
+                self.final_latency.record(now - item['queued_at'])
+
+
+async def produce(queue, duration: float, interim_rate: float, utterance_seconds: float):
+    """발화 단위로 중간 결과를 interim_rate(/s)로 만들고, 발화 끝에 최종 결과 추가"""
+    interval = 1 / interim_rate
+    per_utterance = max(1, int(utterance_seconds * interim_rate))
+    deadline = time.perf_counter() + duration
+    utterance_id = 0
+    while time.perf_counter() < deadline:
+        utterance_id += 1
+        for index in range(per_utterance):
+            queue.put_nowait({
+                'is_final': False, 'utterance_id': utterance_id,
+                'text': f"interim {index}", 'queued_at': time.perf_counter(),
+            })
+            await asyncio.sleep(interval)
+        queue.put_nowait({
+            'is_final': True, 'utterance_id': utterance_id,
+            'text': "final", 'queued_at': time.perf_counter(),
+        })
+
+
+async def run_fifo(websocket, args):
+    queue = asyncio.Queue()
+
+    async def sender():
+        while True:
+            item = await queue.get()
+            await websocket.send_json(item)
+
+    task = asyncio.create_task(sender())
+    await produce(queue, args.duration, args.interim_rate, args.utterance_seconds)
+    await asyncio.sleep(args.drain)
+    task.cancel()
+    return queue.qsize()
+
+
+async def run_scheduler(websocket, args, batch_enabled: bool):
+    queue = BoundedResultQueue(args.queue_size)
+    scheduler = OutboundScheduler(
+        websocket, queue.get_batch, lambda item, serializer: serializer.encode(item), batch_enabled=batch_enabled
+    )
+    task = asyncio.create_task(scheduler.run())
+    await produce(queue, args.duration, args.interim_rate, args.utterance_seconds)
+    await asyncio.sleep(args.drain)
+    task.cancel()
+    return queue.qsize()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="outbound scheduler slow-reader benchmark")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--send-delay", type=float, default=0.1, help="프레임 1개 전송 시간 (느린 클라이언트)")
+    parser.add_argument("--interim-rate", type=float, default=15.0, help="초당 중간 결과 수")
+    parser.add_argument("--utterance-seconds", type=float, default=2.0)
+    parser.add_argument("--queue-size", type=int, default=32)
+    parser.add_argument("--drain", type=float, default=1.0, help="생산 종료 후 전송 대기 시간")
+    args = parser.parse_args()
+
+    print(f"duration={args.duration}s send_delay={args.send_delay}s interim_rate={args.interim_rate}/s")
+    print(f"{'mode':<10} {'frames/s':>9} {'items':>7} {'backlog':>8} {'final p50 (ms)':>15} {'final p99 (ms)':>15}")
+    scenarios = (
+        ("fifo", lambda ws: run_fifo(ws, args)),
+        ("scheduler", lambda ws: run_scheduler(ws, args, False)),
+        ("batch", lambda ws: run_scheduler(ws, args, True)),
+    )
+    for name, scenario in scenarios:
+        websocket = SlowWebSocket(args.send_delay)
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):     # 전송 로그 출력 생략
+            backlog = await scenario(websocket)
+        elapsed = time.perf_counter() - started
+        latency = websocket.final_latency
+        print(
+            f"{name:<10} {websocket.frames / elapsed:>9.2f} {websocket.items:>7} {backlog:>8} "
+            f"{latency.percentile(50) * 1000:>15.1f} {latency.percentile(99) * 1000:>15.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
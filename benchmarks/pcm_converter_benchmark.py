@@ -0,0 +1,56 @@
+# [benchmarks/pcm_converter_benchmark.py]
+# 브라우저 PCM -> 16kHz mono s16 변환 처리량
+#
+# 실행: python -m benchmarks.pcm_converter_benchmark --seconds 60
+#
+# 브라우저 캡처 형식별로 합성 오디오를 100ms 청크 단위로 PcmConverter.convert 에 넣는다.
+# 측정 항목
+#   - throughput : CPU 1초당 변환한 오디오 길이 (audio-seconds / CPU-second)
+#   - sessions   : 코어 1개로 실시간 처리 가능한 세션 수 (= throughput)
+import argparse
+import time
+import numpy as np
+from src.app.modules.audio.pcm_converter import PcmConverter
+
+CHUNK_MS = 100
+INPUT_FORMATS = [
+    (48000, 2, "f32"),      # Chrome / Firefox 기본 (AudioWorklet)
+    (44100, 2, "f32"),      # macOS / 일부 USB 마이크
+    (48000, 1, "s16"),
+    (44100, 1, "s16"),
+]
+
+
+def synthesize(sample_rate: int, channels: int, sample_format: str, seconds: int) -> bytes:
+    rng = np.random.default_rng(0)
+    t = np.arange(sample_rate * seconds) / sample_rate
+    mono = 0.3 * np.sin(2 * np.pi * 220 * t) + 0.05 * rng.standard_normal(t.size)
+    interleaved = np.repeat(mono, channels)
+    if sample_format == "s16":
+        return (interleaved * 32767).astype("<i2").tobytes()
+    return interleaved.astype("<f4").tobytes()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="pcm converter throughput benchmark")
+    parser.add_argument("--seconds", type=int, default=60, help="형식별 합성 오디오 길이 (초)")
+    args = parser.parse_args()
+
+    print(f"{'input':<20} {'audio-s/cpu-s':>14} {'us/chunk':>9}")
+    for sample_rate, channels, sample_format in INPUT_FORMATS:
+        data = synthesize(sample_rate, channels, sample_format, args.seconds)
+        chunk_bytes = sample_rate * CHUNK_MS // 1000 * channels * (2 if sample_format == "s16" else 4)
+        chunks = [data[offset:offset + chunk_bytes] for offset in range(0, len(data), chunk_bytes)]
+
+        converter = PcmConverter(sample_rate, channels, sample_format)
+        started = time.process_time()
+        for chunk in chunks:
+            converter.convert(chunk)
+        cpu_seconds = time.process_time() - started
+
+        label = f"{sample_rate}Hz/{channels}ch/{sample_format}"
+        print(f"{label:<20} {args.seconds / cpu_seconds:>14.0f} {cpu_seconds / len(chunks) * 1e6:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
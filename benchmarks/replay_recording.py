@@ -0,0 +1,102 @@
+# [benchmarks/replay_recording.py]
+# 세션 녹음 재생 : 녹음한 입력 오디오를 실제 세션 파이프라인(디코딩 / 변환 / VAD / STT / 번역)에 다시 넣기
+#
+# 실행: python -m benchmarks.replay_recording recordings/<session_id>_00.idx.jsonl [--fast | --speed 2]
+#
+# - 기본은 녹음 당시 청크 도착 간격 그대로(1배속) 재생 -> 자막 오류 재현 / 회귀 테스트
+# - --fast : 대기 없이 최대한 빨리 재생 -> 파이프라인 처리 속도 측정
+# - STT 백엔드는 STT_BACKEND 설정을 따름 (azure : 실제 인식 결과 비교 / replay : Azure 없이 성능 측정)
+# - --translator local : 번역 API 없이 지연만 재현 (session_load_benchmark의 로컬 번역기)
+import argparse
+import asyncio
+import time
+from src.app.core.metrics import LatencyRecorder
+from src.app.modules.audio.session_recorder import read_recording
+
+
+def create_interface(metadata: dict, translator_name: str, translate_latency: float):
+    translator = None
+    if translator_name == "local":
+        from benchmarks.session_load_benchmark import LocalTranslator
+        translator = LocalTranslator(translate_latency)
+    if metadata['mode'] == "multiple":
+        from src.app.interfaces.multiple_speech_translation_interface import MultipleSpeechTranslationInterface
+        return MultipleSpeechTranslationInterface(translator=translator), metadata['input_languages']
+    from src.app.interfaces.single_speech_translation_interface import SingleSpeechTranslationInterface
+    return SingleSpeechTranslationInterface(translator=translator), metadata['input_language']
+
+
+async def feed(interface, chunks: list[tuple[float, bytes]], speed: float, chunk_latency: LatencyRecorder):
+    """녹음된 도착 시각에 맞춰 청크 입력 (speed <= 0 이면 대기 없음)"""
+    started = time.perf_counter()
+    for arrival, chunk in chunks:
+        if speed > 0:
+            await asyncio.sleep(max(0.0, started + arrival / speed - time.perf_counter()))
+        else:
+            await asyncio.sleep(0)
+        chunk_started = time.perf_counter()
+        await interface.process_audio_chunk(chunk)
+        chunk_latency.record(time.perf_counter() - chunk_started)
+
+
+async def collect(interface, started: float, counters: dict, show: bool):
+    while True:
+        for item in await interface.get_translation_results(16):
+            if not item.get('is_final'):
+                counters['interims'] += 1
+                continue
+            counters['finals'] += 1
+            if show:
+                texts = " | ".join(f"{lang}: {value['result_text']}" for lang, value in item['translations'].items())
+                print(f"[{time.perf_counter() - started:7.2f}s] {texts}")
+
+
+async def run(args):
+    metadata, chunks = read_recording(args.index)
+    interface, input_language = create_interface(metadata, args.translator, args.translate_latency)
+    interface.set_input_codec(metadata['codec'])
+    interface.set_input_format(metadata['sample_rate'], metadata['channels'], metadata['sample_format'])
+    if args.vad:
+        interface.set_vad(True)
+    await interface.start_session(input_language, args.targets or metadata['target_languages'])
+
+    counters = {'finals': 0, 'interims': 0}
+    chunk_latency = LatencyRecorder(max_samples=100_000)
+    started = time.perf_counter()
+    collector = asyncio.create_task(collect(interface, started, counters, not args.quiet))
+
+    cpu_started = time.process_time()
+    await feed(interface, chunks, 0 if args.fast else args.speed, chunk_latency)
+    feed_seconds = time.perf_counter() - started
+    cpu_seconds = time.process_time() - cpu_started
+    await asyncio.sleep(args.drain)      # 마지막 결과 대기
+
+    status = interface.get_status()
+    collector.cancel()
+    interface.stop_session()
+
+    audio_seconds = chunks[-1][0] if chunks else 0.0
+    stats = chunk_latency.snapshot()
+    print(f"recording  : {metadata['session_id']} part {metadata['part']} ({metadata['codec']}, {len(chunks)} chunks, {audio_seconds:.1f}s)")
+    print(f"replay     : {feed_seconds:.2f}s wall ({audio_seconds / feed_seconds if feed_seconds else 0:.1f}x), cpu {cpu_seconds:.2f}s")
+    print(f"chunk      : p50 {stats['p50_ms']:.2f} ms / p99 {stats['p99_ms']:.2f} ms / max {stats['max_ms']:.2f} ms")
+    print(f"results    : {counters['finals']} finals, {counters['interims']} interims")
+    print(f"interims   : {status['interims']['received']} received -> {status['interims']['forwarded']} forwarded")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="replay a recorded session through the speech pipeline")
+    parser.add_argument("index", help="녹음 인덱스 파일 (<session_id>_<part>.idx.jsonl)")
+    parser.add_argument("--speed", type=float, default=1.0, help="재생 배속 (녹음 도착 간격 기준)")
+    parser.add_argument("--fast", action="store_true", help="대기 없이 최대한 빨리 재생")
+    parser.add_argument("--targets", nargs="+", help="번역 언어 (기본: 녹음 당시 설정)")
+    parser.add_argument("--vad", action="store_true", help="음성 구간 게이트 사용")
+    parser.add_argument("--translator", choices=("api", "local"), default="api", help="api : TRANSLATION_ROUTES 설정의 번역 제공자")
+    parser.add_argument("--translate-latency", type=float, default=0.15, help="로컬 번역기 지연 (초)")
+    parser.add_argument("--drain", type=float, default=3.0, help="입력 종료 후 결과 대기 시간 (초)")
+    parser.add_argument("--quiet", action="store_true", help="최종 결과 출력 생략")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
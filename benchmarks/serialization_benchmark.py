@@ -0,0 +1,69 @@
+# [benchmarks/serialization_benchmark.py]
+# 결과 메시지 1건당 직렬화 비용 (번역 언어 1 / 5 / 10개)
+#
+# 실행: python -m benchmarks.serialization_benchmark
+#
+# 비교 대상
+#   - pydantic+json : 기존 방식 (SpeechTranslationResponse 생성 -> model_dump -> 표준 json, send_json과 같은 옵션)
+#   - dict+json     : Pydantic 모델 없이 dict 구성 -> 표준 json
+#   - fast json     : FrameSerializer("json") (orjson 설치 시 orjson)
+#   - msgpack       : FrameSerializer("msgpack") (msgpack 설치 시)
+import argparse
+import json
+import timeit
+from src.app.core import frame_serializer
+from src.app.core.frame_serializer import FrameSerializer
+
+SAMPLE_LANGUAGES = ["en", "ja", "zh-CN", "vi", "es", "fr", "de", "ru", "th", "id"]
+SAMPLE_TEXT = "오늘은 자료구조 수업에서 이진 탐색 트리의 삽입과 삭제 연산을 살펴보겠습니다."
+
+
+def build_translations(language_count: int) -> dict:
+    translations = {'ko': {'target_lang': 'ko', 'result_text': SAMPLE_TEXT}}
+    for lang in SAMPLE_LANGUAGES[:language_count]:
+        translations[lang] = {'target_lang': lang, 'result_text': f"[{lang}] translated sentence for benchmark"}
+    return translations
+
+
+def build_cases(translations: dict) -> dict:
+    cases = {}
+    try:
+        from src.app.dto.speech_translation_dto import SpeechTranslationResponse
+        cases["pydantic+json"] = lambda: json.dumps(
+            SpeechTranslationResponse(is_final=True, translations=translations).model_dump(),
+            separators=(",", ":"), ensure_ascii=False
+        ).encode("utf-8")
+    except ImportError:
+        pass    # pydantic 미설치 환경
+
+    cases["dict+json"] = lambda: json.dumps(
+        {'type': "result", 'is_final': True, 'translations': translations},
+        separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+    fast_json = FrameSerializer("json")
+    cases["fast json"] = lambda: fast_json.encode({'type': "result", 'is_final': True, 'translations': translations})
+
+    if frame_serializer.msgpack is not None:
+        packer = FrameSerializer("msgpack")
+        cases["msgpack"] = lambda: packer.encode({'type': "result", 'is_final': True, 'translations': translations})
+    return cases
+
+
+def main():
+    parser = argparse.ArgumentParser(description="result frame serialization microbenchmark")
+    parser.add_argument("--number", type=int, default=20000, help="케이스별 반복 횟수")
+    args = parser.parse_args()
+
+    print(f"orjson={'yes' if frame_serializer.orjson else 'no'} msgpack={'yes' if frame_serializer.msgpack else 'no'}")
+    print(f"{'languages':>9} {'case':<15} {'us/message':>11} {'bytes':>7}")
+    for language_count in (1, 5, 10):
+        translations = build_translations(language_count)
+        for name, case in build_cases(translations).items():
+            seconds = min(timeit.repeat(case, number=args.number, repeat=3))
+            size = len(case())
+            print(f"{language_count:>9} {name:<15} {seconds / args.number * 1e6:>11.2f} {size:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# [benchmarks/session_load_benchmark.py]
+# 동시 세션 부하 테스트 (Azure / Google 없이 실제 세션 파이프라인 사용)
+#
+# 실행: python -m benchmarks.session_load_benchmark --sessions 1000 --seconds 60
+#
+# 세션마다 SingleSpeechTranslationInterface(stt=ReplaySTT, translator=지연만 있는 로컬 번역기)를 만들고
+# 100ms마다 무음 PCM 100ms를 넣는다 (--speed 로 배속). ReplaySTT가 fixture 스크립트대로 인식 결과를 발생시킨다.
+# 측정 항목
+#   - loop lag : 이벤트 루프 지연 p50 / p99 (ms) - 세션 수가 늘 때 가장 먼저 나빠지는 지표
+#   - cpu      : 프로세스 CPU 사용률
+#   - results  : 초당 전달된 결과 수 (최종 / 중간), 큐 대기 시간 p50 / p99 (ms)
+import argparse
+import asyncio
+import os
+import time
+from src.app.core.metrics import LatencyRecorder
+from src.app.interfaces.single_speech_translation_interface import SingleSpeechTranslationInterface
+from src.app.modules.stt.replay_stt import ReplaySTT
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), "fixtures", "replay_lecture.json")
+CHUNK_SECONDS = 0.1
+CHUNK = bytes(int(16000 * 2 * CHUNK_SECONDS))
+
+
+class LocalTranslator:
+    """네트워크 없이 지연만 재현하는 번역기 (Translator.translate_multiple_languages와 같은 반환 형식)"""
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def translate_multiple_languages(self, text, input_language, target_languages, session_id=None, on_result=None):
+        await asyncio.sleep(self.latency)
+        simple_lang_code = input_language.split('-')[0]
+        results = {simple_lang_code: {'target_lang': simple_lang_code, 'result_text': text}}
+        for lang in target_languages:
+            results[lang] = {'target_lang': lang, 'result_text': f"[{lang}] {text}"}
+            if on_result is not None:
+                on_result(lang, results[lang])
+        return results
+
+
+async def feed_audio(interface, seconds: float, speed: float):
+    interval = CHUNK_SECONDS / speed
+    next_at = time.perf_counter()
+    for _ in range(int(seconds / CHUNK_SECONDS)):
+        await interface.process_audio_chunk(CHUNK)
+        next_at += interval
+        await asyncio.sleep(max(0.0, next_at - time.perf_counter()))
+
+
+async def consume(interface, counters: dict, queue_wait: LatencyRecorder):
+    while True:
+        for item in await interface.get_translation_results(16):
+            counters['finals' if item.get('is_final') else 'interims'] += 1
+            queue_wait.record(time.perf_counter() - item['queued_at'])
+
+
+async def measure_loop_lag(lag: LatencyRecorder, interval: float = 0.05):
+    while True:
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lag.record(time.perf_counter() - started - interval)
+
+
+async def run(args):
+    translator = LocalTranslator(args.translate_latency)
+    interfaces = []
+    for index in range(args.sessions):
+        interface = SingleSpeechTranslationInterface(
+            stt=ReplaySTT(FIXTURE_PATH, seed=index),
+            translator=translator,
+        )
+        await interface.start_session("ko-KR", args.targets)
+        interfaces.append(interface)
+
+    counters = {'finals': 0, 'interims': 0}
+    queue_wait = LatencyRecorder(max_samples=100_000)
+    lag = LatencyRecorder(max_samples=100_000)
+    background = [asyncio.create_task(consume(interface, counters, queue_wait)) for interface in interfaces]
+    background.append(asyncio.create_task(measure_loop_lag(lag)))
+
+    cpu_started, wall_started = time.process_time(), time.perf_counter()
+    await asyncio.gather(*(feed_audio(interface, args.seconds, args.speed) for interface in interfaces))
+    await asyncio.sleep(1.0)        # 마지막 결과 대기
+    cpu_seconds, wall_seconds = time.process_time() - cpu_started, time.perf_counter() - wall_started
+
+    for task in background:
+        task.cancel()
+    for interface in interfaces:
+        interface.stop_session()
+
+    lag_stats, wait_stats = lag.snapshot(), queue_wait.snapshot()
+    print(f"sessions   : {args.sessions} x {args.seconds:.0f} audio-s (speed x{args.speed}, targets {args.targets})")
+    print(f"loop lag   : p50 {lag_stats['p50_ms']:.1f} ms / p99 {lag_stats['p99_ms']:.1f} ms / max {lag_stats['max_ms']:.1f} ms")
+    print(f"cpu        : {cpu_seconds / wall_seconds:.0%} of one core")
+    print(f"results    : {counters['finals'] / wall_seconds:.0f} finals/s, {counters['interims'] / wall_seconds:.0f} interims/s")
+    print(f"queue wait : p50 {wait_stats['p50_ms']:.1f} ms / p99 {wait_stats['p99_ms']:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="concurrent session load test with the replay STT backend")
+    parser.add_argument("--sessions", type=int, default=500)
+    parser.add_argument("--seconds", type=float, default=60.0, help="세션별 입력 오디오 길이")
+    parser.add_argument("--speed", type=float, default=1.0, help="오디오 입력 배속")
+    parser.add_argument("--targets", nargs="+", default=["en", "ja", "zh-CN"])
+    parser.add_argument("--translate-latency", type=float, default=0.15, help="로컬 번역기 지연 (초)")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# [benchmarks/speech_pipeline_benchmark.py]
+# STT -> 번역 -> WebSocket 전송 경로 벤치마크 (폴링 방식 vs 푸시 방식)
+#
+# 실행: python -m benchmarks.speech_pipeline_benchmark --sessions 200
+#
+# Azure / Google 없이 세션 루프 구조만 재현한다.
+#   - legacy : _process_stt_results 의 sleep(0.1) + send_translation_results 의 get_nowait/sleep(0.05) 폴링
+#   - push   : 각 단계가 입력 큐를 직접 await (현재 구현)
+# 측정 항목
+#   - idle CPU : 결과가 없을 때 세션당 초당 CPU 사용 시간 (ms)
+#   - latency  : STT 이벤트(콜백 스레드) 발생 -> WebSocket 전송까지 p50 / p99 (ms)
+import argparse
+import asyncio
+import random
+import threading
+import time
+
+
+class FakeWebSocket:
+    """전송 시각만 기록하는 WebSocket 대용 객체"""
+    def __init__(self, latencies: list):
+        self.latencies = latencies
+
+    async def send_json(self, data):
+        self.latencies.append(time.perf_counter() - data['stt_timestamp'])
+
+
+class LegacySession:
+    """기존 폴링 루프 재현"""
+    def __init__(self, websocket):
+        self.websocket = websocket
+        self.stt_queue = asyncio.Queue()
+        self.translation_result_queue = asyncio.Queue()
+
+    async def process_stt_results(self):
+        while True:
+            stt_result = await self.stt_queue.get()
+            await self.translation_result_queue.put(stt_result)
+            await asyncio.sleep(0.1)
+
+    async def send_translation_results(self):
+        while True:
+            try:
+                result = self.translation_result_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                result = None
+            if result:
+                await self.websocket.send_json(result)
+            else:
+                await asyncio.sleep(0.05)
+
+
+class PushSession(LegacySession):
+    """푸시 방식 루프 (각 단계가 입력을 직접 대기)"""
+    async def process_stt_results(self):
+        while True:
+            stt_result = await self.stt_queue.get()
+            await self.translation_result_queue.put(stt_result)
+
+    async def send_translation_results(self):
+        while True:
+            result = await self.translation_result_queue.get()
+            await self.websocket.send_json(result)
+
+
+def _percentile(samples: list, percent: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(percent / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _emit_events(loop, sessions, rate: float, duration: float, stop: threading.Event):
+    """SDK 콜백 스레드 흉내 : 세션별 포아송 간격으로 recognizing 이벤트 발생"""
+    total_rate = rate * len(sessions)
+    deadline = time.perf_counter() + duration
+    while not stop.is_set() and time.perf_counter() < deadline:
+        time.sleep(random.expovariate(total_rate))
+        session = random.choice(sessions)
+        event = {'text': '...', 'is_final': False, 'stt_timestamp': time.perf_counter()}
+        loop.call_soon_threadsafe(session.stt_queue.put_nowait, event)
+
+
+async def run_scenario(session_class, session_count: int, idle_seconds: float, active_seconds: float, rate: float):
+    loop = asyncio.get_running_loop()
+    latencies = []
+    sessions = [session_class(FakeWebSocket(latencies)) for _ in range(session_count)]
+    tasks = []
+    for session in sessions:
+        tasks.append(asyncio.create_task(session.process_stt_results()))
+        tasks.append(asyncio.create_task(session.send_translation_results()))
+
+    # [1] 유휴 구간 : 이벤트 없음
+    await asyncio.sleep(0.2)
+    cpu_start = time.process_time()
+    await asyncio.sleep(idle_seconds)
+    idle_cpu = time.process_time() - cpu_start
+
+    # [2] 활성 구간 : 콜백 스레드에서 이벤트 발생
+    stop = threading.Event()
+    producer = threading.Thread(
+        target=_emit_events, args=(loop, sessions, rate, active_seconds, stop), daemon=True
+    )
+    producer.start()
+    await asyncio.to_thread(producer.join)
+    await asyncio.sleep(0.5)    # 큐에 남은 이벤트 전송 대기
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    return {
+        'idle_cpu_ms_per_session_sec': idle_cpu * 1000 / idle_seconds / session_count,
+        'events': len(latencies),
+        'p50_ms': _percentile(latencies, 50) * 1000,
+        'p99_ms': _percentile(latencies, 99) * 1000,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="speech pipeline push vs polling benchmark")
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--idle-seconds", type=float, default=5.0)
+    parser.add_argument("--active-seconds", type=float, default=5.0)
+    parser.add_argument("--rate", type=float, default=5.0, help="세션당 초당 STT 이벤트 수")
+    args = parser.parse_args()
+
+    print(f"sessions={args.sessions} idle={args.idle_seconds}s active={args.active_seconds}s rate={args.rate}/s")
+    print(f"{'mode':<8} {'idle CPU (ms/s/session)':>24} {'events':>8} {'p50 (ms)':>10} {'p99 (ms)':>10}")
+    for name, session_class in (("legacy", LegacySession), ("push", PushSession)):
+        result = await run_scenario(session_class, args.sessions, args.idle_seconds, args.active_seconds, args.rate)
+        print(
+            f"{name:<8} {result['idle_cpu_ms_per_session_sec']:>24.3f} {result['events']:>8} "
+            f"{result['p50_ms']:>10.2f} {result['p99_ms']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,96 @@
+# [benchmarks/translation_batch_benchmark.py]
+# 세션 간 번역 묶음 처리 비교 (Google API 없이 호출 1회 지연 = 기본 지연 + 문장당 지연 으로 재현)
+#
+# 실행: python -m benchmarks.translation_batch_benchmark --sessions 300 --windows 0 10 20 50
+#
+# 비교 대상 : 묶음 시간(window) 별 TranslationBatcher (0 : 묶음 처리 x, 문장 / 언어마다 API 1회 호출)
+# 시나리오 : 세션 N개가 평균 interval초마다 최종 문장 1개 -> 번역 언어별 번역 요청
+# 측정 항목 : API 호출 수, 묶음 크기 분포, 묶음 대기로 늘어난 지연 p50 / p99, 문장 번역 완료 지연 p50 / p99
+import argparse
+import asyncio
+import random
+import time
+from src.app.core.metrics import LatencyRecorder
+from src.app.modules.translation.translation_batcher import TranslationBatcher
+from src.app.modules.translation.translation_executor import FairTranslationExecutor
+
+
+class LocalBatchTranslator:
+    """네트워크 없이 API 호출 지연만 재현 (TranslationProvider.translate_text / translate_batch와 같은 반환 형식)"""
+    def __init__(self, base_latency: float, per_text_latency: float):
+        self.base_latency = base_latency
+        self.per_text_latency = per_text_latency
+        self.calls = 0
+
+    def translate_text(self, text, target_language):
+        self.calls += 1
+        time.sleep(self.base_latency + self.per_text_latency)
+        return {'target_lang': target_language, 'result_text': text}
+
+    def translate_batch(self, texts, target_language):
+        self.calls += 1
+        time.sleep(self.base_latency + self.per_text_latency * len(texts))
+        return [{'target_lang': target_language, 'result_text': text} for text in texts]
+
+
+async def translate(batcher, executor, translator, session_id, text, targets):
+    if batcher.enabled:
+        tasks = [batcher.submit(lang, text, translator.translate_batch, session_id=session_id) for lang in targets]
+    else:
+        tasks = [executor.submit(session_id, translator.translate_text, text, lang) for lang in targets]
+    return await asyncio.gather(*tasks)
+
+
+async def session(index, batcher, executor, translator, args, latency: LatencyRecorder):
+    rng = random.Random(index)
+    await asyncio.sleep(rng.uniform(0, args.interval))       # 세션별 발화 시점 분산
+    for sentence in range(args.utterances):
+        started = time.perf_counter()
+        await translate(batcher, executor, translator, f"session-{index}", f"sentence {index}-{sentence}", args.targets)
+        latency.record(time.perf_counter() - started)
+        await asyncio.sleep(rng.expovariate(1 / args.interval))
+
+
+async def run_mode(window_ms, args):
+    executor = FairTranslationExecutor(args.workers)
+    batcher = TranslationBatcher(window_ms, args.max_size, args.max_chars, executor)
+    translator = LocalBatchTranslator(args.call_latency, args.per_text_latency)
+    latency = LatencyRecorder(max_samples=100_000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(session(index, batcher, executor, translator, args, latency) for index in range(args.sessions)))
+    elapsed = time.perf_counter() - started
+
+    total = latency.snapshot()
+    stats = batcher.get_stats()
+    wait = stats['window_wait']
+    sizes = " ".join(f"{label}:{count}" for label, count in stats['batch_sizes'].items() if count)
+    print(f"window {window_ms:3d} ms: calls {translator.calls:6d} ({translator.calls / elapsed:6.1f}/s), "
+          f"sentence p50 {total['p50_ms']:7.1f} / p99 {total['p99_ms']:7.1f} ms, "
+          f"window wait p50 {wait['p50_ms']:5.1f} / p99 {wait['p99_ms']:5.1f} ms")
+    if batcher.enabled:
+        print(f"               avg batch {stats['avg_batch_size']:.2f}, flush {stats['flush_reasons']}, sizes {sizes}")
+
+
+async def main_async(args):
+    for window_ms in args.windows:
+        await run_mode(window_ms, args)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="compare cross-session translation batching windows")
+    parser.add_argument("--sessions", type=int, default=300, help="동시 세션 수")
+    parser.add_argument("--utterances", type=int, default=10, help="세션별 최종 문장 수")
+    parser.add_argument("--interval", type=float, default=1.0, help="세션별 평균 문장 간격 (초)")
+    parser.add_argument("--targets", nargs="+", default=["en", "ja", "zh-CN"])
+    parser.add_argument("--windows", type=int, nargs="+", default=[0, 10, 20, 50], help="비교할 묶음 시간 (ms)")
+    parser.add_argument("--max-size", type=int, default=32, help="묶음 최대 문장 수")
+    parser.add_argument("--max-chars", type=int, default=5000, help="묶음 최대 글자 수")
+    parser.add_argument("--call-latency", type=float, default=0.08, help="API 호출 1회 기본 지연 (초)")
+    parser.add_argument("--per-text-latency", type=float, default=0.002, help="문장 1개당 추가 지연 (초)")
+    parser.add_argument("--workers", type=int, default=16, help="공용 번역 실행기 작업 스레드 수")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
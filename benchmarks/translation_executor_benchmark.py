@@ -0,0 +1,101 @@
+# [benchmarks/translation_executor_benchmark.py]
+# 번역 호출 실행 방식 비교 (Google API 없이 블로킹 호출 지연만 재현)
+#
+# 실행: python -m benchmarks.translation_executor_benchmark --sessions 40 --call-latency 0.08
+#
+# 비교 대상
+#   - per-call : 기존 방식 (발화마다 ThreadPoolExecutor 생성 -> 언어별 스레드 -> 정리)
+#   - shared   : 공용 ThreadPoolExecutor 하나 (FIFO, 세션 구분 x)
+#   - fair     : FairTranslationExecutor (공용 작업 스레드 + 세션별 라운드 로빈)
+# 시나리오 : 일반 세션 N개는 interval마다 발화 1개, 수다스러운 세션 1개는 시작하자마자 발화 burst개를 한꺼번에 요청
+# 측정 항목 : 일반 세션 발화의 번역 완료 지연 p50 / p99, 생성된 스레드 수
+import argparse
+import asyncio
+import concurrent.futures
+import random
+import threading
+import time
+from src.app.core.metrics import LatencyRecorder
+from src.app.modules.translation.translation_executor import FairTranslationExecutor
+
+
+def blocking_translate(latency: float, text: str, lang: str):
+    time.sleep(latency)         # 동기 번역 API 호출 대기
+    return {'target_lang': lang, 'result_text': text}
+
+
+async def translate_per_call(executor, session_id, fn, langs):
+    loop = asyncio.get_running_loop()
+    with concurrent.futures.ThreadPoolExecutor() as pool:
+        return await asyncio.gather(*(loop.run_in_executor(pool, fn, "text", lang) for lang in langs))
+
+
+async def translate_shared(executor, session_id, fn, langs):
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(*(loop.run_in_executor(executor, fn, "text", lang) for lang in langs))
+
+
+async def translate_fair(executor, session_id, fn, langs):
+    return await asyncio.gather(*(executor.submit(session_id, fn, "text", lang) for lang in langs))
+
+
+async def normal_session(translate, executor, session_id, fn, args, latency: LatencyRecorder):
+    await asyncio.sleep(random.Random(session_id).uniform(0, args.interval))     # 세션별 발화 시점 분산
+    for _ in range(args.utterances):
+        started = time.perf_counter()
+        await translate(executor, session_id, fn, args.targets)
+        latency.record(time.perf_counter() - started)
+        await asyncio.sleep(args.interval)
+
+
+async def chatty_session(translate, executor, fn, args):
+    await asyncio.gather(*(translate(executor, "chatty", fn, args.targets) for _ in range(args.burst)))
+
+
+async def run_mode(name, translate, executor, args):
+    fn = lambda text, lang: blocking_translate(args.call_latency, text, lang)
+    latency = LatencyRecorder(max_samples=100_000)
+    threads_before = threading.active_count()
+    peak_threads = threads_before
+
+    async def watch_threads():
+        nonlocal peak_threads
+        while True:
+            peak_threads = max(peak_threads, threading.active_count())
+            await asyncio.sleep(0.01)
+
+    watcher = asyncio.create_task(watch_threads())
+    started = time.perf_counter()
+    await asyncio.gather(
+        chatty_session(translate, executor, fn, args),
+        *(normal_session(translate, executor, f"session-{index}", fn, args, latency) for index in range(args.sessions)),
+    )
+    elapsed = time.perf_counter() - started
+    watcher.cancel()
+
+    stats = latency.snapshot()
+    print(f"{name:9s}: normal p50 {stats['p50_ms']:7.1f} ms / p99 {stats['p99_ms']:7.1f} ms, "
+          f"peak threads {peak_threads - threads_before:4d}, total {elapsed:.1f}s")
+
+
+async def main_async(args):
+    await run_mode("per-call", translate_per_call, None, args)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args.workers) as shared:
+        await run_mode("shared", translate_shared, shared, args)
+    await run_mode("fair", translate_fair, FairTranslationExecutor(args.workers), args)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="compare translation call executors")
+    parser.add_argument("--sessions", type=int, default=40, help="일반 세션 수")
+    parser.add_argument("--utterances", type=int, default=10, help="일반 세션별 발화 수")
+    parser.add_argument("--interval", type=float, default=0.3, help="일반 세션 발화 간격 (초)")
+    parser.add_argument("--burst", type=int, default=100, help="수다스러운 세션이 한꺼번에 요청하는 발화 수")
+    parser.add_argument("--targets", nargs="+", default=["en", "ja", "zh-CN"])
+    parser.add_argument("--call-latency", type=float, default=0.08, help="번역 API 호출 1회 지연 (초)")
+    parser.add_argument("--workers", type=int, default=16, help="shared / fair 작업 스레드 수")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
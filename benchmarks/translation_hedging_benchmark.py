@@ -0,0 +1,84 @@
+# [benchmarks/translation_hedging_benchmark.py]
+# 번역 제공자 헤징 비교 (로컬 stub 서버 2개 : 느린 꼬리가 있는 주 제공자 + 보조 제공자)
+#
+# 실행: python -m benchmarks.translation_hedging_benchmark --requests 2000 --tail-prob 0.03 --tail-ms 1500
+#
+# 경로 : "*=azure,deepl" (Azure 요청 형식 stub = 주 제공자, DeepL 요청 형식 stub = 보조 제공자)
+# 비교 대상 : 헤징 x / 헤징 o (주 제공자 p95까지 응답이 없으면 보조 제공자에도 요청)
+# 측정 항목 : 요청 -> 결과 지연 p50 / p95 / p99 / max, 헤징 비율, 제공자별 실제 API 호출 수 (추가 비용)
+import argparse
+import asyncio
+import os
+import random
+import time
+from benchmarks.translation_stub_server import StubConfig, start_stub_server
+
+
+async def run_mode(hedge: bool, args, primary: StubConfig, secondary: StubConfig):
+    # 환경 변수 설정 후 import (제공자 엔드포인트 / 키는 import 시점에 읽음)
+    from src.app.core.metrics import LatencyRecorder
+    from src.app.modules.translation.translation_batcher import TranslationBatcher
+    from src.app.modules.translation.translation_executor import FairTranslationExecutor
+    from src.app.modules.translation.translation_router import TranslationRouter
+
+    executor = FairTranslationExecutor(args.workers)
+    router = TranslationRouter("*=azure,deepl", hedge, executor, TranslationBatcher(0, executor=executor))
+    latency = LatencyRecorder(max_samples=100_000)
+    primary_before, secondary_before = primary.requests, secondary.requests
+    semaphore = asyncio.Semaphore(args.concurrency)
+    rng = random.Random(1)
+
+    async def request(index: int):
+        async with semaphore:
+            started = time.perf_counter()
+            result = await router.translate(f"문장 {index}", "ko-KR", rng.choice(args.targets), session_id=f"session-{index % 50}")
+            if result:
+                latency.record(time.perf_counter() - started)
+
+    await asyncio.gather(*(request(index) for index in range(args.requests)))
+
+    stats = latency.snapshot()
+    router_stats = router.get_stats()
+    primary_calls = primary.requests - primary_before
+    secondary_calls = secondary.requests - secondary_before
+    print(f"hedge {'on ' if hedge else 'off'}: p50 {stats['p50_ms']:7.1f} / p95 {stats['p95_ms']:7.1f} / "
+          f"p99 {stats['p99_ms']:7.1f} / max {stats['max_ms']:7.1f} ms, "
+          f"hedged {router_stats['hedge_rate'] * 100:4.1f}% (wins {router_stats['hedge_wins']}), "
+          f"calls primary {primary_calls} + secondary {secondary_calls} "
+          f"(+{secondary_calls / max(1, primary_calls) * 100:.1f}%), failed {router_stats['failed']}")
+
+
+async def main_async(args):
+    primary = StubConfig(args.latency_ms, args.jitter, args.tail_prob, args.tail_ms, args.error_rate, seed=1)
+    secondary = StubConfig(args.secondary_latency_ms, args.jitter, 0.0, 0.0, 0.0, seed=2)
+    _, primary_url = start_stub_server(primary)
+    _, secondary_url = start_stub_server(secondary)
+    os.environ.update({
+        'AZURE_TRANSLATION_ENDPOINT': primary_url,
+        'AZURE_TRANSLATION_KEY': "stub",
+        'DEEPL_TRANSLATION_ENDPOINT': secondary_url,
+        'DEEPL_TRANSLATION_KEY': "stub",
+        'TRANSLATION_HEDGE_MIN_SAMPLES': str(args.min_samples),
+    })
+    for hedge in (False, True):
+        await run_mode(hedge, args, primary, secondary)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="compare hedged vs single-provider translation requests")
+    parser.add_argument("--requests", type=int, default=2000, help="번역 요청 수 (문장 1개 / 언어 1개)")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 요청 수 (제공자 연결 수 상한보다 크면 연결 대기가 지연에 포함됨)")
+    parser.add_argument("--targets", nargs="+", default=["en", "ja", "zh-CN"])
+    parser.add_argument("--latency-ms", type=float, default=80, help="주 제공자 응답 지연 중앙값 (ms)")
+    parser.add_argument("--secondary-latency-ms", type=float, default=120, help="보조 제공자 응답 지연 중앙값 (ms)")
+    parser.add_argument("--jitter", type=float, default=0.25, help="응답 지연 로그 정규 분포 sigma")
+    parser.add_argument("--tail-prob", type=float, default=0.03, help="주 제공자 느린 응답 확률")
+    parser.add_argument("--tail-ms", type=float, default=1500, help="주 제공자 느린 응답 추가 지연 (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="주 제공자 503 응답 확률 (failover 확인)")
+    parser.add_argument("--min-samples", type=int, default=20, help="p95 헤징을 시작하는 최소 샘플 수")
+    parser.add_argument("--workers", type=int, default=64, help="공용 번역 실행기 작업 스레드 수")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# [benchmarks/translation_stub_server.py]
+# 로컬 번역 API stub 서버 (Google v2 / Azure Translator v3 / DeepL v2 요청 형식, 실제 번역 x)
+#
+# 실행: python -m benchmarks.translation_stub_server --port 8701 --latency-ms 80 --tail-prob 0.05 --tail-ms 1500
+#   서버 1개가 세 API 경로를 모두 처리 -> 엔드포인트 환경 변수만 바꿔서 사용
+#   GOOGLE_TRANSLATION_ENDPOINT=http://127.0.0.1:8701
+#   AZURE_TRANSLATION_ENDPOINT=http://127.0.0.1:8701  (AZURE_TRANSLATION_KEY는 아무 값)
+#   DEEPL_TRANSLATION_ENDPOINT=http://127.0.0.1:8701  (DEEPL_TRANSLATION_KEY는 아무 값)
+#
+# 응답 지연 : latency-ms 기준 로그 정규 분포 + tail-prob 확률로 tail-ms 추가 (느린 꼬리 재현), error-rate 확률로 503
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class StubConfig:
+    def __init__(self, latency_ms: float = 80, jitter: float = 0.25, tail_prob: float = 0.0, tail_ms: float = 1000,
+                 error_rate: float = 0.0, seed: int = 0):
+        self.latency_ms = latency_ms
+        self.jitter = jitter
+        self.tail_prob = tail_prob
+        self.tail_ms = tail_ms
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.texts = 0
+
+    def sample(self) -> tuple[float, bool]:
+        """(응답 지연(초), 실패 여부)"""
+        with self.lock:
+            self.requests += 1
+            delay = self.latency_ms * self.random.lognormvariate(0, self.jitter)
+            if self.random.random() < self.tail_prob:
+                delay += self.tail_ms
+            return delay / 1000, self.random.random() < self.error_rate
+
+
+def _translate(text: str, target: str) -> str:
+    return f"[{target}] {text}"
+
+
+class StubTranslationHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"       # 연결 재사용 (실제 API와 같은 조건)
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        request = json.loads(body) if body else {}
+
+        if url.path == "/language/translate/v2":
+            # Google v2 : {"q": [...], "target"} -> {"data": {"translations": [{"translatedText"}]}}
+            texts = request.get('q', [])
+            texts = [texts] if isinstance(texts, str) else texts
+            target = request.get('target', "")
+            response = {'data': {'translations': [{'translatedText': _translate(text, target)} for text in texts]}}
+        elif url.path == "/translate":
+            # Azure v3 : ?to= + [{"Text"}] -> [{"translations": [{"text", "to"}]}]
+            texts = [item['Text'] for item in request]
+            target = query.get('to', [""])[0]
+            response = [{'translations': [{'text': _translate(text, target), 'to': target}]} for text in texts]
+        elif url.path == "/v2/translate":
+            # DeepL v2 : {"text": [...], "target_lang"} -> {"translations": [{"text"}]}
+            texts = request.get('text', [])
+            target = request.get('target_lang', "")
+            response = {'translations': [{'detected_source_language': "KO", 'text': _translate(text, target)} for text in texts]}
+        else:
+            self._send(404, {'error': "not found"})
+            return
+
+        config = self.server.stub_config
+        delay, failed = config.sample()
+        with config.lock:
+            config.texts += len(texts)
+        time.sleep(delay)
+        if failed:
+            self._send(503, {'error': "stub failure"})
+            return
+        self._send(200, response)
+
+    def _send(self, status: int, payload):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass        # 요청마다 로그 출력 x
+
+
+def start_stub_server(config: StubConfig, host: str = "127.0.0.1", port: int = 0) -> tuple[ThreadingHTTPServer, str]:
+    """백그라운드 스레드에서 stub 서버 시작 -> (서버, 엔드포인트 URL)"""
+    server = ThreadingHTTPServer((host, port), StubTranslationHandler)
+    server.daemon_threads = True
+    server.stub_config = config
+    threading.Thread(target=server.serve_forever, name="translation-stub", daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="local translation API stub server (google / azure / deepl)")
+    parser.add_argument("--port", type=int, default=8701)
+    parser.add_argument("--latency-ms", type=float, default=80, help="응답 지연 중앙값 (ms)")
+    parser.add_argument("--jitter", type=float, default=0.25, help="응답 지연 로그 정규 분포 sigma")
+    parser.add_argument("--tail-prob", type=float, default=0.0, help="느린 응답 확률")
+    parser.add_argument("--tail-ms", type=float, default=1000, help="느린 응답 추가 지연 (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 응답 확률")
+    args = parser.parse_args()
+
+    config = StubConfig(args.latency_ms, args.jitter, args.tail_prob, args.tail_ms, args.error_rate)
+    server, url = start_stub_server(config, port=args.port)
+    print(f"translation stub server: {url}")
+    try:
+        while True:
+            time.sleep(10)
+            print(f"requests {config.requests}, texts {config.texts}")
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# [benchmarks/vad_gate_benchmark.py]
+# 음성 구간 게이트 비용 / 절감량 측정
+#
+# 실행: python -m benchmarks.vad_gate_benchmark --seconds 600
+#
+# 합성 강의 오디오 (16kHz mono s16) : 발화(변조된 배음 + 잡음) / 침묵(배경 소음) 구간 반복
+# 100ms 청크로 나눠 VadGate.process 에 넣는다 (WebSocket 수신 단위와 동일).
+# 측정 항목
+#   - cpu      : 오디오 1초당 게이트 CPU 시간 (ms) -> 코어 1개당 처리 가능한 세션 수
+#   - forwarded: STT로 전달된 오디오 비율 (= Azure 과금 비율)
+import argparse
+import time
+import numpy as np
+from src.app.modules.audio.vad_gate import VadGate, VAD_SAMPLE_RATE
+
+CHUNK_MS = 100
+
+
+def synthesize(seconds: int, speech_ratio: float, seed: int = 0) -> bytes:
+    """발화 4초 단위 + 침묵 구간을 speech_ratio 비율로 반복"""
+    rng = np.random.default_rng(seed)
+    speech_seconds = 4.0
+    silence_seconds = speech_seconds * (1 - speech_ratio) / speech_ratio
+    pieces = []
+    total = 0.0
+    while total < seconds:
+        t = np.arange(int(speech_seconds * VAD_SAMPLE_RATE)) / VAD_SAMPLE_RATE
+        envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 4 * t) ** 2          # 음절 단위 진폭 변화
+        voiced = sum(np.sin(2 * np.pi * f * t) / k for k, f in enumerate((180, 360, 540, 900), start=1))
+        pieces.append(0.1 * envelope * voiced + 0.01 * rng.standard_normal(t.size))
+        pieces.append(0.002 * rng.standard_normal(int(silence_seconds * VAD_SAMPLE_RATE)))
+        total += speech_seconds + silence_seconds
+    audio = np.concatenate(pieces)[:seconds * VAD_SAMPLE_RATE]
+    return (np.clip(audio, -1, 1) * 32767).astype("<i2").tobytes()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="vad gate benchmark")
+    parser.add_argument("--seconds", type=int, default=600, help="합성 오디오 길이 (초)")
+    parser.add_argument("--speech-ratio", type=float, default=0.5, help="발화 구간 비율")
+    args = parser.parse_args()
+
+    pcm = synthesize(args.seconds, args.speech_ratio)
+    chunk_bytes = VAD_SAMPLE_RATE * 2 * CHUNK_MS // 1000
+    chunks = [pcm[offset:offset + chunk_bytes] for offset in range(0, len(pcm), chunk_bytes)]
+
+    gate = VadGate()
+    started = time.process_time()
+    forwarded = sum(len(gate.process(chunk)) for chunk in chunks)
+    cpu_seconds = time.process_time() - started
+
+    stats = gate.get_stats()
+    cpu_ms = cpu_seconds / args.seconds * 1000
+    print(f"audio      : {args.seconds} s (speech ratio {args.speech_ratio:.0%}, {len(chunks)} chunks)")
+    print(f"segments   : {stats['speech_segments']}")
+    print(f"forwarded  : {forwarded / len(pcm):.1%} of received audio")
+    print(f"cpu        : {cpu_ms:.3f} ms/audio-second (~{1000 / cpu_ms:.0f} real-time sessions per core)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# [core/delta_encoder.py]
+# 중간 결과(recognizing) 델타 인코딩 + 중복 제거
+import os
+
+class InterimDeltaEncoder:
+    """
+    소켓별 중간 결과 델타 인코더
+
+    Azure recognizing 이벤트는 매번 누적된 전체 문장을 다시 보내므로,
+    마지막으로 전송한 문장과의 공통 접두사 길이 + 바뀐 뒷부분만 전송한다.
+    - 완전히 같은 중간 결과는 전송하지 않음 (delta 설정과 무관)
+    - prefix_len은 유니코드 코드 포인트 기준
+    - 전송 시점에 호출해야 클라이언트가 받은 문장과 기준이 일치함
+
+    델타 프레임 : {"type": "delta", "is_final": false, "utterance_id", "lang", "prefix_len", "suffix"}
+    클라이언트 복원 : text = 이전 text[:prefix_len] + suffix
+    """
+    # [1] 초기화
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled      # 델타 프레임 사용 여부 (클라이언트 opt-in)
+        self._last_sent = {}        # (utterance_id, language) -> 마지막으로 전송한 문장
+
+        # 지표
+        self.interims = 0
+        self.duplicates = 0         # 전송 생략된 중복 중간 결과
+        self.full_bytes = 0         # 전체 문장 기준 바이트
+        self.delta_bytes = 0        # 실제 전송한 뒷부분 바이트
+
+    # [2] 중간 결과 인코딩
+    def encode(self, utterance_id, language: str, text: str):
+        """
+        중간 결과 인코딩
+
+        Returns:
+            None : 직전 전송과 동일 (전송 생략)
+            dict : 델타 프레임 (enabled=False여도 반환 -> 호출 측에서 전체 프레임 사용)
+        """
+        self.interims += 1
+        key = (utterance_id, language)
+        previous = self._last_sent.get(key, "")
+        if previous == text:
+            self.duplicates += 1
+            return None
+
+        prefix_len = len(os.path.commonprefix([previous, text]))
+        suffix = text[prefix_len:]
+
+        # 진행 중인 발화만 유지 (이전 발화 기록 제거)
+        if key not in self._last_sent:
+            self._last_sent = {k: v for k, v in self._last_sent.items() if k[0] == utterance_id}
+        self._last_sent[key] = text
+
+        self.full_bytes += len(text.encode('utf-8'))
+        self.delta_bytes += len(suffix.encode('utf-8'))
+
+        return {
+            'type': "delta",
+            'is_final': False,
+            'utterance_id': utterance_id,
+            'lang': language,
+            'prefix_len': prefix_len,
+            'suffix': suffix,
+        }
+
+    # [3] 발화 종료
+    def finish(self, utterance_id):
+        """최종 결과 전송 시 해당 발화 기록 제거"""
+        self._last_sent = {k: v for k, v in self._last_sent.items() if k[0] != utterance_id}
+
+    # [4] 지표 반환
+    def get_stats(self) -> dict:
+        return {
+            'enabled': self.enabled,
+            'interims': self.interims,
+            'duplicates': self.duplicates,
+            'full_bytes': self.full_bytes,
+            'delta_bytes': self.delta_bytes,
+        }
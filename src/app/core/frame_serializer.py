@@ -0,0 +1,86 @@
+# [core/frame_serializer.py]
+# 결과 프레임 직렬화 (JSON / MessagePack)
+import json
+
+# 선택 의존성 : 설치되어 있으면 사용
+try:
+    import orjson       # 빠른 JSON 인코더 (C 확장)
+except ImportError:
+    orjson = None
+try:
+    import msgpack      # 바이너리 프레임
+except ImportError:
+    msgpack = None
+
+SUPPORTED_FORMATS = ("json", "msgpack")
+
+class FrameSerializer:
+    """
+    소켓별 결과 프레임 직렬화기
+
+    - json    : 텍스트 프레임 (orjson 설치 시 orjson, 없으면 표준 json)
+    - msgpack : 바이너리 프레임
+    결과 메시지 외 상태(status) 메시지는 항상 JSON 텍스트 프레임으로 전송한다.
+    """
+    # [1] 초기화
+    def __init__(self, wire_format: str = "json"):
+        """
+        Args:
+            wire_format: "json" | "msgpack"
+        """
+        if wire_format not in SUPPORTED_FORMATS:
+            raise ValueError(f"지원하지 않는 전송 형식입니다: {wire_format}")
+        if wire_format == "msgpack" and msgpack is None:
+            raise ValueError("msgpack 패키지가 설치되지 않아 msgpack 형식을 사용할 수 없습니다")
+
+        self.wire_format = wire_format
+        self.is_binary = wire_format == "msgpack"
+
+        # 형식별 인코더 미리 선택 (프레임마다 분기 x)
+        if self.is_binary:
+            self._packer = msgpack.Packer(use_bin_type=True)
+            self._encode = self._packer.pack
+        elif orjson is not None:
+            self._encode = orjson.dumps
+        else:
+            self._encode = lambda payload: json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    # [2] 인코딩
+    def encode(self, payload: dict) -> bytes:
+        """dict -> 직렬화된 bytes"""
+        return self._encode(payload)
+
+    def encode_shared(self, item: dict, build_payload) -> bytes:
+        """
+        여러 소켓이 공유하는 결과 항목 -> 형식별로 한 번만 직렬화 (결과 항목에 캐시)
+
+        Args:
+            item: 결과 큐 항목 (소켓 간 공유)
+            build_payload: 결과 항목 -> 전송용 dict 변환 함수
+        """
+        cache = item.setdefault('encoded', {})
+        frame = cache.get(self.wire_format)
+        if frame is None:
+            frame = cache[self.wire_format] = self.encode(build_payload(item))
+        return frame
+
+    def encode_batch(self, parts: list[bytes]) -> bytes:
+        """
+        이미 직렬화된 결과들을 {"type": "batch", "items": [...]} 프레임으로 결합 (재직렬화 x)
+
+        Args:
+            parts: encode()로 직렬화된 결과 목록
+        """
+        if self.is_binary:
+            header = self._packer.pack_map_header(2) + self._packer.pack("type") + self._packer.pack("batch")
+            header += self._packer.pack("items") + self._packer.pack_array_header(len(parts))
+            return header + b"".join(parts)
+        return b'{"type":"batch","items":[' + b",".join(parts) + b"]}"
+
+    # [3] 전송
+    async def send(self, websocket, frame: bytes):
+        """직렬화된 프레임 전송 (json -> 텍스트 프레임, msgpack -> 바이너리 프레임)"""
+        if self.is_binary:
+            await websocket.send_bytes(frame)
+        else:
+            await websocket.send_text(frame.decode("utf-8"))
@@ -0,0 +1,124 @@
+# [core/interim_throttle.py]
+# 세션별 중간 결과 전달 빈도 제한 (trailing-edge + 전송 지연에 따른 자동 감속)
+import asyncio
+import os
+import time
+
+INTERIM_SEND_LATENCY_TARGET_MS = float(os.getenv("INTERIM_SEND_LATENCY_TARGET_MS", "50"))  # 이보다 전송이 느리면 간격을 늘림
+INTERIM_MAX_BACKOFF = float(os.getenv("INTERIM_MAX_BACKOFF", "8"))                          # 간격을 늘리는 최대 배수
+SEND_LATENCY_SMOOTHING = 0.2        # 전송 지연 지수 이동 평균 가중치
+
+class InterimThrottle:
+    """
+    중간 결과 빈도 제한
+
+    - 간격(1 / max_hz)이 지났으면 바로 전달, 간격 안에 들어온 결과는 가장 최근 것 하나만 보관했다가
+      간격이 끝나는 시점에 전달 (trailing-edge -> 마지막 가설은 항상 전달됨)
+    - 소켓 전송 지연(지수 이동 평균)이 목표보다 크면 비율만큼 간격을 늘림 (최대 INTERIM_MAX_BACKOFF배)
+    - 같은 발화의 최종 결과가 오면 보관 중인 중간 결과는 폐기
+    """
+    # [1] 초기화
+    def __init__(self, emit, max_hz: float = 0, enabled: bool = True):
+        """
+        Args:
+            emit: 중간 결과 전달 함수 (이벤트 루프 스레드에서 호출)
+            max_hz: 초당 최대 전달 횟수 (0이면 제한 x)
+            enabled: False면 중간 결과 전달 x
+        """
+        self.emit = emit
+        self.max_hz = max_hz
+        self.enabled = enabled
+
+        self.pending = None             # 간격이 끝나면 전달할 최신 중간 결과
+        self.timer = None
+        self.last_emit_at = 0.0
+        self.send_latency = 0.0         # 전송 지연 지수 이동 평균 (초)
+
+        # 지표
+        self.received = 0
+        self.forwarded = 0
+        self.superseded = 0             # 더 새로운 중간 결과로 대체됨
+        self.finalized = 0              # 최종 결과 도착으로 폐기됨
+        self.disabled_dropped = 0       # 중간 결과 전달 x 설정으로 버림
+
+    def configure(self, max_hz: float, enabled: bool):
+        """지연 프로파일 변경 시 호출"""
+        self.max_hz = max_hz
+        self.enabled = enabled
+        if not enabled:
+            self._clear_pending()
+
+    # [2] 현재 전달 간격
+    def backoff(self) -> float:
+        """전송 지연에 따른 간격 배수 (1 ~ INTERIM_MAX_BACKOFF)"""
+        ratio = self.send_latency * 1000 / INTERIM_SEND_LATENCY_TARGET_MS
+        return min(INTERIM_MAX_BACKOFF, max(1.0, ratio))
+
+    def interval(self) -> float:
+        if self.max_hz <= 0:
+            return 0.0
+        return self.backoff() / self.max_hz
+
+    # [3] 중간 결과 입력
+    def submit(self, item):
+        """중간 결과 입력 -> 즉시 전달 또는 간격이 끝날 때까지 보관 (이전 보관 결과는 대체)"""
+        self.received += 1
+        if not self.enabled:
+            self.disabled_dropped += 1
+            return
+        if self.pending is not None:
+            self.superseded += 1
+        self.pending = item
+        if self.timer is not None:
+            return
+
+        wait = self.last_emit_at + self.interval() - time.monotonic()
+        if wait <= 0:
+            self._flush()
+        else:
+            self.timer = asyncio.get_running_loop().call_later(wait, self._flush)
+
+    def _flush(self):
+        self.timer = None
+        item, self.pending = self.pending, None
+        if item is None:
+            return
+        self.last_emit_at = time.monotonic()
+        self.forwarded += 1
+        self.emit(item)
+
+    def finalize(self, utterance_id):
+        """최종 결과 도착 -> 같은 발화의 보관 중인 중간 결과 폐기"""
+        if self.pending is not None and self.pending.get('utterance_id') == utterance_id:
+            self.finalized += 1
+            self._clear_pending()
+
+    def _clear_pending(self):
+        self.pending = None
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+    # [4] 소켓 전송 지연 반영
+    def observe_send(self, seconds: float):
+        """소켓 send 소요 시간 기록 (OutboundScheduler on_send)"""
+        self.send_latency += SEND_LATENCY_SMOOTHING * (seconds - self.send_latency)
+
+    def close(self):
+        self._clear_pending()
+
+    # 현재 상태 확인
+    def get_stats(self) -> dict:
+        return {
+            'enabled': self.enabled,
+            'max_hz': self.max_hz,
+            'effective_hz': round(1 / self.interval(), 2) if self.interval() else None,
+            'backoff': round(self.backoff(), 2),
+            'send_latency_ms': round(self.send_latency * 1000, 3),
+            'received': self.received,
+            'forwarded': self.forwarded,
+            'forward_ratio': round(self.forwarded / self.received, 3) if self.received else 0.0,
+            'superseded': self.superseded,
+            'finalized': self.finalized,
+            'disabled_dropped': self.disabled_dropped,
+        }
@@ -0,0 +1,62 @@
+# [core/language_demand.py]
+# 번역 언어 수요 관리 (구독자가 있는 언어만 번역)
+
+class LanguageDemand:
+    """
+    번역 언어별 구독자 수 (reference count)
+
+    - 구독자(소켓)는 원하는 번역 언어를 선언하고, 설정 메시지로 언제든 변경 가능
+    - 구독자가 1명 이상인 언어만 번역 -> 아무도 보지 않는 언어의 번역 호출 절약
+    """
+    # [1] 초기화
+    def __init__(self):
+        self.counts = {}                # 언어 -> 구독자 수
+
+        # 지표
+        self.translation_calls = 0      # 실제 번역한 (문장, 언어) 수
+        self.saved_calls = 0            # 구독자가 없어 생략한 (문장, 언어) 수
+
+    # [2] 수요 등록 / 해제
+    def add(self, languages: list[str]):
+        """구독자 1명의 선언 언어 추가"""
+        for lang in set(languages):
+            self.counts[lang] = self.counts.get(lang, 0) + 1
+
+    def remove(self, languages: list[str]):
+        """구독자 1명의 선언 언어 제거"""
+        for lang in set(languages):
+            remaining = self.counts.get(lang, 0) - 1
+            if remaining > 0:
+                self.counts[lang] = remaining
+            else:
+                self.counts.pop(lang, None)
+
+    def update(self, old_languages: list[str], new_languages: list[str]):
+        """구독자 1명의 선언 언어 변경"""
+        self.add(new_languages)
+        self.remove(old_languages)
+
+    # [3] 번역 대상 언어 선택
+    def active_languages(self, configured_languages: list[str]) -> list[str]:
+        """
+        구독자가 있는 언어만 반환
+
+        Args:
+            configured_languages: 세션에 설정된 번역 언어 (순서 유지)
+        Returns:
+            설정 언어 중 구독자가 있는 언어 (설정되지 않은 언어는 구독자가 있어도 번역 x - 번역 비용은 방 설정 범위 안에서만 발생)
+        """
+        return [lang for lang in configured_languages if self.counts.get(lang)]
+
+    def record_segment(self, configured_languages: list[str], active_languages: list[str]):
+        """최종 문장 1개의 번역 호출 / 절약 수 기록"""
+        self.translation_calls += len(active_languages)
+        self.saved_calls += len([lang for lang in configured_languages if lang not in active_languages])
+
+    # [4] 지표 반환
+    def get_stats(self) -> dict:
+        return {
+            'demand': dict(self.counts),
+            'translation_calls': self.translation_calls,
+            'saved_calls': self.saved_calls,
+        }
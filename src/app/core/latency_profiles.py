@@ -0,0 +1,83 @@
+# [core/latency_profiles.py]
+# 세션별 지연 프로파일 : 인식기(Azure) 설정 + 서버 중간 결과 전달 설정 묶음
+# interim_max_hz : 초당 최대 중간 결과 전달 횟수 (0이면 제한 x, 소켓 전송이 느려지면 자동으로 더 줄어듦)
+DEFAULT_LATENCY_PROFILE = "balanced"
+SUPPORTED_RECO_MODES = ("INTERACTIVE", "CONVERSATION", "DICTATION")
+
+# 인식기를 다시 만들어야 적용되는 항목 (인식기 풀 key / 무중단 교체 여부 판단)
+RECOGNIZER_FIELDS = ("initial_silence_ms", "segmentation_silence_ms", "end_silence_ms", "reco_mode")
+
+# initial_silence_ms가 None이면 인식 모드별 기본값 (단일 언어 3000ms / 다중 언어 1000ms)
+LATENCY_PROFILES = {
+    # 짧은 침묵에도 문장을 끊음 -> 최종 결과(번역)가 빨리 나오지만 문장이 잘게 나뉨
+    "low-latency": {
+        'initial_silence_ms': 1000,
+        'segmentation_silence_ms': 300,
+        'end_silence_ms': 300,
+        'reco_mode': "INTERACTIVE",
+        'interim_results': True,
+        'interim_max_hz': 10,
+    },
+    # 기존 기본 설정 (인식기 항목)
+    "balanced": {
+        'initial_silence_ms': None,
+        'segmentation_silence_ms': 700,
+        'end_silence_ms': 600,
+        'reco_mode': "INTERACTIVE",
+        'interim_results': True,
+        'interim_max_hz': 5,
+    },
+    # 긴 침묵까지 한 문장으로 인식 -> 문장 단위 정확도 우선 (강의 / 대화체)
+    "accurate": {
+        'initial_silence_ms': 5000,
+        'segmentation_silence_ms': 1200,
+        'end_silence_ms': 1000,
+        'reco_mode': "CONVERSATION",
+        'interim_results': True,
+        'interim_max_hz': 3,
+    },
+}
+
+def resolve_latency_profile(name: str = None, overrides: dict = None) -> dict:
+    """
+    프로파일 이름 + 항목별 덮어쓰기 -> 적용할 설정
+
+    Args:
+        name: 프로파일 이름 (None이면 기본 프로파일)
+        overrides: 덮어쓸 항목 (ex. {"segmentation_silence_ms": 500})
+    Returns:
+        {'name', 'overrides', 항목...}
+    """
+    name = name or DEFAULT_LATENCY_PROFILE
+    if name not in LATENCY_PROFILES:
+        raise ValueError(f"지원하지 않는 지연 프로파일입니다: {name} (지원: {', '.join(LATENCY_PROFILES)})")
+
+    profile = dict(LATENCY_PROFILES[name])
+    for field, value in (overrides or {}).items():
+        if field not in profile:
+            raise ValueError(f"지원하지 않는 지연 프로파일 항목입니다: {field}")
+        profile[field] = _validate(field, value)
+    return {'name': name, 'overrides': dict(overrides or {}), **profile}
+
+def _validate(field: str, value):
+    if field == "reco_mode":
+        if value not in SUPPORTED_RECO_MODES:
+            raise ValueError(f"지원하지 않는 인식 모드입니다: {value}")
+        return value
+    if field == "interim_results":
+        if not isinstance(value, bool):
+            raise ValueError(f"{field}는 true / false 값이어야 합니다")
+        return value
+    if field == "initial_silence_ms" and value is None:
+        return None
+    if field == "interim_max_hz":
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+            raise ValueError(f"{field}는 0 이상의 숫자여야 합니다")
+        return value
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise ValueError(f"{field}는 0 이상의 정수(ms)여야 합니다")
+    return value
+
+def recognizer_settings(profile: dict) -> tuple:
+    """인식기에 적용되는 항목만 추출 ((항목, 값), ...) - 비교 / dict key 용"""
+    return tuple((field, profile[field]) for field in RECOGNIZER_FIELDS)
@@ -0,0 +1,102 @@
+# [core/metrics.py]
+# 세션 / 모듈 성능 지표 수집
+import threading
+from collections import deque
+
+# [1] 지연 시간 기록기
+class LatencyRecorder:
+    """최근 샘플 기준 지연 시간 분위수 (p50/p95/p99) 계산"""
+    def __init__(self, max_samples: int = 1024):
+        self.samples = deque(maxlen=max_samples)    # 최근 샘플만 유지 (메모리 고정)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        """지연 시간(초) 기록"""
+        self.samples.append(seconds)
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, percent: float) -> float:
+        """최근 샘플의 분위수 (초) 반환"""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(round(percent / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def snapshot(self) -> dict:
+        """지표 반환 (ms 단위)"""
+        return {
+            'count': self.count,
+            'avg_ms': round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            'p50_ms': round(self.percentile(50) * 1000, 3),
+            'p95_ms': round(self.percentile(95) * 1000, 3),
+            'p99_ms': round(self.percentile(99) * 1000, 3),
+            'max_ms': round(self.max * 1000, 3),
+        }
+
+# [1-1] 지연 시간 분포 기록기
+class LatencyHistogram(LatencyRecorder):
+    """분위수 + 구간별 누적 건수 (최근 샘플이 아닌 전체 기록 기준)"""
+    DEFAULT_BUCKETS_MS = (50, 100, 200, 300, 500, 750, 1000, 2000, 5000)
+
+    def __init__(self, buckets_ms: tuple = DEFAULT_BUCKETS_MS, max_samples: int = 1024):
+        super().__init__(max_samples)
+        self.buckets_ms = buckets_ms
+        self.bucket_counts = [0] * (len(buckets_ms) + 1)     # 마지막 구간 : 상한 초과
+
+    def record(self, seconds: float):
+        super().record(seconds)
+        milliseconds = seconds * 1000
+        index = next((i for i, limit in enumerate(self.buckets_ms) if milliseconds <= limit), len(self.buckets_ms))
+        self.bucket_counts[index] += 1
+
+    def snapshot(self) -> dict:
+        stats = super().snapshot()
+        stats['buckets'] = {
+            **{f"<={limit}ms": count for limit, count in zip(self.buckets_ms, self.bucket_counts)},
+            f">{self.buckets_ms[-1]}ms": self.bucket_counts[-1],
+        }
+        return stats
+
+# [2] 지표 저장소
+class MetricsRegistry:
+    """지표 제공 함수 등록 -> /metrics 요청 시 한 번에 수집"""
+    def __init__(self):
+        self._providers = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, provider):
+        """
+        지표 제공 함수 등록
+
+        Args:
+            name: 지표 이름 (ex. "session.<id>")
+            provider: dict를 반환하는 함수
+        """
+        with self._lock:
+            self._providers[name] = provider
+
+    def unregister(self, name: str):
+        """지표 제공 함수 해제"""
+        with self._lock:
+            self._providers.pop(name, None)
+
+    def snapshot(self) -> dict:
+        """등록된 모든 지표 수집"""
+        with self._lock:
+            providers = list(self._providers.items())
+
+        results = {}
+        for name, provider in providers:
+            try:
+                results[name] = provider()
+            except Exception as e:
+                results[name] = {'error': str(e)}
+        return results
+
+metrics_registry = MetricsRegistry()
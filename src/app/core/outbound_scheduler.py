@@ -0,0 +1,115 @@
+# [core/outbound_scheduler.py]
+# 소켓별 결과 전송 스케줄러 (최종 결과 우선 + 밀린 결과 묶음 전송)
+import time
+from src.app.core.metrics import LatencyRecorder
+from src.app.core.frame_serializer import FrameSerializer
+
+DEFAULT_MAX_BATCH = 16      # batch 프레임 하나에 담을 최대 결과 수
+
+class OutboundScheduler:
+    """
+    WebSocket 하나에 대한 결과 전송 스케줄러
+
+    - 전송 대기 중인 결과 중 최종 결과(is_final=True)를 중간 결과보다 먼저 전송
+    - batch 모드(클라이언트 opt-in) : 소켓이 밀려 여러 결과가 준비된 경우
+      {"type": "batch", "items": [...]} 프레임 하나로 묶어서 전송
+    """
+    # [1] 초기화
+    def __init__(self, websocket, get_results, encode_item, batch_enabled: bool = False, max_batch: int = DEFAULT_MAX_BATCH, serializer: FrameSerializer = None, on_send=None):
+        """
+        Args:
+            websocket: 결과를 전송할 WebSocket
+            get_results: 최대 limit개의 결과를 대기 후 반환하는 비동기 함수 (최종 결과 우선)
+            encode_item: (결과 항목, serializer) -> 직렬화된 bytes 변환 함수 (None 반환 시 전송 생략)
+            batch_enabled: batch 프레임 사용 여부
+            max_batch: batch 프레임 하나에 담을 최대 결과 수
+            serializer: 프레임 직렬화기 (기본 JSON)
+            on_send: 프레임 전송 소요 시간(초)을 받을 함수 (ex. 중간 결과 빈도 제한의 자동 감속)
+        """
+        self.websocket = websocket
+        self.get_results = get_results
+        self.encode_item = encode_item
+        self.batch_enabled = batch_enabled
+        self.max_batch = max_batch
+        self.serializer = serializer or FrameSerializer()
+        self.on_send = on_send
+
+        # 지표
+        self.frames_sent = 0
+        self.items_sent = 0
+        self.batch_frames = 0
+        self.bytes_sent = 0
+        self.replayed_sent = 0      # 재연결 후 재전송한 결과 (지연 지표 제외)
+        self.send_latency = LatencyRecorder()       # send 호출 소요 시간
+        self.final_latency = LatencyRecorder()      # 최종 결과 큐 저장 -> 전송 완료
+        self.interim_latency = LatencyRecorder()    # 중간 결과 큐 저장 -> 전송 완료
+
+    # [2] 전송 루프
+    async def run(self):
+        """결과가 준비될 때마다 전송 (폴링 x)"""
+        print("번역 결과 전송 태스크 시작")
+
+        while True:
+            try:
+                # batch 모드가 아니면 한 번에 하나씩 (최종 결과 우선)
+                limit = self.max_batch if self.batch_enabled else 1
+                items = await self.get_results(limit)
+                if not items:
+                    continue
+
+                serializer = self.serializer
+                parts = [self.encode_item(item, serializer) for item in items]
+                parts = [part for part in parts if part is not None]
+                if not parts:
+                    continue
+                if len(parts) == 1:
+                    frame = parts[0]
+                else:
+                    frame = serializer.encode_batch(parts)
+                    self.batch_frames += 1
+
+                started = time.perf_counter()
+                await serializer.send(self.websocket, frame)
+                finished = time.perf_counter()
+
+                self.bytes_sent += len(frame)
+                self._record(items, started, finished)
+                if self.on_send is not None:
+                    self.on_send(finished - started)
+                print(f"클라이언트에 번역 결과 전송 완료 ({len(items)}건)")
+
+            except Exception as e:
+                print(f"번역 결과 전송 오류: {e}")
+                break
+
+    def _record(self, items: list[dict], started: float, finished: float):
+        self.frames_sent += 1
+        self.items_sent += len(items)
+        self.send_latency.record(finished - started)
+        for item in items:
+            if item.get('replayed'):
+                # 재전송 결과는 소켓이 끊긴 동안 링 버퍼에 있었음 -> 파이프라인 지연이 아님
+                self.replayed_sent += 1
+                continue
+            queued_at = item.get('queued_at')
+            if queued_at is None:
+                continue
+            if item.get('is_final'):
+                self.final_latency.record(finished - queued_at)
+            else:
+                self.interim_latency.record(finished - queued_at)
+
+    # [3] 지표 반환
+    def get_stats(self) -> dict:
+        return {
+            'batch_enabled': self.batch_enabled,
+            'wire_format': self.serializer.wire_format,
+            'frames_sent': self.frames_sent,
+            'items_sent': self.items_sent,
+            'batch_frames': self.batch_frames,
+            'bytes_sent': self.bytes_sent,
+            'replayed_sent': self.replayed_sent,
+            'send_latency': self.send_latency.snapshot(),
+            'final_latency': self.final_latency.snapshot(),
+            'interim_latency': self.interim_latency.snapshot(),
+        }
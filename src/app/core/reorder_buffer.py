@@ -0,0 +1,129 @@
+# [core/reorder_buffer.py]
+# 세션별 최종 결과 순서 보장 (번역은 동시에, 전달은 인식 순서대로 + 최대 대기 시간)
+import asyncio
+import os
+from src.app.core.metrics import LatencyRecorder
+
+REORDER_MAX_WAIT_MS = float(os.getenv("REORDER_MAX_WAIT_MS", "1500"))     # 앞 문장 번역을 기다리는 최대 시간
+
+class ReorderBuffer:
+    """
+    인식 순서 번호(segment_seq) 기준으로 최종 결과 전달
+
+    - 최종 인식 결과마다 next_seq()로 번호 발급 -> 번역은 동시에 진행
+    - complete(seq, item) : 앞 번호가 모두 끝났으면 바로 전달, 아니면 보관
+    - 앞 번호 번역이 max_wait 이상 끝나지 않으면 건너뛰고 보관 중인 결과 전달 (느린 번역 1개가 자막 전체를 막지 않음)
+    - 건너뛴 번호의 결과가 늦게 끝나면 버리지 않고 바로 전달 (late)
+    - item이 None이면 (번역 실패 / 결과 없음) 전달 없이 순서만 진행
+    """
+    # [1] 초기화
+    def __init__(self, release, max_wait_ms: float = REORDER_MAX_WAIT_MS, loop=None):
+        """
+        Args:
+            release: 결과 전달 함수 (이벤트 루프 스레드에서 호출)
+            max_wait_ms: 앞 번호를 기다리는 최대 시간 (ms)
+            loop: 시각(time) / 대기 타이머(call_later) 기준 (None이면 호출 시점의 실행 중인 이벤트 루프, 테스트에서 교체)
+        """
+        self.release = release
+        self.max_wait = max_wait_ms / 1000
+        self.loop = loop
+
+        self.next_issue = 0             # 다음에 발급할 번호
+        self.next_release = 0           # 다음에 전달할 번호
+        self.waiting = {}               # seq -> (완료 시각, item) : 앞 번호를 기다리는 결과
+        self.skipped = set()            # 대기 시간 초과로 건너뛴 번호 (늦게 완료되면 바로 전달)
+        self.timer = None
+
+        # 지표
+        self.released = 0
+        self.reordered = 0              # 앞 번호를 기다렸다가 전달된 결과
+        self.skipped_count = 0
+        self.late = 0                   # 건너뛴 뒤 늦게 전달된 결과
+        self.max_waiting = 0
+        self.hold_time = LatencyRecorder()      # 완료 -> 전달 대기 시간
+
+    # [2] 번호 발급 (최종 인식 결과 도착 시)
+    def next_seq(self) -> int:
+        seq = self.next_issue
+        self.next_issue += 1
+        return seq
+
+    # [3] 번역 완료
+    def complete(self, seq: int, item: dict = None):
+        if item is not None:
+            item['segment_seq'] = seq
+
+        if seq in self.skipped:
+            self.skipped.discard(seq)
+            if item is not None:
+                self.late += 1
+                self._release(item, 0.0)
+            return
+        if seq < self.next_release:
+            return
+
+        self.waiting[seq] = (self._loop().time(), item)
+        self.max_waiting = max(self.max_waiting, len(self.waiting))
+        self._drain(seq)
+
+    def _drain(self, completed_seq: int = None):
+        """앞에서부터 끝난 번호 연속 전달 + 막혀 있으면 대기 타이머 예약"""
+        loop = self._loop()
+        now = loop.time()
+        while self.next_release in self.waiting:
+            seq = self.next_release
+            completed_at, item = self.waiting.pop(seq)
+            self.next_release += 1
+            if item is not None:
+                if seq != completed_seq:
+                    self.reordered += 1
+                self._release(item, now - completed_at)
+
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        if self.waiting:
+            oldest = min(completed_at for completed_at, _ in self.waiting.values())
+            delay = max(0.0, oldest + self.max_wait - now)
+            self.timer = loop.call_later(delay, self._on_timeout)
+
+    def _on_timeout(self):
+        """가장 오래 기다린 결과 앞의 끝나지 않은 번호 건너뛰기"""
+        self.timer = None
+        if not self.waiting:
+            return
+        first_waiting = min(self.waiting)
+        for seq in range(self.next_release, first_waiting):
+            self.skipped.add(seq)
+            self.skipped_count += 1
+        self.next_release = first_waiting
+        self._drain()
+
+    def _loop(self):
+        return self.loop or asyncio.get_running_loop()
+
+    def _release(self, item: dict, held: float):
+        self.hold_time.record(held)
+        self.released += 1
+        self.release(item)
+
+    # [4] 종료
+    def close(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        self.waiting.clear()
+        self.skipped.clear()
+
+    # 현재 상태 확인
+    def get_stats(self) -> dict:
+        return {
+            'issued': self.next_issue,
+            'released': self.released,
+            'waiting': len(self.waiting),
+            'max_waiting': self.max_waiting,
+            'reordered': self.reordered,
+            'skipped': self.skipped_count,
+            'late': self.late,
+            'hold_time': self.hold_time.snapshot(),
+        }
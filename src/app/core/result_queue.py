@@ -0,0 +1,152 @@
+# [core/result_queue.py]
+# 세션별 결과 큐 (크기 제한 + 오래된 중간 결과 대체)
+import asyncio
+import time
+from collections import deque
+
+class BoundedResultQueue:
+    """
+    크기가 제한된 세션 결과 큐 (이벤트 루프 스레드 전용)
+
+    큐 항목은 'is_final', 'utterance_id' 키를 가진 dict.
+    - 같은 발화의 새 중간 결과 -> 대기 중인 이전 중간 결과를 그 자리에서 대체 (superseded)
+    - 최종 결과 -> 같은 발화의 대기 중인 중간 결과 제거 (superseded)
+    - 큐가 가득 참 -> 가장 오래된 중간 결과 삭제 (dropped), 최종 결과는 절대 삭제하지 않음
+    """
+    # [1] 초기화
+    def __init__(self, maxsize: int = 32):
+        self.maxsize = maxsize
+        self._items = deque()
+        self._getters = deque()     # get() 대기 중인 future
+
+        # 지표
+        self.put_count = 0
+        self.dropped = 0            # 큐 초과로 삭제된 중간 결과
+        self.superseded = 0         # 새 결과로 대체된 중간 결과
+        self.overflow_finals = 0    # 큐 초과 상태에서 추가된 최종 결과 (삭제 x)
+        self.max_depth = 0
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    # [2] 결과 추가
+    def put_nowait(self, item: dict):
+        """결과 추가 (대기 x) - 중간 결과는 대체/삭제될 수 있음"""
+        self.put_count += 1
+        item.setdefault('queued_at', time.perf_counter())     # 전송 지연 측정용
+        utterance_id = item.get('utterance_id')
+
+        if item.get('is_final'):
+            # 같은 발화의 대기 중인 중간 결과는 더 이상 의미 없음
+            self.discard_interims(utterance_id)
+        else:
+            # 같은 발화의 대기 중인 중간 결과가 있으면 최신 결과로 교체 (순서 유지)
+            for index, queued in enumerate(self._items):
+                if not queued.get('is_final') and queued.get('utterance_id') == utterance_id:
+                    self._items[index] = item
+                    self.superseded += 1
+                    return
+
+        if len(self._items) >= self.maxsize:
+            if not self._drop_oldest_interim():
+                if not item.get('is_final'):
+                    # 최종 결과로만 가득 찬 경우 -> 새 중간 결과를 버림
+                    self.dropped += 1
+                    return
+                self.overflow_finals += 1
+
+        self._items.append(item)
+        if len(self._items) > self.max_depth:
+            self.max_depth = len(self._items)
+        self._wakeup_next()
+
+    async def put(self, item: dict):
+        """asyncio.Queue 호환용 (대기 없이 추가)"""
+        self.put_nowait(item)
+
+    def discard_interims(self, utterance_id) -> int:
+        """같은 발화의 대기 중인 중간 결과 제거"""
+        before = len(self._items)
+        self._items = deque(
+            queued for queued in self._items
+            if queued.get('is_final') or queued.get('utterance_id') != utterance_id
+        )
+        removed = before - len(self._items)
+        self.superseded += removed
+        return removed
+
+    def _drop_oldest_interim(self) -> bool:
+        """가장 오래된 중간 결과 삭제 -> 삭제 여부 반환"""
+        for index, queued in enumerate(self._items):
+            if not queued.get('is_final'):
+                del self._items[index]
+                self.dropped += 1
+                return True
+        return False
+
+    # [3] 결과 꺼내기
+    def get_nowait(self) -> dict:
+        if not self._items:
+            raise asyncio.QueueEmpty
+        return self._items.popleft()
+
+    async def get(self) -> dict:
+        """결과가 들어올 때까지 대기 후 반환"""
+        await self._wait_not_empty()
+        return self._items.popleft()
+
+    async def _wait_not_empty(self):
+        while not self._items:
+            getter = asyncio.get_running_loop().create_future()
+            self._getters.append(getter)
+            try:
+                await getter
+            except:
+                getter.cancel()
+                try:
+                    self._getters.remove(getter)
+                except ValueError:
+                    pass
+                # 깨운 뒤 취소된 경우 -> 다음 대기자에게 넘김
+                if self._items and not getter.cancelled():
+                    self._wakeup_next()
+                raise
+
+    async def get_batch(self, limit: int) -> list[dict]:
+        """
+        결과가 들어올 때까지 대기 후 최대 limit개 반환 (최종 결과 우선)
+
+        Args:
+            limit: 한 번에 꺼낼 최대 개수
+        """
+        await self._wait_not_empty()
+
+        finals = [queued for queued in self._items if queued.get('is_final')]
+        interims = [queued for queued in self._items if not queued.get('is_final')]
+        batch = (finals + interims)[:limit]
+
+        taken = set(map(id, batch))
+        self._items = deque(queued for queued in self._items if id(queued) not in taken)
+        return batch
+
+    def _wakeup_next(self):
+        while self._getters:
+            getter = self._getters.popleft()
+            if not getter.done():
+                getter.set_result(None)
+                break
+
+    # [4] 지표 반환
+    def get_stats(self) -> dict:
+        return {
+            'depth': len(self._items),
+            'max_depth': self.max_depth,
+            'maxsize': self.maxsize,
+            'put': self.put_count,
+            'dropped': self.dropped,
+            'superseded': self.superseded,
+            'overflow_finals': self.overflow_finals,
+        }
@@ -0,0 +1,109 @@
+# [core/transcript_store.py]
+# 세션별 최종 인식 결과(자막 원문) 누적 -> 발화 정제 요청 시 full_text 업로드 없이 사용
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from src.app.core.metrics import metrics_registry
+
+TRANSCRIPT_RETENTION_SECONDS = float(os.getenv("TRANSCRIPT_RETENTION_SECONDS", "21600"))   # 세션 종료 후 보관 시간 (기본 6시간)
+MAX_TRANSCRIPTS = int(os.getenv("MAX_TRANSCRIPTS", "1000"))                                  # 보관하는 세션 수 상한
+
+class SessionTranscript:
+    """세션 1개의 최종 인식 결과 (추가만 가능)"""
+    # [1] 초기화
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        self.access_token = secrets.token_urlsafe(16)     # 원문 조회 권한 (세션을 연 클라이언트에게만 ready 응답으로 전달)
+        self.started_at = time.time()
+        self.closed_at = None
+        self.segments = []          # {'text', 'language', 'timestamp', 'offset'}
+        self.char_count = 0
+
+    # [2] 최종 결과 추가
+    def append(self, text: str, language: str, offset=None):
+        """
+        Args:
+            text: 최종 인식 문장
+            language: 인식 언어
+            offset: 인식기 기준 발화 시작 위치 (Azure offset, 100ns 단위)
+        """
+        self.segments.append({
+            'text': text,
+            'language': language,
+            'timestamp': time.time(),
+            'offset': offset,
+        })
+        self.char_count += len(text)
+
+    # [3] 전체 원문
+    def full_text(self) -> str:
+        return "\n".join(segment['text'] for segment in self.segments)
+
+    def languages(self) -> list[str]:
+        """등장한 인식 언어 (등장 순서)"""
+        return list(dict.fromkeys(segment['language'] for segment in self.segments if segment['language']))
+
+
+class TranscriptStore:
+    """
+    session_id -> SessionTranscript
+
+    - 세션 종료 후에도 보관 시간 동안 유지 (종료 직후 정제 요청 대비)
+    - 보관 시간이 지났거나 상한을 넘으면 오래된 것부터 제거
+    - 조회는 session_id + access_token이 모두 맞을 때만 (session_id만 알아서는 다른 세션 원문 조회 x)
+    """
+    # [1] 초기화
+    def __init__(self):
+        self._transcripts = OrderedDict()
+        self._lock = threading.Lock()
+
+    # [2] 세션 시작 / 종료
+    def create(self, session_id: str) -> SessionTranscript:
+        transcript = SessionTranscript(session_id)
+        with self._lock:
+            self._evict()
+            self._transcripts[session_id] = transcript
+        return transcript
+
+    def close(self, session_id: str):
+        with self._lock:        # 다른 스레드의 _evict와 closed_at 기록이 엇갈리지 않도록
+            transcript = self._transcripts.get(session_id)
+            if transcript is not None and transcript.closed_at is None:
+                transcript.closed_at = time.time()
+
+    # [3] 조회
+    def get(self, session_id: str, access_token: str):
+        """없거나 보관 시간이 지났거나 access_token이 다르면 None (존재 여부를 구분하지 않음)"""
+        with self._lock:
+            self._evict()
+            transcript = self._transcripts.get(session_id)
+        if transcript is None or not access_token or not secrets.compare_digest(transcript.access_token, access_token):
+            return None
+        return transcript
+
+    def _evict(self):
+        now = time.time()
+        expired = [
+            session_id for session_id, transcript in self._transcripts.items()
+            if transcript.closed_at is not None and now - transcript.closed_at > TRANSCRIPT_RETENTION_SECONDS
+        ]
+        for session_id in expired:
+            del self._transcripts[session_id]
+        while len(self._transcripts) > MAX_TRANSCRIPTS:
+            self._transcripts.popitem(last=False)
+
+    # 현재 상태 확인
+    def get_stats(self) -> dict:
+        with self._lock:
+            transcripts = list(self._transcripts.values())
+        return {
+            'transcripts': len(transcripts),
+            'active': sum(1 for transcript in transcripts if transcript.closed_at is None),
+            'segments': sum(len(transcript.segments) for transcript in transcripts),
+            'chars': sum(transcript.char_count for transcript in transcripts),
+        }
+
+transcript_store = TranscriptStore()
+metrics_registry.register("transcripts", transcript_store.get_stats)
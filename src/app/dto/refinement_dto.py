@@ -8,7 +8,10 @@ from typing import Optional, List
 # [1] 발화 정제
 # Request
 class SpeechRefineRequest(BaseModel):
-    full_text: str
+    # 원문 : session_id(서버에 누적된 세션 원문) 또는 full_text(직접 전달) 중 하나
+    session_id: Optional[str] = None
+    transcript_token: Optional[str] = None      # session_id 사용 시 필수 (세션 ready 응답의 transcript_token)
+    full_text: Optional[str] = None
     fileName : str = "speech"  # 기본 파일 이름
     fileFormat: str = "txt"  # 기본 파일 형식은 txt
 
@@ -47,7 +50,10 @@ class SpeechRefineResponse(BaseModel):
         )
 
 class SpeechRefineConferenceRequest(BaseModel):
-    full_text: str
+    # 원문 : session_id(서버에 누적된 세션 원문) 또는 full_text(직접 전달) 중 하나
+    session_id: Optional[str] = None
+    transcript_token: Optional[str] = None      # session_id 사용 시 필수 (세션 ready 응답의 transcript_token)
+    full_text: Optional[str] = None
     fileName: str = "conference_speech"  # 기본 파일 이름
     fileFormat: str = "txt"  # 기본 파일 형식은 txt
 
@@ -1,19 +1,55 @@
 # [dto/speech_translation_dto.py] 
 # 발화 정제 요청 & 응답 클래스 
 from pydantic import BaseModel
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 # [1]-1 단일 인식 언어 설정 메시지 (Request)
 class ConfigMessage(BaseModel):
     type: str = "setting" 
     input_language: str                    # 음성 인식 언어
     target_languages: list[str]            # 번역 출력 언어
+    batch: bool = False                    # 밀린 결과 묶음 전송 (batch 프레임) 사용 여부
+    delta: bool = False                    # 중간 결과를 바뀐 부분만 전송 (delta 프레임) 사용 여부
+    format: str = "json"                   # 결과 전송 형식 : "json"(텍스트 프레임) | "msgpack"(바이너리 프레임)
+    codec: str = "pcm"                     # 입력 오디오 코덱 : "pcm" | "opus"(Ogg 또는 WebM 컨테이너)
+    sample_rate: int = 16000               # pcm 입력 샘플레이트 (16000이 아니면 서버에서 리샘플링)
+    channels: int = 1                      # pcm 입력 채널 수 (2 이상이면 서버에서 다운믹스)
+    sample_format: str = "s16"             # pcm 샘플 형식 : "s16"(16bit 정수) | "f32"(32bit 실수)
+    vad: bool = False                      # 침묵 구간 오디오를 STT로 보내지 않음 (음성 구간 게이트)
+    record: bool = False                   # 입력 오디오를 서버에 녹음 (자막 오류 재현용)
+    profile: str = "balanced"              # 지연 프로파일 : "low-latency" | "balanced" | "accurate"
+    profile_overrides: Optional[Dict[str, Any]] = None     # 프로파일 항목별 덮어쓰기 (ex. {"segmentation_silence_ms": 500})
+    incremental: bool = False              # 최종 결과를 번역 언어별로 끝나는 즉시 전송 (translation 프레임, segment_seq로 병합)
+    resume_token: Optional[str] = None     # 재연결 시 : 이전 ready 메시지로 받은 토큰 (초기 설정 메시지에서만 사용)
+    last_seq: Optional[int] = None         # 재연결 시 : 마지막으로 받은 결과 seq (이후 최종 결과만 재전송)
 
 # [1]-2 다중 인식 언어 설정 메시지 (Request)
 class MultipleConfigMessage(BaseModel):
     type: str = "setting" 
     input_languages: list[str]                    # 음성 인식 언어
     target_languages: list[str]            # 번역 출력 언어
+    batch: bool = False                    # 밀린 결과 묶음 전송 (batch 프레임) 사용 여부
+    delta: bool = False                    # 중간 결과를 바뀐 부분만 전송 (delta 프레임) 사용 여부
+    format: str = "json"                   # 결과 전송 형식 : "json"(텍스트 프레임) | "msgpack"(바이너리 프레임)
+    codec: str = "pcm"                     # 입력 오디오 코덱 : "pcm" | "opus"(Ogg 또는 WebM 컨테이너)
+    sample_rate: int = 16000               # pcm 입력 샘플레이트 (16000이 아니면 서버에서 리샘플링)
+    channels: int = 1                      # pcm 입력 채널 수 (2 이상이면 서버에서 다운믹스)
+    sample_format: str = "s16"             # pcm 샘플 형식 : "s16"(16bit 정수) | "f32"(32bit 실수)
+    vad: bool = False                      # 침묵 구간 오디오를 STT로 보내지 않음 (음성 구간 게이트)
+    record: bool = False                   # 입력 오디오를 서버에 녹음 (자막 오류 재현용)
+    profile: str = "balanced"              # 지연 프로파일 : "low-latency" | "balanced" | "accurate"
+    profile_overrides: Optional[Dict[str, Any]] = None     # 프로파일 항목별 덮어쓰기 (ex. {"segmentation_silence_ms": 500})
+    incremental: bool = False              # 최종 결과를 번역 언어별로 끝나는 즉시 전송 (translation 프레임, segment_seq로 병합)
+    resume_token: Optional[str] = None     # 재연결 시 : 이전 ready 메시지로 받은 토큰 (초기 설정 메시지에서만 사용)
+    last_seq: Optional[int] = None         # 재연결 시 : 마지막으로 받은 결과 seq (이후 최종 결과만 재전송)
+
+# [1]-3 방송 모드 청취자 설정 메시지 (Request)
+class ListenerConfigMessage(BaseModel):
+    type: str = "setting"
+    batch: bool = False                    # 밀린 결과 묶음 전송 (batch 프레임) 사용 여부
+    delta: bool = False                    # 중간 결과를 바뀐 부분만 전송 (delta 프레임) 사용 여부
+    format: str = "json"                   # 결과 전송 형식 : "json"(텍스트 프레임) | "msgpack"(바이너리 프레임)
+    languages: Optional[list[str]] = None  # 받아볼 번역 언어 (None이면 방에 설정된 번역 언어 전체)
 
 # [2] 번역 결과 반환 (Response)
 class TranslationResult(BaseModel):
@@ -21,19 +57,37 @@ class TranslationResult(BaseModel):
     result_text: str
 class SpeechTranslationResponse(BaseModel):
     type: str = "result"
+    seq: Optional[int] = None
+    segment_seq: Optional[int] = None      # 최종 결과 인식 순서 번호 (대기 시간 초과로 늦게 전달된 결과 구분용)
     is_final: bool
     translations: Dict[str, TranslationResult]
 
 # [2]-2 원문 지정 번역 결과 반환 (Response) 
 class SeparatedSpeechTranslationResponse(BaseModel):
     type: str = "result"
+    seq: Optional[int] = None
+    segment_seq: Optional[int] = None      # 최종 결과 인식 순서 번호 (대기 시간 초과로 늦게 전달된 결과 구분용)
     is_final: bool
     original: Dict[str, TranslationResult]
     translations: Dict[str, TranslationResult]
 
+# [2]-3 언어별 즉시 전달 번역 결과 (Response) - incremental 설정 시 최종 결과 대신 언어마다 전송
+class TranslationUpdateResponse(BaseModel):
+    type: str = "translation"
+    seq: Optional[int] = None
+    segment_seq: Optional[int] = None      # 같은 문장의 원문 / 언어별 결과는 같은 번호
+    is_final: bool = True
+    original: bool = False                 # True : 원문 (인식 직후 전송)
+    translation: TranslationResult
+
 # 상태 반환 (Response)
 class StatusMessage(BaseModel):
     type: str = "status"
     status: str                           # "ready", "error", "disconnected"
     message: Optional[str] = None         # nullable str형 : msg
-    error_code: Optional[str] = None      # nullable str형 : error 코드
\ No newline at end of file
+    error_code: Optional[str] = None      # nullable str형 : error 코드
+    room_id: Optional[str] = None         # 방송 모드 방 id (발화자 ready 응답에 포함)
+    session_id: Optional[str] = None      # 세션 id (ready 응답에 포함)
+    resume_token: Optional[str] = None    # 재연결 토큰 (ready 응답에 포함, 연결이 끊기면 유예 시간 안에 설정 메시지로 전달)
+    transcript_token: Optional[str] = None    # 세션 원문 조회 토큰 (ready 응답에 포함, 발화 정제 요청에 session_id와 함께 전달)
+    latency_profile: Optional[Dict[str, Any]] = None      # 적용된 지연 프로파일 (ready 응답에 포함)
@@ -0,0 +1,150 @@
+# [interfaces/broadcast_room.py]
+# 강의 방송 모드 : 발화자 세션 1개 -> 다수 청취자 소켓
+import asyncio
+import secrets
+from src.app.core.interim_throttle import InterimThrottle
+from src.app.core.language_demand import LanguageDemand
+from src.app.core.metrics import metrics_registry
+from src.app.core.result_queue import BoundedResultQueue
+from src.app.interfaces.single_speech_translation_interface import SingleSpeechTranslationInterface
+
+SUBSCRIBER_QUEUE_SIZE = 32      # 구독자(소켓)별 결과 큐 최대 크기
+FANOUT_BATCH = 64               # 한 번에 꺼내서 나눠줄 최대 결과 수
+
+class BroadcastRoom:
+    """
+    방송 방 하나 = 발화자 인식 세션 1개 + 구독자 N명
+
+    - STT 인식 / 번역은 방에서 한 번만 수행 (구독자 수와 무관)
+    - 결과 항목은 구독자별 큐에 같은 객체로 전달 -> 직렬화도 형식별로 한 번만 수행
+    - 구독자별 큐가 따로 있으므로 느린 청취자가 다른 청취자를 막지 않음
+    - 중간 결과 자동 감속도 구독자별 (각 소켓의 전송 지연만 반영 -> 느린 청취자 1명이 방 전체 중간 결과를 줄이지 않음)
+    - 구독자가 선언한 언어만 번역 (구독자가 없는 언어는 번역 호출 생략)
+    - 구독자는 방에 설정된 번역 언어 중에서만 선택 가능 (설정 밖 언어는 무시 -> 방 주인이 정하지 않은 번역 비용 x)
+    """
+    # [1] 초기화
+    def __init__(self, interface: SingleSpeechTranslationInterface = None):
+        """
+        Args:
+            interface: 발화자 인식 세션 (None이면 새 SingleSpeechTranslationInterface)
+        """
+        self.room_id = secrets.token_urlsafe(6)
+        self.interface = interface or SingleSpeechTranslationInterface()
+        self.language_demand = LanguageDemand()
+        self.interface.language_demand = self.language_demand
+
+        self.subscribers = {}               # subscriber_id -> 결과 큐
+        self.subscriber_throttles = {}      # subscriber_id -> 중간 결과 빈도 제한 (해당 소켓 전송 지연으로 감속)
+        self.subscriber_languages = {}      # subscriber_id -> 선언한 번역 언어
+        self.closed = asyncio.Event()       # 방 종료 알림 (청취자 연결 정리용)
+        self.fanout_task = None
+        self.next_seq = 1                   # 결과 순번 (청취자 간 동일)
+
+        # 지표
+        self.items_fanned_out = 0           # 방에서 꺼낸 결과 수
+        self.deliveries = 0                 # 구독자 큐에 전달한 횟수 (결과 수 x 구독자 수)
+        self.peak_subscribers = 0
+
+    # [2] 방 열기
+    async def open(self, input_language: str, target_languages: list[str]):
+        """발화자 인식 세션 시작 + 결과 분배 태스크 시작"""
+        await self.interface.start_session(input_language, target_languages)
+        self.fanout_task = asyncio.create_task(self._fan_out())
+        metrics_registry.register(f"room.{self.room_id}", self.get_status)
+        print(f"방송 방 생성: {self.room_id}")
+
+    # [3] 구독 관리
+    def unavailable_languages(self, languages: list[str]) -> list[str]:
+        """방에 설정되지 않은 번역 언어 목록"""
+        configured = self.interface.current_target_languages or []
+        return [lang for lang in languages if lang not in configured]
+
+    def _allowed(self, languages: list[str]) -> list[str]:
+        configured = self.interface.current_target_languages or []
+        return [lang for lang in languages if lang in configured]
+
+    def subscribe(self, languages: list[str]) -> tuple[str, BoundedResultQueue, InterimThrottle]:
+        """
+        구독자 추가 -> (subscriber_id, 결과 큐, 중간 결과 빈도 제한) 반환
+        - 소켓 전송 스케줄러의 on_send를 반환된 빈도 제한의 observe_send로 연결
+
+        Args:
+            languages: 구독자가 받아볼 번역 언어 (방에 설정되지 않은 언어는 무시)
+        """
+        languages = self._allowed(languages)
+        subscriber_id = secrets.token_hex(4)
+        queue = BoundedResultQueue(SUBSCRIBER_QUEUE_SIZE)
+        base = self.interface.interim_throttle
+        self.subscribers[subscriber_id] = queue
+        self.subscriber_throttles[subscriber_id] = InterimThrottle(queue.put_nowait, base.max_hz)     # 방 설정(전달 여부)은 발화자 세션에서 이미 적용
+        self.subscriber_languages[subscriber_id] = languages
+        self.language_demand.add(languages)
+        self.peak_subscribers = max(self.peak_subscribers, len(self.subscribers))
+        print(f"방송 방 {self.room_id} 구독자 추가: {subscriber_id} (총 {len(self.subscribers)}명)")
+        return subscriber_id, queue, self.subscriber_throttles[subscriber_id]
+
+    def unsubscribe(self, subscriber_id: str):
+        """구독자 제거"""
+        if self.subscribers.pop(subscriber_id, None) is not None:
+            self.subscriber_throttles.pop(subscriber_id).close()
+            self.language_demand.remove(self.subscriber_languages.pop(subscriber_id, []))
+            print(f"방송 방 {self.room_id} 구독자 제거: {subscriber_id} (총 {len(self.subscribers)}명)")
+
+    def set_languages(self, subscriber_id: str, languages: list[str]):
+        """구독자의 번역 언어 변경 (다음 문장부터 반영, 방에 설정되지 않은 언어는 무시)"""
+        if subscriber_id not in self.subscribers:
+            return
+        languages = self._allowed(languages)
+        self.language_demand.update(self.subscriber_languages[subscriber_id], languages)
+        self.subscriber_languages[subscriber_id] = languages
+
+    # [4] 결과 분배
+    async def _fan_out(self):
+        """번역 결과를 모든 구독자 큐에 전달 (중간 결과는 구독자별 빈도 제한을 거쳐 전달)"""
+        while True:
+            try:
+                items = await self.interface.get_translation_results(FANOUT_BATCH)
+                base = self.interface.interim_throttle      # 방 전체 상한 (지연 프로파일)
+                for item in items:
+                    item['seq'] = self.next_seq
+                    self.next_seq += 1
+                    self.items_fanned_out += 1
+                    is_final = item.get('is_final', False)
+                    for subscriber_id, queue in list(self.subscribers.items()):
+                        throttle = self.subscriber_throttles[subscriber_id]
+                        # 같은 객체 공유 -> 형식별 직렬화 캐시 공유
+                        if is_final:
+                            throttle.finalize(item.get('utterance_id'))
+                            queue.put_nowait(item)
+                        else:
+                            if throttle.max_hz != base.max_hz:       # 발화자가 지연 프로파일을 바꾼 경우
+                                throttle.configure(base.max_hz, True)
+                            throttle.submit(item)
+                        self.deliveries += 1
+            except Exception as e:
+                print(f"방송 결과 분배 오류: {e}")
+                break
+
+    # [5] 방 종료
+    def close(self):
+        """인식 세션 종료 + 청취자에게 종료 알림"""
+        if self.fanout_task is not None and not self.fanout_task.done():
+            self.fanout_task.cancel()
+        self.interface.stop_session()
+        metrics_registry.unregister(f"room.{self.room_id}")
+        self.closed.set()
+        print(f"방송 방 종료: {self.room_id}")
+
+    # 현재 방 상태 확인
+    def get_status(self) -> dict:
+        return {
+            'room_id': self.room_id,
+            'subscribers': len(self.subscribers),
+            'peak_subscribers': self.peak_subscribers,
+            'items_fanned_out': self.items_fanned_out,
+            'deliveries': self.deliveries,
+            'session': self.interface.get_status(),
+        }
+
+# 방 목록 (room_id -> BroadcastRoom)
+broadcast_rooms: dict[str, BroadcastRoom] = {}
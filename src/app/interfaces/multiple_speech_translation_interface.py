@@ -1,27 +1,70 @@
 # [interfaces/multiple_speech_translation_interface.py]
 # 실시간 번역 인터페이스 (AI 모듈 조합)
 import asyncio
-from src.app.modules.stt.azure_stt_multiple import AzureSTTMultiple
-from src.app.modules.translation.google_translator import GoogleTranslator
+import uuid
+from src.app.core.interim_throttle import InterimThrottle
+from src.app.core.latency_profiles import resolve_latency_profile, recognizer_settings
+from src.app.core.metrics import metrics_registry
+from src.app.core.reorder_buffer import ReorderBuffer
+from src.app.core.result_queue import BoundedResultQueue
+from src.app.core.transcript_store import transcript_store
+from src.app.modules.audio.audio_decoder import create_audio_decoder
+from src.app.modules.audio.pcm_converter import create_pcm_converter
+from src.app.modules.audio.session_recorder import SessionRecorder
+from src.app.modules.audio.vad_gate import VadGate
+from src.app.modules.stt.base_stt import BaseSTT
+from src.app.modules.stt.recognizer_pool import recognizer_pool
+from src.app.modules.translation.translator import Translator
+
+TRANSLATION_RESULT_QUEUE_SIZE = 32     # 세션별 번역 결과 큐 최대 크기
 
 class MultipleSpeechTranslationInterface:
     # [1] 초기화
-    def __init__(self):
-        """STT + Translation 인터페이스 초기화"""
+    def __init__(self, stt: BaseSTT = None, translator=None):
+        """
+        STT + Translation 인터페이스 초기화
+
+        Args:
+            stt: STT 백엔드 (None이면 세션 시작 시 인식기 풀에서 가져옴 - STT_BACKEND 설정)
+            translator: 번역기 (None이면 Translator - TRANSLATION_ROUTES 설정의 번역 제공자)
+        """
          # STT &번역기 초기화
-        self.stt = AzureSTTMultiple()
-        self.translator = GoogleTranslator()
-        self.translator.setup_translation() 
+        self.stt = stt
+        if translator is None:
+            translator = Translator()
+            translator.setup_translation()
+        self.translator = translator
                         
         # stt 설정 변수
         self.current_input_languages = None
         self.current_target_languages = None
 
+        # 입력 오디오 코덱 / 디코더 (None이면 PCM 그대로 전달)
+        self.input_codec = "pcm"
+        self.audio_decoder = None
+        self.input_format = (16000, 1, "s16")   # PCM 입력 형식 (샘플레이트, 채널 수, 샘플 형식)
+        self.pcm_converter = None               # PCM 형식 변환기 (None이면 STT 입력 형식 그대로)
+        self.vad_gate = None                    # 음성 구간 게이트 (None이면 모든 오디오 전달)
+        self.latency_profile = resolve_latency_profile()    # 지연 프로파일 (인식기 침묵 시간 / 중간 결과 전달)
+        self.recording_enabled = False          # 입력 오디오 녹음 여부
+        self.recorder = None                    # 현재 녹음 파일 (첫 오디오 청크 수신 시 생성)
+        self.recording_part = 0                 # 녹음 파일 번호 (코덱 / 형식 / 소켓이 바뀌면 증가)
+        self.incremental = False                # 언어별 즉시 전달 (최종 결과를 언어마다 끝나는 대로 전송)
+        self.interim_throttle = InterimThrottle(                # 중간 결과 빈도 제한 (전송 지연이 커지면 자동 감속)
+            self._queue_interim,
+            self.latency_profile['interim_max_hz'],
+            self.latency_profile['interim_results'],
+        )
+
         # 실행 상태 변수
         self.is_active = False  
+        self.session_id = uuid.uuid4().hex      # 세션 식별자 (지표 수집 / 발화 정제 요청용)
+        self.transcript = None                  # 최종 인식 결과 누적 (발화 정제 원문)
 
-        # 번역 결과 저장 큐
-        self.translation_result_queue = asyncio.Queue()
+        # 번역 결과 저장 큐 (크기 제한 + 오래된 중간 결과 대체)
+        self.translation_result_queue = BoundedResultQueue(TRANSLATION_RESULT_QUEUE_SIZE)
+        # 최종 결과 순서 보장 (번역은 동시에 진행, 인식 순서대로 큐에 저장)
+        self.reorder_buffer = ReorderBuffer(self.translation_result_queue.put_nowait)
 
          # 백그라운드 태스크 관리
         self.background_tasks = []
@@ -38,8 +81,12 @@ class MultipleSpeechTranslationInterface:
         try:
             # STT 설정 및 시작
             print("STT 세션 시작 시도 중...")
-            self.stt.setup_streaming_recognition(input_languages)
-            self.stt.start_recognition()
+            if self.stt is None:
+                self.stt = await recognizer_pool.acquire("multiple", input_languages, recognizer_settings(self.latency_profile))     # 미리 만들어 둔 인식기 사용
+            else:
+                self.stt.set_recognizer_settings(dict(recognizer_settings(self.latency_profile)))
+                self.stt.setup_streaming_recognition(input_languages)
+                self.stt.start_recognition()
             
             # 현재 설정 저장
             self.current_input_languages = input_languages
@@ -49,6 +96,12 @@ class MultipleSpeechTranslationInterface:
             # STT 결과를 지속적으로 처리하는 백그라운드 태스크 시작
             task = asyncio.create_task(self._process_stt_results())
             self.background_tasks.append(task)
+
+            # 최종 인식 결과 누적 시작
+            self.transcript = transcript_store.create(self.session_id)
+
+            # 세션 지표 등록
+            metrics_registry.register(f"session.{self.session_id}", self.get_status)
             
             print(f"번역 세션 시작: {self.current_input_languages} → {self.current_target_languages}")
             
@@ -63,7 +116,7 @@ class MultipleSpeechTranslationInterface:
         
         while self.is_active:
             try:
-                # STT에서 결과 가져오기 (논블로킹)
+                # STT 결과가 도착할 때까지 대기 (폴링 x)
                 stt_result = await self.stt.get_recognition_result()
                 
                 if stt_result and isinstance(stt_result, dict) and stt_result.get('text', '').strip():
@@ -73,37 +126,20 @@ class MultipleSpeechTranslationInterface:
                     is_final = stt_result.get('is_final', False)
                     text = stt_result.get('text')
                     language = stt_result.get('language')
+                    utterance_id = stt_result.get('utterance_id')
 
                     # recognized인 경우에만 번역 처리
                     if is_final == True:
-                        # 번역 태스크 시작 (백그라운드에서 처리)
-                        asyncio.create_task(self._translate_and_queue(text, language, is_final))
+                        # 발화 정제용 원문 누적
+                        self.transcript.append(text, language, utterance_id)
+                        # 같은 발화의 전송 대기 중인 중간 결과 제거 (곧 최종 결과로 대체됨)
+                        self.interim_throttle.finalize(utterance_id)
+                        self.translation_result_queue.discard_interims(utterance_id)
+                        # 번역 태스크 시작 (백그라운드에서 처리, 인식 순서 번호는 지금 발급)
+                        asyncio.create_task(self._translate_and_queue(text, language, is_final, utterance_id, self.reorder_buffer.next_seq()))
                     else:
-                        # recognizing인 경우에는 번역 x
-                        raw_result = {
-                            'is_final': False    
-                        }
-
-                        # 현재 발화 언어
-                        simple_lang_code = language.split('-')[0];
-
-                        for lang in self.current_target_languages:
-                            if lang == simple_lang_code:
-                                raw_result[simple_lang_code] = {
-                                    'target_lang': lang,
-                                    'result_text': text
-                                }
-                            else:
-                                raw_result[lang] = {
-                                    'target_lang': lang,
-                                    'result_text': "..."
-                                } # 번역 x 원문 그대로 대입
-
-                        # 번역 결과를 큐에 저장
-                        await self.translation_result_queue.put(raw_result)
-                
-                # 짧은 대기 후 다시 확인
-                await asyncio.sleep(0.1)
+                        # 중간 결과 : 빈도 제한 (간격 안에서는 가장 최근 결과만 전달)
+                        self.interim_throttle.submit({'utterance_id': utterance_id, 'language': language, 'text': text})
                 
             except Exception as e:
                 print(f"STT 결과 처리 오류: {e}")
@@ -112,56 +148,225 @@ class MultipleSpeechTranslationInterface:
         
         print("STT 결과 처리 태스크 종료")
     
+    # [] 중간 결과 큐 저장 (빈도 제한 통과 시 호출)
+    def _queue_interim(self, interim: dict):
+        """recognizing 결과 -> 원문 + 번역 언어 자리 표시 결과로 큐에 저장"""
+        utterance_id, language, text = interim['utterance_id'], interim['language'], interim['text']
+        # recognizing인 경우에는 번역 x
+        translations = {}
+
+        # 현재 발화 언어
+        simple_lang_code = language.split('-')[0];
+
+        for lang in self.current_target_languages:
+            if lang == simple_lang_code:
+                translations[simple_lang_code] = {
+                    'target_lang': lang,
+                    'result_text': text
+                }
+            else:
+                translations[lang] = {
+                    'target_lang': lang,
+                    'result_text': "..."
+                } # 번역 x 원문 그대로 대입
+
+        # 번역 결과를 큐에 저장 (같은 발화의 이전 중간 결과는 대체됨)
+        self.translation_result_queue.put_nowait({
+            'is_final': False,
+            'utterance_id': utterance_id,
+            'language': simple_lang_code,
+            'text': text,
+            'translations': translations,
+        })
+
+    # [] 입력 코덱 설정
+    def set_input_codec(self, codec: str):
+        """
+        입력 오디오 코덱 설정 (새 스트림으로 간주 -> 디코더 상태 초기화)
+
+        Args:
+            codec: "pcm" | "opus"
+        """
+        self.audio_decoder = create_audio_decoder(codec)
+        self.input_codec = codec
+        self._close_recorder()                  # 새 스트림 -> 새 녹음 파일
+
+    # [] PCM 입력 형식 설정
+    def set_input_format(self, sample_rate: int, channels: int, sample_format: str):
+        """
+        PCM 입력 형식 설정 (STT 입력 형식과 다르면 서버에서 변환)
+
+        Args:
+            sample_rate: 샘플레이트 (Hz)
+            channels: 채널 수
+            sample_format: "s16" | "f32"
+        """
+        self.pcm_converter = create_pcm_converter(sample_rate, channels, sample_format)
+        self.input_format = (sample_rate, channels, sample_format)
+        self._close_recorder()                  # 형식 변경 -> 새 녹음 파일 (WAV 헤더 형식 고정)
+
+    # [] 음성 구간 게이트 설정
+    def set_vad(self, enabled: bool):
+        """침묵 구간 오디오를 STT로 보내지 않도록 설정 (켤 때마다 게이트 상태 초기화)"""
+        self.vad_gate = VadGate() if enabled else None
+
+    # [] 지연 프로파일 설정
+    def set_latency_profile(self, profile: dict):
+        """
+        지연 프로파일 적용 (인식기 항목이 바뀌었으면 인식 중단 없이 인식기 교체)
+
+        Args:
+            profile: resolve_latency_profile() 결과
+        """
+        previous = self.latency_profile
+        self.latency_profile = profile
+        self.interim_throttle.configure(profile['interim_max_hz'], profile['interim_results'])
+        if self.is_active and recognizer_settings(previous) != recognizer_settings(profile):
+            self.stt.set_recognizer_settings(dict(recognizer_settings(profile)))
+            self.stt.change_setup_recognition(self.current_input_languages)
+
+    # [] 언어별 즉시 전달 설정
+    def set_incremental(self, enabled: bool):
+        """True면 최종 결과를 언어별로 번역이 끝나는 즉시 전송 (느린 언어를 기다리지 않음, segment_seq로 병합)"""
+        self.incremental = enabled
+
+    # [] 입력 오디오 녹음 설정
+    def set_recording(self, enabled: bool):
+        """받은 오디오 청크를 그대로 파일에 녹음 (쓰기는 백그라운드 스레드)"""
+        self.recording_enabled = enabled
+        if not enabled:
+            self._close_recorder()
+
+    def _record(self, audio_data: bytes):
+        if self.recorder is None:
+            sample_rate, channels, sample_format = self.input_format
+            self.recorder = SessionRecorder({
+                'session_id': self.session_id,
+                'part': self.recording_part,
+                'mode': "multiple",
+                'input_languages': self.current_input_languages,
+                'target_languages': self.current_target_languages,
+                'codec': self.input_codec,
+                'sample_rate': sample_rate,
+                'channels': channels,
+                'sample_format': sample_format,
+                'latency_profile': self.latency_profile['name'],
+            })
+            self.recording_part += 1
+        self.recorder.write(audio_data)
+
+    def _close_recorder(self):
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
     # [] 논블로킹 음성 스트림
-    def process_audio_chunk(self, audio_data):
+    async def process_audio_chunk(self, audio_data):
         """
         오디오 청크를 논블로킹 방식으로 처리
         
         Args:
-            audio_data: 오디오 바이트 데이터
+            audio_data: 오디오 바이트 데이터 (설정된 입력 코덱 형식)
         """
         if not self.is_active:
             return
+
+        # 받은 그대로 녹음 (디코딩 / 변환 전)
+        if self.recording_enabled:
+            self._record(audio_data)
+
+        # 압축 오디오 -> PCM (공용 디코딩 스레드 풀에서 실행, 지원하지 않는 컨테이너 / 코덱이면 ValueError)
+        if self.audio_decoder is not None:
+            audio_data = await self.audio_decoder.decode_async(audio_data)
+            if not audio_data:
+                return
+        # PCM 형식 변환 (다운믹스 + 리샘플링)
+        elif self.pcm_converter is not None:
+            audio_data = self.pcm_converter.convert(audio_data)
+            if not audio_data:
+                return
+
+        # 침묵 구간 제외
+        if self.vad_gate is not None:
+            audio_data = self.vad_gate.process(audio_data)
+            if not audio_data:
+                return
             
         # STT에 오디오 데이터 전달 (즉시 반환)
         self.stt.write_audio_chunk(audio_data)
 
     # [] 번역 후 결과 큐에 저장
-    async def _translate_and_queue(self, text, language, is_final):
+    async def _translate_and_queue(self, text, language, is_final, utterance_id, segment_seq=None):
         """텍스트를 번역하고 결과 큐에 저장"""
+        result = None
         try:
             print(f"번역 시작: {language} - \"{text}")
 
             input_language = language
             
+            # 언어별 즉시 전달 : 원문은 바로, 번역은 언어마다 끝나는 대로 큐에 저장
+            incremental = self.incremental
+            on_result = None
+            if incremental:
+                on_result = self._incremental_sender(utterance_id, segment_seq, input_language, text)
+
             # 번역 실행
             translation_result = await self.translator.translate_multiple_languages(
                 text, 
                 input_language, 
-                self.current_target_languages
+                self.current_target_languages,
+                session_id=self.session_id,     # 공용 번역 실행기 공정성 기준
+                on_result=on_result,
             )
             
-            if translation_result:
-                # 번역 결과에 stt 모드 값 추가
-                translation_result['is_final'] = is_final
-
+            if translation_result and not incremental:
                 print(f"번역 완료: (최종: {is_final}): {list(translation_result.keys())}")
-                # 번역 결과를 큐에 저장
-                await self.translation_result_queue.put(translation_result)
+                result = {
+                    'is_final': is_final,
+                    'utterance_id': utterance_id,
+                    'translations': translation_result,
+                }
             
         except Exception as e:
             print(f"번역 처리 오류: {e}")
+        finally:
+            # 번역 결과를 인식 순서대로 큐에 저장 (최종 결과는 삭제되지 않음, 실패해도 순서는 진행 -> 뒤 문장이 기다리지 않음)
+            if segment_seq is not None:
+                self.reorder_buffer.complete(segment_seq, result)
+            elif result:
+                self.translation_result_queue.put_nowait(result)
+
+    # [] 언어별 즉시 전달 (번역 1개 = 큐 항목 1개)
+    def _incremental_sender(self, utterance_id, segment_seq, input_language: str, text: str):
+        """원문 항목을 바로 큐에 저장하고, 언어별 번역 결과를 큐에 저장하는 함수 반환"""
+        def queue_translation(translation: dict, original: bool = False):
+            self.translation_result_queue.put_nowait({
+                'is_final': True,
+                'incremental': True,
+                'utterance_id': utterance_id,
+                'segment_seq': segment_seq,
+                'original': original,
+                'translation': translation,
+            })
+
+        source_language = input_language.split('-')[0]
+        queue_translation({'target_lang': source_language, 'result_text': text}, original=True)
+
+        def on_result(lang, translation):
+            if translation:
+                queue_translation(translation)
+        return on_result
+
+    # [] 번역 결과 가져오기
+    async def get_translation_results(self, limit: int = 1) -> list[dict]:
+        """
+        번역 결과가 큐에 들어올 때까지 대기 후 최대 limit개 반환 (폴링 x, 최종 결과 우선)
+
+        Args:
+            limit: 한 번에 꺼낼 최대 개수
+        """
+        return await self.translation_result_queue.get_batch(limit)
 
-    # [] 최신 번역 결과 가져오기
-    async def get_latest_translation_result(self):
-        """최신 번역 결과를 논블로킹으로 가져오기"""
-        try:
-            # 큐에서 결과를 논블로킹으로 가져오기
-            return self.translation_result_queue.get_nowait()
-        except:
-            # 큐가 비어있으면 None 반환
-            return None
-    
     # [3-1] 음성 인식 언어 변경
     async def change_input_language_settings(self, input_languages: list[str]):
         """
@@ -173,12 +378,14 @@ class MultipleSpeechTranslationInterface:
         try:
             print(f"입력 언어 설정 변경: {input_languages}")
 
-            # 새 설정 저장
+            # STT 언어 변경 (새 언어 인식기 연결 후 교체 - 전환 중 오디오는 버퍼에 보관)
+            switched = self.stt.change_setup_recognition(input_languages)
+            if switched is not None:
+                await asyncio.wrap_future(switched)     # 연결 실패 시 예외 -> 기존 언어로 계속 인식
+
+            # 전환 성공 후 새 설정 저장
             self.current_input_languages = input_languages
-            
-            # STT 언어 변경 (기존 세션 종료 -> 재시작)
-            self.stt.change_setup_recognition(self.current_input_languages)
-            
+
             print(f"언어 설정 변경 완료: {self.current_input_languages} -> {self.current_target_languages}")
             
         except Exception as e:
@@ -218,6 +425,11 @@ class MultipleSpeechTranslationInterface:
                         task.cancel()
                 self.background_tasks.clear()
                 
+                metrics_registry.unregister(f"session.{self.session_id}")
+                transcript_store.close(self.session_id)
+                self.interim_throttle.close()
+                self.reorder_buffer.close()
+                self._close_recorder()
                 self.stt.stop_recognition()
                 
                 print("번역 세션 종료")
@@ -230,5 +442,16 @@ class MultipleSpeechTranslationInterface:
         return {
             'is_active': self.is_active,
             'input_languages': self.current_input_languages,
-            'stt_active': self.stt.is_active() if self.stt else False
+            'stt_active': self.stt.is_active() if self.stt else False,
+            'stt': self.stt.get_stats() if self.stt else {},
+            'translation_queue': self.translation_result_queue.get_stats(),
+            'transcript_segments': len(self.transcript.segments) if self.transcript else 0,
+            'audio_decoder': self.audio_decoder.get_stats() if self.audio_decoder else None,
+            'pcm_converter': self.pcm_converter.get_stats() if self.pcm_converter else None,
+            'vad': self.vad_gate.get_stats() if self.vad_gate else None,
+            'latency_profile': self.latency_profile,
+            'recording': self.recorder.get_stats() if self.recorder else None,
+            'interims': self.interim_throttle.get_stats(),
+            'reorder': self.reorder_buffer.get_stats(),
+            'incremental': self.incremental,
         }
\ No newline at end of file
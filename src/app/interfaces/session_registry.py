@@ -0,0 +1,203 @@
+# [interfaces/session_registry.py]
+# 재연결 가능한 번역 세션 관리 (소켓이 끊겨도 유예 시간 동안 인식 세션 유지)
+import asyncio
+import os
+import secrets
+from collections import deque
+from src.app.core.metrics import metrics_registry
+from src.app.core.result_queue import BoundedResultQueue
+
+SESSION_RESUME_GRACE_SECONDS = float(os.getenv("SESSION_RESUME_GRACE_SECONDS", "30"))    # 소켓 없이 세션을 유지하는 시간
+REPLAY_BUFFER_SIZE = 256        # 재전송용으로 보관하는 최종 결과 수
+OUTBOUND_QUEUE_SIZE = 32        # 연결된 소켓의 결과 큐 최대 크기
+PUMP_BATCH = 64                 # 한 번에 꺼내서 처리할 최대 결과 수
+
+class ResumableSession:
+    """
+    번역 세션 1개 + 현재 연결된 소켓(0 또는 1개)
+
+    - 모든 결과에 순번(seq) 부여 -> 최종 결과는 링 버퍼에 보관
+    - 소켓이 끊기면 유예 시간 동안 인식기 / 번역 유지 (결과는 링 버퍼에 계속 쌓임)
+    - 재연결 시 클라이언트가 마지막으로 받은 seq 이후의 최종 결과만 다시 전송
+    """
+    # [1] 초기화
+    def __init__(self, interface, mode: str):
+        self.interface = interface
+        self.mode = mode
+        self.resume_token = secrets.token_urlsafe(16)
+
+        self.next_seq = 1
+        self.replay_buffer = deque(maxlen=REPLAY_BUFFER_SIZE)   # 최종 결과 (seq 순)
+        self.evicted_seq = 0                                    # 링 버퍼에서 밀려난 마지막 seq
+
+        self.outbound_queue = None      # 연결된 소켓의 결과 큐 (없으면 None)
+        self.attachment_id = None       # 연결 식별자 (이전 소켓의 늦은 정리가 새 연결을 끊지 않도록)
+        self.pump_task = None
+        self.expiry_handle = None
+
+        # 지표
+        self.attaches = 0
+        self.resumes = 0
+        self.replayed = 0
+        self.truncated_resumes = 0      # 재전송할 결과 일부가 이미 링 버퍼에서 밀려난 재연결
+
+    # [2] 결과 수집 시작
+    def start(self):
+        self.pump_task = asyncio.create_task(self._pump())
+
+    async def _pump(self):
+        """번역 결과에 seq 부여 -> 링 버퍼 보관 + 연결된 소켓 큐로 전달"""
+        while True:
+            try:
+                items = await self.interface.get_translation_results(PUMP_BATCH)
+                for item in items:
+                    item['seq'] = self.next_seq
+                    self.next_seq += 1
+                    if item.get('is_final', False):
+                        if len(self.replay_buffer) == self.replay_buffer.maxlen:
+                            self.evicted_seq = self.replay_buffer[0]['seq']
+                        self.replay_buffer.append(item)
+                    if self.outbound_queue is not None:
+                        self.outbound_queue.put_nowait(item)
+            except Exception as e:
+                print(f"세션 결과 수집 오류: {e}")
+                break
+
+    # [3] 소켓 연결 / 해제
+    def attach(self, last_seq: int = None) -> tuple[str, BoundedResultQueue, int]:
+        """
+        소켓 연결 (이전 연결이 남아 있으면 대체)
+
+        Args:
+            last_seq: 클라이언트가 마지막으로 받은 seq (None이면 재전송 x)
+        Returns:
+            (attachment_id, 결과 큐, 재전송한 결과 수)
+        """
+        if self.expiry_handle is not None:
+            self.expiry_handle.cancel()
+            self.expiry_handle = None
+
+        queue = BoundedResultQueue(OUTBOUND_QUEUE_SIZE)
+        replayed = 0
+        if last_seq is not None:
+            if last_seq < self.evicted_seq:
+                self.truncated_resumes += 1
+            for item in self.replay_buffer:
+                if item['seq'] > last_seq:
+                    # 사본으로 전달 : 처음 큐 저장 시각(queued_at)은 끊긴 시간까지 포함 -> 전송 지연 지표에서 제외
+                    replayed_item = {**item, 'replayed': True}
+                    replayed_item.pop('queued_at', None)
+                    queue.put_nowait(replayed_item)
+                    replayed += 1
+            self.resumes += 1
+            self.replayed += replayed
+
+        self.attachment_id = secrets.token_hex(4)
+        self.outbound_queue = queue
+        self.attaches += 1
+        return self.attachment_id, queue, replayed
+
+    def detach(self, attachment_id: str, on_expire):
+        """
+        소켓 연결 해제 -> 유예 시간 후에도 재연결이 없으면 on_expire 호출
+
+        Args:
+            attachment_id: attach()가 반환한 연결 식별자 (이미 다른 소켓이 연결되었으면 무시)
+            on_expire: 유예 시간 만료 시 호출할 함수 (세션 종료)
+        """
+        if attachment_id != self.attachment_id:
+            return
+        self.attachment_id = None
+        self.outbound_queue = None
+        self.expiry_handle = asyncio.get_running_loop().call_later(SESSION_RESUME_GRACE_SECONDS, on_expire)
+        print(f"세션 연결 해제: {self.interface.session_id} ({SESSION_RESUME_GRACE_SECONDS}초 동안 재연결 대기)")
+
+    # [4] 세션 종료
+    def close(self, attachment_id: str = None) -> bool:
+        """
+        세션 종료 (인식기 / 번역 정리)
+
+        Args:
+            attachment_id: 종료를 요청한 소켓의 연결 식별자 (이미 다른 소켓이 재연결했으면 무시, None이면 무조건 종료)
+        Returns:
+            종료 여부
+        """
+        if attachment_id is not None and attachment_id != self.attachment_id:
+            return False
+        if self.expiry_handle is not None:
+            self.expiry_handle.cancel()
+            self.expiry_handle = None
+        if self.pump_task is not None and not self.pump_task.done():
+            self.pump_task.cancel()
+        self.outbound_queue = None
+        self.interface.stop_session()
+        return True
+
+    # 현재 상태 확인
+    def get_status(self) -> dict:
+        return {
+            'attached': self.attachment_id is not None,
+            'next_seq': self.next_seq,
+            'replay_buffer': len(self.replay_buffer),
+            'attaches': self.attaches,
+            'resumes': self.resumes,
+            'replayed': self.replayed,
+            'truncated_resumes': self.truncated_resumes,
+        }
+
+
+class SessionRegistry:
+    """resume_token -> ResumableSession"""
+    # [1] 초기화
+    def __init__(self):
+        self.sessions = {}
+
+        # 지표
+        self.created = 0
+        self.resumed = 0
+        self.expired = 0
+
+    # [2] 세션 등록 / 조회
+    def create(self, interface, mode: str) -> ResumableSession:
+        """시작된 번역 세션 등록 -> 결과 수집 시작"""
+        session = ResumableSession(interface, mode)
+        session.start()
+        self.sessions[session.resume_token] = session
+        self.created += 1
+        return session
+
+    def resume(self, resume_token: str, mode: str):
+        """재연결 -> 유효한 세션 반환 (없거나 모드가 다르면 None)"""
+        session = self.sessions.get(resume_token)
+        if session is None or session.mode != mode:
+            return None
+        self.resumed += 1
+        return session
+
+    # [3] 세션 해제
+    def detach(self, session: ResumableSession, attachment_id: str):
+        """소켓만 해제 (유예 시간 후 세션 종료)"""
+        session.detach(attachment_id, lambda: self._expire(session))
+
+    def close(self, session: ResumableSession, attachment_id: str = None):
+        """세션 즉시 종료 (attachment_id가 현재 연결과 다르면 무시 - 대체된 이전 소켓의 늦은 정상 종료)"""
+        if session.close(attachment_id):
+            self.sessions.pop(session.resume_token, None)
+
+    def _expire(self, session: ResumableSession):
+        print(f"세션 재연결 유예 만료: {session.interface.session_id}")
+        self.expired += 1
+        self.close(session)
+
+    # 현재 상태 확인
+    def get_status(self) -> dict:
+        return {
+            'sessions': len(self.sessions),
+            'detached': sum(1 for session in self.sessions.values() if session.attachment_id is None),
+            'created': self.created,
+            'resumed': self.resumed,
+            'expired': self.expired,
+        }
+
+session_registry = SessionRegistry()
+metrics_registry.register("sessions", session_registry.get_status)
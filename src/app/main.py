@@ -1,11 +1,20 @@
 # app/main.py
 
 import uvicorn
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from src.app.routes.common_route import api_router
+from src.app.modules.stt.recognizer_pool import recognizer_pool
 
-app = FastAPI()
+# 서버 시작 시 인식기 풀 채우기 (STT_POOL_LANGUAGES), 종료 시 보관 중인 인식기 정리
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    recognizer_pool.start()
+    yield
+    await recognizer_pool.close()
+
+app = FastAPI(lifespan=lifespan)
 
 # CORS 미들웨어 추가
 app.add_middleware(
@@ -0,0 +1,114 @@
+# [modules/audio/audio_decoder.py]
+# 압축 오디오(Opus) -> STT 입력 PCM(16kHz / 16bit / mono) 디코딩
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from src.app.modules.audio.opus_demuxer import create_demuxer
+
+# 선택 의존성 : Opus 디코딩 (FFmpeg 바인딩)
+try:
+    import av
+except ImportError:
+    av = None
+
+SUPPORTED_CODECS = ("pcm", "opus")      # opus : Ogg / WebM 컨테이너 (첫 청크로 자동 판별)
+
+STT_SAMPLE_RATE = 16000                 # STT 입력 형식 (AudioStreamFormat과 동일)
+STT_SAMPLE_WIDTH = 2
+
+# 프로세스 공용 디코딩 스레드 풀 (세션 수와 무관하게 동시 디코딩 수 제한)
+AUDIO_DECODE_WORKERS = int(os.getenv("AUDIO_DECODE_WORKERS", "4"))
+decode_executor = ThreadPoolExecutor(max_workers=AUDIO_DECODE_WORKERS, thread_name_prefix="audio-decode")
+
+class OpusStreamDecoder:
+    """
+    세션(소켓)별 Opus 스트림 디코더
+
+    - 청크 도착 순서대로 디먹스 -> 디코딩 -> 16kHz mono s16 변환 (디코더 상태가 청크 간 이어짐)
+    - 디코딩은 이벤트 루프 밖(공용 스레드 풀)에서 실행
+    """
+    # [1] 초기화
+    def __init__(self):
+        if av is None:
+            raise ValueError("av(PyAV) 패키지가 설치되지 않아 opus 입력을 사용할 수 없습니다")
+        self.demuxer = None
+        self.codec_context = None
+        self.resampler = av.AudioResampler(format="s16", layout="mono", rate=STT_SAMPLE_RATE)
+
+        # 지표
+        self.chunks = 0
+        self.packets = 0
+        self.errors = 0
+        self.input_bytes = 0
+        self.audio_seconds = 0.0        # 디코딩된 오디오 길이
+        self.decode_seconds = 0.0       # 디코딩에 쓴 CPU 시간 (스레드 기준)
+
+    # [2] 디코딩
+    async def decode_async(self, chunk: bytes) -> bytes:
+        """이벤트 루프를 막지 않고 디코딩 (공용 스레드 풀)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(decode_executor, self.decode, chunk)
+
+    def decode(self, chunk: bytes) -> bytes:
+        """
+        압축 청크 -> PCM (청크 하나에 완성된 패킷이 없으면 빈 bytes)
+        """
+        started = time.thread_time()
+        self.chunks += 1
+        self.input_bytes += len(chunk)
+
+        if self.demuxer is None:
+            self.demuxer = create_demuxer(chunk)
+        packets = self.demuxer.feed(chunk)
+
+        pcm = bytearray()
+        for packet in packets:
+            try:
+                for frame in self._codec().decode(av.Packet(packet)):
+                    for resampled in self.resampler.resample(frame):
+                        pcm += bytes(resampled.planes[0])[:resampled.samples * STT_SAMPLE_WIDTH]
+            except av.error.FFmpegError as e:
+                # 손상된 패킷 1개 때문에 스트림 전체를 끊지 않음
+                self.errors += 1
+                print(f"Opus 디코딩 오류: {e}")
+        self.packets += len(packets)
+
+        self.decode_seconds += time.thread_time() - started
+        self.audio_seconds += len(pcm) / (STT_SAMPLE_RATE * STT_SAMPLE_WIDTH)
+        return bytes(pcm)
+
+    def _codec(self):
+        # 컨테이너 헤더(OpusHead)를 읽은 뒤 디코더 생성
+        if self.codec_context is None:
+            self.codec_context = av.CodecContext.create("opus", "r")
+            if self.demuxer.opus_head:
+                self.codec_context.extradata = self.demuxer.opus_head
+        return self.codec_context
+
+    # [3] 지표 반환
+    def get_stats(self) -> dict:
+        return {
+            'codec': "opus",
+            'container': type(self.demuxer).__name__ if self.demuxer else None,
+            'chunks': self.chunks,
+            'packets': self.packets,
+            'errors': self.errors,
+            'input_bytes': self.input_bytes,
+            'audio_seconds': round(self.audio_seconds, 3),
+            'decode_ms_per_audio_second': round(self.decode_seconds / self.audio_seconds * 1000, 3) if self.audio_seconds else 0.0,
+        }
+
+
+def create_audio_decoder(codec: str):
+    """
+    입력 코덱 -> 디코더 생성
+
+    Returns:
+        None : pcm (디코딩 없이 그대로 STT 전달)
+    """
+    if codec not in SUPPORTED_CODECS:
+        raise ValueError(f"지원하지 않는 입력 코덱입니다: {codec}")
+    if codec == "opus":
+        return OpusStreamDecoder()
+    return None
@@ -0,0 +1,216 @@
+# [modules/audio/opus_demuxer.py]
+# 스트리밍 컨테이너(Ogg / WebM) -> Opus 패킷 분리
+#
+# 브라우저 MediaRecorder 출력 형식
+#   - Chrome / Edge : audio/webm;codecs=opus
+#   - Firefox       : audio/ogg;codecs=opus (webm도 지원)
+# 청크는 컨테이너 구조와 무관한 위치에서 잘려서 도착 -> 남은 바이트를 버퍼에 보관하고 이어서 분석
+
+OGG_CAPTURE = b"OggS"
+EBML_MAGIC = b"\x1a\x45\xdf\xa3"
+
+# Ogg 첫 패킷 시그니처 -> 코덱 이름 (Opus가 아닌 스트림 안내용)
+OGG_CODEC_SIGNATURES = {b"\x01vorbis": "Vorbis", b"\x7fFLAC": "FLAC", b"Speex": "Speex", b"\x80theora": "Theora"}
+
+class OggOpusDemuxer:
+    """
+    Ogg 페이지 -> Opus 패킷
+
+    - 첫 패킷 OpusHead : 디코더 설정(extradata)으로 보관 (OpusHead가 아니면 ValueError - Opus가 아닌 코덱 / 손상된 첫 페이지)
+    - 두 번째 패킷 OpusTags : 무시
+    """
+    # [1] 초기화
+    def __init__(self):
+        self.buffer = bytearray()
+        self.partial_packet = bytearray()   # 다음 페이지로 이어지는 패킷
+        self.opus_head = None               # OpusHead (디코더 extradata)
+        self.packets_seen = 0
+
+    # [2] 청크 분석
+    def feed(self, data: bytes) -> list[bytes]:
+        """도착한 청크 -> 완성된 Opus 패킷 목록"""
+        self.buffer += data
+        packets = []
+
+        while True:
+            # 페이지 시작 위치 찾기 (앞쪽 쓰레기 바이트 제거)
+            start = self.buffer.find(OGG_CAPTURE)
+            if start < 0:
+                del self.buffer[:-3]        # 'OggS'가 청크 경계에 걸친 경우 대비
+                break
+            if start > 0:
+                del self.buffer[:start]
+
+            # 페이지 헤더 : 27바이트 + 세그먼트 테이블
+            if len(self.buffer) < 27:
+                break
+            segment_count = self.buffer[26]
+            header_size = 27 + segment_count
+            if len(self.buffer) < header_size:
+                break
+            lacing = self.buffer[27:header_size]
+            page_size = header_size + sum(lacing)
+            if len(self.buffer) < page_size:
+                break
+
+            # 세그먼트 -> 패킷 조립 (255 미만 세그먼트에서 패킷 종료)
+            offset = header_size
+            for size in lacing:
+                self.partial_packet += self.buffer[offset:offset + size]
+                offset += size
+                if size < 255:
+                    self._emit(bytes(self.partial_packet), packets)
+                    self.partial_packet.clear()
+            del self.buffer[:page_size]
+
+        return packets
+
+    def _emit(self, packet: bytes, packets: list[bytes]):
+        self.packets_seen += 1
+        if self.packets_seen == 1 and not packet.startswith(b"OpusHead"):
+            codec = next((name for signature, name in OGG_CODEC_SIGNATURES.items() if packet.startswith(signature)), None)
+            if codec:
+                raise ValueError(f"지원하지 않는 오디오 코덱입니다: Ogg {codec} (Opus만 지원)")
+            raise ValueError("Ogg 스트림의 첫 패킷이 OpusHead가 아닙니다 (손상된 스트림 또는 Opus가 아닌 코덱)")
+        if packet.startswith(b"OpusHead"):
+            self.opus_head = packet
+        elif packet.startswith(b"OpusTags"):
+            pass
+        elif packet:
+            packets.append(packet)
+
+
+# WebM(Matroska) 요소 ID
+EBML_ID_SEGMENT = 0x18538067
+EBML_ID_CLUSTER = 0x1F43B675
+EBML_ID_TRACKS = 0x1654AE6B
+EBML_ID_TRACK_ENTRY = 0xAE
+EBML_ID_CODEC_ID = 0x86
+EBML_ID_CODEC_PRIVATE = 0x63A2
+EBML_ID_BLOCK_GROUP = 0xA0
+EBML_ID_BLOCK = 0xA1
+EBML_ID_SIMPLE_BLOCK = 0xA3
+
+# 내용을 건너뛰지 않고 안으로 들어가서 읽는 요소 (크기 미정 Segment / Cluster 포함)
+EBML_MASTER_IDS = {EBML_ID_SEGMENT, EBML_ID_CLUSTER, EBML_ID_TRACKS, EBML_ID_TRACK_ENTRY, EBML_ID_BLOCK_GROUP}
+
+class WebmOpusDemuxer:
+    """
+    WebM(EBML) 요소 -> Opus 패킷
+
+    - 오디오 트랙 1개(MediaRecorder 출력)만 가정
+    - CodecID : A_OPUS가 아니면 ValueError
+    - CodecPrivate(OpusHead) : 디코더 설정으로 보관
+    - SimpleBlock / Block : 프레임 추출 (lacing 사용 블록은 건너뜀 - 브라우저 오디오는 lacing x)
+    """
+    # [1] 초기화
+    def __init__(self):
+        self.buffer = bytearray()
+        self.skip_remaining = 0             # 필요 없는 요소의 남은 바이트 (버퍼에 쌓지 않고 버림)
+        self.opus_head = None
+        self.laced_blocks = 0               # 지원하지 않아 건너뛴 블록 수
+
+    # [2] 청크 분석
+    def feed(self, data: bytes) -> list[bytes]:
+        """도착한 청크 -> 완성된 Opus 패킷 목록"""
+        packets = []
+        if self.skip_remaining:
+            skipped = min(self.skip_remaining, len(data))
+            self.skip_remaining -= skipped
+            data = data[skipped:]
+        self.buffer += data
+
+        while True:
+            element_id, id_length = _read_vint(self.buffer, 0, keep_marker=True)
+            if element_id is None:
+                break
+            size, size_length = _read_vint(self.buffer, id_length)
+            if size is None:
+                break
+            header_size = id_length + size_length
+
+            # 컨테이너 요소 : 헤더만 소비하고 자식 요소를 이어서 분석
+            if element_id in EBML_MASTER_IDS:
+                del self.buffer[:header_size]
+                continue
+
+            # 블록 / 코덱 설정 : 요소 전체가 도착할 때까지 대기
+            if element_id in (EBML_ID_SIMPLE_BLOCK, EBML_ID_BLOCK, EBML_ID_CODEC_ID, EBML_ID_CODEC_PRIVATE):
+                if size == _UNKNOWN_SIZE or len(self.buffer) < header_size + size:
+                    break
+                body = bytes(self.buffer[header_size:header_size + size])
+                del self.buffer[:header_size + size]
+                if element_id == EBML_ID_CODEC_ID:
+                    codec = body.rstrip(b"\x00").decode("ascii", "replace")
+                    if codec != "A_OPUS":
+                        raise ValueError(f"지원하지 않는 오디오 코덱입니다: WebM {codec} (Opus만 지원)")
+                elif element_id == EBML_ID_CODEC_PRIVATE:
+                    self.opus_head = body
+                else:
+                    self._emit_block(body, packets)
+                continue
+
+            # 그 외 요소 : 내용 건너뛰기
+            if size == _UNKNOWN_SIZE:
+                del self.buffer[:header_size]
+                continue
+            available = len(self.buffer) - header_size
+            if available >= size:
+                del self.buffer[:header_size + size]
+            else:
+                self.skip_remaining = size - available
+                self.buffer.clear()
+                break
+
+        return packets
+
+    def _emit_block(self, body: bytes, packets: list[bytes]):
+        # 블록 구조 : 트랙 번호(vint) + 타임코드(2) + 플래그(1) + 프레임
+        _, track_length = _read_vint(body, 0)
+        if track_length is None or len(body) < track_length + 3:
+            return
+        flags = body[track_length + 2]
+        if flags & 0x06:
+            self.laced_blocks += 1
+            return
+        frame = body[track_length + 3:]
+        if frame:
+            packets.append(frame)
+
+
+# EBML 가변 길이 정수 (크기 값이 모두 1이면 '크기 미정')
+_UNKNOWN_SIZE = -1
+
+def _read_vint(buffer, offset: int, keep_marker: bool = False):
+    """
+    Returns:
+        (값, 바이트 길이) / 데이터 부족 시 (None, None)
+    """
+    if offset >= len(buffer):
+        return None, None
+    first = buffer[offset]
+    length = 1
+    mask = 0x80
+    while length <= 8 and not first & mask:
+        mask >>= 1
+        length += 1
+    if length > 8:
+        raise ValueError("잘못된 WebM 데이터입니다")
+    if offset + length > len(buffer):
+        return None, None
+
+    value = first if keep_marker else first & (mask - 1)
+    for byte in buffer[offset + 1:offset + length]:
+        value = (value << 8) | byte
+    if not keep_marker and value == (1 << (7 * length)) - 1:
+        return _UNKNOWN_SIZE, length
+    return value, length
+
+
+def create_demuxer(first_chunk: bytes):
+    """첫 청크의 시그니처로 컨테이너 판별 -> 디먹서 생성"""
+    if first_chunk.startswith(OGG_CAPTURE):
+        return OggOpusDemuxer()
+    if first_chunk.startswith(EBML_MAGIC):
+        return WebmOpusDemuxer()
+    raise ValueError("Opus 오디오는 Ogg 또는 WebM 컨테이너로 전송해야 합니다")
@@ -0,0 +1,155 @@
+# [modules/audio/pcm_converter.py]
+# 브라우저 PCM(44.1/48kHz, stereo, float32 등) -> STT 입력 PCM(16kHz / 16bit / mono) 변환
+import math
+import time
+
+# 선택 의존성 : 벡터 연산
+try:
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+except ImportError:
+    np = None
+
+STT_SAMPLE_RATE = 16000
+SUPPORTED_SAMPLE_FORMATS = {"s16": "<i2", "f32": "<f4"}     # 형식 -> numpy dtype (little endian)
+MAX_CHANNELS = 8
+RESAMPLER_ZERO_CROSSINGS = 16       # 필터 한쪽 sinc 영점 수 (클수록 정확, 느림)
+RESAMPLER_ROLLOFF = 0.95            # 차단 주파수 = 나이퀴스트 x rolloff (에일리어싱 여유)
+
+class PcmConverter:
+    """
+    세션별 스트리밍 PCM 변환기 (다운믹스 + polyphase 리샘플링)
+
+    - 리샘플링 비율 L/M = 16000 / 입력 샘플레이트 (기약분수) -> 업샘플 x L, 로우패스, 다운샘플 / M
+      polyphase 구조로 실제 필요한 출력 샘플만 계산
+    - 필터 지연선(이전 청크의 마지막 샘플)과 출력 위상을 청크 간 유지 -> 청크 경계에서 끊김 x
+    - 청크가 프레임(채널 x 샘플 크기) 중간에서 잘려도 남은 바이트를 다음 청크에 이어 붙임
+    """
+    # [1] 초기화
+    def __init__(self, sample_rate: int, channels: int, sample_format: str):
+        """
+        Args:
+            sample_rate: 입력 샘플레이트 (Hz)
+            channels: 입력 채널 수 (interleaved)
+            sample_format: "s16" | "f32"
+        """
+        if np is None:
+            raise ValueError("numpy 패키지가 설치되지 않아 입력 오디오 형식 변환을 사용할 수 없습니다")
+        if sample_format not in SUPPORTED_SAMPLE_FORMATS:
+            raise ValueError(f"지원하지 않는 샘플 형식입니다: {sample_format}")
+        if not 1 <= channels <= MAX_CHANNELS:
+            raise ValueError(f"지원하지 않는 채널 수입니다: {channels}")
+        if not 8000 <= sample_rate <= 192000:
+            raise ValueError(f"지원하지 않는 샘플레이트입니다: {sample_rate}")
+
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.sample_format = sample_format
+        self.dtype = np.dtype(SUPPORTED_SAMPLE_FORMATS[sample_format])
+        self.frame_bytes = self.dtype.itemsize * channels
+        self.remainder = b""
+
+        # 리샘플링 비율 + polyphase 필터 (phase별 탭을 행으로)
+        divisor = math.gcd(STT_SAMPLE_RATE, sample_rate)
+        self.up = STT_SAMPLE_RATE // divisor
+        self.down = sample_rate // divisor
+        self.resampling = self.up != self.down
+        if self.resampling:
+            self.phase_filters = _design_polyphase_filter(self.up, self.down)
+            self.taps = self.phase_filters.shape[1]
+            self.history = np.zeros(self.taps - 1, dtype=np.float32)   # 필터 지연선
+            self.time_offset = 0        # 다음 출력 샘플 위치 (업샘플 단위, 현재 청크 시작 기준)
+
+        # 지표
+        self.input_frames = 0
+        self.output_samples = 0
+        self.cpu_seconds = 0.0
+
+    # [2] 변환
+    def convert(self, data: bytes) -> bytes:
+        """입력 PCM 청크 -> 16kHz / s16 / mono PCM (출력 샘플이 없으면 빈 bytes)"""
+        started = time.thread_time()
+        data = self.remainder + data
+        frame_count = len(data) // self.frame_bytes
+        self.remainder = data[frame_count * self.frame_bytes:]
+        if frame_count == 0:
+            return b""
+
+        # 정규화 (-1.0 ~ 1.0) + 다운믹스 (채널 평균)
+        samples = np.frombuffer(data, dtype=self.dtype, count=frame_count * self.channels).astype(np.float32)
+        if self.sample_format == "s16":
+            samples *= 1.0 / 32768.0
+        if self.channels > 1:
+            samples = samples.reshape(frame_count, self.channels).mean(axis=1)
+
+        if self.resampling:
+            samples = self._resample(samples)
+
+        self.input_frames += frame_count
+        self.output_samples += samples.size
+        pcm = (np.clip(samples, -1.0, 1.0) * 32767.0).astype("<i2").tobytes()
+        self.cpu_seconds += time.thread_time() - started
+        return pcm
+
+    def _resample(self, samples):
+        # 지연선 + 현재 청크 : 출력 샘플마다 입력 기준 위치 base에서 과거 taps개 샘플 사용
+        extended = np.concatenate((self.history, samples))
+        input_count = samples.size
+
+        # 이번 청크에서 계산 가능한 출력 위치 (업샘플 단위) : base = position // up < input_count
+        limit = input_count * self.up
+        positions = np.arange(self.time_offset, limit, self.down, dtype=np.int64)
+        if positions.size:
+            bases = positions // self.up
+            # windows[base] = extended[base : base + taps] (복사 없는 view) -> 필요한 행만 모아서 탭(역순)과 내적
+            windows = sliding_window_view(extended, self.taps)[bases]
+            if self.up == 1:
+                output = windows @ self.phase_filters[0]
+            else:
+                output = np.einsum("ij,ij->i", windows, self.phase_filters[positions % self.up])
+            self.time_offset = int(positions[-1]) + self.down - limit
+        else:
+            output = np.zeros(0, dtype=np.float32)
+            self.time_offset -= limit
+
+        self.history = extended[-(self.taps - 1):] if self.taps > 1 else extended[:0]
+        return output.astype(np.float32)
+
+    # [3] 지표 반환
+    def get_stats(self) -> dict:
+        input_seconds = self.input_frames / self.sample_rate
+        return {
+            'input_format': f"{self.sample_rate}Hz/{self.channels}ch/{self.sample_format}",
+            'input_seconds': round(input_seconds, 2),
+            'output_seconds': round(self.output_samples / STT_SAMPLE_RATE, 2),
+            'cpu_ms_per_audio_second': round(self.cpu_seconds / input_seconds * 1000, 3) if input_seconds else 0.0,
+        }
+
+
+def _design_polyphase_filter(up: int, down: int):
+    """
+    windowed-sinc 로우패스 (업샘플 단위) -> (up, taps) polyphase 행렬
+
+    phase p 의 k번째 탭 = h[p + k * up], 입력 창(오래된 샘플 -> 최근 샘플)과 바로 내적하도록 탭 순서를 뒤집어 저장
+    """
+    cutoff = 0.5 / max(up, down) * RESAMPLER_ROLLOFF       # 업샘플 단위 정규화 주파수 (cycles/sample)
+    half_length = RESAMPLER_ZERO_CROSSINGS * max(up, down)
+    n = np.arange(-half_length, half_length + 1)
+    prototype = 2 * cutoff * np.sinc(2 * cutoff * n) * np.kaiser(n.size, 8.0) * up   # 업샘플 이득 보정
+
+    taps = -(-prototype.size // up)
+    padded = np.zeros(taps * up)
+    padded[:prototype.size] = prototype
+    return padded.reshape(taps, up).T[:, ::-1].astype(np.float32)
+
+
+def create_pcm_converter(sample_rate: int, channels: int, sample_format: str):
+    """
+    입력 PCM 형식 -> 변환기 생성
+
+    Returns:
+        None : 이미 STT 입력 형식 (16kHz / mono / s16) -> 변환 없이 그대로 전달
+    """
+    if sample_rate == STT_SAMPLE_RATE and channels == 1 and sample_format == "s16":
+        return None
+    return PcmConverter(sample_rate, channels, sample_format)
@@ -0,0 +1,243 @@
+# [modules/audio/session_recorder.py]
+# 세션 입력 오디오 녹음 (자막 오류 재현 / 회귀 · 성능 테스트용 재생)
+import json
+import os
+import queue
+import struct
+import threading
+import time
+from src.app.core.metrics import metrics_registry
+
+SESSION_RECORDING_DIR = os.getenv("SESSION_RECORDING_DIR", "recordings")                   # 녹음 파일 저장 위치
+RECORD_ALL_SESSIONS = os.getenv("SESSION_RECORDING", "0") == "1"                            # 설정 메시지와 무관하게 모든 세션 녹음
+RECORDING_MAX_PENDING_BYTES = int(os.getenv("RECORDING_MAX_PENDING_BYTES", str(64 * 1024 * 1024)))   # 디스크 쓰기 대기 상한 (초과 시 청크 버림)
+WAV_HEADER_BYTES = 44
+INDEX_SUFFIX = ".idx.jsonl"
+
+def _wav_header(sample_rate: int, channels: int, sample_format: str, data_bytes: int) -> bytes:
+    """RIFF/WAVE 헤더 (s16 : PCM / f32 : IEEE float)"""
+    format_tag, bits = (3, 32) if sample_format == "f32" else (1, 16)
+    block_align = channels * bits // 8
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_bytes, b"WAVE",
+        b"fmt ", 16, format_tag, channels, sample_rate, sample_rate * block_align, block_align, bits,
+        b"data", data_bytes,
+    )
+
+def _audio_extension(codec: str, first_chunk: bytes) -> str:
+    if codec == "pcm":
+        return ".wav"
+    # 압축 오디오는 받은 컨테이너 그대로 저장
+    if first_chunk[:4] == b"OggS":
+        return ".ogg"
+    if first_chunk[:4] == b"\x1a\x45\xdf\xa3":
+        return ".webm"
+    return ".bin"
+
+# [1] 공용 쓰기 스레드
+class RecordingWriter:
+    """
+    모든 세션의 녹음 파일 쓰기를 전담하는 백그라운드 스레드 1개
+
+    - 이벤트 루프는 큐에 작업을 넣기만 함 (디스크 I/O로 막히지 않음)
+    - 스레드 1개가 순서대로 처리 -> 파일별 청크 순서 보장
+    - 디스크가 느려 대기 바이트가 상한을 넘으면 새 청크는 버림 (메모리 보호)
+    """
+    def __init__(self, max_pending_bytes: int = RECORDING_MAX_PENDING_BYTES):
+        self.max_pending_bytes = max_pending_bytes
+        self._queue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._thread = None
+        self.pending_bytes = 0
+
+        # 지표
+        self.written_bytes = 0
+        self.dropped_bytes = 0
+        self.max_pending = 0
+        self.write_seconds = 0.0
+        self.errors = 0
+
+    def submit(self, action, *args, size: int = 0) -> bool:
+        """
+        쓰기 작업 예약 (임의 스레드에서 호출 가능)
+
+        Args:
+            action: 쓰기 스레드에서 실행할 함수
+            size: 작업이 쓰는 오디오 바이트 수 (대기 상한 계산용, 0이면 항상 예약)
+        Returns:
+            False : 대기 상한 초과로 버림
+        """
+        with self._lock:
+            if size and self.pending_bytes + size > self.max_pending_bytes:
+                self.dropped_bytes += size
+                return False
+            self.pending_bytes += size
+            self.max_pending = max(self.max_pending, self.pending_bytes)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="session-recorder", daemon=True)
+                self._thread.start()
+        self._queue.put((action, args, size))
+        return True
+
+    def _run(self):
+        while True:
+            action, args, size = self._queue.get()
+            started = time.perf_counter()
+            try:
+                action(*args)
+            except Exception as e:
+                self.errors += 1
+                print(f"녹음 파일 쓰기 오류: {e}")
+            self.write_seconds += time.perf_counter() - started
+            with self._lock:
+                self.pending_bytes -= size
+                self.written_bytes += size
+
+    def get_stats(self) -> dict:
+        return {
+            'pending_bytes': self.pending_bytes,
+            'max_pending_bytes': self.max_pending,
+            'written_bytes': self.written_bytes,
+            'dropped_bytes': self.dropped_bytes,
+            'write_seconds': round(self.write_seconds, 3),
+            'errors': self.errors,
+        }
+
+recording_writer = RecordingWriter()
+metrics_registry.register("recording_writer", recording_writer.get_stats)
+
+# [2] 세션 녹음
+class SessionRecorder:
+    """
+    세션(소켓 오디오 스트림) 1개의 입력 오디오 녹음
+
+    <session_id>_<part>.wav|.ogg|.webm : 받은 청크를 그대로 이어 붙인 오디오 (pcm은 WAV 헤더 포함, 종료 시 크기 기록)
+    <session_id>_<part>.idx.jsonl      : 첫 줄 메타데이터, 이후 청크별 {"t": 도착 시각(초), "offset", "size"}, 마지막 줄 종료 정보
+    - 코덱 / PCM 형식이 바뀌거나 새 소켓이 연결되면 part를 늘려 새 파일로 녹음
+    """
+    def __init__(self, metadata: dict, directory: str = SESSION_RECORDING_DIR, writer: RecordingWriter = recording_writer):
+        """
+        Args:
+            metadata: 재생에 필요한 세션 정보 (session_id, part, mode, 언어, codec, sample_rate, channels, sample_format ...)
+        """
+        self.metadata = dict(metadata)
+        self.writer = writer
+        self.base_path = os.path.join(directory, f"{metadata['session_id']}_{metadata.get('part', 0):02d}")
+        self.index_path = self.base_path + INDEX_SUFFIX
+        self.started = time.monotonic()
+
+        self.audio_file = None          # 쓰기 스레드에서만 접근 (열기 실패 시 None 유지)
+        self.index_file = None
+        self.open_error = None          # 파일 열기 실패 사유 (이후 청크 / 종료 쓰기는 건너뜀)
+        self.opened = False
+        self.closed = False
+        self.next_offset = 0            # 다음 청크의 오디오 데이터 내 위치
+
+        # 지표
+        self.chunks = 0
+        self.dropped_chunks = 0
+
+    # [2-1] 청크 추가 (이벤트 루프)
+    def write(self, chunk: bytes):
+        if self.closed or not chunk:
+            return
+        arrival = time.monotonic() - self.started
+        if not self.opened:
+            self.opened = True
+            self.writer.submit(self._open, _audio_extension(self.metadata['codec'], chunk))
+        if self.writer.submit(self._append, arrival, self.next_offset, chunk, size=len(chunk)):
+            self.next_offset += len(chunk)
+            self.chunks += 1
+        else:
+            self.dropped_chunks += 1
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        if self.opened:
+            self.writer.submit(self._finish, self.dropped_chunks)
+
+    # [2-2] 파일 쓰기 (쓰기 스레드)
+    def _open(self, extension: str):
+        audio_path = self.base_path + extension
+        audio_file = None
+        try:
+            os.makedirs(os.path.dirname(self.base_path) or ".", exist_ok=True)
+            audio_file = open(audio_path, "wb")
+            header_bytes = 0
+            if extension == ".wav":
+                # 크기는 종료 시 기록 (비정상 종료 시에도 인덱스 offset으로 복구 가능)
+                audio_file.write(_wav_header(self.metadata['sample_rate'], self.metadata['channels'], self.metadata['sample_format'], 0))
+                header_bytes = WAV_HEADER_BYTES
+            index_file = open(self.index_path, "w", encoding="utf-8")
+        except OSError as e:
+            self.open_error = str(e)
+            if audio_file is not None:
+                audio_file.close()
+            raise
+        self.audio_file, self.index_file = audio_file, index_file
+        self.index_file.write(json.dumps({
+            **self.metadata,
+            'audio_file': os.path.basename(audio_path),
+            'header_bytes': header_bytes,
+            'started_at': time.time(),
+        }, ensure_ascii=False) + "\n")
+
+    def _append(self, arrival: float, offset: int, chunk: bytes):
+        if self.audio_file is None:     # 파일 열기 실패
+            return
+        self.audio_file.write(chunk)
+        self.index_file.write(f'{{"t": {arrival:.4f}, "offset": {offset}, "size": {len(chunk)}}}\n')
+
+    def _finish(self, dropped_chunks: int):
+        if self.audio_file is None:     # 파일 열기 실패
+            return
+        data_bytes = self.audio_file.tell() - (WAV_HEADER_BYTES if self.audio_file.name.endswith(".wav") else 0)
+        if self.audio_file.name.endswith(".wav"):
+            self.audio_file.seek(0)
+            self.audio_file.write(_wav_header(self.metadata['sample_rate'], self.metadata['channels'], self.metadata['sample_format'], data_bytes))
+        self.audio_file.close()
+        self.index_file.write(json.dumps({'closed': True, 'data_bytes': data_bytes, 'dropped_chunks': dropped_chunks}) + "\n")
+        self.index_file.close()
+
+    # 현재 상태 확인
+    def get_stats(self) -> dict:
+        return {
+            'path': self.base_path,
+            'chunks': self.chunks,
+            'bytes': self.next_offset,
+            'dropped_chunks': self.dropped_chunks,
+            'open_error': self.open_error,
+        }
+
+# [3] 녹음 읽기 (재생용)
+def read_recording(index_path: str) -> tuple[dict, list[tuple[float, bytes]]]:
+    """
+    인덱스 파일 -> (메타데이터, [(도착 시각(초), 청크), ...])
+
+    종료 정보가 없는 녹음(비정상 종료)도 인덱스에 기록된 청크까지 읽음
+    - 쓰다가 잘린 마지막 인덱스 줄 / 오디오 파일 끝을 넘는 청크는 제외
+    """
+    with open(index_path, encoding="utf-8") as f:
+        raw_lines = [line for line in f if line.strip()]
+    lines = []
+    for number, line in enumerate(raw_lines):
+        try:
+            lines.append(json.loads(line))
+        except json.JSONDecodeError:
+            if number != len(raw_lines) - 1:    # 중간 줄 손상은 잘린 녹음이 아님
+                raise
+    metadata, entries = lines[0], [line for line in lines[1:] if 'offset' in line]
+
+    audio_path = os.path.join(os.path.dirname(index_path), metadata['audio_file'])
+    chunks = []
+    with open(audio_path, "rb") as f:
+        for entry in entries:
+            f.seek(metadata['header_bytes'] + entry['offset'])
+            chunk = f.read(entry['size'])
+            if len(chunk) < entry['size']:
+                break
+            chunks.append((entry['t'], chunk))
+    return metadata, chunks
@@ -0,0 +1,168 @@
+# [modules/audio/vad_gate.py]
+# 음성 구간 게이트 : 침묵 구간 오디오를 STT로 보내지 않음 (Azure 과금 = 전송한 오디오 길이)
+import time
+from collections import deque
+
+# 선택 의존성 : 프레임 에너지 계산 (벡터 연산)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+VAD_SAMPLE_RATE = 16000         # 입력 형식 : 16kHz / 16bit / mono PCM (디코딩 / 변환 이후)
+VAD_FRAME_MS = 20               # 판정 단위 프레임 길이
+
+class VadGate:
+    """
+    세션별 에너지 기반 음성 구간 게이트
+
+    - 프레임(20ms)별 RMS(dBFS) 계산 -> 배경 소음 대비 임계값으로 판정
+    - 히스테리시스 : 열림 임계값 > 닫힘 임계값 (경계 부근에서 게이트가 떨리지 않도록)
+    - onset     : 열림 임계값을 연속으로 넘어야 열림 (짧은 잡음 무시)
+    - pre-roll  : 닫혀 있는 동안 직전 오디오를 보관 -> 열릴 때 함께 전달 (발화 시작 잘림 방지)
+    - hangover  : 음성이 끝나도 일정 시간 더 전달
+                  Azure는 침묵(Segmentation Silence 700ms)을 받아야 문장을 확정하므로 그보다 길게 유지
+    - keep-alive: 닫혀 있는 동안에도 주기적으로 짧은 무음 전달 (인식기 타임아웃 방지)
+    """
+    # [1] 초기화
+    def __init__(self,
+                 open_db: float = 12.0,
+                 close_db: float = 6.0,
+                 min_speech_dbfs: float = -50.0,
+                 onset_ms: int = 40,
+                 hangover_ms: int = 1000,
+                 preroll_ms: int = 300,
+                 keepalive_interval_ms: int = 10000,
+                 keepalive_ms: int = 200):
+        """
+        Args:
+            open_db / close_db: 배경 소음 대비 열림 / 닫힘 임계값 (dB)
+            min_speech_dbfs: 이보다 작은 소리는 배경 소음과 무관하게 음성으로 보지 않음
+            onset_ms: 열림 판정에 필요한 연속 음성 길이
+            hangover_ms: 음성 종료 후 게이트 유지 시간
+            preroll_ms: 열릴 때 함께 전달하는 직전 오디오 길이
+            keepalive_interval_ms / keepalive_ms: 닫힌 상태에서 무음을 보내는 주기 / 길이
+        """
+        if np is None:
+            raise ValueError("numpy 패키지가 설치되지 않아 음성 구간 게이트를 사용할 수 없습니다")
+
+        self.frame_samples = VAD_SAMPLE_RATE * VAD_FRAME_MS // 1000
+        self.frame_bytes = self.frame_samples * 2
+
+        self.open_db = open_db
+        self.close_db = close_db
+        self.min_speech_dbfs = min_speech_dbfs
+        self.onset_frames = max(1, onset_ms // VAD_FRAME_MS)
+        self.hangover_frames = hangover_ms // VAD_FRAME_MS
+        self.preroll_frames = preroll_ms // VAD_FRAME_MS
+        self.keepalive_interval_frames = keepalive_interval_ms // VAD_FRAME_MS
+        self.keepalive_bytes = bytes(VAD_SAMPLE_RATE * keepalive_ms // 1000 * 2)
+
+        # 상태 (청크 경계를 넘어 유지)
+        self.remainder = b""                # 프레임 단위로 나누고 남은 바이트
+        self.is_open = False
+        self.noise_floor_dbfs = -60.0       # 배경 소음 추정값
+        self.onset_count = 0
+        self.hangover_left = 0
+        self.preroll = deque(maxlen=self.preroll_frames + self.onset_frames)    # 닫힌 상태의 최근 프레임 (onset 프레임 포함)
+        self.closed_frames = 0              # 마지막 전송 이후 닫힌 상태로 지난 프레임 수
+
+        # 지표
+        self.received_frames = 0
+        self.forwarded_frames = 0
+        self.keepalive_bytes_sent = 0
+        self.speech_segments = 0
+        self.cpu_seconds = 0.0
+
+    # [2] 청크 처리
+    def process(self, pcm: bytes) -> bytes:
+        """
+        PCM 청크 -> STT로 보낼 PCM (닫힌 구간은 제외, 없으면 빈 bytes)
+        """
+        started = time.thread_time()
+        data = self.remainder + pcm
+        frame_count = len(data) // self.frame_bytes
+        self.remainder = data[frame_count * self.frame_bytes:]
+        if frame_count == 0:
+            return b""
+
+        # 프레임별 에너지 (한 번에 계산)
+        samples = np.frombuffer(data, dtype="<i2", count=frame_count * self.frame_samples)
+        frames = samples.reshape(frame_count, self.frame_samples).astype(np.float32)
+        rms = np.sqrt(np.mean(frames * frames, axis=1)) / 32768.0
+        levels = 20.0 * np.log10(np.maximum(rms, 1e-10))
+
+        output = bytearray()
+        for index, level in enumerate(levels.tolist()):
+            frame = data[index * self.frame_bytes:(index + 1) * self.frame_bytes]
+            self.received_frames += 1
+            if self.is_open:
+                self._process_open(frame, level, output)
+            else:
+                self._process_closed(frame, level, output)
+
+        self.cpu_seconds += time.thread_time() - started
+        return bytes(output)
+
+    def _process_open(self, frame: bytes, level: float, output: bytearray):
+        output += frame
+        self.forwarded_frames += 1
+        # 열린 상태에서도 아주 천천히 따라감 (지속적인 소음이 생기면 약 10초 후 닫힘)
+        self.noise_floor_dbfs += 0.002 * (level - self.noise_floor_dbfs)
+        if level >= self._close_threshold():
+            self.hangover_left = self.hangover_frames
+            return
+        self.hangover_left -= 1
+        if self.hangover_left <= 0:
+            self.is_open = False
+            self.closed_frames = 0
+
+    def _process_closed(self, frame: bytes, level: float, output: bytearray):
+        self.preroll.append(frame)
+
+        if level >= self._open_threshold():
+            self.onset_count += 1
+        else:
+            self.onset_count = 0
+            # 배경 소음 추정 (천천히 따라감)
+            self.noise_floor_dbfs += 0.05 * (level - self.noise_floor_dbfs)
+
+        # 열림 : pre-roll(onset 프레임 포함) 한꺼번에 전달
+        if self.onset_count >= self.onset_frames:
+            for buffered in self.preroll:
+                output += buffered
+            self.forwarded_frames += len(self.preroll)
+            self.preroll.clear()
+            self.onset_count = 0
+            self.is_open = True
+            self.hangover_left = self.hangover_frames
+            self.speech_segments += 1
+            return
+
+        # keep-alive : 오래 닫혀 있으면 짧은 무음 전달
+        self.closed_frames += 1
+        if self.keepalive_interval_frames and self.closed_frames >= self.keepalive_interval_frames:
+            output += self.keepalive_bytes
+            self.keepalive_bytes_sent += len(self.keepalive_bytes)
+            self.closed_frames = 0
+
+    def _open_threshold(self) -> float:
+        return max(self.noise_floor_dbfs + self.open_db, self.min_speech_dbfs)
+
+    def _close_threshold(self) -> float:
+        return max(self.noise_floor_dbfs + self.close_db, self.min_speech_dbfs)
+
+    # [3] 지표 반환
+    def get_stats(self) -> dict:
+        frame_seconds = VAD_FRAME_MS / 1000
+        received_seconds = self.received_frames * frame_seconds
+        forwarded_seconds = self.forwarded_frames * frame_seconds + self.keepalive_bytes_sent / (VAD_SAMPLE_RATE * 2)
+        return {
+            'is_open': self.is_open,
+            'noise_floor_dbfs': round(self.noise_floor_dbfs, 1),
+            'speech_segments': self.speech_segments,
+            'received_seconds': round(received_seconds, 2),
+            'forwarded_seconds': round(forwarded_seconds, 2),
+            'forwarded_ratio': round(forwarded_seconds / received_seconds, 3) if received_seconds else 0.0,
+            'cpu_ms_per_audio_second': round(self.cpu_seconds / received_seconds * 1000, 3) if received_seconds else 0.0,
+        }
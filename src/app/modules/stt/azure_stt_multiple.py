@@ -1,12 +1,17 @@
 # [modules/stt/azure_stt_multiple.py]
 # Azure Speech to Text AI
 import os
+import threading
 import azure.cognitiveservices.speech as speechsdk
-import asyncio  #async 선언이 안된 동기 함수에서 비동기 함수를 사용할 때 필요한 라이브러리
+from src.app.modules.stt.base_stt import BaseSTT
+from src.app.modules.stt.language_switch import LanguageSwitchMixin
 
-class AzureSTTMultiple:
+DEFAULT_INITIAL_SILENCE_MS = 1000       # 지연 프로파일에서 지정하지 않았을 때 첫 음성 대기 시간
+
+class AzureSTTMultiple(LanguageSwitchMixin, BaseSTT):
     # [1] 초기화
     def __init__(self):
+        super().__init__()
         # stt 변수 초기화
         self.azure_key = os.environ['AZURE_STT_KEY']
         self.azure_region = os.environ['AZURE_REGION']  
@@ -14,8 +19,7 @@ class AzureSTTMultiple:
         self.speech_v2_endpoint = f"wss://{self.azure_region}.stt.speech.microsoft.com/speech/universal/v2"
         self.speech_recognizer = None
         self.audio_stream = None
-        self.is_listening = False   # 음성 인식 중복 방지
-        self.result_queue = None    # stt 결과 저장 함수 ["language", "text"] (동기 저장 -> 비동기 추출)
+        self._init_language_switch()        # 무중단 언어 전환 상태
 
     # [2] 음성 인식 설정
     def setup_streaming_recognition(self, input_languages: list[str]) : 
@@ -25,8 +29,11 @@ class AzureSTTMultiple:
         """
 
         # stt 결과 저장 queue 생성
-        if self.result_queue is None:
-            self.result_queue = asyncio.Queue()
+        self.setup_result_queue()
+        self.speech_recognizer, self.audio_stream, self.recognizer_stopped = self._create_recognizer(input_languages)
+
+    def _create_recognizer(self, input_languages):
+        """인식기 + 오디오 스트림 생성 -> (speech_recognizer, audio_stream, stopped_event)"""
 
         #speech 설정
         speech_config = speechsdk.SpeechConfig(
@@ -34,14 +41,16 @@ class AzureSTTMultiple:
             endpoint=self.speech_v2_endpoint,
         )
         
-        speech_config.set_property(speechsdk.PropertyId.SpeechServiceConnection_InitialSilenceTimeoutMs, "1000")  # 녹음 시작 후 첫 음성을 기다리는 시간
-        speech_config.set_property(speechsdk.PropertyId.Speech_SegmentationSilenceTimeoutMs, "700")               # (세그먼트)문장 구분을 위한 침묵 감지 시간
-        speech_config.set_property(speechsdk.PropertyId.SpeechServiceConnection_EndSilenceTimeoutMs, "600")       # (문장)문장 구분을 위한 침묵 감지 시간
+        # 침묵 시간 / 인식 모드 (지연 프로파일)
+        settings = self.recognizer_settings
+        initial_silence_ms = settings['initial_silence_ms'] if settings['initial_silence_ms'] is not None else DEFAULT_INITIAL_SILENCE_MS
+        speech_config.set_property(speechsdk.PropertyId.SpeechServiceConnection_InitialSilenceTimeoutMs, str(initial_silence_ms))  # 녹음 시작 후 첫 음성을 기다리는 시간
+        speech_config.set_property(speechsdk.PropertyId.Speech_SegmentationSilenceTimeoutMs, str(settings['segmentation_silence_ms']))           # (세그먼트)문장 구분을 위한 침묵 감지 시간
+        speech_config.set_property(speechsdk.PropertyId.SpeechServiceConnection_EndSilenceTimeoutMs, str(settings['end_silence_ms']))   # (문장)문장 구분을 위한 침묵 감지 시간
         
         speech_config.set_property(property_id=speechsdk.PropertyId.SpeechServiceConnection_LanguageIdMode, value='Continuous')     # 다중 언어 인식 모드
 
-        speech_config.set_property_by_name("SpeechServiceConnection_RecoMode", "INTERACTIVE")  # 실시간용 모드
-        #speech_config.set_property_by_name("SpeechServiceConnection_RecoMode", "CONVERSATION")  # 대화용
+        speech_config.set_property_by_name("SpeechServiceConnection_RecoMode", settings['reco_mode'])  # INTERACTIVE : 실시간용 / CONVERSATION : 대화용
         speech_config.output_format = speechsdk.OutputFormat.Simple  # 간단한 출력 형식
         #speech_config.enable_dictation() 
 
@@ -56,43 +65,18 @@ class AzureSTTMultiple:
             bits_per_sample=16, 
             channels=1
         )
-        self.audio_stream = speechsdk.audio.PushAudioInputStream(audio_format)
-        audio_config = speechsdk.audio.AudioConfig(stream=self.audio_stream)
+        audio_stream = speechsdk.audio.PushAudioInputStream(audio_format)
+        audio_config = speechsdk.audio.AudioConfig(stream=audio_stream)
 
         # 음성 인식기 생성
-        self.speech_recognizer = speechsdk.SpeechRecognizer(
+        speech_recognizer = speechsdk.SpeechRecognizer(
             speech_config=speech_config,
             auto_detect_source_language_config=auto_detect_source_language_config,
             audio_config=audio_config
         )
 
-        # 이벤트 핸들러 설정 - recognizing
-        # mode - recognizing : stt가 인식한 단위의 연속해서 반환. 실시성이 우수하나 빠른 업데이트로 보기 어지러울 수 있음.
-        def recognizing_handler(evt):            
-            if evt.result.reason == speechsdk.ResultReason.RecognizingSpeech:    #stt 결과 받아오기 -> 처리 자체를 동기 방식으로 진행 (비동기 함수 사용x)
-                text = evt.result.text.strip()
-
-                #인식 음성 분석
-                auto_detect_result = speechsdk.AutoDetectSourceLanguageResult(evt.result)
-                detected_language = auto_detect_result.language
-
-                if text:
-                    print(f"원본: {text} (언어 : {detected_language})\n")
-                    try:
-                        result_data = {
-                            'language': detected_language,
-                            'text': text
-                        }
-                        self.result_queue.put_nowait(result_data)    #동기 방식으로 반환된 stt 결과를 queue에 순서대로 저장
-                    except Exception as e:
-                        print(f"큐 추가 오류: {e}")
-                else:
-                    print("빈 텍스트 결과")
-            elif evt.result.reason == speechsdk.ResultReason.NoMatch:
-                print("음성 인식 결과 없음")
-            else:
-                print(f"기타 STT 결과: {evt.result.reason}")
-
+        stopped = threading.Event()     # session_stopped / canceled 수신 (전환 시 이전 인식기의 마지막 결과 대기용)
+        offset_base = self._stream_offset()     # 이 인식기 스트림의 세션 기준 시작 위치 (offset은 인식기마다 0부터)
 
         # 공통 핸들러 함수 정의 - reconizing + recognized
         def hybrid_result_handler(evt, is_final: bool):
@@ -109,11 +93,12 @@ class AzureSTTMultiple:
                     result_data = {
                         'language': detected_language,
                         'text': text,
-                        'is_final': is_final
+                        'is_final': is_final,
+                        'utterance_id': offset_base + evt.result.offset     # 같은 발화의 중간/최종 결과는 offset이 동일, 전환 후에도 세션 안에서 고유
                     }
                     print(f"{'[최종]' if is_final else '[중간]'} {text} (언어 : {detected_language})")
                     try:
-                        self.result_queue.put_nowait(result_data)   #동기 방식으로 반환된 stt 결과를 queue에 순서대로 저장
+                        self.result_bridge.put(result_data)     # SDK 콜백 스레드 -> 브리지 -> 이벤트 루프에서 queue에 저장
                     except Exception as e:
                         print(f"큐 추가 오류: {e}")
             
@@ -125,23 +110,29 @@ class AzureSTTMultiple:
             
         def session_stopped_handler(evt):
             print("음성 인식 세션이 종료되었습니다.")
-            self.is_listening = False
+            stopped.set()
+            if speech_recognizer is self.speech_recognizer:     # 전환 후 정리 중인 이전 인식기는 상태 변경 x
+                self.is_listening = False
             
         def canceled_handler(evt):
             print(f"음성 인식이 취소되었습니다: {evt.result.cancellation_details.reason}")
             if evt.result.cancellation_details.reason == speechsdk.CancellationReason.Error:
                 print(f"오류 세부사항: {evt.result.cancellation_details.error_details}")
-            self.is_listening = False
+            stopped.set()
+            if speech_recognizer is self.speech_recognizer:
+                self.is_listening = False
         
         # 이벤트 연결
         # stt 결과가 나왔을 때,
-        self.speech_recognizer.recognized.connect(lambda evt: hybrid_result_handler(evt, is_final=True))                   
-        self.speech_recognizer.recognizing.connect(lambda evt: hybrid_result_handler(evt, is_final=False))
+        speech_recognizer.recognized.connect(lambda evt: hybrid_result_handler(evt, is_final=True))                   
+        speech_recognizer.recognizing.connect(lambda evt: hybrid_result_handler(evt, is_final=False))
+
+        speech_recognizer.session_started.connect(session_started_handler)         # 세션이 시작되었을 때, 
+        speech_recognizer.session_stopped.connect(session_stopped_handler)         # 세션이 종료되었을 때,
+        speech_recognizer.canceled.connect(canceled_handler)                       # 인식이 취소되었을 때,
+
+        return speech_recognizer, audio_stream, stopped
 
-        self.speech_recognizer.session_started.connect(session_started_handler)         # 세션이 시작되었을 때, 
-        self.speech_recognizer.session_stopped.connect(session_stopped_handler)         # 세션이 종료되었을 때,
-        self.speech_recognizer.canceled.connect(canceled_handler)                       # 인식이 취소되었을 때,
-    
     # [3] 음성 인식 
     def start_recognition(self):
         """연속 음성 인식 시작"""
@@ -168,42 +159,25 @@ class AzureSTTMultiple:
         Args:
             audio_data: 오디오 바이트 데이터
         """
-        if self.audio_stream and self.is_listening:
-            self.audio_stream.write(audio_data)
+        if self._write_audio(audio_data):      # 언어 전환 중이면 버퍼에 보관
             print(f"Azure STT에 오디오 전송: {len(audio_data)} bytes")
         else:
             print(f"Azure STT 비활성 상태: stream={self.audio_stream is not None}, listening={self.is_listening}")
     
-    # [3-2] 음성 처리 결과 queue 비동기로 반환
-    async def get_recognition_result(self):
-        """STT 결과를 비동기로 반환"""
-        try:
-            return await self.result_queue.get()
-        except:
-            return None
-
     # [4] 실행 중지
     def stop_recognition(self):
         """연속 음성 인식 중지"""
-        if self.speech_recognizer and self.is_listening:
-            print("\n음성 인식을 중지합니다...")
-            self.speech_recognizer.stop_continuous_recognition()
-            self.is_listening = False
-        else:
-            print("진행 중인 음성 인식이 없습니다.")
+        with self.audio_lock:       # 언어 전환 중이면 교체 전에 중지 -> 전환 작업이 새 인식기 정리
+            if self.speech_recognizer and self.is_listening:
+                print("\n음성 인식을 중지합니다...")
+                self.speech_recognizer.stop_continuous_recognition()
+                self.is_listening = False
+            else:
+                print("진행 중인 음성 인식이 없습니다.")
 
-        if self.audio_stream:
-            self.audio_stream.close()
-            self.audio_stream = None
+            if self.audio_stream:
+                self.audio_stream.close()
+                self.audio_stream = None
+            self.switch_buffer = None
 
         print("음성 인식 중지 완료")
-
-    # [5] 음성 인식 언어 변경
-    def change_setup_recognition(self, input_language) : 
-        self.stop_recognition()                                     # 기존 인식 중지
-        self.setup_streaming_recognition(input_language)  # 음성 인식 언어 변경
-        self.start_recognition()                                    # 다시 시작
-
-    def is_active(self) -> bool:
-        """현재 인식이 활성화되어 있는지 확인"""
-        return self.is_listening
\ No newline at end of file
@@ -0,0 +1,86 @@
+# [modules/stt/base_stt.py]
+# STT 백엔드 공통 인터페이스
+import asyncio
+from abc import ABC, abstractmethod
+from src.app.modules.stt.result_bridge import CallbackResultBridge
+from src.app.core.result_queue import BoundedResultQueue
+from src.app.core.latency_profiles import resolve_latency_profile, recognizer_settings
+
+STT_RESULT_QUEUE_SIZE = 64      # 세션별 STT 결과 큐 최대 크기
+
+class BaseSTT(ABC):
+    """
+    STT 백엔드 공통 인터페이스 (Azure / 로컬 재생 등)
+
+    인식 결과는 dict로 result_bridge에 넣는다 (콜백 스레드에서 호출 가능)
+        {'text', 'is_final', 'utterance_id', 'language'(다중 언어 모드)}
+    """
+    # [1] 초기화
+    def __init__(self):
+        self.is_listening = False   # 음성 인식 중복 방지
+        self.result_bridge = None   # 콜백 스레드 -> 이벤트 루프 결과 전달 브리지
+        self.result_queue = None    # stt 결과 저장 함수 (동기 저장 -> 비동기 추출)
+        self.recognizer_settings = dict(recognizer_settings(resolve_latency_profile()))    # 침묵 시간 / 인식 모드 (지연 프로파일)
+
+    def setup_result_queue(self):
+        """stt 결과 저장 queue 생성 (이벤트 루프 안에서 최초 1회 - 인식기 생성을 다른 스레드에서 할 때는 먼저 호출)"""
+        if self.result_queue is None:
+            self.result_queue = BoundedResultQueue(STT_RESULT_QUEUE_SIZE)
+            self.result_bridge = CallbackResultBridge(asyncio.get_running_loop(), self.result_queue)
+
+    def set_recognizer_settings(self, settings: dict):
+        """
+        지연 프로파일의 인식기 항목 설정 (다음 setup_streaming_recognition부터 적용)
+
+        Args:
+            settings: {'initial_silence_ms', 'segmentation_silence_ms', 'end_silence_ms', 'reco_mode'}
+        """
+        self.recognizer_settings = dict(settings)
+
+    # [2] 음성 인식 설정
+    @abstractmethod
+    def setup_streaming_recognition(self, input_language):
+        """
+        실시간 스트리밍 음성 인식 설정
+
+        Args:
+            input_language: 입력 언어 코드 (다중 언어 모드는 언어 코드 리스트)
+        """
+
+    # [3] 음성 인식
+    @abstractmethod
+    def start_recognition(self):
+        """연속 음성 인식 시작"""
+
+    @abstractmethod
+    def write_audio_chunk(self, audio_data: bytes):
+        """오디오 청크(16kHz / 16bit / mono PCM)를 스트림에 추가 (즉시 반환)"""
+
+    async def get_recognition_result(self):
+        """STT 결과를 비동기로 반환"""
+        try:
+            return await self.result_queue.get()
+        except Exception:
+            return None
+
+    # [4] 실행 중지
+    @abstractmethod
+    def stop_recognition(self):
+        """연속 음성 인식 중지"""
+
+    # [5] 음성 인식 언어 변경
+    def change_setup_recognition(self, input_language):
+        self.stop_recognition()                                     # 기존 인식 중지
+        self.setup_streaming_recognition(input_language)            # 음성 인식 언어 변경
+        self.start_recognition()                                    # 다시 시작
+
+    def is_active(self) -> bool:
+        """현재 인식이 활성화되어 있는지 확인"""
+        return self.is_listening
+
+    def get_stats(self) -> dict:
+        """콜백 브리지 / 결과 큐 지표 반환"""
+        return {
+            'bridge': self.result_bridge.get_stats() if self.result_bridge else {},
+            'result_queue': self.result_queue.get_stats() if self.result_queue else {},
+        }
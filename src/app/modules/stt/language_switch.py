@@ -0,0 +1,157 @@
+# [modules/stt/language_switch.py]
+# 입력 언어 무중단 전환 (make-before-break) : 새 언어 인식기를 먼저 연결한 뒤 교체
+import os
+import threading
+from concurrent.futures import Future
+import time
+from src.app.core.metrics import LatencyRecorder
+
+STT_BYTES_PER_SECOND = 16000 * 2                                                        # 16kHz / 16bit / mono
+TICKS_PER_SECOND = 10_000_000                                                           # 인식 결과 offset 단위 (100ns)
+SWITCH_BUFFER_SECONDS = float(os.getenv("STT_SWITCH_BUFFER_SECONDS", "10"))             # 전환 중 보관하는 오디오 최대 길이
+SWITCH_FLUSH_TIMEOUT = float(os.getenv("STT_SWITCH_FLUSH_TIMEOUT", "5"))                # 이전 인식기의 마지막 결과 대기 시간
+
+class LanguageSwitchMixin:
+    """
+    인식을 멈추지 않고 입력 언어 변경 (Azure 단일 / 다중 언어 STT 공용)
+
+    1. 새 언어 인식기 생성 + 연결 - 그동안 들어온 오디오는 버퍼에 보관
+    2. 새 인식기 연결 완료 -> 청크 경계에서 버퍼 오디오를 새 스트림에 쓰고 교체
+    3. 이전 인식기는 스트림 종료 -> 마지막 recognized(session_stopped)까지 받은 뒤 중지
+    - 새 인식기 연결 실패 시 버퍼 오디오를 이전 스트림에 써서 기존 언어로 계속 인식
+    - 전환 결과는 반환된 future로 확인 (교체 완료 시 완료, 연결 실패 시 예외) -> 호출한 쪽은 성공한 경우에만 언어 설정 반영
+    - 인식 결과 offset은 인식기(스트림)마다 0부터 시작 -> _stream_offset()을 더해 세션 기준 발화 위치로 사용 (전환 후 발화 ID 중복 x)
+    - 오디오 손실은 버퍼 상한(SWITCH_BUFFER_SECONDS)을 넘은 경우에만 발생
+
+    사용하는 클래스가 구현
+        _create_recognizer(input_language) -> (recognizer, audio_stream, stopped_event)
+        (stopped_event : 해당 인식기의 session_stopped / canceled 시 set)
+    """
+    def _init_language_switch(self):
+        self.recognizer_stopped = None          # 현재 인식기의 종료 이벤트
+        self.audio_lock = threading.Lock()      # 오디오 쓰기 <-> 인식기 교체 보호
+        self.switch_lock = threading.Lock()     # 전환 작업 직렬화 (연속 변경 요청)
+        self.switch_buffer = None               # 전환 중 보관 오디오 (None이면 전환 중 아님)
+        self.written_bytes = 0                  # 인식기 스트림에 쓴 오디오 누적 (모든 인식기 합계)
+
+        # 지표
+        self.switches = 0
+        self.switch_failures = 0
+        self.switch_gap = LatencyRecorder()     # 변경 요청 -> 새 인식기로 교체 (버퍼 오디오의 인식 지연)
+        self.retire_flush = LatencyRecorder()   # 이전 스트림 종료 -> 마지막 결과 수신
+        self.retire_timeouts = 0
+        self.switch_buffered_bytes = 0          # 버퍼에 보관했다가 전달한 오디오
+        self.switch_lost_bytes = 0              # 버퍼 상한 초과로 버린 오디오
+
+    # [1] 입력 언어 변경
+    def change_setup_recognition(self, input_language) -> Future:
+        """
+        인식 중이면 백그라운드에서 무중단 전환 (즉시 반환), 아니면 기존 방식(중지 -> 설정 -> 시작)
+
+        Returns:
+            전환 결과 future (새 인식기로 교체되면 완료 - 이전 인식기 정리는 기다리지 않음, 실패 시 예외)
+        """
+        switched = Future()
+        if not self.is_listening:
+            super().change_setup_recognition(input_language)
+            switched.set_result(None)
+            return switched
+        threading.Thread(
+            target=self._switch_language,
+            args=(input_language, time.perf_counter(), switched),
+            daemon=True,
+        ).start()
+        return switched
+
+    def _switch_language(self, input_language, requested_at: float, switched: Future):
+        with self.switch_lock:
+            with self.audio_lock:
+                self.switch_buffer = bytearray()
+            try:
+                recognizer, audio_stream, stopped = self._create_recognizer(input_language)
+                recognizer.start_continuous_recognition()       # 새 인식기 연결 (블로킹, 이전 인식기는 유지)
+            except Exception as e:
+                print(f"입력 언어 전환 실패 (기존 언어로 계속 인식): {e}")
+                self.switch_failures += 1
+                with self.audio_lock:
+                    self._flush_switch_buffer(self.audio_stream if self.is_listening else None)
+                switched.set_exception(e)
+                return
+
+            # 청크 경계에서 교체 (audio_lock 보유 중에는 오디오 쓰기 x)
+            with self.audio_lock:
+                if not self.is_listening:       # 전환 중 세션 종료 -> 새 인식기 정리
+                    self.switch_buffer = None
+                    retired = (recognizer, audio_stream, stopped)
+                    switched.set_exception(RuntimeError("입력 언어 전환 중 인식이 중지되었습니다"))
+                else:
+                    self._flush_switch_buffer(audio_stream)
+                    retired = (self.speech_recognizer, self.audio_stream, self.recognizer_stopped)
+                    self.speech_recognizer, self.audio_stream, self.recognizer_stopped = recognizer, audio_stream, stopped
+                    self.switches += 1
+                    self.switch_gap.record(time.perf_counter() - requested_at)
+                    print(f"입력 언어 전환 완료: {input_language} ({(time.perf_counter() - requested_at) * 1000:.0f}ms)")
+                    switched.set_result(None)
+            self._retire_recognizer(*retired)
+
+    def _flush_switch_buffer(self, audio_stream):
+        """전환 중 보관한 오디오를 스트림에 쓰고 버퍼 해제 (audio_lock 보유 상태에서 호출)"""
+        if self.switch_buffer:
+            if audio_stream is not None:
+                audio_stream.write(bytes(self.switch_buffer))
+                self.written_bytes += len(self.switch_buffer)
+                self.switch_buffered_bytes += len(self.switch_buffer)
+            else:
+                self.switch_lost_bytes += len(self.switch_buffer)
+        self.switch_buffer = None
+
+    def _retire_recognizer(self, recognizer, audio_stream, stopped):
+        """스트림 종료 -> 남은 오디오의 마지막 결과(session_stopped)까지 대기 -> 인식기 중지"""
+        retire_started = time.perf_counter()
+        try:
+            if audio_stream is not None:
+                audio_stream.close()
+            if stopped is not None and stopped.wait(SWITCH_FLUSH_TIMEOUT):
+                self.retire_flush.record(time.perf_counter() - retire_started)
+            else:
+                self.retire_timeouts += 1
+            recognizer.stop_continuous_recognition()
+        except Exception as e:
+            print(f"이전 인식기 정리 오류: {e}")
+
+    # [2] 오디오 쓰기
+    def _write_audio(self, audio_data: bytes) -> bool:
+        """현재 스트림에 쓰기 (전환 중이면 버퍼에 보관) -> 인식 중이 아니면 False"""
+        with self.audio_lock:
+            if self.switch_buffer is not None:
+                if len(self.switch_buffer) + len(audio_data) > SWITCH_BUFFER_SECONDS * STT_BYTES_PER_SECOND:
+                    self.switch_lost_bytes += len(audio_data)
+                else:
+                    self.switch_buffer.extend(audio_data)
+                return True
+            if self.audio_stream and self.is_listening:
+                self.audio_stream.write(audio_data)
+                self.written_bytes += len(audio_data)
+                return True
+            return False
+
+    def _stream_offset(self) -> int:
+        """
+        지금까지 인식기 스트림에 쓴 오디오 길이 (100ns 단위)
+        - 새 인식기 생성 시점에 읽어서 그 인식기 결과 offset에 더함 (전환 중 오디오는 버퍼에 있으므로 이전 스트림 끝 = 새 스트림 시작)
+        """
+        return self.written_bytes * TICKS_PER_SECOND // STT_BYTES_PER_SECOND
+
+    def get_stats(self) -> dict:
+        return {
+            **super().get_stats(),
+            'language_switch': {
+                'switches': self.switches,
+                'failures': self.switch_failures,
+                'gap': self.switch_gap.snapshot(),
+                'retire_flush': self.retire_flush.snapshot(),
+                'retire_timeouts': self.retire_timeouts,
+                'buffered_seconds': round(self.switch_buffered_bytes / STT_BYTES_PER_SECOND, 3),
+                'lost_seconds': round(self.switch_lost_bytes / STT_BYTES_PER_SECOND, 3),
+            },
+        }
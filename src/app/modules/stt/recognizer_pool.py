@@ -0,0 +1,239 @@
+# [modules/stt/recognizer_pool.py]
+# 미리 만들어 둔 인식기 풀 : 연결 시 SpeechConfig / PushAudioInputStream / SpeechRecognizer 생성 시간을 없앰
+import asyncio
+import os
+import time
+from collections import OrderedDict, deque
+from src.app.core.latency_profiles import resolve_latency_profile, recognizer_settings
+from src.app.core.metrics import LatencyRecorder, metrics_registry
+from src.app.modules.stt.stt_factory import create_stt
+
+STT_POOL_SIZE = int(os.getenv("STT_POOL_SIZE", "2"))                                # 언어(조합)별로 미리 만들어 두는 인식기 수 (0이면 풀 사용 x)
+STT_POOL_MAX_KEYS = int(os.getenv("STT_POOL_MAX_KEYS", "8"))                        # 풀을 유지하는 언어(조합) 수 상한
+STT_POOL_CHECK_SECONDS = float(os.getenv("STT_POOL_CHECK_SECONDS", "10"))           # 풀 정리 / 상태 확인 / 보충 주기
+STT_POOL_MAX_AGE_SECONDS = float(os.getenv("STT_POOL_MAX_AGE_SECONDS", "0"))        # 이 시간이 지난 인식기는 새로 생성 (0이면 나이 기준 교체 x)
+STT_POOL_DEMAND_SECONDS = float(os.getenv("STT_POOL_DEMAND_SECONDS", "1800"))       # 마지막 요청 후 언어 풀을 유지하는 시간
+STT_POOL_PRESTART = os.getenv("STT_POOL_PRESTART", "1") == "1"                      # 인식 연결(start)까지 미리 수행 (0이면 연결 유지 비용 x 대신 acquire에서 start 블로킹 호출)
+STT_POOL_WARM_LANGUAGES = [lang for lang in os.getenv("STT_POOL_LANGUAGES", "").split(",") if lang]   # 서버 시작 시 채워 둘 단일 모드 언어
+
+def _pool_key(mode: str, input_language, settings: tuple = None) -> tuple:
+    """(모드, 언어, 인식기 설정) -> 풀 key (다중 언어 모드는 후보 언어 조합)"""
+    if settings is None:
+        settings = recognizer_settings(resolve_latency_profile())
+    if isinstance(input_language, list):
+        input_language = tuple(input_language)
+    return mode, input_language, settings
+
+class RecognizerPool:
+    """
+    (모드, 입력 언어, 지연 프로파일의 인식기 설정)별 설정이 끝난 인식기 보관
+
+    - acquire : 풀에 있으면 즉시 반환 (hit), 없으면 새로 생성 (miss) -> 둘 다 백그라운드 보충 예약
+    - 인식기 생성 / 시작은 SDK 블로킹 호출 -> 스레드에서 실행 (동시 접속 시 이벤트 루프 정지 x)
+    - 끊긴 인식기만 폐기 후 새로 생성 (미리 시작한 인식기의 서버 연결 종료, 또는 max_age_seconds 초과) -> 불필요한 재연결 x
+    - 최근 요청이 없는 언어는 풀에서 제외 (STT_POOL_LANGUAGES 언어는 항상 유지)
+    """
+    # [1] 초기화
+    def __init__(self,
+                 size: int = STT_POOL_SIZE,
+                 max_keys: int = STT_POOL_MAX_KEYS,
+                 check_seconds: float = STT_POOL_CHECK_SECONDS,
+                 max_age_seconds: float = STT_POOL_MAX_AGE_SECONDS,
+                 prestart: bool = STT_POOL_PRESTART):
+        self.size = size
+        self.max_keys = max_keys
+        self.check_seconds = check_seconds
+        self.max_age_seconds = max_age_seconds
+        self.prestart = prestart
+
+        self.entries = {}                   # key -> deque[(stt, 생성 시각)]
+        self.demand = OrderedDict()         # key -> 마지막 요청 시각 (오래된 순)
+        self.pinned = set()                 # 항상 유지하는 key
+        self.refilling = set()              # 보충 중인 key
+        self.maintenance_task = None
+
+        # 지표
+        self.hits = 0
+        self.misses = 0
+        self.stale_discarded = 0            # 꺼낼 때 이미 끊겨 있던 인식기
+        self.stale_refreshed = 0            # 상태 확인에서 끊긴 / 오래된 인식기로 판단해 교체한 수
+        self.built = 0
+        self.build_failures = 0
+        self.build_latency = LatencyRecorder()
+        self.acquire_latency = LatencyRecorder()
+
+    # [2] 풀 시작 (서버 시작 시 호출)
+    def start(self, warm_languages: list[str] = STT_POOL_WARM_LANGUAGES):
+        """정리 태스크 시작 + 지정한 단일 모드 언어 미리 채우기"""
+        for language in warm_languages:
+            key = _pool_key("single", language)
+            self.pinned.add(key)
+            self._touch(key)
+            self._schedule_refill(key)
+        self._ensure_maintenance()
+
+    def _ensure_maintenance(self):
+        if self.size > 0 and (self.maintenance_task is None or self.maintenance_task.done()):
+            self.maintenance_task = asyncio.create_task(self._maintain())
+
+    # [3] 인식기 꺼내기
+    async def acquire(self, mode: str, input_language, settings: tuple = None):
+        """
+        인식이 시작된 STT 반환
+
+        Args:
+            mode: "single" | "multiple"
+            input_language: 입력 언어 코드 (다중 언어 모드는 언어 코드 리스트)
+            settings: 인식기 설정 (recognizer_settings(지연 프로파일), None이면 기본 프로파일)
+        """
+        started = time.perf_counter()
+        key = _pool_key(mode, input_language, settings)
+        stt = None
+        if self.size > 0:
+            self._ensure_maintenance()
+            self._touch(key)
+            stt = self._take(key)
+            self._schedule_refill(key)
+
+        if stt is not None:
+            self.hits += 1
+            if not stt.is_active():
+                await asyncio.to_thread(stt.start_recognition)
+        else:
+            self.misses += 1
+            stt = await self._build(mode, input_language, key[2], start=True)
+        self.acquire_latency.record(time.perf_counter() - started)
+        return stt
+
+    def _take(self, key: tuple):
+        entries = self.entries.get(key)
+        while entries:
+            stt, built_at = entries.popleft()
+            if self._is_stale(stt, built_at, time.monotonic()):
+                self.stale_discarded += 1
+                asyncio.create_task(asyncio.to_thread(stt.stop_recognition))
+                continue
+            return stt
+        return None
+
+    def _is_stale(self, stt, built_at: float, now: float) -> bool:
+        # 미리 시작한 인식기가 서버 쪽에서 끊겼거나, 나이 상한(설정 시)을 넘은 인식기
+        if self.prestart and not stt.is_active():
+            return True
+        return self.max_age_seconds > 0 and now - built_at > self.max_age_seconds
+
+    def _touch(self, key: tuple):
+        self.demand[key] = time.monotonic()
+        self.demand.move_to_end(key)
+        # 언어(조합) 수 상한 : 가장 오래 요청되지 않은 key부터 제외
+        while len(self.demand) > self.max_keys:
+            oldest = next((k for k in self.demand if k not in self.pinned and k != key), None)
+            if oldest is None:
+                break
+            self._drop_key(oldest)
+
+    # [4] 인식기 생성 / 보충
+    async def _build(self, mode: str, input_language, settings: tuple, start: bool):
+        built_at = time.perf_counter()
+        stt = create_stt(mode)
+        stt.set_recognizer_settings(dict(settings))
+        stt.setup_result_queue()        # 결과 브리지는 이벤트 루프에 연결 -> 나머지 설정은 스레드에서
+        await asyncio.to_thread(self._setup, stt, input_language, start)
+        self.built += 1
+        self.build_latency.record(time.perf_counter() - built_at)
+        return stt
+
+    @staticmethod
+    def _setup(stt, input_language, start: bool):
+        stt.setup_streaming_recognition(input_language)
+        if start:
+            stt.start_recognition()
+
+    def _schedule_refill(self, key: tuple):
+        if key not in self.refilling:
+            self.refilling.add(key)
+            asyncio.create_task(self._refill(key))
+
+    async def _refill(self, key: tuple):
+        """key의 인식기 수를 size까지 하나씩 보충"""
+        mode, language, settings = key
+        input_language = list(language) if isinstance(language, tuple) else language
+        try:
+            while key in self.demand and len(self.entries.get(key, ())) < self.size:
+                try:
+                    stt = await self._build(mode, input_language, settings, start=self.prestart)
+                except Exception as e:
+                    self.build_failures += 1
+                    print(f"인식기 풀 보충 오류 ({key}): {e}")
+                    break
+                if key not in self.demand:      # 생성 중에 풀에서 제외된 key
+                    await asyncio.to_thread(stt.stop_recognition)
+                    break
+                self.entries.setdefault(key, deque()).append((stt, time.monotonic()))
+        finally:
+            self.refilling.discard(key)
+
+    # [5] 정리 (끊긴 인식기 / 요청 없는 언어 제거)
+    async def _maintain(self):
+        while True:
+            await asyncio.sleep(self.check_seconds)
+            try:
+                now = time.monotonic()
+                for key, last_demand in list(self.demand.items()):
+                    if key not in self.pinned and now - last_demand > STT_POOL_DEMAND_SECONDS:
+                        self._drop_key(key)
+                        continue
+                    entries = self.entries.get(key)
+                    if not entries:
+                        self._schedule_refill(key)
+                        continue
+                    healthy = deque()
+                    for stt, built_at in entries:
+                        if self._is_stale(stt, built_at, now):
+                            self.stale_refreshed += 1
+                            asyncio.create_task(asyncio.to_thread(stt.stop_recognition))
+                        else:
+                            healthy.append((stt, built_at))
+                    self.entries[key] = healthy
+                    if len(healthy) < self.size:
+                        self._schedule_refill(key)
+            except Exception as e:
+                print(f"인식기 풀 정리 오류: {e}")
+
+    def _drop_key(self, key: tuple):
+        self.demand.pop(key, None)
+        for stt, _ in self.entries.pop(key, ()):
+            asyncio.create_task(asyncio.to_thread(stt.stop_recognition))
+
+    # [6] 풀 종료 (서버 종료 시 호출)
+    async def close(self):
+        """정리 태스크 중지 + 보관 중인 인식기 모두 중지"""
+        if self.maintenance_task is not None:
+            self.maintenance_task.cancel()
+            self.maintenance_task = None
+        self.demand.clear()             # 진행 중인 보충 중단
+        self.pinned.clear()
+        entries = [stt for key in list(self.entries) for stt, _ in self.entries.pop(key)]
+        await asyncio.gather(*(asyncio.to_thread(stt.stop_recognition) for stt in entries), return_exceptions=True)
+
+    # 현재 상태 확인
+    def get_stats(self) -> dict:
+        requests = self.hits + self.misses
+        return {
+            'size': self.size,
+            'prestart': self.prestart,
+            'pooled': {f"{mode}:{'|'.join(language) if isinstance(language, tuple) else language}:{dict(settings)['reco_mode']}/{dict(settings)['segmentation_silence_ms']}ms": len(entries)
+                       for (mode, language, settings), entries in self.entries.items()},
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / requests, 3) if requests else 0.0,
+            'stale_discarded': self.stale_discarded,
+            'stale_refreshed': self.stale_refreshed,
+            'built': self.built,
+            'build_failures': self.build_failures,
+            'build': self.build_latency.snapshot(),
+            'acquire': self.acquire_latency.snapshot(),
+        }
+
+recognizer_pool = RecognizerPool()
+metrics_registry.register("recognizer_pool", recognizer_pool.get_stats)
@@ -0,0 +1,217 @@
+# [modules/stt/replay_stt.py]
+# 로컬 재생 STT 백엔드 : 스크립트(fixture)의 인식 결과를 입력 오디오 길이에 맞춰 발생 (Azure 없이 부하 테스트)
+import asyncio
+import json
+import os
+import random
+import threading
+import time
+from src.app.modules.stt.base_stt import BaseSTT
+from src.app.modules.stt.language_switch import LanguageSwitchMixin
+
+STT_SAMPLE_RATE = 16000
+STT_BYTES_PER_SECOND = STT_SAMPLE_RATE * 2      # 16kHz / 16bit / mono
+TICKS_PER_SECOND = 10_000_000                   # Azure offset 단위 (100ns)
+
+# fixture 미지정 시 사용하는 기본 스크립트
+DEFAULT_SCRIPT = {
+    'segments': [
+        {'language': "ko-KR", 'start': 0.4, 'end': 3.1, 'text': "오늘은 자료구조 수업을 시작하겠습니다"},
+        {'language': "ko-KR", 'start': 4.0, 'end': 7.6, 'text': "지난 시간에는 연결 리스트의 삽입과 삭제를 살펴봤습니다"},
+        {'language': "ko-KR", 'start': 8.5, 'end': 12.2, 'text': "이번 시간에는 이진 탐색 트리의 구조를 알아보겠습니다"},
+        {'language': "en-US", 'start': 13.0, 'end': 15.4, 'text': "Let's look at the insert operation first"},
+    ],
+}
+
+def _running_loop():
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+class _ReplayRecognizer:
+    """언어 설정 1개의 재생 인식기 (Azure SpeechRecognizer 대역)"""
+    def __init__(self, input_languages: list[str], connect_delay: float):
+        self.input_languages = input_languages
+        self.connect_delay = connect_delay
+        self.listening = False
+
+    def start_continuous_recognition(self):
+        time.sleep(self.connect_delay)      # 서비스 연결 시간 (블로킹, 언어 전환 중 오디오 버퍼링 재현)
+        self.listening = True
+
+    def stop_continuous_recognition(self):
+        self.listening = False
+
+class _ReplayAudioStream:
+    """재생 인식기 입력 스트림 (PushAudioInputStream 대역) - 쓴 오디오만큼 스크립트 시계 진행"""
+    def __init__(self, stt, recognizer: _ReplayRecognizer, stopped: threading.Event):
+        self.stt = stt
+        self.recognizer = recognizer
+        self.stopped = stopped
+
+    def write(self, audio_data: bytes):
+        self.stt._advance(self.recognizer, audio_data)
+
+    def close(self):
+        self.stopped.set()      # 남은 인식 결과 없음 -> 바로 session_stopped
+
+class ReplaySTT(LanguageSwitchMixin, BaseSTT):
+    """
+    스크립트 재생 STT
+
+    fixture (JSON)
+        {"segments": [{"language": "ko-KR", "start": 0.4, "end": 3.1, "text": "..."}, ...],
+         "duration": 16.0}                      # 생략 시 마지막 segment end + 1초
+    - 입력된 오디오 길이(바이트 수 / 32000)를 시계로 사용 -> 오디오를 빨리 넣으면 결과도 빨리 발생
+    - 발화 구간 동안 단어 단위로 늘어나는 recognizing, 구간 종료 + 문장 구분 침묵 후 recognized
+    - 결과 발생 지연(인식 처리 시간)을 무작위로 더해 실제 인식기와 비슷한 타이밍 재현
+    - 스크립트 끝에 도달하면 처음부터 반복 (offset은 계속 증가)
+    - 발화 ID는 세션 오디오 시계 기준 (Azure 백엔드의 인식기 시작 위치 + offset과 같은 의미, 언어 전환 후에도 고유)
+    - 입력 언어 변경은 Azure 백엔드와 같은 무중단 전환 (LanguageSwitchMixin) - 새 인식기 연결 시간은 connect_delay
+    """
+    # [1] 초기화
+    def __init__(self,
+                 fixture_path: str = None,
+                 interim_interval: float = 0.3,
+                 segmentation_silence: float = 0.7,
+                 latency_range: tuple[float, float] = (0.1, 0.3),
+                 connect_delay: float = 0.0,
+                 seed: int = None):
+        """
+        Args:
+            fixture_path: 스크립트 파일 경로 (None이면 STT_REPLAY_FIXTURE 환경 변수, 없으면 기본 스크립트)
+            interim_interval: recognizing 발생 간격 (오디오 시간, 초)
+            segmentation_silence: 발화 종료 후 recognized까지의 침묵 (오디오 시간, 초)
+            latency_range: 결과 발생 지연 범위 (실제 시간, 초)
+            connect_delay: 인식기 연결(start) 시간 (실제 시간, 초)
+            seed: 지연 난수 시드 (재현용)
+        """
+        super().__init__()
+        fixture_path = fixture_path or os.getenv("STT_REPLAY_FIXTURE")
+        if fixture_path:
+            with open(fixture_path, encoding="utf-8") as f:
+                script = json.load(f)
+        else:
+            script = DEFAULT_SCRIPT
+
+        self.interim_interval = interim_interval
+        self.segmentation_silence = segmentation_silence
+        self.latency_range = latency_range
+        self.connect_delay = connect_delay
+        self.random = random.Random(seed)
+        self.events = self._build_events(script['segments'])
+        self.duration = script.get('duration') or (max(segment['end'] for segment in script['segments']) + segmentation_silence + 0.3)
+
+        self.speech_recognizer = None
+        self.audio_stream = None
+        self.audio_bytes = 0            # 입력된 오디오 누적 바이트 (시계)
+        self.next_event = 0             # 다음에 발생할 이벤트 위치
+        self.loop_count = 0             # 스크립트 반복 횟수
+        self._last_due = 0.0            # 마지막 결과 전달 예정 시각 (이벤트 루프 시간)
+
+        # 지표
+        self.emitted = 0
+        self._init_language_switch()        # 무중단 언어 전환 상태
+
+    @property
+    def input_languages(self) -> list[str]:
+        return self.speech_recognizer.input_languages if self.speech_recognizer else []
+
+    def _build_events(self, segments: list[dict]) -> list[tuple]:
+        """segment -> (발생 시각, 결과) 목록 (시각순)"""
+        events = []
+        for segment in segments:
+            words = segment['text'].split()
+            speech_length = segment['end'] - segment['start']
+            interim_count = max(1, int(speech_length / self.interim_interval))
+            for index in range(1, interim_count + 1):
+                word_count = max(1, round(len(words) * index / interim_count))
+                events.append((segment['start'] + self.interim_interval * index, segment, " ".join(words[:word_count]), False))
+            events.append((segment['end'] + self.segmentation_silence, segment, segment['text'], True))
+        events.sort(key=lambda event: event[0])
+        return events
+
+    # [2] 음성 인식 설정
+    def setup_streaming_recognition(self, input_language):
+        self.setup_result_queue()
+        self.speech_recognizer, self.audio_stream, self.recognizer_stopped = self._create_recognizer(input_language)
+
+    def _create_recognizer(self, input_language):
+        """인식기 + 오디오 스트림 생성 -> (recognizer, audio_stream, stopped_event)"""
+        input_languages = input_language if isinstance(input_language, list) else [input_language]
+        recognizer = _ReplayRecognizer(input_languages, self.connect_delay)
+        stopped = threading.Event()
+        return recognizer, _ReplayAudioStream(self, recognizer, stopped), stopped
+
+    # [3] 음성 인식
+    def start_recognition(self):
+        if self.is_listening:
+            print("이미 음성 인식이 진행 중입니다.")
+            return
+        self.speech_recognizer.start_continuous_recognition()
+        self.is_listening = True
+
+    def write_audio_chunk(self, audio_data: bytes):
+        """현재 인식기 스트림에 쓰기 (언어 전환 중이면 버퍼에 보관)"""
+        self._write_audio(audio_data)
+
+    def _advance(self, recognizer: _ReplayRecognizer, audio_data: bytes):
+        """입력 오디오 길이만큼 시계를 진행 -> 그 사이의 스크립트 이벤트 발생 (audio_lock 보유 상태에서 호출)"""
+        self.audio_bytes += len(audio_data)
+        audio_time = self.audio_bytes / STT_BYTES_PER_SECOND
+
+        while True:
+            if self.next_event >= len(self.events):
+                self.next_event = 0
+                self.loop_count += 1
+            at, segment, text, is_final = self.events[self.next_event]
+            loop_offset = self.loop_count * self.duration
+            if at + loop_offset > audio_time:
+                break
+            self.next_event += 1
+            self._emit({
+                'text': text,
+                'is_final': is_final,
+                'utterance_id': int((segment['start'] + loop_offset) * TICKS_PER_SECOND),
+                'language': self._language(segment, recognizer.input_languages),
+            })
+
+    def _language(self, segment: dict, input_languages: list[str]) -> str:
+        # 단일 언어 모드 : 설정된 언어 / 다중 언어 모드 : 스크립트 언어 (후보에 없으면 첫 번째 후보)
+        language = segment.get('language')
+        if len(input_languages) <= 1 or language not in input_languages:
+            return input_languages[0] if input_languages else language
+        return language
+
+    def _emit(self, result_data: dict):
+        # 인식 처리 지연 후 결과 전달 (실제 SDK 콜백처럼 오디오 입력과 비동기)
+        # 전달 시각은 스트림 안에서 단조 증가 -> 오디오를 실시간보다 빨리 넣어도 recognizing이 recognized 뒤에 오지 않음
+        loop = self.result_bridge.loop
+        due = max(self._last_due + 1e-6, loop.time() + self.random.uniform(*self.latency_range))     # 같은 시각 타이머는 순서 보장 x
+        self._last_due = due
+        if _running_loop() is loop:
+            loop.call_at(due, self.result_bridge.put, result_data)
+        else:
+            # 언어 전환 스레드에서 버퍼 오디오를 쓴 경우
+            loop.call_soon_threadsafe(loop.call_at, due, self.result_bridge.put, result_data)
+        self.emitted += 1
+
+    # [4] 실행 중지
+    def stop_recognition(self):
+        with self.audio_lock:       # 언어 전환 중이면 교체 전에 중지 -> 전환 작업이 새 인식기 정리
+            if self.speech_recognizer and self.is_listening:
+                self.speech_recognizer.stop_continuous_recognition()
+            self.is_listening = False
+            if self.audio_stream:
+                self.audio_stream.close()
+                self.audio_stream = None
+            self.switch_buffer = None
+
+    def get_stats(self) -> dict:
+        return {
+            **super().get_stats(),
+            'audio_seconds': round(self.audio_bytes / STT_BYTES_PER_SECOND, 2),
+            'emitted': self.emitted,
+            'loops': self.loop_count,
+        }
@@ -0,0 +1,98 @@
+# [modules/stt/result_bridge.py]
+# Azure SDK 콜백 스레드 -> asyncio 이벤트 루프 결과 전달 브리지
+import threading
+import time
+from collections import deque
+from src.app.core.metrics import LatencyRecorder
+
+class CallbackResultBridge:
+    """
+    SDK 콜백 스레드에서 받은 결과를 이벤트 루프로 묶음 전달
+
+    콜백 스레드는 deque에 추가만 하고 (append는 스레드 안전),
+    한 묶음(burst)당 한 번만 call_soon_threadsafe로 루프를 깨운다.
+    루프 스레드는 깨어났을 때 쌓인 결과를 한 번에 sink로 옮긴다.
+    """
+    # [1] 초기화
+    def __init__(self, loop, sink):
+        """
+        Args:
+            loop: sink를 소유한 이벤트 루프
+            sink: 루프 스레드에서만 접근하는 큐 (put_nowait 지원)
+        """
+        self.loop = loop
+        self.sink = sink
+
+        self._pending = deque()             # (enqueue 시각, 결과) - 콜백 스레드 -> 루프 스레드
+        self._lock = threading.Lock()       # 깨우기 예약 여부 보호용
+        self._scheduled = False             # 루프 깨우기 예약 여부 (burst당 1회)
+
+        # 지표
+        self.latency = LatencyRecorder()    # enqueue -> dequeue 지연
+        self.enqueued = 0
+        self.delivered = 0
+        self.wakeups = 0
+        self.max_depth = 0
+        self.max_batch = 0
+
+    # [2] 결과 추가 (SDK 콜백 스레드)
+    def put(self, item):
+        """임의 스레드에서 호출 가능 - 결과를 버퍼에 추가하고 필요 시 루프 깨우기"""
+        self._pending.append((time.perf_counter(), item))
+
+        with self._lock:
+            self.enqueued += 1
+            depth = len(self._pending)
+            if depth > self.max_depth:
+                self.max_depth = depth
+            if self._scheduled:
+                return      # 이미 깨우기 예약됨 -> 같은 묶음으로 처리
+            self._scheduled = True
+
+        try:
+            self.loop.call_soon_threadsafe(self._drain)
+        except RuntimeError:
+            # 이벤트 루프가 이미 종료된 경우
+            with self._lock:
+                self._scheduled = False
+            print("이벤트 루프 종료로 STT 결과 전달 실패")
+
+    # [3] 버퍼 비우기 (이벤트 루프 스레드)
+    def _drain(self):
+        """쌓인 결과를 한 번에 sink로 전달"""
+        # 예약 해제를 먼저 해야 drain 도중 추가된 결과가 다음 깨우기로 처리됨
+        with self._lock:
+            self._scheduled = False
+
+        now = time.perf_counter()
+        batch = 0
+        while True:
+            try:
+                enqueued_at, item = self._pending.popleft()
+            except IndexError:
+                break
+            self.latency.record(now - enqueued_at)
+            try:
+                self.sink.put_nowait(item)
+            except Exception as e:
+                print(f"큐 추가 오류: {e}")
+            batch += 1
+
+        self.wakeups += 1
+        self.delivered += batch
+        if batch > self.max_batch:
+            self.max_batch = batch
+
+    # [4] 지표 반환
+    def get_stats(self) -> dict:
+        """브리지 지연 / 깊이 지표"""
+        return {
+            'depth': len(self._pending),
+            'max_depth': self.max_depth,
+            'enqueued': self.enqueued,
+            'delivered': self.delivered,
+            'wakeups': self.wakeups,
+            'avg_batch': round(self.delivered / self.wakeups, 2) if self.wakeups else 0.0,
+            'max_batch': self.max_batch,
+            'latency': self.latency.snapshot(),
+        }
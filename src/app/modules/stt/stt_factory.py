@@ -0,0 +1,29 @@
+# [modules/stt/stt_factory.py]
+# STT 백엔드 선택 (STT_BACKEND 환경 변수)
+import os
+
+SUPPORTED_STT_BACKENDS = ("azure", "replay")
+
+def create_stt(mode: str):
+    """
+    모드 / 환경 설정에 맞는 STT 백엔드 생성
+
+    Args:
+        mode: "single" | "multiple"
+    STT_BACKEND
+        azure  : Azure Speech (기본값)
+        replay : 로컬 스크립트 재생 (STT_REPLAY_FIXTURE) - Azure 없이 부하 테스트
+    """
+    backend = os.getenv("STT_BACKEND", "azure")
+    if backend not in SUPPORTED_STT_BACKENDS:
+        raise ValueError(f"지원하지 않는 STT 백엔드입니다: {backend}")
+
+    # 백엔드별 SDK는 사용할 때만 import (replay는 Azure SDK 없이 동작)
+    if backend == "replay":
+        from src.app.modules.stt.replay_stt import ReplaySTT
+        return ReplaySTT()
+    if mode == "multiple":
+        from src.app.modules.stt.azure_stt_multiple import AzureSTTMultiple
+        return AzureSTTMultiple()
+    from src.app.modules.stt.azure_stt_single import AzureSTTSingle
+    return AzureSTTSingle()
@@ -0,0 +1,24 @@
+# [modules/translation/language_latency.py]
+# 번역 언어별 지연 시간 분포 (문장 번역 요청 -> 해당 언어 결과 도착)
+import threading
+from src.app.core.metrics import LatencyHistogram, metrics_registry
+
+class LanguageLatency:
+    """번역 언어별 LatencyHistogram (언어는 처음 기록될 때 추가)"""
+    def __init__(self):
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def record(self, language: str, seconds: float):
+        with self._lock:
+            histogram = self._histograms.get(language)
+            if histogram is None:
+                histogram = self._histograms[language] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {language: histogram.snapshot() for language, histogram in sorted(self._histograms.items())}
+
+language_latency = LanguageLatency()
+metrics_registry.register("translation_latency", language_latency.get_stats)
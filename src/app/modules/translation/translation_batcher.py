@@ -0,0 +1,171 @@
+# [modules/translation/translation_batcher.py]
+# 세션 간 번역 요청 묶음 처리 (번역 언어별로 짧은 시간 동안 모아 API 1회 호출)
+import asyncio
+import os
+import threading
+import time
+from src.app.core.metrics import LatencyRecorder, metrics_registry
+from src.app.modules.translation.translation_executor import _deliver, _set_result, translation_executor
+
+TRANSLATION_BATCH_WINDOW_MS = int(os.getenv("TRANSLATION_BATCH_WINDOW_MS", "20"))      # 첫 요청 후 모으는 시간 (0이면 묶음 처리 x)
+TRANSLATION_BATCH_MAX_SIZE = int(os.getenv("TRANSLATION_BATCH_MAX_SIZE", "32"))        # 묶음 1개 최대 문장 수 (v2 API 상한 128)
+TRANSLATION_BATCH_MAX_CHARS = int(os.getenv("TRANSLATION_BATCH_MAX_CHARS", "5000"))    # 묶음 1개 최대 글자 수 (v2 API 권장 상한)
+
+# 묶음 크기 분포 구간 (상한 포함)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+class TranslationBatcher:
+    """
+    번역 언어별 대기 목록에 문장을 모았다가 한 번에 번역
+
+    - 언어별 첫 요청 후 window_ms가 지나거나, 문장 수 / 글자 수 상한에 닿으면 즉시 묶음 전송
+    - 묶음 호출은 공용 번역 실행기에서 실행 (동시 호출 수 상한 유지)
+    - 실행기 대기열은 묶음에 문장을 넣은 세션 기준 : 대기 중인 묶음이 가장 적은 세션의 차례로 예약
+      -> 한 세션이 문장을 몰아서 보내도 그 세션의 묶음만 쌓이고 다른 세션 묶음과 번갈아 실행 (세션 간 라운드 로빈 유지)
+    - 결과는 요청 순서대로 각 세션의 future로 전달 (실패한 문장은 None - translate_text와 동일)
+    - 같은 인증 정보의 번역 클라이언트는 서로 대체 가능 -> 묶음의 첫 요청이 넘긴 번역 함수로 전체 호출
+    """
+    # [1] 초기화
+    def __init__(self, window_ms: int = TRANSLATION_BATCH_WINDOW_MS, max_size: int = TRANSLATION_BATCH_MAX_SIZE,
+                 max_chars: int = TRANSLATION_BATCH_MAX_CHARS, executor=translation_executor):
+        self.window = window_ms / 1000
+        self.max_size = max_size
+        self.max_chars = max_chars
+        self.executor = executor
+        self._lock = threading.Lock()
+        self._pending = {}              # (group, 번역 언어) -> 대기 묶음 {'target_language', 'items', 'chars', 'translate_batch', 'timer'}
+        self._outstanding = {}          # session_id -> 실행기에 예약되어 아직 끝나지 않은 묶음 수
+
+        # 지표
+        self.requests = 0
+        self.batched_requests = 0       # 전송된 묶음에 포함된 요청 수
+        self.batches = 0
+        self.errors = 0
+        self.flush_reasons = {'window': 0, 'size': 0, 'chars': 0}
+        self.size_buckets = dict.fromkeys(BATCH_SIZE_BUCKETS, 0)
+        self.window_wait = LatencyRecorder()    # 요청 -> 묶음 전송 (묶음 처리로 늘어난 지연)
+        self.call_time = LatencyRecorder()      # 묶음 API 호출 소요 시간
+
+    @property
+    def enabled(self) -> bool:
+        return self.window > 0 and self.max_size > 1
+
+    # [2] 요청 추가 (이벤트 루프)
+    def submit(self, target_language: str, text: str, translate_batch, group=None, session_id=None) -> asyncio.Future:
+        """
+        문장 1개 번역 예약
+
+        Args:
+            translate_batch: (texts, target_language) -> [결과 | None, ...] 동기 함수
+            group: 같은 번역 언어라도 따로 묶을 기준 (ex. 번역 제공자 이름)
+            session_id: 요청한 세션 (실행기 공정성 기준)
+        Returns:
+            번역 결과 ({'target_lang', 'result_text'} 또는 None)를 받을 future
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            self.requests += 1
+            key = (group, target_language)
+            batch = self._pending.get(key)
+            # 글자 수 상한을 넘기게 되면 기존 묶음 먼저 전송
+            if batch is not None and batch['chars'] + len(text) > self.max_chars:
+                self._flush_locked(key, "chars")
+                batch = None
+            if batch is None:
+                batch = self._pending[key] = {
+                    'target_language': target_language,
+                    'items': [],
+                    'chars': 0,
+                    'translate_batch': translate_batch,
+                    'timer': loop.call_later(self.window, self._flush_on_timer, key),
+                }
+            batch['items'].append((time.perf_counter(), loop, future, text, session_id))
+            batch['chars'] += len(text)
+
+            if len(batch['items']) >= self.max_size:
+                self._flush_locked(key, "size")
+            elif batch['chars'] >= self.max_chars:
+                self._flush_locked(key, "chars")
+        return future
+
+    def _flush_on_timer(self, key):
+        with self._lock:
+            self._flush_locked(key, "window")
+
+    def _flush_locked(self, key, reason: str):
+        """대기 묶음을 공용 번역 실행기로 전송 (_lock 보유 상태, 이벤트 루프에서 호출)"""
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        batch['timer'].cancel()
+        items = batch['items']
+        flushed = time.perf_counter()
+        for enqueued_at, _, _, _, _ in items:
+            self.window_wait.record(flushed - enqueued_at)
+        self.batches += 1
+        self.batched_requests += len(items)
+        self.flush_reasons[reason] += 1
+        bucket = next((limit for limit in BATCH_SIZE_BUCKETS if len(items) <= limit), BATCH_SIZE_BUCKETS[-1])
+        self.size_buckets[bucket] += 1
+
+        # 결과 전달은 _run_batch에서 직접 처리 -> 실행기 future는 오류만 무시
+        session_id = self._owner(items)
+        self._outstanding[session_id] = self._outstanding.get(session_id, 0) + 1
+        task = self.executor.submit(session_id, self._run_batch, batch['translate_batch'], batch['target_language'], items)
+        task.add_done_callback(lambda done: self._batch_done(session_id, done))
+
+    def _owner(self, items: list):
+        """묶음을 예약할 세션 = 문장을 넣은 세션 중 대기 중인 묶음이 가장 적은 세션 (같으면 먼저 넣은 세션)"""
+        sessions = dict.fromkeys(session_id for _, _, _, _, session_id in items)
+        return min(sessions, key=lambda session_id: self._outstanding.get(session_id, 0))
+
+    def _batch_done(self, session_id, task: asyncio.Future):
+        with self._lock:
+            remaining = self._outstanding.get(session_id, 0) - 1
+            if remaining > 0:
+                self._outstanding[session_id] = remaining
+            else:
+                self._outstanding.pop(session_id, None)
+        task.cancelled() or task.exception()
+
+    # [3] 묶음 번역 (작업 스레드)
+    def _run_batch(self, translate_batch, target_language: str, items: list):
+        started = time.perf_counter()
+        try:
+            results = translate_batch([text for _, _, _, text, _ in items], target_language)
+            if len(results) != len(items):
+                raise ValueError(f"묶음 번역 결과 수 불일치: {len(results)} / {len(items)}")
+        except Exception as e:
+            print(f"{target_language} 묶음 번역 중 오류 발생: {e}")
+            results = [None] * len(items)
+            with self._lock:
+                self.errors += 1
+
+        with self._lock:
+            self.call_time.record(time.perf_counter() - started)
+        for (_, loop, future, _, _), result in zip(items, results):
+            _deliver(loop, _set_result, future, result)      # 닫힌 루프가 있어도 나머지 문장 결과는 전달
+
+    # 현재 상태 확인
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'window_ms': round(self.window * 1000),
+                'max_size': self.max_size,
+                'max_chars': self.max_chars,
+                'requests': self.requests,
+                'batches': self.batches,
+                'avg_batch_size': round(self.batched_requests / self.batches, 2) if self.batches else 0.0,
+                'saved_calls': self.batched_requests - self.batches,
+                'pending': sum(len(batch['items']) for batch in self._pending.values()),
+                'errors': self.errors,
+                'flush_reasons': dict(self.flush_reasons),
+                'batch_sizes': {f"<={limit}": count for limit, count in self.size_buckets.items()},
+                'window_wait': self.window_wait.snapshot(),
+                'call_time': self.call_time.snapshot(),
+            }
+
+translation_batcher = TranslationBatcher()
+metrics_registry.register("translation_batcher", translation_batcher.get_stats)
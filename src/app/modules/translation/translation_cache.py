@@ -0,0 +1,193 @@
+# [modules/translation/translation_cache.py]
+# 번역 결과 캐시 (메모리 LRU + 선택적 SQLite 디스크 캐시 + 진행 중인 동일 요청 합치기)
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from src.app.core.metrics import metrics_registry
+
+TRANSLATION_CACHE_SIZE = int(os.getenv("TRANSLATION_CACHE_SIZE", "10000"))                 # 메모리 캐시 최대 항목 수 (0이면 캐시 x)
+TRANSLATION_CACHE_TTL_SECONDS = float(os.getenv("TRANSLATION_CACHE_TTL_SECONDS", "86400"))   # 항목 유효 시간 (메모리 / 디스크 공통)
+TRANSLATION_CACHE_DB = os.getenv("TRANSLATION_CACHE_DB", "")                                # 디스크 캐시 파일 경로 (비어 있으면 디스크 캐시 x)
+
+def normalize_text(text: str) -> str:
+    """캐시 key용 문장 정규화 (유니코드 NFC + 앞뒤 / 연속 공백 정리)"""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+def _language_code(language: str) -> str:
+    # 'ko-KR' -> 'ko' (Translator 원문 언어 처리와 동일), 번역 언어는 'zh-CN'처럼 그대로 사용
+    return language.split('-')[0] if language else ""
+
+class TranslationCache:
+    """
+    (정규화한 문장, 원문 언어, 번역 언어) -> 번역 결과
+
+    - 메모리 : LRU + TTL, 최대 항목 수 고정
+    - 디스크 : SQLite (선택), 서버 재시작 후에도 유지 -> 메모리에 없을 때 조회
+    - 같은 key의 번역이 진행 중이면 새로 호출하지 않고 그 결과를 함께 기다림
+    - 실패한 번역(None)은 저장하지 않음
+    """
+    # [1] 초기화
+    def __init__(self, max_entries: int = TRANSLATION_CACHE_SIZE, ttl: float = TRANSLATION_CACHE_TTL_SECONDS,
+                 db_path: str = TRANSLATION_CACHE_DB):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.db_path = db_path
+        self._entries = OrderedDict()   # key -> (만료 시각, 번역 문장)
+        self._in_flight = {}            # key -> 진행 중인 번역 future (이벤트 루프에서만 접근)
+        self._db = None
+        self._db_lock = threading.Lock()
+
+        # 지표
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.expired = 0
+        self.evictions = 0
+        self.disk_errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    # [2] 번역 요청
+    def translate(self, text: str, source_language: str, target_language: str, request) -> asyncio.Future:
+        """
+        캐시 확인 후 없으면 request()로 번역 (이벤트 루프에서 호출)
+
+        Args:
+            request: 인자 없이 호출하면 번역 결과 awaitable을 반환하는 함수 (캐시에 없을 때만 호출)
+        Returns:
+            번역 결과 ({'target_lang', 'result_text'} 또는 None)를 받을 future
+        """
+        loop = asyncio.get_running_loop()
+        key = (normalize_text(text), _language_code(source_language), target_language)
+
+        result_text = self._get(key)
+        if result_text is not None:
+            self.hits += 1
+            future = loop.create_future()
+            future.set_result({'target_lang': target_language, 'result_text': result_text})
+            return future
+
+        shared = self._in_flight.get(key)
+        if shared is not None:
+            self.coalesced += 1
+            return asyncio.shield(shared)      # 한 세션의 취소가 다른 세션 대기에 영향 x
+
+        shared = self._in_flight[key] = loop.create_future()
+        loop.create_task(self._fill(key, shared, request))
+        return asyncio.shield(shared)
+
+    async def _fill(self, key, shared: asyncio.Future, request):
+        """디스크 캐시 -> 실제 번역 순으로 결과 채우기"""
+        try:
+            result = None
+            if self.db_path:
+                result_text = await asyncio.to_thread(self._disk_get, key)
+                if result_text is not None:
+                    self.disk_hits += 1
+                    self._put(key, result_text)
+                    result = {'target_lang': key[2], 'result_text': result_text}
+
+            if result is None:
+                self.misses += 1
+                result = await request()
+                if result:
+                    self._put(key, result['result_text'])
+                    if self.db_path:
+                        asyncio.get_running_loop().run_in_executor(None, self._disk_put, key, result['result_text'])
+            shared.set_result(result)
+        except asyncio.CancelledError:
+            shared.cancel()
+            raise
+        except Exception as e:
+            shared.set_exception(e)
+        finally:
+            self._in_flight.pop(key, None)
+
+    # [3] 메모리 캐시 (LRU + TTL)
+    def _get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, result_text = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            self.expired += 1
+            return None
+        self._entries.move_to_end(key)
+        return result_text
+
+    def _put(self, key, result_text: str):
+        self._entries[key] = (time.monotonic() + self.ttl, result_text)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    # [4] 디스크 캐시 (SQLite, 작업 스레드에서 호출)
+    def _connect(self):
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+            self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                "text TEXT, source TEXT, target TEXT, result TEXT, created_at REAL, "
+                "PRIMARY KEY (text, source, target))"
+            )
+            # 시작 시 만료 항목 정리
+            self._db.execute("DELETE FROM translations WHERE created_at < ?", (time.time() - self.ttl,))
+            self._db.commit()
+        return self._db
+
+    def _disk_get(self, key):
+        try:
+            with self._db_lock:
+                row = self._connect().execute(
+                    "SELECT result, created_at FROM translations WHERE text = ? AND source = ? AND target = ?", key
+                ).fetchone()
+        except sqlite3.Error as e:
+            self.disk_errors += 1
+            print(f"번역 캐시 조회 오류: {e}")
+            return None
+        if row is None or row[1] < time.time() - self.ttl:
+            return None
+        return row[0]
+
+    def _disk_put(self, key, result_text: str):
+        try:
+            with self._db_lock:
+                db = self._connect()
+                db.execute("INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?)", (*key, result_text, time.time()))
+                db.commit()
+        except sqlite3.Error as e:
+            self.disk_errors += 1
+            print(f"번역 캐시 저장 오류: {e}")
+
+    # 현재 상태 확인
+    def get_stats(self) -> dict:
+        lookups = self.hits + self.disk_hits + self.misses + self.coalesced
+        return {
+            'enabled': self.enabled,
+            'disk': bool(self.db_path),
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'in_flight': len(self._in_flight),
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'coalesced': self.coalesced,
+            'hit_rate': round((self.hits + self.disk_hits + self.coalesced) / lookups, 4) if lookups else 0.0,
+            'expired': self.expired,
+            'evictions': self.evictions,
+            'disk_errors': self.disk_errors,
+        }
+
+translation_cache = TranslationCache()
+metrics_registry.register("translation_cache", translation_cache.get_stats)
@@ -0,0 +1,144 @@
+# [modules/translation/translation_executor.py]
+# 프로세스 공용 번역 실행기 (동기 번역 API 호출 수 제한 + 세션 간 공정한 처리 순서)
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from src.app.core.metrics import LatencyRecorder, metrics_registry
+
+TRANSLATION_WORKERS = int(os.getenv("TRANSLATION_WORKERS", "16"))     # 동시에 실행하는 번역 API 호출 수 상한
+
+def _set_result(future: asyncio.Future, result):
+    if not future.done():
+        future.set_result(result)
+
+def _set_exception(future: asyncio.Future, error: Exception):
+    if not future.done():
+        future.set_exception(error)
+
+def _deliver(loop, setter, future: asyncio.Future, value):
+    # 요청한 이벤트 루프가 이미 닫혔으면 (취소된 헤징 요청이 늦게 끝난 경우 등) 결과만 버림 -> 작업 스레드 유지
+    try:
+        loop.call_soon_threadsafe(setter, future, value)
+    except RuntimeError:
+        pass
+
+class FairTranslationExecutor:
+    """
+    고정 개수의 작업 스레드로 번역 호출 실행
+
+    - 발화마다 스레드 풀을 만들지 않음 (스레드 생성 / 정리 비용 x, 동시 호출 수 상한 고정)
+    - 세션별 대기열 + 라운드 로빈 : 한 세션에 작업이 많이 쌓여도 다른 세션 작업이 번갈아 실행됨
+    - 결과는 호출한 이벤트 루프의 future로 전달
+    """
+    # [1] 초기화
+    def __init__(self, workers: int = TRANSLATION_WORKERS):
+        self.workers = workers
+        self._condition = threading.Condition()
+        self._queues = {}               # session_id -> deque[(enqueue 시각, loop, future, fn, args)]
+        self._ready = deque()           # 대기 작업이 있는 session_id (라운드 로빈 순서)
+        self._threads = []
+
+        # 지표 (_condition 보유 상태에서 갱신)
+        self.queued = 0
+        self.in_flight = 0
+        self.max_queued = 0
+        self.max_in_flight = 0
+        self.submitted = 0
+        self.completed = 0
+        self.errors = 0
+        self.queue_wait = LatencyRecorder()     # 대기열 -> 작업 스레드 시작
+        self.run_time = LatencyRecorder()       # 번역 호출 소요 시간
+
+    # [2] 작업 추가
+    def submit(self, session_id, fn, *args) -> asyncio.Future:
+        """
+        번역 호출 예약 (이벤트 루프에서 호출)
+
+        Args:
+            session_id: 공정성 기준 (None이면 공용 대기열)
+            fn: 작업 스레드에서 실행할 동기 함수
+        Returns:
+            fn 결과를 받을 future
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._condition:
+            if not self._threads:
+                self._start_workers()
+            queue = self._queues.get(session_id)
+            if queue is None:
+                queue = self._queues[session_id] = deque()
+            if not queue:
+                self._ready.append(session_id)
+            queue.append((time.perf_counter(), loop, future, fn, args))
+            self.queued += 1
+            self.submitted += 1
+            self.max_queued = max(self.max_queued, self.queued)
+            self._condition.notify()
+        return future
+
+    def _start_workers(self):
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"translation-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    # [3] 작업 스레드
+    def _next_job(self):
+        """라운드 로빈으로 다음 세션의 가장 오래된 작업 꺼내기 (_condition 보유 상태에서 호출)"""
+        session_id = self._ready.popleft()
+        queue = self._queues[session_id]
+        job = queue.popleft()
+        if queue:
+            self._ready.append(session_id)      # 남은 작업이 있으면 순서 맨 뒤로
+        else:
+            del self._queues[session_id]
+        return job
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._ready:
+                    self._condition.wait()
+                enqueued_at, loop, future, fn, args = self._next_job()
+                self.queued -= 1
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                started = time.perf_counter()
+                self.queue_wait.record(started - enqueued_at)
+
+            failed = False
+            try:
+                if not future.cancelled():
+                    _deliver(loop, _set_result, future, fn(*args))
+            except Exception as e:
+                failed = True
+                _deliver(loop, _set_exception, future, e)
+
+            with self._condition:
+                self.in_flight -= 1
+                self.completed += 1
+                self.errors += failed
+                self.run_time.record(time.perf_counter() - started)
+
+    # 현재 상태 확인
+    def get_stats(self) -> dict:
+        with self._condition:
+            return {
+                'workers': self.workers,
+                'queued': self.queued,
+                'in_flight': self.in_flight,
+                'max_queued': self.max_queued,
+                'max_in_flight': self.max_in_flight,
+                'waiting_sessions': len(self._ready),
+                'submitted': self.submitted,
+                'completed': self.completed,
+                'errors': self.errors,
+                'queue_wait': self.queue_wait.snapshot(),
+                'run_time': self.run_time.snapshot(),
+            }
+
+translation_executor = FairTranslationExecutor()
+metrics_registry.register("translation_executor", translation_executor.get_stats)
@@ -0,0 +1,223 @@
+# [modules/translation/translation_providers.py]
+# 번역 제공자 (Google / Azure Translator / DeepL) 공통 인터페이스
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from src.app.core.config import api_settings
+from src.app.core.metrics import LatencyRecorder, metrics_registry
+from src.app.modules.translation.translation_executor import TRANSLATION_WORKERS
+
+# 번역 API 클라이언트는 사용하는 제공자만 필요 (설치되지 않았으면 해당 제공자 생성 시 오류)
+try:
+    from google.auth.credentials import AnonymousCredentials
+    from google.cloud import translate_v2 as translate
+except ImportError:
+    AnonymousCredentials = None
+    translate = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+SUPPORTED_TRANSLATION_PROVIDERS = ("google", "azure", "deepl")
+TRANSLATION_HTTP_TIMEOUT = float(os.getenv("TRANSLATION_HTTP_TIMEOUT", "5"))       # Azure / DeepL 요청 제한 시간 (초)
+
+# 엔드포인트 변경 (로컬 stub 서버로 테스트 / 벤치마크할 때 사용)
+GOOGLE_TRANSLATION_ENDPOINT = os.getenv("GOOGLE_TRANSLATION_ENDPOINT", "")
+AZURE_TRANSLATION_ENDPOINT = os.getenv("AZURE_TRANSLATION_ENDPOINT", "https://api.cognitive.microsofttranslator.com")
+AZURE_TRANSLATION_REGION = os.getenv("AZURE_TRANSLATION_REGION", "")
+DEEPL_TRANSLATION_ENDPOINT = os.getenv("DEEPL_TRANSLATION_ENDPOINT", "")
+
+# 제공자별 번역 언어 코드 (Google 언어 코드 기준, 없으면 기본 규칙)
+AZURE_LANGUAGE_CODES = {'zh-CN': "zh-Hans", 'zh-TW': "zh-Hant"}
+DEEPL_LANGUAGE_CODES = {'en': "EN-US", 'pt': "PT-BR", 'zh': "ZH-HANS", 'zh-CN': "ZH-HANS", 'zh-TW': "ZH-HANT"}
+DEEPL_REGIONAL_CODES = ("EN-GB", "EN-US", "PT-BR", "PT-PT")
+
+class TranslationProvider(ABC):
+    """
+    번역 제공자 공통 인터페이스 (작업 스레드에서 호출하는 동기 API)
+
+    - translate_batch : 문장 여러 개를 한 번에 번역 (묶음 처리용, 실패 시 예외)
+    - translate_text  : 문장 1개 번역 (실패 시 None)
+    - 원문 언어는 제공자가 자동 감지 (여러 세션의 문장을 언어와 무관하게 묶기 위함)
+    """
+    name = ""
+
+    # [1] 초기화
+    def __init__(self):
+        self._lock = threading.Lock()
+
+        # 지표
+        self.calls = 0
+        self.texts = 0
+        self.errors = 0
+        self.call_time = LatencyRecorder()      # API 호출 1회 소요 시간
+
+    @abstractmethod
+    def _translate(self, texts: list[str], target_language: str) -> list[str]:
+        """texts를 target_language로 번역 -> 같은 순서의 번역 문장 목록"""
+
+    # [2] 번역
+    def translate_batch(self, texts: list[str], target_language: str) -> list[dict]:
+        started = time.perf_counter()
+        try:
+            translated = self._translate(texts, target_language)
+            if len(translated) != len(texts):
+                raise ValueError(f"{self.name} 번역 결과 수 불일치: {len(translated)} / {len(texts)}")
+        except Exception:
+            with self._lock:
+                self.errors += 1
+            raise
+        finally:
+            with self._lock:
+                self.calls += 1
+                self.texts += len(texts)
+                self.call_time.record(time.perf_counter() - started)
+
+        print(f"[TRANSLATOR] {self.name} {target_language} 번역 결과: {len(translated)}개")
+        return [
+            {
+                'target_lang': target_language,
+                'result_text': text,
+            }
+            for text in translated
+        ]
+
+    def translate_text(self, text: str, target_language: str):
+        if not text:
+            return None
+        try:
+            return self.translate_batch([text], target_language)[0]
+        except Exception as e:
+            print(f"{self.name} {target_language} 번역 중 오류 발생: {e}")
+            return None
+
+    # 현재 상태 확인
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                'calls': self.calls,
+                'texts': self.texts,
+                'errors': self.errors,
+                'call_time': self.call_time.snapshot(),
+            }
+
+# [3] Google Cloud Translation (v2)
+class GoogleProvider(TranslationProvider):
+    name = "google"
+
+    def __init__(self):
+        super().__init__()
+        if translate is None:
+            raise ValueError("google-cloud-translate가 설치되지 않아 Google 번역을 사용할 수 없습니다")
+        if GOOGLE_TRANSLATION_ENDPOINT:
+            # 로컬 stub 서버 : 인증 x
+            self.client = translate.Client(credentials=AnonymousCredentials(), client_options={'api_endpoint': GOOGLE_TRANSLATION_ENDPOINT})
+        else:
+            if not os.environ.get('GOOGLE_APPLICATION_CREDENTIALS'):
+                raise ValueError("GOOGLE_APPLICATION_CREDENTIALS 환경변수가 설정되지 않았습니다")
+            self.client = translate.Client()
+        print("Google Translator 초기화 완료")
+
+    def _translate(self, texts, target_language):
+        results = self.client.translate(texts, target_language=target_language)
+        return [result['translatedText'] for result in results]
+
+# [4] Azure Translator (v3)
+class AzureProvider(TranslationProvider):
+    name = "azure"
+
+    def __init__(self):
+        super().__init__()
+        if httpx is None:
+            raise ValueError("httpx가 설치되지 않아 Azure 번역을 사용할 수 없습니다")
+        if not api_settings.azure_translation_key:
+            raise ValueError("AZURE_TRANSLATION_KEY 환경변수가 설정되지 않았습니다")
+        headers = {'Ocp-Apim-Subscription-Key': api_settings.azure_translation_key}
+        if AZURE_TRANSLATION_REGION:
+            headers['Ocp-Apim-Subscription-Region'] = AZURE_TRANSLATION_REGION
+        # 연결 재사용 (작업 스레드 수만큼 동시 연결)
+        self.client = httpx.Client(
+            base_url=AZURE_TRANSLATION_ENDPOINT,
+            headers=headers,
+            timeout=TRANSLATION_HTTP_TIMEOUT,
+            limits=httpx.Limits(max_connections=TRANSLATION_WORKERS),
+        )
+        print("Azure Translator 초기화 완료")
+
+    def _translate(self, texts, target_language):
+        response = self.client.post(
+            "/translate",
+            params={'api-version': "3.0", 'to': AZURE_LANGUAGE_CODES.get(target_language, target_language)},
+            json=[{'Text': text} for text in texts],
+        )
+        response.raise_for_status()
+        return [item['translations'][0]['text'] for item in response.json()]
+
+# [5] DeepL (v2)
+class DeepLProvider(TranslationProvider):
+    name = "deepl"
+
+    def __init__(self):
+        super().__init__()
+        if httpx is None:
+            raise ValueError("httpx가 설치되지 않아 DeepL 번역을 사용할 수 없습니다")
+        key = api_settings.deepl_translation_key
+        if not key:
+            raise ValueError("DEEPL_TRANSLATION_KEY 환경변수가 설정되지 않았습니다")
+        # 무료 API 키는 ':fx'로 끝나고 엔드포인트가 다름
+        endpoint = DEEPL_TRANSLATION_ENDPOINT or ("https://api-free.deepl.com" if key.endswith(":fx") else "https://api.deepl.com")
+        self.client = httpx.Client(
+            base_url=endpoint,
+            headers={'Authorization': f"DeepL-Auth-Key {key}"},
+            timeout=TRANSLATION_HTTP_TIMEOUT,
+            limits=httpx.Limits(max_connections=TRANSLATION_WORKERS),
+        )
+        print("DeepL Translator 초기화 완료")
+
+    @staticmethod
+    def language_code(target_language: str) -> str:
+        if target_language in DEEPL_LANGUAGE_CODES:
+            return DEEPL_LANGUAGE_CODES[target_language]
+        if target_language.upper() in DEEPL_REGIONAL_CODES:
+            return target_language.upper()
+        return target_language.split('-')[0].upper()
+
+    def _translate(self, texts, target_language):
+        response = self.client.post("/v2/translate", json={'text': texts, 'target_lang': self.language_code(target_language)})
+        response.raise_for_status()
+        return [item['text'] for item in response.json()['translations']]
+
+# [6] 제공자 생성 (제공자별 1개 공유)
+PROVIDER_CLASSES = {
+    "google": GoogleProvider,
+    "azure": AzureProvider,
+    "deepl": DeepLProvider,
+}
+_providers = {}
+_providers_lock = threading.Lock()
+
+def get_provider(name: str) -> TranslationProvider:
+    """
+    이름에 맞는 번역 제공자 반환 (처음 요청 시 생성)
+
+    Raises:
+        ValueError: 지원하지 않는 제공자 / 인증 정보 또는 라이브러리 없음
+    """
+    if name not in PROVIDER_CLASSES:
+        raise ValueError(f"지원하지 않는 번역 제공자입니다: {name} (지원: {', '.join(SUPPORTED_TRANSLATION_PROVIDERS)})")
+    with _providers_lock:
+        provider = _providers.get(name)
+        if provider is None:
+            provider = _providers[name] = PROVIDER_CLASSES[name]()
+        return provider
+
+def get_provider_stats() -> dict:
+    """생성된 제공자별 API 호출 지표"""
+    with _providers_lock:
+        providers = dict(_providers)
+    return {name: provider.get_stats() for name, provider in providers.items()}
+
+metrics_registry.register("translation_providers", get_provider_stats)
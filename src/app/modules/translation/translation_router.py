@@ -0,0 +1,182 @@
+# [modules/translation/translation_router.py]
+# 언어 쌍별 번역 제공자 선택 + 늦은 요청 헤징 (응답이 p95보다 늦으면 다음 제공자에도 요청)
+import asyncio
+import os
+import time
+from src.app.core.metrics import LatencyRecorder, metrics_registry
+from src.app.modules.translation.translation_batcher import translation_batcher
+from src.app.modules.translation.translation_executor import translation_executor
+from src.app.modules.translation.translation_providers import SUPPORTED_TRANSLATION_PROVIDERS, get_provider
+
+# 언어 쌍별 제공자 (우선순위 순) - "원문>번역=제공자,제공자;..." ('*'는 모든 언어, 원문은 'ko'처럼 기본 코드)
+# ex. "ko>en=deepl,google;*>ja=azure,google;*=google"
+TRANSLATION_ROUTES = os.getenv("TRANSLATION_ROUTES", "*=google")
+TRANSLATION_HEDGE = os.getenv("TRANSLATION_HEDGE", "1") == "1"                        # 다음 제공자가 있는 경로에서 헤징 사용
+TRANSLATION_HEDGE_PERCENTILE = float(os.getenv("TRANSLATION_HEDGE_PERCENTILE", "95"))  # 이 분위수보다 늦으면 헤징
+TRANSLATION_HEDGE_MIN_SAMPLES = int(os.getenv("TRANSLATION_HEDGE_MIN_SAMPLES", "20"))  # 분위수를 쓰기 위한 최소 샘플 수
+TRANSLATION_HEDGE_DEFAULT_MS = float(os.getenv("TRANSLATION_HEDGE_DEFAULT_MS", "1000")) # 샘플이 부족할 때 헤징 대기 시간
+TRANSLATION_HEDGE_MIN_MS = float(os.getenv("TRANSLATION_HEDGE_MIN_MS", "50"))           # 헤징 대기 시간 하한 (과도한 중복 호출 방지)
+
+def parse_routes(spec: str) -> dict:
+    """
+    "ko>en=deepl,google;*=google" -> {('ko', 'en'): ('deepl', 'google'), ('*', '*'): ('google',)}
+
+    Raises:
+        ValueError: 형식 오류 / 지원하지 않는 제공자
+    """
+    routes = {}
+    for entry in filter(None, (part.strip() for part in spec.split(";"))):
+        pair, _, names = entry.partition("=")
+        providers = tuple(name.strip() for name in names.split(",") if name.strip())
+        if not providers:
+            raise ValueError(f"번역 경로에 제공자가 없습니다: {entry}")
+        for name in providers:
+            if name not in SUPPORTED_TRANSLATION_PROVIDERS:
+                raise ValueError(f"지원하지 않는 번역 제공자입니다: {name} (지원: {', '.join(SUPPORTED_TRANSLATION_PROVIDERS)})")
+        source, _, target = pair.strip().partition(">")
+        routes[(source.strip() or "*", target.strip() or "*")] = providers
+    routes.setdefault(("*", "*"), ("google",))
+    return routes
+
+class TranslationRouter:
+    """
+    문장 1개 / 번역 언어 1개 요청을 제공자에게 전달
+
+    - 언어 쌍별 제공자 목록 : (원문, 번역) -> (*, 번역) -> (원문, *) -> (*, *) 순으로 찾음
+    - 헤징 : 첫 제공자가 자기 p95(라우터에서 본 요청 -> 응답 시간)까지 응답하지 않으면 다음 제공자에도 요청,
+             먼저 온 결과 사용 (헤징은 요청당 1회)
+    - 실패 시 다음 제공자로 재요청 (failover)
+    - 호출은 묶음 처리기(제공자별로 묶음) 또는 공용 번역 실행기에서 실행
+    """
+    # [1] 초기화
+    def __init__(self, routes: str = TRANSLATION_ROUTES, hedge: bool = TRANSLATION_HEDGE,
+                 executor=translation_executor, batcher=translation_batcher):
+        self.routes = parse_routes(routes)
+        self.hedge = hedge
+        self.executor = executor
+        self.batcher = batcher
+        self.latency = {name: LatencyRecorder() for name in SUPPORTED_TRANSLATION_PROVIDERS}   # 제공자별 요청 -> 응답
+
+        # 지표
+        self.requests = 0
+        self.hedged = 0             # 헤징 요청을 보낸 수
+        self.hedge_wins = 0         # 헤징 요청이 먼저 응답한 수
+        self.failovers = 0          # 실패로 다음 제공자에 요청한 수
+        self.failed = 0             # 모든 제공자 실패
+        self.wins = dict.fromkeys(SUPPORTED_TRANSLATION_PROVIDERS, 0)
+
+    def setup(self):
+        """경로에 설정된 제공자 미리 생성 (인증 정보 / 라이브러리 확인)"""
+        for providers in self.routes.values():
+            for name in providers:
+                get_provider(name)
+
+    # [2] 제공자 선택
+    def providers_for(self, source_language: str, target_language: str) -> tuple:
+        source = source_language.split('-')[0] if source_language else "*"
+        for key in ((source, target_language), ("*", target_language), (source, "*"), ("*", "*")):
+            if key in self.routes:
+                return self.routes[key]
+        return self.routes[("*", "*")]
+
+    def hedge_delay(self, name: str) -> float:
+        """헤징 전 대기 시간 (초) - 제공자 응답 시간 분위수, 샘플이 부족하면 기본값"""
+        latency = self.latency[name]
+        if len(latency.samples) < TRANSLATION_HEDGE_MIN_SAMPLES:
+            return TRANSLATION_HEDGE_DEFAULT_MS / 1000
+        return max(TRANSLATION_HEDGE_MIN_MS / 1000, latency.percentile(TRANSLATION_HEDGE_PERCENTILE))
+
+    # [3] 번역 요청
+    def _submit(self, name: str, text: str, target_language: str, session_id) -> asyncio.Future:
+        provider = get_provider(name)
+        if self.batcher.enabled:
+            # 같은 제공자 / 번역 언어 요청끼리 묶어서 API 1회 호출
+            return self.batcher.submit(target_language, text, provider.translate_batch, group=name, session_id=session_id)
+        return self.executor.submit(session_id, provider.translate_text, text, target_language)
+
+    async def translate(self, text: str, source_language: str, target_language: str, session_id=None):
+        """
+        문장 1개 번역 (이벤트 루프에서 호출)
+
+        Returns:
+            {'target_lang', 'result_text'} 또는 None (모든 제공자 실패)
+        """
+        if not text:
+            return None
+        providers = self.providers_for(source_language, target_language)
+        self.requests += 1
+
+        attempts = {}           # future -> (제공자 이름, 요청 시각)
+        next_index = 0
+        hedged = False
+
+        def launch():
+            nonlocal next_index
+            name = providers[next_index]
+            next_index += 1
+            attempts[self._submit(name, text, target_language, session_id)] = (name, time.perf_counter())
+
+        launch()
+        try:
+            while attempts:
+                # 첫 요청만 진행 중 + 다음 제공자 있음 -> 첫 제공자 p95까지만 대기
+                timeout = None
+                if self.hedge and not hedged and len(attempts) == 1 and next_index < len(providers):
+                    name, started = next(iter(attempts.values()))
+                    timeout = max(0.0, started + self.hedge_delay(name) - time.perf_counter())
+
+                done, _ = await asyncio.wait(attempts, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    hedged = True
+                    self.hedged += 1
+                    launch()
+                    continue
+
+                for future in done:
+                    name, started = attempts.pop(future)
+                    result = None if future.cancelled() or future.exception() else future.result()
+                    if result:
+                        self.latency[name].record(time.perf_counter() - started)
+                        self.wins[name] += 1
+                        if hedged and name != providers[0]:
+                            self.hedge_wins += 1
+                        return result
+
+                # 진행 중인 요청이 모두 실패 -> 다음 제공자
+                if not attempts and next_index < len(providers):
+                    self.failovers += 1
+                    launch()
+
+            self.failed += 1
+            return None
+        finally:
+            # 늦은 요청 정리 : 대기 중이면 호출 취소, 경과 시간은 최소 응답 시간으로 기록 (p95가 낮게 치우치지 않도록)
+            now = time.perf_counter()
+            for future, (name, started) in attempts.items():
+                future.cancel()
+                self.latency[name].record(now - started)
+
+    # 현재 상태 확인
+    def get_stats(self) -> dict:
+        used = sorted({name for providers in self.routes.values() for name in providers})
+        return {
+            'routes': {f"{source}>{target}": ",".join(providers) for (source, target), providers in self.routes.items()},
+            'hedge': self.hedge,
+            'requests': self.requests,
+            'hedged': self.hedged,
+            'hedge_rate': round(self.hedged / self.requests, 4) if self.requests else 0.0,
+            'hedge_wins': self.hedge_wins,
+            'failovers': self.failovers,
+            'failed': self.failed,
+            'providers': {
+                name: {
+                    'wins': self.wins[name],
+                    'hedge_delay_ms': round(self.hedge_delay(name) * 1000, 3),
+                    'latency': self.latency[name].snapshot(),
+                }
+                for name in used
+            },
+        }
+
+translation_router = TranslationRouter()
+metrics_registry.register("translation_router", translation_router.get_stats)
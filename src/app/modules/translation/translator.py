@@ -0,0 +1,96 @@
+# [modules/translation/translator.py]
+# 번역기 : 다중 언어 번역 (캐시 -> 언어 쌍별 번역 제공자 라우팅 / 헤징 -> 묶음 처리 / 공용 실행기)
+import asyncio
+import time
+from src.app.modules.translation.translation_cache import translation_cache
+from src.app.modules.translation.translation_router import translation_router
+from src.app.modules.translation.language_latency import language_latency
+
+async def _with_language(lang, task):
+    return lang, await task
+
+class Translator:
+    # [1] 초기화
+    def __init__(self, router=translation_router):
+        """
+        Args:
+            router: 번역 제공자 라우터 (TRANSLATION_ROUTES 설정 - 기본 Google)
+        """
+        self.router = router
+
+    # [2] 번역 설정    
+    def setup_translation(self) :
+        """ 번역기 초기화 """ 
+        # 경로에 설정된 번역 제공자 준비 (제공자별 1개를 모든 세션이 공유)
+        self.router.setup()
+
+    # [3] 번역 
+    # 3-1) 다중 번역 실행 -> 다중 번역 결과 반환
+    async def translate_multiple_languages(self, text, input_language, target_languages : list[str], session_id=None, on_result=None):
+        """
+        텍스트를 여러 언어로 동시 번역
+
+        Args:
+            session_id: 공용 번역 실행기의 공정성 기준 (세션별 라운드 로빈)
+            on_result: 언어별 번역이 끝나는 즉시 호출 (lang, 결과 | None) - 느린 언어를 기다리지 않고 전달할 때 사용
+        """
+        started = time.perf_counter()
+        # 결과 저장 변수
+        results = {}
+
+        # 'en-US'에서 'en'만 추출
+        simple_lang_code = input_language.split('-')[0];
+
+        # 원문 내용 저장 (가장 첫번째로 저장)
+        results[simple_lang_code] = {
+                'target_lang': simple_lang_code,
+                'result_text': text,
+            }
+        
+        # 언어 별 번역 처리 -> 병렬 처리 (호출마다 스레드 풀 생성 x)
+        tasks = []
+
+        # target_languages에서 원문과 동일한 language 제거
+        # target_languages : google 언어 코드 기준 -> '-' 있는 것, 없는 것이 있음 -> 조건문으로 비교
+        # input_languages : azure 언어 -> 모두 '-'가 있음 -> 항상 파싱해서 비교
+        translate_target_languages = []
+        for language in target_languages :
+            if '-' in language:
+                if input_language.split('-')[0] != language.split('-')[0]:
+                    translate_target_languages.append(language)
+            else :
+                if input_language.split('-')[0] != language:
+                    translate_target_languages.append(language)
+
+        for lang in translate_target_languages:
+            if translation_cache.enabled and text:
+                # 같은 문장 / 언어 번역은 캐시 결과 사용 (진행 중인 동일 요청은 합쳐서 1회만 호출)
+                task = translation_cache.translate(text, input_language, lang, lambda lang=lang: self._request_translation(text, input_language, lang, session_id))
+            else:
+                task = self._request_translation(text, input_language, lang, session_id)
+            tasks.append((lang, task))      # task 추가
+            
+        # 각 번역 결과 저장 (끝나는 순서대로 처리)
+        completed = {}
+        for finished in asyncio.as_completed([_with_language(lang, task) for lang, task in tasks]):
+            lang, result = await finished
+            language_latency.record(lang, time.perf_counter() - started)      # 언어별 지연 분포
+            if result:
+                completed[lang] = result
+                #이거 로그 안찍혔던거 같은디 왜지
+                print(f"[TRANSLATOR] {lang} 결과 미리보기: {result['result_text'][:100]}...")
+            if on_result is not None:
+                on_result(lang, result)
+
+        # 번역 언어 설정 순서 유지
+        for lang in translate_target_languages:
+            if lang in completed:
+                results[lang] = completed[lang]
+
+        #모든 번역 결과 반환
+        return results
+    
+    # 3-2) 번역 요청 -> 번역 결과 awaitable 반환
+    def _request_translation(self, text, input_language, lang, session_id):
+        # 언어 쌍별 제공자 선택 + 늦으면 다음 제공자로 헤징 (호출은 묶음 처리기 / 공용 번역 실행기에서 실행)
+        return self.router.translate(text, input_language, lang, session_id)
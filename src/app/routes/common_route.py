@@ -1,7 +1,9 @@
 from fastapi import APIRouter
 from src.app.routes.speech_route import router as speech_router
 from src.app.routes.language_route import router as language_router
+from src.app.routes.metrics_route import router as metrics_router
 
 api_router = APIRouter(prefix= "/api/routes")
 api_router.include_router(speech_router)
 api_router.include_router(language_router)
+api_router.include_router(metrics_router)
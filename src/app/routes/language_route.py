@@ -4,6 +4,7 @@ from fastapi import APIRouter, status, HTTPException
 import logging
 from src.app.dto.refinement_dto import SpeechRefineRequest, SpeechRefineResponse, SpeechRefineConferenceRequest, SpeechRefineConferenceResponse
 from src.app.services.language_service import build_lecture_text_service, build_conference_text_service
+from src.app.core.transcript_store import transcript_store
 
 router = APIRouter(prefix="/language")
 
@@ -14,14 +15,13 @@ router = APIRouter(prefix="/language")
     status_code=status.HTTP_200_OK,
     response_model = SpeechRefineResponse,
     summary="발화 정제",
-    description="정제되지 않은 강연자의 발화 내용을 입력 받아 발화를 정제한다.",
+    description="정제되지 않은 강연자의 발화 내용(full_text) 또는 실시간 번역 세션 id(session_id) + 원문 조회 토큰(transcript_token)을 입력 받아 발화를 정제한다.",
 )
 async def refine_text_route(request: SpeechRefineRequest) -> SpeechRefineResponse:
     try:
         # [0] 디버깅 코드
         print(f"=== [ROUTER DEBUG] ===") 
-        if not request.full_text or not request.full_text.strip():
-            raise HTTPException(status_code=400, detail="[ROUTER ERROR] 발화 내용이 비어있습니다.")
+        _validate_source_text(request)
         
         response = await build_lecture_text_service(request)
         return response
@@ -39,14 +39,13 @@ async def refine_text_route(request: SpeechRefineRequest) -> SpeechRefineRespons
     status_code=status.HTTP_200_OK,
     response_model = SpeechRefineConferenceResponse,
     summary="발화 정제 (회의모드)",
-    description="정제되지 않은 강연자의 발화 내용을 입력 받아 발화를 정제한다. (회의모드)",
+    description="정제되지 않은 강연자의 발화 내용(full_text) 또는 실시간 번역 세션 id(session_id) + 원문 조회 토큰(transcript_token)을 입력 받아 발화를 정제한다. (회의모드)",
 )
 async def refine_conference_text_route(request: SpeechRefineConferenceRequest) -> SpeechRefineConferenceResponse:
     try:
         # [0] 디버깅 코드
         print(f"=== [ROUTER DEBUG] ===") 
-        if not request.full_text or not request.full_text.strip():
-            raise HTTPException(status_code=400, detail="[ROUTER ERROR] 발화 내용이 비어있습니다.")
+        _validate_source_text(request)
         
         response = await build_conference_text_service(request)
         return response
@@ -57,4 +56,17 @@ async def refine_conference_text_route(request: SpeechRefineConferenceRequest) -
 
     except Exception as e:
         logging.error(f"[ROUTER ERROR] 발화 정제 실패 - {str(e)}")
-        raise HTTPException(status_code=500, detail="발화 정제 처리 중 오류 발생")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="발화 정제 처리 중 오류 발생")
+
+# 원문 확인 (세션 원문 또는 직접 전달한 원문)
+def _validate_source_text(request):
+    if request.session_id:
+        if not request.transcript_token:
+            raise HTTPException(status_code=401, detail="[ROUTER ERROR] 세션 원문을 사용하려면 transcript_token이 필요합니다.")
+        transcript = transcript_store.get(request.session_id, request.transcript_token)
+        if transcript is None:
+            raise HTTPException(status_code=404, detail="[ROUTER ERROR] 세션 원문을 찾을 수 없습니다.")
+        if not transcript.segments:
+            raise HTTPException(status_code=400, detail="[ROUTER ERROR] 세션 원문이 비어있습니다.")
+    elif not request.full_text or not request.full_text.strip():
+        raise HTTPException(status_code=400, detail="[ROUTER ERROR] 발화 내용이 비어있습니다.")
@@ -0,0 +1,17 @@
+# [routes/metrics_route.py]
+# 성능 지표 조회 엔드포인트
+from fastapi import APIRouter, status
+from src.app.core.metrics import metrics_registry
+
+router = APIRouter(prefix="/metrics")
+
+# 전체 지표 조회
+@router.get(
+    "",
+    tags=["Metrics"],
+    status_code=status.HTTP_200_OK,
+    summary="성능 지표 조회",
+    description="활성 세션 및 공용 모듈의 성능 지표(지연 시간, 큐 깊이 등)를 반환한다.",
+)
+async def get_metrics_route() -> dict:
+    return metrics_registry.snapshot()
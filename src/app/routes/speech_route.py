@@ -2,6 +2,7 @@
 # speech 작업 엔드포인트
 from fastapi import APIRouter, WebSocket
 from src.app.services.speech_service import websocket_speech_service
+from src.app.services.broadcast_service import websocket_broadcast_speaker_service, websocket_broadcast_listener_service
 
 router = APIRouter(prefix="/speech-translation")
 
@@ -21,4 +22,24 @@ async def websocket_endpoint(websocket: WebSocket):
         회의 모드 :
         입력 언어가 1~10개인 경우에 활용할 수 있는 기능입니다.
     """
-    await websocket_speech_service(websocket, "multiple")
\ No newline at end of file
+    await websocket_speech_service(websocket, "multiple")
+
+# [3] 방송 모드 - 발화자 WebSocket 연결
+@router.websocket("/connect/broadcast/speaker")
+async def websocket_broadcast_speaker_endpoint(websocket: WebSocket):
+    """
+        방송 모드 (발화자) :
+        발화자 1명의 음성을 인식/번역하여 방(room)에 참여한 모든 청취자에게 전송합니다.
+        ready 응답의 room_id를 청취자에게 공유합니다.
+    """
+    await websocket_broadcast_speaker_service(websocket)
+
+# [4] 방송 모드 - 청취자 WebSocket 연결
+@router.websocket("/connect/broadcast/listener/{room_id}")
+async def websocket_broadcast_listener_endpoint(websocket: WebSocket, room_id: str):
+    """
+        방송 모드 (청취자) :
+        room_id 방에 참여하여 발화자의 자막/번역 결과를 수신합니다.
+        청취자 수와 관계없이 음성 인식/번역은 방에서 한 번만 수행됩니다.
+    """
+    await websocket_broadcast_listener_service(websocket, room_id)
\ No newline at end of file
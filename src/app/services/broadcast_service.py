@@ -0,0 +1,182 @@
+# [services/broadcast_service.py]
+# 강의 방송 모드 작업 로직 처리 (발화자 1명 -> 청취자 N명)
+from src.app.interfaces.broadcast_room import BroadcastRoom, broadcast_rooms
+from src.app.dto.speech_translation_dto import ConfigMessage, ListenerConfigMessage, StatusMessage
+from src.app.core.outbound_scheduler import OutboundScheduler
+from src.app.core.delta_encoder import InterimDeltaEncoder
+from src.app.core.frame_serializer import FrameSerializer
+from src.app.core.metrics import metrics_registry
+from src.app.services.speech_service import process_audio_stream, apply_audio_settings, apply_latency_profile, encode_result_frame, connect_to_ready
+from fastapi import WebSocket, WebSocketDisconnect
+import json, traceback, asyncio, time
+
+# [1] 발화자 WebSocket 연결 -> 방 생성 + 음성 스트림 수신
+async def websocket_broadcast_speaker_service(websocket: WebSocket):
+    room = None
+    subscription = None
+    try:
+        await websocket.accept()
+        connected_at = time.perf_counter()
+        print("방송 발화자 연결됨")
+
+        # 1. 초기 설정 (입력 언어 / 번역 언어 / 전송 옵션)
+        config = ConfigMessage(**await websocket.receive_json())
+        print(f"방송 발화자 설정 메시지 : {config}")
+        try:
+            serializer = FrameSerializer(config.format)
+        except ValueError as e:
+            await websocket.send_json(StatusMessage(status="error", message=str(e), error_code="UNSUPPORTED_FORMAT").model_dump())
+            return
+
+        # 2. 방 생성 + 인식 세션 시작
+        room = BroadcastRoom()
+        if not await apply_audio_settings(websocket, room.interface, config):
+            return
+        if not await apply_latency_profile(websocket, room.interface, config):
+            return
+        try:
+            await room.open(config.input_language, config.target_languages)
+        except Exception as e:
+            await websocket.send_json(StatusMessage(status="error", message="STT 초기화 실패", error_code="STT_INIT_FAILED").model_dump())
+            return
+        broadcast_rooms[room.room_id] = room
+
+        # 3. 발화자도 구독자로 등록 (자신의 자막 확인용, 번역 수요에는 포함 x)
+        subscription = _subscribe(websocket, room, config, serializer, [])
+        await websocket.send_json(StatusMessage(status="ready", message="방송 준비 완료", room_id=room.room_id, session_id=room.interface.session_id, transcript_token=room.interface.transcript.access_token, latency_profile=room.interface.latency_profile).model_dump())
+        connect_to_ready['broadcast'].record(time.perf_counter() - connected_at)
+
+        # 4. 오디오 스트림 수신 (설정 변경 시 방 전체 언어 설정 변경)
+        _, scheduler, delta_encoder, _ = subscription
+        await process_audio_stream(websocket, room.interface, "single", scheduler, delta_encoder)
+
+    except WebSocketDisconnect:
+        print("방송 발화자 연결 종료")
+    except Exception as e:
+        print(f"방송 발화자 오류: {e}")
+        traceback.print_exc()
+    finally:
+        if room is not None:
+            if subscription is not None:
+                _unsubscribe(room, subscription)
+            broadcast_rooms.pop(room.room_id, None)
+            room.close()
+        print("방송 세션 종료 완료")
+
+# [2] 청취자 WebSocket 연결 -> 방 참여 + 결과 수신
+async def websocket_broadcast_listener_service(websocket: WebSocket, room_id: str):
+    room = None
+    subscription = None
+    try:
+        await websocket.accept()
+        print(f"방송 청취자 연결됨 : {room_id}")
+
+        room = broadcast_rooms.get(room_id)
+        if room is None:
+            await websocket.send_json(StatusMessage(status="error", message="존재하지 않는 방입니다", error_code="ROOM_NOT_FOUND").model_dump())
+            return
+
+        # 1. 초기 설정 (받아볼 번역 언어 / 전송 옵션)
+        config = ListenerConfigMessage(**await websocket.receive_json())
+        try:
+            serializer = FrameSerializer(config.format)
+        except ValueError as e:
+            await websocket.send_json(StatusMessage(status="error", message=str(e), error_code="UNSUPPORTED_FORMAT").model_dump())
+            return
+
+        # 2. 구독 등록 (언어 미지정 시 방에 설정된 번역 언어 전체, 설정 밖 언어 요청은 거부)
+        languages = config.languages if config.languages is not None else room.interface.current_target_languages
+        if not await _check_languages(websocket, room, languages):
+            return
+        subscription = _subscribe(websocket, room, config, serializer, languages)
+        await websocket.send_json(StatusMessage(status="ready", message="방송 참여 완료", room_id=room.room_id).model_dump())
+
+        # 3. 설정 메시지 수신 / 방 종료 중 먼저 끝나는 쪽까지 대기
+        subscriber_id, scheduler, delta_encoder, _ = subscription
+        receiver_task = asyncio.create_task(process_listener_messages(websocket, room, subscriber_id, scheduler, delta_encoder))
+        closed_task = asyncio.create_task(room.closed.wait())
+        done, pending = await asyncio.wait({receiver_task, closed_task}, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+
+        if closed_task in done:
+            await websocket.send_json(StatusMessage(status="disconnected", message="발화자가 방송을 종료했습니다", error_code="ROOM_CLOSED").model_dump())
+            await websocket.close()
+
+    except WebSocketDisconnect:
+        print("방송 청취자 연결 종료")
+    except Exception as e:
+        print(f"방송 청취자 오류: {e}")
+    finally:
+        if room is not None and subscription is not None:
+            _unsubscribe(room, subscription)
+        print("방송 청취 종료 완료")
+
+# [3] 청취자 설정 메시지 처리
+async def process_listener_messages(websocket: WebSocket, room: BroadcastRoom, subscriber_id: str, scheduler: OutboundScheduler, delta_encoder: InterimDeltaEncoder):
+    """청취자 설정 변경 (번역 언어 / 전송 옵션) - 오디오 등 그 외 메시지는 무시"""
+    while True:
+        try:
+            message = await websocket.receive()
+            if message.get("type") == "websocket.disconnect":
+                break
+            if message.get("type") != "websocket.receive" or "text" not in message:
+                continue
+
+            config_data = json.loads(message["text"])
+            if config_data.get("type") != "setting":
+                continue
+
+            config = ListenerConfigMessage(**config_data)
+            if config.languages is not None and await _check_languages(websocket, room, config.languages):
+                room.set_languages(subscriber_id, config.languages)
+            scheduler.batch_enabled = config.batch
+            delta_encoder.enabled = config.delta
+            if scheduler.serializer.wire_format != config.format:
+                try:
+                    scheduler.serializer = FrameSerializer(config.format)
+                except ValueError as e:
+                    await websocket.send_json(StatusMessage(status="error", message=str(e), error_code="UNSUPPORTED_FORMAT").model_dump())
+
+        except Exception as e:
+            print(f"청취자 메시지 처리 오류: {e}")
+            break
+
+# 청취자 요청 언어 확인 (방 주인이 설정한 번역 언어만 허용)
+async def _check_languages(websocket: WebSocket, room: BroadcastRoom, languages: list[str]) -> bool:
+    unavailable = room.unavailable_languages(languages)
+    if unavailable:
+        await websocket.send_json(StatusMessage(
+            status="error",
+            message=f"방에 설정되지 않은 번역 언어입니다: {', '.join(unavailable)} (가능: {', '.join(room.interface.current_target_languages or [])})",
+            error_code="LANGUAGE_NOT_AVAILABLE",
+        ).model_dump())
+        return False
+    return True
+
+# 구독 등록 -> 소켓별 전송 스케줄러 시작
+def _subscribe(websocket: WebSocket, room: BroadcastRoom, config, serializer: FrameSerializer, languages: list[str]):
+    subscriber_id, queue, throttle = room.subscribe(languages)
+    delta_encoder = InterimDeltaEncoder(enabled=config.delta)
+    scheduler = OutboundScheduler(
+        websocket,
+        queue.get_batch,
+        lambda result, serializer: encode_result_frame(result, "single", delta_encoder, serializer),
+        batch_enabled=config.batch,
+        serializer=serializer,
+        on_send=throttle.observe_send,      # 이 소켓이 느려지면 이 소켓의 중간 결과만 감속
+    )
+    metrics_registry.register(
+        f"outbound.{room.room_id}.{subscriber_id}",
+        lambda: {**scheduler.get_stats(), 'interim_delta': delta_encoder.get_stats(), 'queue': queue.get_stats(), 'interims': throttle.get_stats()}
+    )
+    sender_task = asyncio.create_task(scheduler.run())
+    return subscriber_id, scheduler, delta_encoder, sender_task
+
+# 구독 해제 -> 전송 스케줄러 정리
+def _unsubscribe(room: BroadcastRoom, subscription):
+    subscriber_id, _, _, sender_task = subscription
+    if not sender_task.done():
+        sender_task.cancel()
+    metrics_registry.unregister(f"outbound.{room.room_id}.{subscriber_id}")
+    room.unsubscribe(subscriber_id)
@@ -9,6 +9,7 @@ from src.app.prompts.refining_prompt import refine_lecture_prompt, refine_meetin
 from src.app.prompts.summarizing_prompt import summarize_lecture_prompt, summarize_meeting_prompt
 from src.app.prompts.keypoints_prompt import extract_keypoints_prompt
 from src.app.utils.file_generator_factory import create_file_by_format
+from src.app.core.transcript_store import transcript_store
 from src.app.interfaces.single_speech_translation_interface import SingleSpeechTranslationInterface
 from src.app.interfaces.multiple_speech_translation_interface import MultipleSpeechTranslationInterface
 
@@ -34,7 +35,7 @@ async def build_lecture_text_service(request: SpeechRefineRequest) -> SpeechRefi
         request.language_list = list(set(normalize_language_code(lang) for lang in request.language_list))
         print(f"정규화된 언어 리스트: {request.language_list}")
 
-        refined_text = await _refine_by_mode(request.full_text, "lecture", request.language_list)
+        refined_text = await _refine_by_mode(_resolve_full_text(request), "lecture", request.language_list)
         return await _process_lecture_mode(request, refined_text)
 
     except Exception as e:
@@ -55,7 +56,7 @@ async def build_conference_text_service(request: SpeechRefineConferenceRequest)
         request.language_list = list(set(normalize_language_code(lang) for lang in request.language_list))
         print(f"정규화된 언어 리스트: {request.language_list}")
 
-        refined_text = await _refine_by_mode(request.full_text, "conference", request.language_list)
+        refined_text = await _refine_by_mode(_resolve_full_text(request), "conference", request.language_list)
         return await _process_conference_mode(request, refined_text)
 
     except Exception as e:
@@ -63,6 +64,17 @@ async def build_conference_text_service(request: SpeechRefineConferenceRequest)
         raise Exception(f"[CONFERENCE SERVICE ERROR] {str(e)}")
 
 
+# 정제할 원문 : session_id가 있으면 서버에 누적된 세션 원문 (업로드 x)
+def _resolve_full_text(request) -> str:
+    if request.session_id:
+        transcript = transcript_store.get(request.session_id, request.transcript_token)
+        if transcript is None:
+            raise Exception(f"세션 원문을 찾을 수 없습니다: {request.session_id}")
+        print(f"세션 원문 사용: {request.session_id} ({len(transcript.segments)}문장, {transcript.char_count}자)")
+        return transcript.full_text()
+    return request.full_text
+
+
 # =============================================================================
 # 모드별 처리 함수
 # =============================================================================
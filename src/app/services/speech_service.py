@@ -2,25 +2,37 @@
 # speech_translation 작업 로직 처리 
 from src.app.interfaces.single_speech_translation_interface import SingleSpeechTranslationInterface
 from src.app.interfaces.multiple_speech_translation_interface import MultipleSpeechTranslationInterface
-from src.app.dto.speech_translation_dto import ConfigMessage, MultipleConfigMessage, SpeechTranslationResponse, SeparatedSpeechTranslationResponse, StatusMessage
+from src.app.dto.speech_translation_dto import ConfigMessage, MultipleConfigMessage, StatusMessage
+from src.app.core.outbound_scheduler import OutboundScheduler
+from src.app.core.delta_encoder import InterimDeltaEncoder
+from src.app.core.frame_serializer import FrameSerializer
+from src.app.core.metrics import LatencyRecorder, metrics_registry
+from src.app.core.latency_profiles import resolve_latency_profile
+from src.app.interfaces.session_registry import session_registry
+from src.app.modules.audio.session_recorder import RECORD_ALL_SESSIONS
 from fastapi import WebSocket, WebSocketDisconnect
-import json, traceback, asyncio
+import json, traceback, asyncio, time
+
+NORMAL_CLOSURE = 1000       # WebSocket 정상 종료 코드 (클라이언트가 세션을 끝냄)
+UNSUPPORTED_DATA = 1003     # WebSocket 종료 코드 : 처리할 수 없는 데이터 (지원하지 않는 오디오 컨테이너 / 코덱)
+
+# 연결(accept) -> ready 응답까지 걸린 시간 (새 세션 / 재연결 / 방송 발화자)
+connect_to_ready = {kind: LatencyRecorder() for kind in ("new", "resumed", "broadcast")}
+metrics_registry.register("connect_to_ready", lambda: {kind: recorder.snapshot() for kind, recorder in connect_to_ready.items()})
 
 # [1] WebSocket 연결 -> speech_translation 처리
 async def websocket_speech_service(websocket : WebSocket, mode : str):
     interface = None
+    session = None
+    attachment_id = None
+    close_code = None
+    result_sender_task = None
     try:
         print(f"모드 설정 : {mode}")
-        # 인터페이스 호출 (init)
-        #print("SpeechTranslationInterface 생성 시도...")
-        if mode == "single" :
-            interface = SingleSpeechTranslationInterface()
-        elif mode == "multiple" :
-            interface = MultipleSpeechTranslationInterface()
-        #print("SpeechTranslationInterface 생성 성공")
 
         # 1. WebSocket 연결
         await websocket.accept()
+        connected_at = time.perf_counter()
         print("클라이언트 연결됨")
 
         # 2. speech_translation 설정
@@ -38,37 +50,101 @@ async def websocket_speech_service(websocket : WebSocket, mode : str):
         else :
             raise Exception('confg 형식이 알맞지 않습니다.')
             
-        
-        # 2-2. 설정에 맞춰 session 열기
+        # 2-2. 결과 전송 형식 확인 (json / msgpack)
         try:
-            if mode == "single" :
-                await interface.start_session(config.input_language, config.target_languages)
-            elif mode == "multiple" :
-                await interface.start_session(config.input_languages, config.target_languages)
-        except Exception as e:
+            serializer = FrameSerializer(config.format)
+        except ValueError as e:
             error_status = StatusMessage(
-                status="error", 
-                message="STT 초기화 실패", 
-                error_code="STT_INIT_FAILED"
+                status="error",
+                message=str(e),
+                error_code="UNSUPPORTED_FORMAT"
             )
-            await websocket.send_json(error_status.model_dump())        # error 메시지 전송 
+            await websocket.send_json(error_status.model_dump())        # error 메시지 전송
             return
-        # 2-3. speech_translation 준비 완료 response 전송
-        status = StatusMessage(status="ready", message="speech_translation 준비 완료")
+
+        # 2-3. 재연결 : 유예 시간 안이면 기존 세션 이어서 사용 (인식기 재생성 x)
+        if config.resume_token:
+            session = session_registry.resume(config.resume_token, mode)
+        resumed = session is not None
+        if resumed:
+            interface = session.interface
+            print(f"세션 재연결 : {interface.session_id}")
+            # 새 소켓 = 새 오디오 스트림 -> 디코더 초기화 + 바뀐 설정 적용
+            if not await apply_audio_settings(websocket, interface, config, new_stream=True):
+                return
+            if not await apply_latency_profile(websocket, interface, config):
+                return
+            await apply_language_settings(websocket, interface, mode, config)
+        else:
+            # 인터페이스 호출 (init)
+            if mode == "single" :
+                interface = SingleSpeechTranslationInterface()
+            elif mode == "multiple" :
+                interface = MultipleSpeechTranslationInterface()
+
+            # 2-4. 입력 오디오 설정 (코덱 / PCM 형식 / 음성 구간 게이트)
+            if not await apply_audio_settings(websocket, interface, config):
+                return
+
+            # 2-5. 지연 프로파일 (인식기 풀에서 같은 설정의 인식기 사용)
+            if not await apply_latency_profile(websocket, interface, config):
+                return
+            
+            # 2-6. 설정에 맞춰 session 열기
+            try:
+                if mode == "single" :
+                    await interface.start_session(config.input_language, config.target_languages)
+                elif mode == "multiple" :
+                    await interface.start_session(config.input_languages, config.target_languages)
+            except Exception as e:
+                error_status = StatusMessage(
+                    status="error", 
+                    message="STT 초기화 실패", 
+                    error_code="STT_INIT_FAILED"
+                )
+                await websocket.send_json(error_status.model_dump())        # error 메시지 전송 
+                return
+            session = session_registry.create(interface, mode)
+
+        # 2-7. 소켓 연결 (재연결이면 놓친 최종 결과 재전송 준비)
+        attachment_id, result_queue, replayed = session.attach(config.last_seq if config.resume_token else None)
+
+        # 2-8. speech_translation 준비 완료 response 전송 (재연결용 토큰 포함)
+        status = StatusMessage(
+            status="ready",
+            message="speech_translation 준비 완료" if not replayed else f"세션 재연결 완료 (결과 {replayed}개 재전송)",
+            session_id=interface.session_id,
+            resume_token=session.resume_token,
+            transcript_token=interface.transcript.access_token,
+            latency_profile=interface.latency_profile,
+        )
         await websocket.send_json(status.model_dump())
+        connect_to_ready['resumed' if resumed else 'new'].record(time.perf_counter() - connected_at)
 
-         # 3. 개선된 실시간 처리 - 백그라운드에서 번역 결과 전송
-        result_sender_task = asyncio.create_task(
-            send_translation_results(websocket, interface, mode)
+        # 3. 개선된 실시간 처리 - 백그라운드에서 번역 결과 전송 (최종 결과 우선 + 묶음 전송)
+        delta_encoder = InterimDeltaEncoder(enabled=config.delta)
+        scheduler = OutboundScheduler(
+            websocket,
+            result_queue.get_batch,
+            lambda result, serializer: encode_result_frame(result, mode, delta_encoder, serializer),
+            batch_enabled=config.batch,
+            serializer=serializer,
+            on_send=interface.interim_throttle.observe_send,     # 소켓이 느려지면 중간 결과 빈도 자동 감속
         )
+        metrics_registry.register(
+            f"outbound.{interface.session_id}",
+            lambda: {**scheduler.get_stats(), 'interim_delta': delta_encoder.get_stats(), 'resume': session.get_status()}
+        )
+        result_sender_task = asyncio.create_task(scheduler.run())
 
         # 4. 오디오 스트림 수신 - 논블로킹
-        await process_audio_stream(websocket, interface, mode)
+        close_code = await process_audio_stream(websocket, interface, mode, scheduler, delta_encoder)
 
         # 3. 실시간 처리
         # await audio_handler(websocket, interface)        # 음성 스트림 수신 -> 결과 송신
 
-    except WebSocketDisconnect:
+    except WebSocketDisconnect as e:
+        close_code = e.code
         disconnect_status = StatusMessage(
             status="disconnected",
             message="클라이언트가 연결을 종료했습니다",
@@ -88,17 +164,41 @@ async def websocket_speech_service(websocket : WebSocket, mode : str):
         except:
             print("연결 종료로 에러 메시지 전송 실패")
     finally:
+        # 결과 전송 태스크 정리 (큐 대기 중인 태스크 취소)
+        if result_sender_task is not None and not result_sender_task.done():
+            result_sender_task.cancel()
         if interface is not None:
-            interface.stop_session()
+            metrics_registry.unregister(f"outbound.{interface.session_id}")
+        if session is None:
+            if interface is not None:
+                interface.stop_session()
+        elif attachment_id is None:
+            # 재연결 설정 실패 -> 기존 연결 / 유예 시간 그대로 유지
+            print("재연결 실패 : 기존 세션 유지")
+        elif close_code in (NORMAL_CLOSURE, UNSUPPORTED_DATA):
+            # 정상 종료 / 처리할 수 없는 오디오 -> 세션 바로 종료 (이미 다른 소켓이 재연결했으면 무시)
+            session_registry.close(session, attachment_id)
+        else:
+            # 비정상 종료 (네트워크 끊김 등) -> 유예 시간 동안 재연결 대기
+            session_registry.detach(session, attachment_id)
         print("세션 종료 완료")
             
 # [2] 오디오 스트림 처리 - 논블로킹 방식
-async def process_audio_stream(websocket: WebSocket, interface, mode):
-    """오디오 스트림을 논블로킹 방식으로 처리"""
+async def process_audio_stream(websocket: WebSocket, interface, mode, scheduler: OutboundScheduler, delta_encoder: InterimDeltaEncoder):
+    """
+    오디오 스트림을 논블로킹 방식으로 처리
+
+    Returns:
+        클라이언트가 보낸 종료 코드 (오류로 끊긴 경우 None, 디코딩할 수 없는 오디오로 서버가 끊은 경우 UNSUPPORTED_DATA)
+    """
     while True:
         try:
             # 메시지 수신
             message_type = await websocket.receive()
+
+            # 연결 종료
+            if message_type.get("type") == "websocket.disconnect":
+                return message_type.get("code")
             
             # JSON 메시지 처리 (설정 변경)
             if message_type.get("type") == "websocket.receive" and "text" in message_type:
@@ -113,24 +213,31 @@ async def process_audio_stream(websocket: WebSocket, interface, mode):
                         config = ConfigMessage(**config_data)
                     elif mode == "multiple" : 
                         config = MultipleConfigMessage(**config_data)
-                    try : 
-                        # 입력 언어 설정 변경
-                        if mode == "single":
-                            if interface.current_input_language != config.input_language:
-                                await interface.change_input_language_settings(config.input_language)
-                        elif mode == "multiple":
-                            if interface.current_input_languages != config.input_languages: 
-                                await interface.change_input_language_settings(config.input_languages)
-                        # 번역 언어 설정 변경
-                        if interface.current_target_languages != config.target_languages : 
-                            await interface.change_target_languages_settings(config.target_languages)
-                    except Exception as e:
-                        error_status = StatusMessage(
-                            status="error",
-                            message=f"언어 변경 실패: {str(e)}",
-                            error_code="LANGUAGE_CHANGE_FAILED" 
-                        )
-                        await websocket.send_json(error_status.model_dump())        # error 메시지 전송
+
+                    # 결과 묶음 전송 / 중간 결과 델타 전송 여부 변경
+                    scheduler.batch_enabled = config.batch
+                    delta_encoder.enabled = config.delta
+
+                    # 결과 전송 형식 변경
+                    if scheduler.serializer.wire_format != config.format:
+                        try:
+                            scheduler.serializer = FrameSerializer(config.format)
+                        except ValueError as e:
+                            error_status = StatusMessage(
+                                status="error",
+                                message=str(e),
+                                error_code="UNSUPPORTED_FORMAT"
+                            )
+                            await websocket.send_json(error_status.model_dump())        # error 메시지 전송
+
+                    # 입력 오디오 설정 변경 (코덱 / PCM 형식 / 음성 구간 게이트)
+                    await apply_audio_settings(websocket, interface, config)
+
+                    # 지연 프로파일 변경 (인식기 항목이 바뀌면 인식 중단 없이 교체)
+                    await apply_latency_profile(websocket, interface, config)
+
+                    # 입력 / 번역 언어 설정 변경
+                    await apply_language_settings(websocket, interface, mode, config)
                     
             # 오디오 데이터 처리
             elif message_type.get("type") == "websocket.receive" and "bytes" in message_type:
@@ -140,51 +247,164 @@ async def process_audio_stream(websocket: WebSocket, interface, mode):
                 audio_data = message_type["bytes"]
                 print(f"오디오 수신: {len(audio_data)} bytes")
                 
-                # 타임아웃 없이 오디오 처리
-                interface.process_audio_chunk(audio_data)
+                # 타임아웃 없이 오디오 처리 (압축 오디오는 디코딩 완료까지 대기 -> 세션 내 순서 유지)
+                try:
+                    await interface.process_audio_chunk(audio_data)
+                except ValueError as e:
+                    # 지원하지 않는 컨테이너 / 코덱, 손상된 스트림 헤더 -> 이후 청크도 디코딩 불가 : 알리고 연결 종료 (재연결 대기 x)
+                    print(f"오디오 디코딩 실패: {e}")
+                    error_status = StatusMessage(status="error", message=str(e), error_code="UNSUPPORTED_AUDIO")
+                    await websocket.send_json(error_status.model_dump())        # error 메시지 전송
+                    await websocket.close(code=UNSUPPORTED_DATA)
+                    return UNSUPPORTED_DATA
                 
         except Exception as e:
             print(f"오디오 스트림 처리 오류: {e}")
             break
 
-# [3] 번역 결과 전송 - 백그라운드 태스크
-async def send_translation_results(websocket: WebSocket, interface, mode):
-    """백그라운드에서 번역 결과를 지속적으로 전송"""
-    print("번역 결과 전송 태스크 시작")
-    
-    while True:
-        try:
-            # 논블로킹으로 결과 확인
-            result = await interface.get_latest_translation_result()
-            
-            # 결과가 있는 경우
-            if result:
-                # dict에서 is_final 값 먼저 추출
-                is_final = result.pop('is_final', False)
+# [3] 입력 / 번역 언어 설정 적용
+async def apply_language_settings(websocket: WebSocket, interface, mode: str, config):
+    """바뀐 언어 설정만 적용 (실패 시 error 메시지 전송)"""
+    try : 
+        # 입력 언어 설정 변경
+        if mode == "single":
+            if interface.current_input_language != config.input_language:
+                await interface.change_input_language_settings(config.input_language)
+        elif mode == "multiple":
+            if interface.current_input_languages != config.input_languages: 
+                await interface.change_input_language_settings(config.input_languages)
+        # 번역 언어 설정 변경
+        if interface.current_target_languages != config.target_languages : 
+            await interface.change_target_languages_settings(config.target_languages)
+    except Exception as e:
+        error_status = StatusMessage(
+            status="error",
+            message=f"언어 변경 실패 (기존 언어로 계속 인식): {str(e)}",
+            error_code="LANGUAGE_CHANGE_FAILED" 
+        )
+        await websocket.send_json(error_status.model_dump())        # error 메시지 전송
 
-                print(f"번역 결과 받음: (최종: {is_final}) {list(result.keys())}")
-                if mode == "single" :
-                    response = SpeechTranslationResponse(
-                        is_final = is_final, 
-                        translations=result
-                    )
-                elif mode == "multiple" :
-                   # 첫 번째 요소를 원문으로 처리
-                    first_key = next(iter(result))
-                    original = {first_key: result[first_key]}
-                    # 나머지를 번역으로 처리
-                    response = SeparatedSpeechTranslationResponse(
-                        is_final=is_final, 
-                        original= original, 
-                        translations=result
-                    )
-                await websocket.send_json(response.model_dump())
-                print(f"websocket 전송 : {response.model_dump()}")
-                print("클라이언트에 번역 결과 전송 완료")
-            else:
-                # 결과가 없으면 잠깐 대기
-                await asyncio.sleep(0.05)
-                
-        except Exception as e:
-            print(f"번역 결과 전송 오류: {e}")
-            break
\ No newline at end of file
+# [4] 입력 오디오 설정 적용
+async def apply_audio_settings(websocket: WebSocket, interface, config, new_stream: bool = False) -> bool:
+    """
+    바뀐 입력 오디오 설정만 적용 (코덱 / PCM 형식 변경 시 디코더 / 변환기 초기화, 녹음 여부)
+
+    Args:
+        new_stream: 새 소켓의 오디오 스트림 (코덱이 같아도 디코더 초기화 - 컨테이너 헤더부터 다시 시작)
+
+    Returns:
+        False : 지원하지 않는 설정 -> error 메시지 전송 완료
+    """
+    try:
+        if new_stream or interface.input_codec != config.codec:
+            interface.set_input_codec(config.codec)
+    except ValueError as e:
+        error_status = StatusMessage(status="error", message=str(e), error_code="UNSUPPORTED_CODEC")
+        await websocket.send_json(error_status.model_dump())        # error 메시지 전송
+        return False
+
+    try:
+        input_format = (config.sample_rate, config.channels, config.sample_format)
+        if interface.input_format != input_format:
+            interface.set_input_format(*input_format)
+    except ValueError as e:
+        error_status = StatusMessage(status="error", message=str(e), error_code="UNSUPPORTED_AUDIO_FORMAT")
+        await websocket.send_json(error_status.model_dump())        # error 메시지 전송
+        return False
+
+    try:
+        if (interface.vad_gate is not None) != config.vad:
+            interface.set_vad(config.vad)
+    except ValueError as e:
+        error_status = StatusMessage(status="error", message=str(e), error_code="VAD_UNAVAILABLE")
+        await websocket.send_json(error_status.model_dump())        # error 메시지 전송
+        return False
+
+    # 입력 오디오 녹음 (SESSION_RECORDING=1이면 항상)
+    record = config.record or RECORD_ALL_SESSIONS
+    if interface.recording_enabled != record:
+        interface.set_recording(record)
+    return True
+
+# [4-1] 지연 프로파일 적용
+async def apply_latency_profile(websocket: WebSocket, interface, config) -> bool:
+    """
+    프로파일 이름 + 항목별 덮어쓰기 + 언어별 즉시 전달 여부 적용 (바뀐 경우에만)
+
+    Returns:
+        False : 지원하지 않는 프로파일 / 항목 -> error 메시지 전송 완료
+    """
+    try:
+        profile = resolve_latency_profile(config.profile, config.profile_overrides)
+    except ValueError as e:
+        error_status = StatusMessage(status="error", message=str(e), error_code="UNSUPPORTED_LATENCY_PROFILE")
+        await websocket.send_json(error_status.model_dump())        # error 메시지 전송
+        return False
+    if interface.latency_profile != profile:
+        interface.set_latency_profile(profile)
+    if interface.incremental != config.incremental:
+        interface.set_incremental(config.incremental)
+    return True
+
+# [5] 번역 결과 -> 전송 프레임 직렬화
+def encode_result_frame(result: dict, mode: str, delta_encoder: InterimDeltaEncoder, serializer: FrameSerializer):
+    """
+    결과 큐 항목을 소켓 설정에 맞춰 직렬화 (전송 직전에 호출)
+
+    Returns:
+        None : 직전에 전송한 중간 결과와 동일 -> 전송 생략
+    """
+    if not result.get('is_final', False):
+        # 중간 결과 : 중복 제거 + (설정 시) 바뀐 부분만 전송
+        delta = delta_encoder.encode(result.get('utterance_id'), result.get('language'), result.get('text', ""))
+        if delta is None:
+            return None
+        if delta_encoder.enabled:
+            return serializer.encode(delta)
+    else:
+        delta_encoder.finish(result.get('utterance_id'))
+
+    # 전체 프레임은 형식별로 한 번만 직렬화 (방송 모드에서 청취자 간 공유)
+    return serializer.encode_shared(result, lambda item: build_result_payload(item, mode))
+
+# [6] 번역 결과 -> 전송용 dict 변환
+def build_result_payload(result: dict, mode: str) -> dict:
+    """결과 큐 항목을 모드별 response 형식으로 변환"""
+    # 언어별 즉시 전달 항목 : 번역 1개 (TranslationUpdateResponse 형식, 모드 공통)
+    if result.get('incremental'):
+        return {
+            'type': "translation",
+            'seq': result.get('seq'),
+            'segment_seq': result.get('segment_seq'),
+            'is_final': True,
+            'original': result.get('original', False),
+            'translation': result['translation'],
+        }
+
+    # 결과 항목에서 is_final / 번역 결과 추출
+    is_final = result.get('is_final', False)
+    translations = result['translations']
+
+    print(f"번역 결과 받음: (최종: {is_final}) {list(translations.keys())}")
+    # Pydantic 모델 생성 / model_dump 없이 response 형식(dict)을 바로 구성
+    if mode == "single" :
+        # SpeechTranslationResponse 형식
+        return {
+            'type': "result",
+            'seq': result.get('seq'),
+            'segment_seq': result.get('segment_seq'),
+            'is_final': is_final,
+            'translations': translations,
+        }
+    elif mode == "multiple" :
+        # SeparatedSpeechTranslationResponse 형식
+        # 첫 번째 요소를 원문으로 처리
+        first_key = next(iter(translations))
+        return {
+            'type': "result",
+            'seq': result.get('seq'),
+            'segment_seq': result.get('segment_seq'),
+            'is_final': is_final,
+            'original': {first_key: translations[first_key]},
+            'translations': translations,
+        }
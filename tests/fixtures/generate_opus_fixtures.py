@@ -0,0 +1,42 @@
+# [tests/fixtures/generate_opus_fixtures.py]
+# 디먹서 / 디코더 테스트용 Opus 샘플 생성 (1초 440Hz 사인파, 48kHz mono, 20ms 프레임)
+#
+# 실행: python -m tests.fixtures.generate_opus_fixtures
+#   -> tests/fixtures/sine_1s.ogg, tests/fixtures/sine_1s.webm
+import os
+import av
+import numpy as np
+
+FIXTURE_DIR = os.path.dirname(os.path.abspath(__file__))
+SAMPLE_RATE = 48000
+DURATION_SECONDS = 1.0
+FRAME_SAMPLES = 960         # 20ms
+
+
+def write_fixture(path: str, container_format: str):
+    t = np.arange(int(SAMPLE_RATE * DURATION_SECONDS)) / SAMPLE_RATE
+    samples = (np.sin(2 * np.pi * 440 * t) * 0.3 * 32767).astype(np.int16)
+
+    with av.open(path, "w", format=container_format) as container:
+        stream = container.add_stream("libopus", rate=SAMPLE_RATE)
+        stream.layout = "mono"
+        stream.bit_rate = 16000
+        for offset in range(0, len(samples), FRAME_SAMPLES):
+            frame = av.AudioFrame.from_ndarray(samples[None, offset:offset + FRAME_SAMPLES], format="s16", layout="mono")
+            frame.sample_rate = SAMPLE_RATE
+            frame.pts = offset
+            for packet in stream.encode(frame):
+                container.mux(packet)
+        for packet in stream.encode(None):
+            container.mux(packet)
+
+
+def main():
+    for extension, container_format in (("ogg", "ogg"), ("webm", "webm")):
+        path = os.path.join(FIXTURE_DIR, f"sine_1s.{extension}")
+        write_fixture(path, container_format)
+        print(f"{path}: {os.path.getsize(path)} bytes")
+
+
+if __name__ == "__main__":
+    main()
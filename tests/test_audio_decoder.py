@@ -0,0 +1,113 @@
+# [tests/test_audio_decoder.py]
+# Opus(Ogg / WebM) 디먹서 + 디코더 : 임의 위치에서 잘린 청크로 같은 결과가 나오는지 확인
+#
+# 샘플 : tests/fixtures/sine_1s.ogg / sine_1s.webm (1초, 20ms 프레임, generate_opus_fixtures.py로 생성)
+import asyncio
+import os
+import random
+import pytest
+
+pytest.importorskip("av")
+
+from src.app.modules.audio.audio_decoder import OpusStreamDecoder, STT_SAMPLE_RATE, STT_SAMPLE_WIDTH
+from src.app.modules.audio.opus_demuxer import OggOpusDemuxer, WebmOpusDemuxer, create_demuxer
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+FIXTURES = {
+    "sine_1s.ogg": OggOpusDemuxer,
+    "sine_1s.webm": WebmOpusDemuxer,
+}
+FIXTURE_SECONDS = 1.0
+FIXTURE_PACKETS = 51            # 20ms 프레임 50개 + 인코더 지연을 채우는 마지막 프레임
+
+
+def _read(name: str) -> bytes:
+    with open(os.path.join(FIXTURE_DIR, name), "rb") as f:
+        return f.read()
+
+
+def _random_chunks(data: bytes, seed: int, max_size: int = 300) -> list[bytes]:
+    rng = random.Random(seed)
+    chunks = []
+    offset = 0
+    while offset < len(data):
+        size = rng.randint(1, max_size)
+        chunks.append(data[offset:offset + size])
+        offset += size
+    return chunks
+
+
+@pytest.mark.parametrize("name", FIXTURES)
+def test_demuxer_packets_do_not_depend_on_chunk_boundaries(name):
+    data = _read(name)
+    whole = create_demuxer(data)
+    expected = whole.feed(data)
+    assert isinstance(whole, FIXTURES[name])
+    assert whole.opus_head.startswith(b"OpusHead")
+    assert len(expected) == FIXTURE_PACKETS
+
+    for seed in range(20):
+        chunks = _random_chunks(data, seed)
+        demuxer = create_demuxer(chunks[0])
+        packets = []
+        for chunk in chunks:
+            packets += demuxer.feed(chunk)
+        assert packets == expected, f"seed {seed}"
+        assert demuxer.opus_head == whole.opus_head
+
+
+@pytest.mark.parametrize("name", FIXTURES)
+def test_decoder_outputs_full_duration_without_errors(name):
+    data = _read(name)
+
+    async def decode(chunks):
+        decoder = OpusStreamDecoder()
+        pcm = bytearray()
+        for chunk in chunks:
+            pcm += await decoder.decode_async(chunk)      # 공용 디코딩 풀 경유
+        return decoder, bytes(pcm)
+
+    async def run():
+        return await asyncio.gather(*(decode(_random_chunks(data, seed)) for seed in range(8)))
+
+    results = asyncio.run(run())
+    reference = results[0][1]
+    for decoder, pcm in results:
+        stats = decoder.get_stats()
+        assert stats['errors'] == 0
+        assert stats['packets'] == FIXTURE_PACKETS
+        duration = len(pcm) / (STT_SAMPLE_RATE * STT_SAMPLE_WIDTH)
+        assert duration == pytest.approx(FIXTURE_SECONDS, abs=0.03)
+        assert stats['audio_seconds'] == pytest.approx(duration, abs=0.001)
+        assert pcm == reference          # 청크 경계와 무관하게 같은 PCM
+    assert max(reference[1000:2000]) > 0   # 무음이 아닌 실제 신호
+
+
+def test_unknown_container_is_rejected():
+    with pytest.raises(ValueError):
+        create_demuxer(b"RIFF\x00\x00\x00\x00WAVE")
+
+
+def _ogg_page(packet: bytes) -> bytes:
+    """패킷 1개(255바이트 미만)짜리 Ogg 페이지 (CRC는 디먹서가 확인하지 않음)"""
+    header = b"OggS" + bytes([0, 0x02]) + bytes(8) + bytes(4) + bytes(4) + bytes(4)
+    return header + bytes([1, len(packet)]) + packet
+
+
+@pytest.mark.parametrize("first_packet, message", [
+    (b"\x01vorbis" + bytes(23), "Vorbis"),
+    (b"\x7fFLAC" + bytes(20), "FLAC"),
+    (b"garbage-first-page", "OpusHead"),
+])
+def test_ogg_stream_without_opus_head_is_rejected(first_packet, message):
+    with pytest.raises(ValueError, match=message):
+        OpusStreamDecoder().decode(_ogg_page(first_packet))
+
+
+def test_webm_with_non_opus_codec_is_rejected():
+    data = _read("sine_1s.webm").replace(b"A_OPUS", b"A_FLAC")
+    chunks = _random_chunks(data, seed=3)
+    decoder = OpusStreamDecoder()
+    with pytest.raises(ValueError, match="A_FLAC"):
+        for chunk in chunks:
+            decoder.decode(chunk)
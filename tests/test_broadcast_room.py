@@ -0,0 +1,150 @@
+# [tests/test_broadcast_room.py]
+# 강의 방송 방 : 결과 분배 / 청취자 언어 검증 / 중간 결과 자동 감속은 구독자(소켓)별
+import asyncio
+from src.app.interfaces.broadcast_room import BroadcastRoom
+from src.app.interfaces.single_speech_translation_interface import SingleSpeechTranslationInterface
+from src.app.services.broadcast_service import _check_languages
+
+
+class UnusedTranslator:
+    """번역 호출 없는 시나리오용 (방 결과 큐에 직접 결과를 넣음)"""
+
+
+def make_room(target_languages: list[str]) -> BroadcastRoom:
+    interface = SingleSpeechTranslationInterface(translator=UnusedTranslator())
+    interface.current_target_languages = target_languages
+    return BroadcastRoom(interface)
+
+
+def result(utterance_id: int, text: str, is_final: bool = False) -> dict:
+    return {'utterance_id': utterance_id, 'text': text, 'is_final': is_final, 'language': "ko-KR"}
+
+
+def drain(queue) -> list[dict]:
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+class RecordingWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send_json(self, data: dict):
+        self.sent.append(data)
+
+
+def test_finals_fan_out_to_every_listener_as_one_shared_item():
+    async def scenario():
+        room = make_room(["en", "ja"])
+        subscriptions = [room.subscribe(["en"]) for _ in range(3)]
+        fan_out = asyncio.create_task(room._fan_out())
+        for utterance_id in (1, 2):
+            room.interface.translation_result_queue.put_nowait(result(utterance_id, f"문장 {utterance_id}", is_final=True))
+        await asyncio.sleep(0.05)
+        fan_out.cancel()
+        return room, [drain(queue) for _, queue, _ in subscriptions]
+
+    room, received = asyncio.run(scenario())
+
+    assert all([item['seq'] for item in items] == [1, 2] for items in received)
+    first, *others = received
+    assert all(items[0] is first[0] for items in others)       # 같은 객체 -> 형식별 직렬화 1번
+    assert room.items_fanned_out == 2
+    assert room.deliveries == 6
+    assert room.get_status()['peak_subscribers'] == 3
+
+
+def test_listener_languages_are_limited_to_room_languages():
+    room = make_room(["en", "ja"])
+
+    assert room.unavailable_languages(["en", "fr", "de"]) == ["fr", "de"]
+    subscriber_id, _, _ = room.subscribe(["en", "fr"])         # 설정 밖 언어는 무시
+    assert room.subscriber_languages[subscriber_id] == ["en"]
+    assert room.language_demand.active_languages(["en", "ja"]) == ["en"]
+
+    room.set_languages(subscriber_id, ["ja", "zh"])
+    assert room.subscriber_languages[subscriber_id] == ["ja"]
+    assert room.language_demand.counts == {'ja': 1}
+
+    room.unsubscribe(subscriber_id)
+    assert room.language_demand.counts == {}
+    room.set_languages(subscriber_id, ["en"])                   # 나간 구독자 -> 무시
+    assert room.language_demand.counts == {}
+
+
+def test_listener_requesting_unconfigured_language_gets_error_frame():
+    async def scenario():
+        room = make_room(["en", "ja"])
+        websocket = RecordingWebSocket()
+        rejected = await _check_languages(websocket, room, ["en", "fr"])
+        accepted = await _check_languages(websocket, room, ["ja"])
+        return rejected, accepted, websocket.sent
+
+    rejected, accepted, sent = asyncio.run(scenario())
+
+    assert rejected is False and accepted is True
+    assert len(sent) == 1
+    assert sent[0]['error_code'] == "LANGUAGE_NOT_AVAILABLE"
+    assert "fr" in sent[0]['message']
+
+
+def test_slow_listener_backs_off_only_its_own_interims():
+    async def scenario():
+        room = make_room(["en"])
+        room.interface.interim_throttle.configure(10, True)        # 방 상한 10 Hz (간격 0.1초)
+        fast_id, fast_queue, fast_throttle = room.subscribe(["en"])
+        slow_id, slow_queue, slow_throttle = room.subscribe(["en"])
+        fan_out = asyncio.create_task(room._fan_out())
+
+        # 느린 태블릿 : 전송 0.5초 -> 최대 감속 (간격 0.8초)
+        for _ in range(20):
+            slow_throttle.observe_send(0.5)
+
+        room.interface.translation_result_queue.put_nowait(result(1, "첫"))
+        await asyncio.sleep(0.15)
+        fast, slow = drain(fast_queue), drain(slow_queue)
+        room.interface.translation_result_queue.put_nowait(result(1, "첫 번째"))
+        await asyncio.sleep(0.15)
+        fast, slow = fast + drain(fast_queue), slow + drain(slow_queue)
+
+        # 최종 결과 -> 느린 청취자가 보관 중이던 중간 결과는 폐기, 최종 결과는 바로 전달
+        room.interface.translation_result_queue.put_nowait(result(1, "첫 번째 문장", is_final=True))
+        await asyncio.sleep(0.05)
+        slow_after_final = drain(slow_queue)
+        await asyncio.sleep(0.8)
+        slow_late = drain(slow_queue)
+
+        fan_out.cancel()
+        return fast, slow, slow_after_final, slow_late, fast_throttle, slow_throttle, room
+
+    fast, slow, slow_after_final, slow_late, fast_throttle, slow_throttle, room = asyncio.run(scenario())
+
+    assert [item['text'] for item in fast] == ["첫", "첫 번째"]
+    assert [item['text'] for item in slow] == ["첫"]
+    assert [item['text'] for item in slow_after_final] == ["첫 번째 문장"]
+    assert slow_late == []
+    assert slow_throttle.finalized == 1
+    assert fast_throttle.backoff() == 1.0
+    assert slow_throttle.backoff() == 8.0
+    # 방 전체 빈도 제한(발화자 세션)에는 청취자 전송 지연이 반영되지 않음
+    assert room.interface.interim_throttle.send_latency == 0.0
+
+
+def test_unsubscribe_cancels_pending_interim():
+    async def scenario():
+        room = make_room(["en"])
+        room.interface.interim_throttle.configure(1, True)
+        subscriber_id, queue, throttle = room.subscribe(["en"])
+        throttle.submit(result(1, "a"))
+        throttle.submit(result(1, "ab"))        # 간격 안 -> 보관 + 타이머
+        timer = throttle.timer
+        room.unsubscribe(subscriber_id)
+        return timer, throttle, room
+
+    timer, throttle, room = asyncio.run(scenario())
+
+    assert timer.cancelled()
+    assert throttle.pending is None
+    assert room.subscriber_throttles == {}
@@ -0,0 +1,60 @@
+# [tests/test_delta_encoder.py]
+# 중간 결과 델타 인코딩 : 클라이언트 복원 왕복 / 중복 생략 / 발화 종료 후 기준 초기화
+from src.app.core.delta_encoder import InterimDeltaEncoder
+
+
+class DeltaClient:
+    """클라이언트 복원 규칙 : text = 이전 text[:prefix_len] + suffix"""
+    def __init__(self):
+        self.texts = {}
+
+    def apply(self, frame: dict) -> str:
+        key = (frame['utterance_id'], frame['lang'])
+        text = self.texts.get(key, "")[:frame['prefix_len']] + frame['suffix']
+        self.texts[key] = text
+        return text
+
+
+def test_client_rebuilds_every_hypothesis_including_revisions():
+    encoder = InterimDeltaEncoder(enabled=True)
+    client = DeltaClient()
+    # 인식 중 앞 단어가 수정되는 경우 포함 (공통 접두사가 줄어듦)
+    hypotheses = ["오늘", "오늘은", "오늘은 날씨가", "오늘 날씨가", "오늘 날씨가 맑습니다", "오늘 날씨가 맑습니다 😀", "오늘 날씨"]
+
+    for text in hypotheses:
+        frame = encoder.encode(7, "ko-KR", text)
+        assert client.apply(frame) == text
+
+    stats = encoder.get_stats()
+    assert stats['duplicates'] == 0
+    assert stats['delta_bytes'] < stats['full_bytes']
+
+
+def test_languages_of_one_utterance_use_separate_bases():
+    encoder = InterimDeltaEncoder(enabled=True)
+    client = DeltaClient()
+    steps = [("en", "Hello"), ("ja", "こんにちは"), ("en", "Hello world"), ("ja", "こんにちは世界")]
+
+    for language, text in steps:
+        assert client.apply(encoder.encode(1, language, text)) == text
+    assert encoder.encode(1, "en", "Hello world!")['prefix_len'] == len("Hello world")
+
+
+def test_duplicate_interim_is_skipped():
+    encoder = InterimDeltaEncoder(enabled=False)
+
+    assert encoder.encode(1, "ko-KR", "안녕") is not None
+    assert encoder.encode(1, "ko-KR", "안녕") is None
+    assert encoder.encode(1, "ko-KR", "안녕하세요") is not None
+    assert encoder.get_stats()['duplicates'] == 1
+
+
+def test_finish_and_next_utterance_reset_the_base():
+    encoder = InterimDeltaEncoder(enabled=True)
+    encoder.encode(1, "ko-KR", "첫 번째")
+    encoder.finish(1)
+    # 같은 발화 번호로 다시 와도 전체 문장 전송 (클라이언트는 최종 결과에서 기준을 버림)
+    assert encoder.encode(1, "ko-KR", "첫 번째")['prefix_len'] == 0
+
+    encoder.encode(2, "ko-KR", "두 번째")       # 새 발화 -> 이전 발화 기록 제거
+    assert encoder._last_sent == {(2, "ko-KR"): "두 번째"}
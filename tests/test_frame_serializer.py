@@ -0,0 +1,89 @@
+# [tests/test_frame_serializer.py]
+# 결과 프레임 직렬화 : JSON(orjson / 표준 json)과 MessagePack이 같은 메시지로 복원 / batch 결합 / 소켓 간 캐시
+import asyncio
+import json
+import pytest
+import src.app.core.frame_serializer as frame_serializer
+from src.app.core.frame_serializer import FrameSerializer
+
+msgpack = pytest.importorskip("msgpack")
+
+PAYLOADS = [
+    {'type': "result", 'seq': 3, 'segment_seq': 2, 'is_final': True,
+     'translations': {'ko': "안녕하세요 😀", 'en': "Hello", 'ja': "こんにちは"}},
+    {'type': "delta", 'is_final': False, 'utterance_id': 12_000_000, 'lang': "en", 'prefix_len': 0, 'suffix': ""},
+    {'type': "translation", 'seq': None, 'segment_seq': 1, 'is_final': True, 'original': False,
+     'translation': {'target_lang': "de", 'result_text': "Grüße \"zitiert\"\n"}},
+]
+
+
+class RecordingWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send_text(self, text: str):
+        self.sent.append(("text", text))
+
+    async def send_bytes(self, data: bytes):
+        self.sent.append(("bytes", data))
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_serializer(request, monkeypatch):
+    """orjson 설치 여부와 무관하게 같은 프레임인지 확인 (표준 json 대체 경로 포함)"""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(frame_serializer, "orjson", None)
+    return FrameSerializer("json")
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_json_and_msgpack_frames_decode_to_the_same_message(json_serializer, payload):
+    packed = FrameSerializer("msgpack").encode(payload)
+
+    assert json.loads(json_serializer.encode(payload)) == payload
+    assert msgpack.unpackb(packed, raw=False) == payload
+
+
+def test_batch_frames_are_equivalent(json_serializer):
+    packer = FrameSerializer("msgpack")
+    expected = {'type': "batch", 'items': PAYLOADS}
+
+    json_batch = json_serializer.encode_batch([json_serializer.encode(payload) for payload in PAYLOADS])
+    msgpack_batch = packer.encode_batch([packer.encode(payload) for payload in PAYLOADS])
+
+    assert json.loads(json_batch) == expected
+    assert msgpack.unpackb(msgpack_batch, raw=False) == expected
+
+
+def test_shared_item_is_encoded_once_per_format():
+    item = {'seq': 1}
+    calls = []
+    build = lambda result: calls.append(result['seq']) or {'seq': result['seq']}
+
+    json_frame = FrameSerializer("json").encode_shared(item, build)
+    assert FrameSerializer("json").encode_shared(item, build) is json_frame      # 다른 소켓도 같은 bytes
+    msgpack_frame = FrameSerializer("msgpack").encode_shared(item, build)
+
+    assert calls == [1, 1]
+    assert msgpack.unpackb(msgpack_frame) == json.loads(json_frame)
+
+
+def test_json_is_sent_as_text_and_msgpack_as_binary():
+    async def scenario():
+        websocket = RecordingWebSocket()
+        for wire_format in ("json", "msgpack"):
+            serializer = FrameSerializer(wire_format)
+            await serializer.send(websocket, serializer.encode(PAYLOADS[0]))
+        return websocket.sent
+
+    (json_kind, text), (msgpack_kind, data) = asyncio.run(scenario())
+
+    assert json_kind == "text" and json.loads(text) == PAYLOADS[0]
+    assert msgpack_kind == "bytes" and msgpack.unpackb(data) == PAYLOADS[0]
+
+
+def test_unknown_wire_format_is_rejected():
+    with pytest.raises(ValueError):
+        FrameSerializer("cbor")
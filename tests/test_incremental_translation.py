@@ -0,0 +1,81 @@
+# [tests/test_incremental_translation.py]
+# 언어별 즉시 전달 : 원문 -> 번역이 끝난 언어 순서로 translation 프레임 / 모든 프레임에 문장의 segment_seq
+import asyncio
+from src.app.interfaces.single_speech_translation_interface import SingleSpeechTranslationInterface
+from src.app.services.speech_service import build_result_payload
+
+
+class StaggeredTranslator:
+    """언어별 지연이 다른 번역기 대역 (None 지연 = 번역 실패) - 끝난 순서대로 on_result 호출"""
+    def __init__(self, delays: dict):
+        self.delays = delays
+
+    async def translate_multiple_languages(self, text, source_language, target_languages, session_id=None, on_result=None):
+        async def translate(lang):
+            delay = self.delays[lang]
+            if delay is None:
+                result = None
+            else:
+                await asyncio.sleep(delay)
+                result = {'target_lang': lang, 'result_text': f"{text}:{lang}"}
+            if on_result is not None:
+                on_result(lang, result)
+            return lang, result
+
+        results = dict(await asyncio.gather(*(translate(lang) for lang in target_languages)))
+        return {lang: results[lang] for lang in target_languages if results[lang]}
+
+
+def make_interface(incremental: bool) -> SingleSpeechTranslationInterface:
+    interface = SingleSpeechTranslationInterface(translator=StaggeredTranslator({'en': 0.06, 'ja': 0.01, 'fr': None}))
+    interface.current_input_language = "ko-KR"
+    interface.current_target_languages = ["en", "ja", "fr"]
+    interface.set_incremental(incremental)
+    return interface
+
+
+def drain(queue) -> list[dict]:
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+async def translate_sentences(interface: SingleSpeechTranslationInterface, texts: list[str]):
+    await asyncio.gather(*(
+        interface._translate_and_queue(text, True, utterance_id, segment_seq=interface.reorder_buffer.next_seq())
+        for utterance_id, text in enumerate(texts)
+    ))
+
+
+def test_each_language_is_queued_as_soon_as_ready_with_segment_seq():
+    async def scenario():
+        interface = make_interface(incremental=True)
+        await translate_sentences(interface, ["첫 문장", "두 번째 문장"])
+        return interface, drain(interface.translation_result_queue)
+
+    interface, items = asyncio.run(scenario())
+
+    for segment_seq, text in enumerate(["첫 문장", "두 번째 문장"]):
+        frames = [build_result_payload(item, "single") for item in items if item['segment_seq'] == segment_seq]
+        # 원문 -> 빠른 언어(ja) -> 느린 언어(en), 실패한 언어(fr)는 전송 x
+        assert [(frame['original'], frame['translation']['target_lang']) for frame in frames] == [(True, "ko"), (False, "ja"), (False, "en")]
+        assert frames[0]['translation']['result_text'] == text
+        assert all(frame['type'] == "translation" and frame['is_final'] and frame['segment_seq'] == segment_seq for frame in frames)
+
+    assert not any('translations' in item for item in items)         # 합친 result 프레임은 보내지 않음
+    assert interface.reorder_buffer.next_release == 2                 # 순서 번호는 그대로 진행
+
+
+def test_combined_result_is_sent_when_incremental_is_off():
+    async def scenario():
+        interface = make_interface(incremental=False)
+        await translate_sentences(interface, ["첫 문장", "두 번째 문장"])
+        return drain(interface.translation_result_queue)
+
+    items = asyncio.run(scenario())
+    frames = [build_result_payload(item, "single") for item in items]
+
+    assert [frame['segment_seq'] for frame in frames] == [0, 1]
+    assert all(frame['type'] == "result" for frame in frames)
+    assert list(frames[0]['translations']) == ["en", "ja"]
@@ -0,0 +1,114 @@
+# [tests/test_interim_throttle.py]
+# 중간 결과 빈도 제한 : 전송 지연에 따른 감속 / 회복 / trailing-edge 전달 / 최종 결과 도착 시 폐기
+import asyncio
+import pytest
+from src.app.core.interim_throttle import INTERIM_MAX_BACKOFF, INTERIM_SEND_LATENCY_TARGET_MS, InterimThrottle
+
+
+def interim(utterance_id: int, text: str) -> dict:
+    return {'utterance_id': utterance_id, 'text': text, 'is_final': False}
+
+
+def test_backoff_grows_with_send_latency_and_is_capped():
+    throttle = InterimThrottle(lambda item: None, max_hz=5)
+    target = INTERIM_SEND_LATENCY_TARGET_MS / 1000
+
+    throttle.observe_send(target / 2)           # 목표보다 빠름 -> 감속 x
+    assert throttle.backoff() == 1.0
+    assert throttle.interval() == pytest.approx(0.2)
+
+    backoffs = []
+    for _ in range(10):
+        throttle.observe_send(target * 4)
+        backoffs.append(throttle.backoff())
+    assert backoffs == sorted(backoffs)                  # 지수 이동 평균 -> 한 번의 느린 전송으로 급격히 늘지 않음
+    assert backoffs[0] < 2.0 < backoffs[-1] < 4.0
+    assert throttle.interval() == pytest.approx(backoffs[-1] / 5)
+
+    for _ in range(50):
+        throttle.observe_send(10.0)
+    assert throttle.backoff() == INTERIM_MAX_BACKOFF
+
+
+def test_backoff_recovers_when_socket_speeds_up():
+    throttle = InterimThrottle(lambda item: None, max_hz=5)
+    for _ in range(50):
+        throttle.observe_send(1.0)
+    assert throttle.backoff() == INTERIM_MAX_BACKOFF
+
+    for _ in range(50):
+        throttle.observe_send(0.001)
+    assert throttle.backoff() == 1.0
+    assert throttle.get_stats()['effective_hz'] == 5.0
+
+
+def test_burst_forwards_first_and_latest_interim():
+    async def scenario():
+        emitted = []
+        throttle = InterimThrottle(emitted.append, max_hz=20)       # 간격 50ms
+        for index in range(5):
+            throttle.submit(interim(1, "가" * (index + 1)))
+        immediately = list(emitted)
+        await asyncio.sleep(0.1)
+        return immediately, emitted, throttle.get_stats()
+
+    immediately, emitted, stats = asyncio.run(scenario())
+
+    assert [item['text'] for item in immediately] == ["가"]
+    assert [item['text'] for item in emitted] == ["가", "가가가가가"]      # 마지막 가설은 항상 전달
+    assert stats['received'] == 5 and stats['forwarded'] == 2 and stats['superseded'] == 3
+
+
+def test_slow_socket_widens_the_gap_between_interims():
+    async def scenario():
+        emitted_at = []
+        loop = asyncio.get_running_loop()
+        throttle = InterimThrottle(lambda item: emitted_at.append(loop.time()), max_hz=20)
+        for _ in range(50):
+            throttle.observe_send(0.2)              # 목표 50ms의 4배 -> 간격 200ms
+        throttle.submit(interim(1, "a"))
+        throttle.submit(interim(1, "ab"))
+        await asyncio.sleep(0.1)
+        early = len(emitted_at)
+        await asyncio.sleep(0.2)
+        return early, emitted_at
+
+    early, emitted_at = asyncio.run(scenario())
+
+    assert early == 1
+    assert len(emitted_at) == 2
+    assert emitted_at[1] - emitted_at[0] >= 0.19
+
+
+def test_final_discards_pending_interim_of_same_utterance_only():
+    async def scenario():
+        emitted = []
+        throttle = InterimThrottle(emitted.append, max_hz=20)
+        throttle.submit(interim(1, "a"))
+        throttle.submit(interim(1, "ab"))
+        throttle.finalize(2)                        # 다른 발화 -> 유지
+        assert throttle.pending is not None
+        throttle.finalize(1)
+        await asyncio.sleep(0.1)
+        return emitted, throttle
+
+    emitted, throttle = asyncio.run(scenario())
+
+    assert [item['text'] for item in emitted] == ["a"]
+    assert throttle.timer is None and throttle.finalized == 1
+
+
+def test_unlimited_and_disabled_modes():
+    async def scenario():
+        unlimited, disabled = [], []
+        free = InterimThrottle(unlimited.append, max_hz=0)
+        off = InterimThrottle(disabled.append, max_hz=5, enabled=False)
+        for index in range(3):
+            free.submit(interim(1, str(index)))
+            off.submit(interim(1, str(index)))
+        return unlimited, disabled, off.get_stats()
+
+    unlimited, disabled, off_stats = asyncio.run(scenario())
+
+    assert [item['text'] for item in unlimited] == ["0", "1", "2"]
+    assert disabled == [] and off_stats['disabled_dropped'] == 3
@@ -0,0 +1,24 @@
+# [tests/test_language_demand.py]
+# 번역 언어 수요 : 구독자가 있는 언어 중 방에 설정된 언어만 번역
+from src.app.core.language_demand import LanguageDemand
+
+
+def test_only_configured_languages_with_subscribers_are_translated():
+    demand = LanguageDemand()
+    demand.add(["en", "fr"])            # fr : 방에 설정되지 않은 언어
+    demand.add(["ja", "en"])
+    assert demand.active_languages(["en", "ja", "zh-CN"]) == ["en", "ja"]
+
+    demand.remove(["ja", "en"])
+    assert demand.active_languages(["en", "ja", "zh-CN"]) == ["en"]
+    demand.update(["en", "fr"], ["de"])
+    assert demand.active_languages(["en", "ja", "zh-CN"]) == []
+
+
+def test_record_segment_counts_saved_calls():
+    demand = LanguageDemand()
+    demand.add(["en"])
+    configured = ["en", "ja", "zh-CN"]
+    demand.record_segment(configured, demand.active_languages(configured))
+    assert demand.get_stats()['translation_calls'] == 1
+    assert demand.get_stats()['saved_calls'] == 2
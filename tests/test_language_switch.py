@@ -0,0 +1,167 @@
+# [tests/test_language_switch.py]
+# 입력 언어 무중단 전환 (LanguageSwitchMixin) : 로컬 재생 STT 기준
+import asyncio
+import time
+import pytest
+from src.app.interfaces.single_speech_translation_interface import SingleSpeechTranslationInterface
+from src.app.modules.stt import replay_stt
+from src.app.modules.stt.replay_stt import ReplaySTT, STT_BYTES_PER_SECOND
+
+CHUNK = b"\x00" * (STT_BYTES_PER_SECOND // 10)      # 100ms
+
+
+async def stream_until(stt: ReplaySTT, done, timeout: float = 3.0) -> int:
+    """20ms마다 100ms 오디오 입력 (전환 스레드가 끝날 때까지) -> 입력한 바이트 수"""
+    written = 0
+    deadline = time.perf_counter() + timeout
+    while not done():
+        assert time.perf_counter() < deadline, "언어 전환이 끝나지 않음"
+        stt.write_audio_chunk(CHUNK)
+        written += len(CHUNK)
+        await asyncio.sleep(0.02)
+    for _ in range(5):                                # 전환 후에도 계속 입력
+        stt.write_audio_chunk(CHUNK)
+        written += len(CHUNK)
+    return written
+
+
+def test_switch_keeps_audio_and_stops_old_recognizer():
+    async def run():
+        stt = ReplaySTT(latency_range=(0.0, 0.0), connect_delay=0.2, seed=1)
+        stt.setup_streaming_recognition("ko-KR")
+        stt.start_recognition()
+        old_recognizer, old_stopped = stt.speech_recognizer, stt.recognizer_stopped
+
+        stt.write_audio_chunk(CHUNK)
+        switched = stt.change_setup_recognition("en-US")     # 즉시 반환, 백그라운드에서 새 인식기 연결
+        written = len(CHUNK) + await stream_until(stt, lambda: stt.switches)
+        await asyncio.sleep(0.05)
+        return stt, old_recognizer, old_stopped, written, switched
+
+    stt, old_recognizer, old_stopped, written, switched = asyncio.run(run())
+    stats = stt.get_stats()['language_switch']
+
+    assert switched.done() and switched.exception() is None
+
+    assert stats['switches'] == 1 and stats['failures'] == 0
+    assert stt.audio_bytes == written                 # 전환 중 들어온 오디오 손실 x
+    assert stats['lost_seconds'] == 0
+    assert stats['buffered_seconds'] > 0              # 연결 중에는 버퍼에 보관했다가 새 인식기로 전달
+    assert stt.speech_recognizer is not old_recognizer
+    assert stt.input_languages == ["en-US"] and stt.speech_recognizer.listening
+    assert not old_recognizer.listening and old_stopped.is_set()       # 이전 인식기는 교체 후 중지
+    assert stats['retire_timeouts'] == 0
+
+
+def test_failed_start_keeps_old_recognizer(monkeypatch):
+    async def run():
+        stt = ReplaySTT(latency_range=(0.0, 0.0), connect_delay=0.1, seed=1)
+        stt.setup_streaming_recognition("ko-KR")
+        stt.start_recognition()
+        old_recognizer = stt.speech_recognizer
+
+        def fail(recognizer):
+            time.sleep(recognizer.connect_delay)
+            raise RuntimeError("connection refused")
+        monkeypatch.setattr(replay_stt._ReplayRecognizer, "start_continuous_recognition", fail)
+
+        switched = stt.change_setup_recognition("en-US")
+        written = await stream_until(stt, lambda: stt.switch_failures)
+        await asyncio.sleep(0.05)
+        return stt, old_recognizer, written, switched
+
+    stt, old_recognizer, written, switched = asyncio.run(run())
+    stats = stt.get_stats()['language_switch']
+
+    assert isinstance(switched.exception(), RuntimeError)
+
+    assert stats['failures'] == 1 and stats['switches'] == 0
+    assert stt.speech_recognizer is old_recognizer and old_recognizer.listening
+    assert stt.input_languages == ["ko-KR"]
+    assert stt.is_listening and stt.switch_buffer is None
+    assert stt.audio_bytes == written                 # 버퍼 오디오는 기존 인식기로 전달
+    assert stats['lost_seconds'] == 0
+
+
+def test_change_while_stopped_restarts_with_new_language():
+    async def run():
+        stt = ReplaySTT(latency_range=(0.0, 0.0), seed=1)
+        stt.setup_streaming_recognition("ko-KR")
+        stt.change_setup_recognition("ja-JP")        # 인식 중이 아님 -> 중지 / 설정 / 시작
+        return stt
+
+    stt = asyncio.run(run())
+    assert stt.is_listening and stt.input_languages == ["ja-JP"]
+    assert stt.get_stats()['language_switch']['switches'] == 0
+
+
+def test_new_recognizer_offsets_start_where_the_old_stream_ended():
+    async def run():
+        stt = ReplaySTT(latency_range=(0.0, 0.0), connect_delay=0.1, seed=1)
+        stt.setup_streaming_recognition("ko-KR")
+        stt.start_recognition()
+        bases = []
+        create = stt._create_recognizer
+        def recording_create(input_language):
+            bases.append(stt._stream_offset())      # 인식기 생성 시점 = 결과 offset에 더할 시작 위치
+            return create(input_language)
+        stt._create_recognizer = recording_create
+
+        for _ in range(3):
+            stt.write_audio_chunk(CHUNK)            # 이전 인식기 : 0.3초
+        stt.change_setup_recognition("en-US")
+        written = 3 * len(CHUNK) + await stream_until(stt, lambda: stt.switches)
+        return stt, bases, written
+
+    stt, bases, written = asyncio.run(run())
+
+    assert bases == [3_000_000]                     # 0.3초 = 3,000,000 x 100ns (전환 중 버퍼 오디오는 새 스트림 앞부분)
+    assert stt.written_bytes == written
+    assert stt._stream_offset() == written * 10_000_000 // STT_BYTES_PER_SECOND
+
+
+class UnusedTranslator:
+    """번역 호출 없는 시나리오용"""
+
+
+def start_interface(connect_delay: float) -> SingleSpeechTranslationInterface:
+    stt = ReplaySTT(latency_range=(0.0, 0.0), connect_delay=connect_delay, seed=1)
+    stt.setup_streaming_recognition("ko-KR")
+    stt.start_recognition()
+    interface = SingleSpeechTranslationInterface(stt=stt, translator=UnusedTranslator())
+    interface.current_input_language = "ko-KR"
+    return interface
+
+
+def test_interface_commits_input_language_only_after_switch():
+    async def run():
+        interface = start_interface(connect_delay=0.1)
+        change = asyncio.create_task(interface.change_input_language_settings("en-US"))
+        await asyncio.sleep(0.05)
+        during = interface.current_input_language         # 연결 중에는 기존 언어
+        await change
+        return interface, during
+
+    interface, during = asyncio.run(run())
+
+    assert during == "ko-KR"
+    assert interface.current_input_language == "en-US"
+    assert interface.stt.input_languages == ["en-US"]
+
+
+def test_interface_keeps_input_language_when_switch_fails(monkeypatch):
+    def fail(recognizer):
+        raise RuntimeError("connection refused")
+
+    async def run():
+        interface = start_interface(connect_delay=0.0)
+        monkeypatch.setattr(replay_stt._ReplayRecognizer, "start_continuous_recognition", fail)
+        with pytest.raises(RuntimeError):
+            await interface.change_input_language_settings("en-US")
+        return interface
+
+    interface = asyncio.run(run())
+
+    assert interface.current_input_language == "ko-KR"     # 상태 / get_status()는 실제 인식 언어 그대로
+    assert interface.stt.input_languages == ["ko-KR"]
+    assert interface.stt.is_listening
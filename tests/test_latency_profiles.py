@@ -0,0 +1,88 @@
+# [tests/test_latency_profiles.py]
+# 지연 프로파일 : 항목별 덮어쓰기 / 지원하지 않는 프로파일 · 항목 · 값 거부 / 설정 메시지 오류 응답
+import asyncio
+import pytest
+from src.app.core.latency_profiles import LATENCY_PROFILES, recognizer_settings, resolve_latency_profile
+from src.app.dto.speech_translation_dto import ConfigMessage
+from src.app.interfaces.single_speech_translation_interface import SingleSpeechTranslationInterface
+from src.app.services.speech_service import apply_latency_profile
+
+
+class UnusedTranslator:
+    """번역 호출 없는 시나리오용"""
+
+
+class RecordingWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send_json(self, data: dict):
+        self.sent.append(data)
+
+
+def test_overrides_apply_on_top_of_named_profile():
+    profile = resolve_latency_profile("accurate", {'segmentation_silence_ms': 900, 'interim_max_hz': 1.5})
+
+    assert profile['name'] == "accurate"
+    assert profile['overrides'] == {'segmentation_silence_ms': 900, 'interim_max_hz': 1.5}
+    assert profile['segmentation_silence_ms'] == 900
+    assert profile['reco_mode'] == LATENCY_PROFILES["accurate"]['reco_mode']
+    assert LATENCY_PROFILES["accurate"]['segmentation_silence_ms'] == 1200      # 원본 프로파일은 그대로
+    assert resolve_latency_profile()['name'] == "balanced"
+
+
+def test_only_recognizer_fields_change_recognizer_settings():
+    base = resolve_latency_profile("balanced")
+
+    assert recognizer_settings(resolve_latency_profile("balanced", {'interim_max_hz': 2})) == recognizer_settings(base)
+    assert recognizer_settings(resolve_latency_profile("balanced", {'end_silence_ms': 400})) != recognizer_settings(base)
+    assert resolve_latency_profile("balanced", {'initial_silence_ms': None})['initial_silence_ms'] is None
+
+
+@pytest.mark.parametrize("name, overrides", [
+    ("fastest", None),
+    ("balanced", {'speed': 1}),
+    ("balanced", {'reco_mode': "FAST"}),
+    ("balanced", {'interim_results': "yes"}),
+    ("balanced", {'segmentation_silence_ms': -1}),
+    ("balanced", {'segmentation_silence_ms': 500.5}),
+    ("balanced", {'end_silence_ms': True}),
+    ("balanced", {'end_silence_ms': None}),
+    ("balanced", {'interim_max_hz': -1}),
+    ("balanced", {'interim_max_hz': False}),
+])
+def test_invalid_profile_or_override_is_rejected(name, overrides):
+    with pytest.raises(ValueError):
+        resolve_latency_profile(name, overrides)
+
+
+def test_invalid_override_answers_error_and_keeps_session_profile():
+    async def scenario():
+        interface = SingleSpeechTranslationInterface(translator=UnusedTranslator())
+        before = interface.latency_profile
+        websocket = RecordingWebSocket()
+        config = ConfigMessage(input_language="ko-KR", target_languages=["en"], profile="low-latency",
+                               profile_overrides={'segmentation_silence_ms': "fast"})
+        applied = await apply_latency_profile(websocket, interface, config)
+        return applied, websocket.sent, before, interface.latency_profile
+
+    applied, sent, before, after = asyncio.run(scenario())
+
+    assert applied is False
+    assert sent[0]['status'] == "error" and sent[0]['error_code'] == "UNSUPPORTED_LATENCY_PROFILE"
+    assert after is before
+
+
+def test_valid_profile_configures_interim_throttle():
+    async def scenario():
+        interface = SingleSpeechTranslationInterface(translator=UnusedTranslator())
+        config = ConfigMessage(input_language="ko-KR", target_languages=["en"], profile="low-latency",
+                               profile_overrides={'interim_max_hz': 4})
+        applied = await apply_latency_profile(RecordingWebSocket(), interface, config)
+        return applied, interface
+
+    applied, interface = asyncio.run(scenario())
+
+    assert applied is True
+    assert interface.latency_profile['name'] == "low-latency"
+    assert interface.interim_throttle.max_hz == 4
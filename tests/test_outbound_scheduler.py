@@ -0,0 +1,88 @@
+# [tests/test_outbound_scheduler.py]
+# 소켓 전송 스케줄러 : 최종 결과 우선 전송 / batch 프레임 묶음 / 전송 생략 항목
+import asyncio
+import json
+from src.app.core.outbound_scheduler import OutboundScheduler
+from src.app.core.result_queue import BoundedResultQueue
+
+
+class RecordingWebSocket:
+    """전송된 텍스트 프레임 기록 (expected개가 모이면 done 설정)"""
+    def __init__(self, expected: int):
+        self.frames = []
+        self.expected = expected
+        self.done = asyncio.Event()
+
+    async def send_text(self, text: str):
+        self.frames.append(json.loads(text))
+        if len(self.frames) >= self.expected:
+            self.done.set()
+
+
+def result(utterance_id: int, text: str, is_final: bool = False) -> dict:
+    return {'utterance_id': utterance_id, 'text': text, 'is_final': is_final}
+
+
+def encode_text(item: dict, serializer):
+    return serializer.encode({'text': item['text'], 'is_final': item['is_final']})
+
+
+async def run_until_sent(scheduler: OutboundScheduler, websocket: RecordingWebSocket):
+    task = asyncio.create_task(scheduler.run())
+    await asyncio.wait_for(websocket.done.wait(), 1)
+    task.cancel()
+
+
+def test_final_is_sent_before_earlier_interims():
+    async def scenario():
+        queue = BoundedResultQueue(maxsize=8)
+        queue.put_nowait(result(1, "1-interim"))
+        queue.put_nowait(result(2, "2-interim"))
+        queue.put_nowait(result(0, "0-final", is_final=True))       # 늦게 들어온 최종 결과
+        websocket = RecordingWebSocket(expected=3)
+        scheduler = OutboundScheduler(websocket, queue.get_batch, encode_text)
+        await run_until_sent(scheduler, websocket)
+        return websocket.frames, scheduler.get_stats()
+
+    frames, stats = asyncio.run(scenario())
+
+    assert [frame['text'] for frame in frames] == ["0-final", "1-interim", "2-interim"]
+    assert stats['frames_sent'] == 3 and stats['batch_frames'] == 0
+
+
+def test_backlog_is_sent_as_one_batch_frame_with_finals_first():
+    async def scenario():
+        queue = BoundedResultQueue(maxsize=8)
+        queue.put_nowait(result(1, "1-interim"))
+        queue.put_nowait(result(0, "0-final", is_final=True))
+        queue.put_nowait(result(2, "2-final", is_final=True))
+        websocket = RecordingWebSocket(expected=1)
+        send_times = []
+        scheduler = OutboundScheduler(websocket, queue.get_batch, encode_text, batch_enabled=True, on_send=send_times.append)
+        await run_until_sent(scheduler, websocket)
+        return websocket.frames, scheduler.get_stats(), send_times
+
+    frames, stats, send_times = asyncio.run(scenario())
+
+    assert len(frames) == 1 and frames[0]['type'] == "batch"
+    assert [item['text'] for item in frames[0]['items']] == ["0-final", "2-final", "1-interim"]
+    assert stats['frames_sent'] == 1 and stats['items_sent'] == 3 and stats['batch_frames'] == 1
+    assert len(send_times) == 1
+
+
+def test_single_remaining_item_is_not_wrapped_in_batch():
+    async def scenario():
+        queue = BoundedResultQueue(maxsize=8)
+        queue.put_nowait(result(0, "skip", is_final=True))
+        queue.put_nowait(result(1, "1-final", is_final=True))
+        websocket = RecordingWebSocket(expected=1)
+        encode = lambda item, serializer: None if item['text'] == "skip" else encode_text(item, serializer)
+        scheduler = OutboundScheduler(websocket, queue.get_batch, encode, batch_enabled=True)
+        await run_until_sent(scheduler, websocket)
+        return websocket.frames, scheduler.get_stats()
+
+    frames, stats = asyncio.run(scenario())
+
+    # 전송 생략(None) 항목을 빼고 남은 1건은 batch 프레임 없이 그대로
+    assert frames == [{'text': "1-final", 'is_final': True}]
+    assert stats['batch_frames'] == 0
@@ -0,0 +1,79 @@
+# [tests/test_pcm_converter.py]
+# 입력 PCM 변환 : 출력 길이 / 청크 경계와 무관한 출력 / 청크 간 위상 연속 / 다운믹스 / 형식 검증
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.app.modules.audio.pcm_converter import PcmConverter, STT_SAMPLE_RATE, create_pcm_converter
+
+
+def sine(frequency: float, sample_rate: int, seconds: float, channels: int = 1, sample_format: str = "f32") -> bytes:
+    t = np.arange(int(sample_rate * seconds)) / sample_rate
+    samples = np.repeat(0.5 * np.sin(2 * np.pi * frequency * t)[:, None], channels, axis=1)
+    if sample_format == "s16":
+        return (samples * 32767).astype("<i2").tobytes()
+    return samples.astype("<f4").tobytes()
+
+
+def convert_in_chunks(converter: PcmConverter, data: bytes, chunk_bytes: int) -> bytes:
+    return b"".join(converter.convert(data[offset:offset + chunk_bytes]) for offset in range(0, len(data), chunk_bytes))
+
+
+def as_float(pcm: bytes):
+    return np.frombuffer(pcm, dtype="<i2").astype(np.float64) / 32767
+
+
+@pytest.mark.parametrize("sample_rate", [44100, 48000, 22050, 8000])
+def test_output_length_matches_sample_rate_ratio(sample_rate):
+    converter = PcmConverter(sample_rate, 2, "f32")
+
+    output = convert_in_chunks(converter, sine(440, sample_rate, 2.0, channels=2), 4096)
+
+    assert len(output) // 2 == 2 * STT_SAMPLE_RATE
+    assert converter.get_stats()['output_seconds'] == 2.0
+
+
+def test_output_does_not_depend_on_chunk_boundaries():
+    data = sine(700, 44100, 1.0, channels=2, sample_format="s16")
+
+    whole = PcmConverter(44100, 2, "s16").convert(data)
+    # 프레임(4바이트) 중간에서 잘리는 청크 크기 포함
+    for chunk_bytes in (1234, 4097, 17):
+        chunked = convert_in_chunks(PcmConverter(44100, 2, "s16"), data, chunk_bytes)
+        assert len(chunked) == len(whole)
+        assert np.max(np.abs(as_float(chunked) - as_float(whole))) <= 1 / 32767
+
+
+def test_phase_is_continuous_across_chunks():
+    frequency = 1000
+    converter = PcmConverter(48000, 1, "f32")
+
+    # 1001 샘플 청크 : 다운샘플 간격(3)으로 나누어떨어지지 않음 -> 청크마다 출력 위상이 달라짐
+    output = as_float(convert_in_chunks(converter, sine(frequency, 48000, 1.0), 1001 * 4))
+
+    # 필터가 채워진 뒤 구간을 단일 정현파(진폭 / 위상 자유)로 맞춤 -> 청크 경계에서 위상이 어긋나면 잔차가 커짐
+    steady = output[STT_SAMPLE_RATE // 10:]
+    t = np.arange(STT_SAMPLE_RATE // 10, len(output)) / STT_SAMPLE_RATE
+    basis = np.column_stack((np.sin(2 * np.pi * frequency * t), np.cos(2 * np.pi * frequency * t)))
+    coefficients, *_ = np.linalg.lstsq(basis, steady, rcond=None)
+    residual = steady - basis @ coefficients
+
+    assert abs(np.hypot(*coefficients) - 0.5) < 0.01
+    assert np.sqrt(np.mean(residual ** 2)) < 0.002
+
+
+def test_downmix_averages_channels():
+    t = np.arange(1600) / STT_SAMPLE_RATE
+    left = 0.5 * np.sin(2 * np.pi * 300 * t)
+    opposite = np.column_stack((left, -left)).astype("<f4").tobytes()
+    same = np.column_stack((left, left)).astype("<f4").tobytes()
+
+    assert not np.any(as_float(PcmConverter(STT_SAMPLE_RATE, 2, "f32").convert(opposite)))
+    assert np.max(np.abs(as_float(PcmConverter(STT_SAMPLE_RATE, 2, "f32").convert(same)) - left)) <= 1 / 32767
+
+
+def test_native_format_needs_no_converter_and_invalid_formats_are_rejected():
+    assert create_pcm_converter(16000, 1, "s16") is None
+    for sample_rate, channels, sample_format in ((48000, 1, "u8"), (48000, 0, "s16"), (48000, 9, "s16"), (4000, 1, "s16")):
+        with pytest.raises(ValueError):
+            PcmConverter(sample_rate, channels, sample_format)
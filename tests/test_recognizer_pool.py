@@ -0,0 +1,92 @@
+# [tests/test_recognizer_pool.py]
+# 인식기 풀 : 끊긴(또는 나이 상한을 넘은) 인식기만 교체 / 종료 시 정리 (로컬 재생 STT 백엔드)
+import asyncio
+import pytest
+from src.app.modules.stt.recognizer_pool import RecognizerPool
+
+
+@pytest.fixture(autouse=True)
+def replay_backend(monkeypatch):
+    monkeypatch.setenv("STT_BACKEND", "replay")
+
+
+async def wait_for(condition, timeout: float = 2.0):
+    for _ in range(int(timeout / 0.01)):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("조건을 만족하지 않음")
+
+
+def pooled(pool: RecognizerPool) -> list:
+    return [stt for entries in pool.entries.values() for stt, _ in entries]
+
+
+def test_only_disconnected_recognizers_are_refreshed():
+    async def run():
+        pool = RecognizerPool(size=2, check_seconds=0.05, prestart=True)
+        pool.start(["ko-KR"])
+        await wait_for(lambda: len(pooled(pool)) == 2)
+        healthy, dropped = pooled(pool)
+
+        await asyncio.sleep(0.2)                         # 상태 확인 여러 번 -> 연결된 인식기는 그대로
+        assert pooled(pool) == [healthy, dropped]
+        assert pool.built == 2
+
+        dropped.is_listening = False                    # 서버 쪽에서 연결 종료
+        await wait_for(lambda: pool.stale_refreshed == 1 and len(pooled(pool)) == 2)
+        assert healthy in pooled(pool) and dropped not in pooled(pool)
+        assert pool.built == 3
+
+        await pool.close()
+        assert pooled(pool) == [] and not healthy.is_active()
+        return pool
+
+    pool = asyncio.run(run())
+    assert pool.maintenance_task is None
+
+
+def test_max_age_refreshes_old_recognizers():
+    async def run():
+        pool = RecognizerPool(size=1, check_seconds=0.05, max_age_seconds=0.15, prestart=False)
+        pool.start(["ko-KR"])
+        await wait_for(lambda: len(pooled(pool)) == 1)
+        first = pooled(pool)[0]
+        await wait_for(lambda: pool.stale_refreshed >= 1 and pooled(pool) and pooled(pool)[0] is not first)
+        await pool.close()
+
+    asyncio.run(run())
+
+
+def test_acquire_skips_disconnected_recognizer():
+    async def run():
+        pool = RecognizerPool(size=1, check_seconds=60, prestart=True)
+        pool.start(["ko-KR"])
+        await wait_for(lambda: len(pooled(pool)) == 1)
+        stale = pooled(pool)[0]
+        stale.is_listening = False
+
+        stt = await pool.acquire("single", "ko-KR")
+        assert stt is not stale and stt.is_active()
+        assert pool.stale_discarded == 1 and pool.misses == 1
+        await pool.close()
+
+    asyncio.run(run())
+
+
+def test_acquire_returns_started_recognizer_from_prestarted_pool():
+    async def run():
+        pool = RecognizerPool(size=1, check_seconds=60, prestart=True)
+        pool.start(["ko-KR"])
+        await wait_for(lambda: len(pooled(pool)) == 1)
+        prestarted = pooled(pool)[0]
+        assert prestarted.is_active()                   # 보관 중에 이미 인식 시작
+
+        stt = await pool.acquire("single", "ko-KR")
+        assert stt is prestarted and stt.is_active()
+        assert pool.hits == 1 and pool.misses == 0 and pool.built == 1
+        await pool.close()
+        return pool
+
+    pool = asyncio.run(run())
+    assert pool.get_stats()['prestart'] is True
@@ -0,0 +1,170 @@
+# [tests/test_reorder_buffer.py]
+# 최종 결과 순서 보장 : segment_seq 순서 전달 / 최대 대기 후 건너뛰기 / 건너뛴 번호의 늦은 결과
+import asyncio
+import pytest
+from src.app.core.reorder_buffer import ReorderBuffer
+
+
+class FakeLoop:
+    """시각을 직접 진행하는 이벤트 루프 대역 (time / call_later만 제공)"""
+    def __init__(self):
+        self.now = 0.0
+        self.timers = []
+
+    def time(self) -> float:
+        return self.now
+
+    def call_later(self, delay: float, callback):
+        timer = FakeTimer(self.now + delay, callback)
+        self.timers.append(timer)
+        return timer
+
+    def advance(self, seconds: float):
+        self.now += seconds
+        while True:
+            due = [timer for timer in self.timers if not timer.cancelled and timer.when <= self.now]
+            if not due:
+                break
+            timer = min(due, key=lambda timer: timer.when)
+            self.timers.remove(timer)
+            timer.callback()
+
+
+class FakeTimer:
+    def __init__(self, when: float, callback):
+        self.when = when
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+@pytest.fixture
+def loop():
+    return FakeLoop()
+
+
+@pytest.fixture
+def released():
+    return []
+
+
+@pytest.fixture
+def buffer(loop, released):
+    return ReorderBuffer(released.append, max_wait_ms=1500, loop=loop)
+
+
+def issue(buffer: ReorderBuffer, count: int) -> list[int]:
+    return [buffer.next_seq() for _ in range(count)]
+
+
+def seqs(released: list) -> list[int]:
+    return [item['segment_seq'] for item in released]
+
+
+def test_releases_in_segment_order(buffer, released):
+    issue(buffer, 4)
+    buffer.complete(2, {'text': "c"})
+    buffer.complete(1, {'text': "b"})
+    assert released == []
+    buffer.complete(0, {'text': "a"})
+    assert [item['text'] for item in released] == ["a", "b", "c"]
+    buffer.complete(3, {'text': "d"})
+    assert seqs(released) == [0, 1, 2, 3]
+
+    stats = buffer.get_stats()
+    assert stats['released'] == 4
+    assert stats['reordered'] == 2          # 1, 2는 0을 기다렸다가 전달
+    assert stats['skipped'] == 0
+    assert stats['waiting'] == 0
+
+
+def test_empty_result_advances_order_without_release(buffer, released):
+    issue(buffer, 3)
+    buffer.complete(1, {'text': "b"})
+    buffer.complete(0, None)                # 번역 실패 / 결과 없음
+    buffer.complete(2, {'text': "c"})
+    assert seqs(released) == [1, 2]
+
+
+def test_skips_unfinished_segment_after_max_wait(buffer, loop, released):
+    issue(buffer, 3)
+    buffer.complete(1, {'text': "b"})
+    buffer.complete(2, {'text': "c"})
+
+    loop.advance(1.49)
+    assert released == []
+    loop.advance(0.01)
+    assert seqs(released) == [1, 2]
+    assert buffer.get_stats()['skipped'] == 1
+    assert buffer.get_stats()['hold_time']['max_ms'] == pytest.approx(1500)
+
+
+def test_max_wait_counts_from_oldest_waiting_result(buffer, loop, released):
+    issue(buffer, 3)
+    buffer.complete(1, {'text': "b"})
+    loop.advance(1.0)
+    buffer.complete(2, {'text': "c"})
+    loop.advance(0.5)                       # 1번 결과 기준 1.5초
+    assert seqs(released) == [1, 2]
+
+
+def test_late_segment_is_delivered_after_skip(buffer, loop, released):
+    issue(buffer, 4)
+    buffer.complete(1, {'text': "b"})
+    loop.advance(1.5)
+    assert seqs(released) == [1]
+
+    buffer.complete(0, {'text': "a"})       # 건너뛴 뒤 늦게 완료 -> 버리지 않고 바로 전달
+    assert seqs(released) == [1, 0]
+    buffer.complete(0, {'text': "a"})       # 같은 번호 중복 완료 -> 무시
+    assert seqs(released) == [1, 0]
+
+    buffer.complete(2, {'text': "c"})       # 이후 번호는 다시 순서대로
+    buffer.complete(3, {'text': "d"})
+    assert seqs(released) == [1, 0, 2, 3]
+    stats = buffer.get_stats()
+    assert stats['late'] == 1
+    assert stats['skipped'] == 1
+
+
+def test_late_empty_result_is_not_delivered(buffer, loop, released):
+    issue(buffer, 2)
+    buffer.complete(1, {'text': "b"})
+    loop.advance(1.5)
+    buffer.complete(0, None)
+    assert seqs(released) == [1]
+    assert buffer.get_stats()['late'] == 0
+
+
+def test_no_timer_while_nothing_is_waiting(buffer, loop, released):
+    issue(buffer, 2)
+    buffer.complete(0, {'text': "a"})
+    buffer.complete(1, {'text': "b"})
+    assert not [timer for timer in loop.timers if not timer.cancelled]
+    loop.advance(10)
+    assert seqs(released) == [0, 1]
+    assert buffer.get_stats()['skipped'] == 0
+
+
+def test_close_cancels_pending_wait(buffer, loop, released):
+    issue(buffer, 2)
+    buffer.complete(1, {'text': "b"})
+    buffer.close()
+    loop.advance(5)
+    assert released == []
+    assert buffer.get_stats()['waiting'] == 0
+
+
+def test_uses_running_event_loop_by_default():
+
+    async def run():
+        released = []
+        buffer = ReorderBuffer(released.append, max_wait_ms=20)
+        issue(buffer, 2)
+        buffer.complete(1, {'text': "b"})
+        await asyncio.sleep(0.05)
+        return released
+
+    assert seqs(asyncio.run(run())) == [1]
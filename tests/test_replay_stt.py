@@ -0,0 +1,34 @@
+# [tests/test_replay_stt.py]
+# 로컬 재생 STT : 오디오를 실시간보다 빨리 넣어도 인식 결과 순서(recognizing -> recognized) 유지
+import asyncio
+from src.app.modules.stt.replay_stt import ReplaySTT, STT_BYTES_PER_SECOND
+
+CHUNK = b"\x00" * (STT_BYTES_PER_SECOND // 10)      # 100ms
+
+
+def test_results_keep_order_when_audio_is_faster_than_realtime():
+    async def run():
+        stt = ReplaySTT(latency_range=(0.0, 0.2), seed=3)
+        stt.setup_streaming_recognition("ko-KR")
+        delivered = []
+        put = stt.result_bridge.put
+        stt.result_bridge.put = lambda item: (delivered.append(item), put(item))
+        stt.start_recognition()
+
+        for _ in range(int(stt.duration * 10) * 2):      # 스크립트 2회분을 한 번에 입력
+            stt.write_audio_chunk(CHUNK)
+        await asyncio.sleep(0.3)
+        return stt, delivered
+
+    stt, delivered = asyncio.run(run())
+    assert len(delivered) == stt.emitted > 0
+
+    finished = set()
+    final_order = []
+    for item in delivered:
+        assert item['utterance_id'] not in finished, "recognized 뒤에 같은 발화의 결과 도착"
+        if item['is_final']:
+            finished.add(item['utterance_id'])
+            final_order.append(item['utterance_id'])
+    assert final_order == sorted(final_order)
+    assert len(final_order) == 2 * 4
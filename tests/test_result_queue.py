@@ -0,0 +1,76 @@
+# [tests/test_result_queue.py]
+# 세션 결과 큐 : 최종 결과는 삭제하지 않음 / 대기 중인 중간 결과는 발화당 최신 1개만 유지
+import asyncio
+import random
+from src.app.core.result_queue import BoundedResultQueue
+
+
+def result(utterance_id: int, text: str, is_final: bool = False) -> dict:
+    return {'utterance_id': utterance_id, 'text': text, 'is_final': is_final}
+
+
+def drain(queue: BoundedResultQueue) -> list[dict]:
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+def test_finals_survive_in_order_and_interims_are_superseded():
+    queue = BoundedResultQueue(maxsize=8)
+    rng = random.Random(7)
+    finals = []
+
+    # 발화 12개 : 발화마다 중간 결과 여러 개 -> 최종 결과, 다음 발화의 중간 결과와 섞어서 추가 (소비 없음 = 느린 클라이언트)
+    for utterance_id in range(12):
+        for word in range(rng.randint(3, 8)):
+            queue.put_nowait(result(utterance_id, f"{utterance_id}-{word}"))
+            queue.put_nowait(result(utterance_id + 1, f"{utterance_id + 1}-early-{word}"))
+        final = result(utterance_id, f"{utterance_id}-final", is_final=True)
+        finals.append(final)
+        queue.put_nowait(final)
+
+    items = drain(queue)
+    assert [item for item in items if item['is_final']] == finals       # 큐 크기를 넘어도 최종 결과는 모두 순서대로
+
+    interim_ids = [item['utterance_id'] for item in items if not item['is_final']]
+    assert len(interim_ids) == len(set(interim_ids))                    # 발화당 중간 결과 최대 1개
+    final_ids = {item['utterance_id'] for item in finals}
+    assert not final_ids & set(interim_ids)                              # 최종 결과가 나온 발화의 중간 결과는 제거
+
+    stats = queue.get_stats()
+    assert stats['overflow_finals'] > 0
+    assert stats['superseded'] > 0
+
+
+def test_newer_interim_replaces_queued_interim_in_place():
+    queue = BoundedResultQueue(maxsize=8)
+    queue.put_nowait(result(1, "a"))
+    queue.put_nowait(result(2, "x"))
+    queue.put_nowait(result(1, "a b"))
+    assert [item['text'] for item in drain(queue)] == ["a b", "x"]
+
+
+def test_full_queue_drops_oldest_interim_not_finals():
+    queue = BoundedResultQueue(maxsize=3)
+    queue.put_nowait(result(1, "1-final", is_final=True))
+    queue.put_nowait(result(2, "2-interim"))
+    queue.put_nowait(result(3, "3-interim"))
+    queue.put_nowait(result(4, "4-final", is_final=True))               # 가득 참 -> 가장 오래된 중간 결과(2) 삭제
+    queue.put_nowait(result(5, "5-final", is_final=True))               # 가득 참 -> 중간 결과(3) 삭제
+    queue.put_nowait(result(6, "6-interim"))                            # 최종 결과로만 가득 참 -> 새 중간 결과를 버림
+    assert [item['text'] for item in drain(queue)] == ["1-final", "4-final", "5-final"]
+    assert queue.get_stats()['dropped'] == 3
+
+
+def test_get_batch_returns_finals_first():
+    async def run():
+        queue = BoundedResultQueue(maxsize=8)
+        queue.put_nowait(result(1, "1-interim"))
+        queue.put_nowait(result(0, "0-final", is_final=True))
+        queue.put_nowait(result(2, "2-interim"))
+        return await queue.get_batch(2), drain(queue)
+
+    batch, rest = asyncio.run(run())
+    assert [item['text'] for item in batch] == ["0-final", "1-interim"]
+    assert [item['text'] for item in rest] == ["2-interim"]
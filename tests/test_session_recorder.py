@@ -0,0 +1,113 @@
+# [tests/test_session_recorder.py]
+# 세션 녹음 : 쓰기 / 읽기 왕복 / 비정상 종료로 잘린 인덱스 / 파일 열기 실패
+import os
+import threading
+from src.app.modules.audio.session_recorder import INDEX_SUFFIX, RecordingWriter, SessionRecorder, read_recording
+
+
+def flush(writer: RecordingWriter):
+    """쓰기 스레드가 앞서 예약된 작업을 모두 처리할 때까지 대기"""
+    done = threading.Event()
+    writer.submit(done.set)
+    assert done.wait(2)
+
+
+def pcm_metadata(session_id: str = "session-a") -> dict:
+    return {'session_id': session_id, 'part': 0, 'mode': "single", 'input_language': "ko-KR",
+            'codec': "pcm", 'sample_rate': 16000, 'channels': 1, 'sample_format': "s16"}
+
+
+def test_pcm_recording_round_trip(tmp_path):
+    writer = RecordingWriter()
+    recorder = SessionRecorder(pcm_metadata(), directory=str(tmp_path), writer=writer)
+    chunks = [bytes([index]) * (320 * (index + 1)) for index in range(3)]
+    for chunk in chunks:
+        recorder.write(chunk)
+    recorder.close()
+    flush(writer)
+
+    metadata, recorded = read_recording(recorder.index_path)
+
+    assert metadata['audio_file'] == "session-a_00.wav"
+    assert metadata['header_bytes'] == 44
+    assert [chunk for _, chunk in recorded] == chunks
+    arrivals = [arrival for arrival, _ in recorded]
+    assert arrivals == sorted(arrivals)
+    # 종료 시 WAV 헤더에 데이터 크기 기록
+    with open(os.path.join(tmp_path, "session-a_00.wav"), "rb") as f:
+        header = f.read(44)
+    assert int.from_bytes(header[40:44], "little") == sum(len(chunk) for chunk in chunks)
+    assert recorder.get_stats()['bytes'] == sum(len(chunk) for chunk in chunks)
+
+
+def test_compressed_recording_keeps_container_extension(tmp_path):
+    writer = RecordingWriter()
+    recorder = SessionRecorder({**pcm_metadata(), 'codec': "opus"}, directory=str(tmp_path), writer=writer)
+    recorder.write(b"OggS" + b"\x00" * 60)
+    recorder.write(b"OggS" + b"\x01" * 30)
+    recorder.close()
+    flush(writer)
+
+    metadata, recorded = read_recording(recorder.index_path)
+
+    assert metadata['audio_file'] == "session-a_00.ogg"
+    assert metadata['header_bytes'] == 0
+    assert [len(chunk) for _, chunk in recorded] == [64, 34]
+
+
+def test_truncated_index_reads_chunks_written_before_crash(tmp_path):
+    writer = RecordingWriter()
+    recorder = SessionRecorder(pcm_metadata(), directory=str(tmp_path), writer=writer)
+    for index in range(3):
+        recorder.write(bytes([index + 1]) * 100)
+    flush(writer)           # 종료 정보 없이 프로세스가 죽은 상황 -> 파일 버퍼를 그대로 디스크에 반영
+    recorder.audio_file.flush()
+    recorder.index_file.flush()
+
+    # 마지막 인덱스 줄이 중간에서 잘리고 오디오 데이터도 마지막 청크 일부만 기록됨
+    with open(recorder.index_path, encoding="utf-8") as f:
+        lines = f.readlines()
+    with open(recorder.index_path, "w", encoding="utf-8") as f:
+        f.writelines(lines[:-1])
+        f.write(lines[-1][:10])
+    with open(os.path.join(tmp_path, "session-a_00.wav"), "r+b") as f:
+        f.truncate(44 + 250)
+
+    metadata, recorded = read_recording(recorder.index_path)
+
+    assert metadata['session_id'] == "session-a"
+    assert [chunk for _, chunk in recorded] == [b"\x01" * 100, b"\x02" * 100]
+    recorder.audio_file.close()
+    recorder.index_file.close()
+
+
+def test_index_pointing_past_audio_end_stops_at_last_complete_chunk(tmp_path):
+    writer = RecordingWriter()
+    recorder = SessionRecorder(pcm_metadata(), directory=str(tmp_path), writer=writer)
+    for index in range(3):
+        recorder.write(bytes([index + 1]) * 100)
+    recorder.close()
+    flush(writer)
+    with open(os.path.join(tmp_path, "session-a_00.wav"), "r+b") as f:
+        f.truncate(44 + 250)
+
+    _, recorded = read_recording(recorder.index_path)
+
+    assert [len(chunk) for _, chunk in recorded] == [100, 100]
+
+
+def test_open_failure_skips_writes_and_is_reported(tmp_path):
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")          # 녹음 폴더 자리에 파일 -> 폴더 생성 실패
+    writer = RecordingWriter()
+    recorder = SessionRecorder(pcm_metadata(), directory=str(blocker / "recordings"), writer=writer)
+    recorder.write(b"\x00" * 320)
+    recorder.write(b"\x00" * 320)
+    recorder.close()
+    flush(writer)
+
+    stats = recorder.get_stats()
+    assert stats['open_error']
+    assert recorder.audio_file is None and recorder.index_file is None
+    assert writer.errors == 1           # 열기 실패만 오류 (이후 청크 / 종료는 건너뜀)
+    assert not os.path.exists(recorder.base_path + INDEX_SUFFIX)
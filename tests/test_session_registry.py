@@ -0,0 +1,106 @@
+# [tests/test_session_registry.py]
+# 재연결 세션 : 링 버퍼에서 재전송한 최종 결과는 전송 지연 지표(final_latency)에서 제외 / 대체된 소켓은 세션을 닫지 못함
+import asyncio
+import time
+from src.app.core.outbound_scheduler import OutboundScheduler
+from src.app.interfaces.session_registry import ResumableSession, SessionRegistry
+
+
+class IdleInterface:
+    """결과를 내지 않는 번역 세션 대역 (attach / detach만 확인)"""
+    session_id = "session-test"
+
+    def __init__(self):
+        self.stopped = False
+
+    async def get_translation_results(self, limit: int):
+        await asyncio.Event().wait()
+        return []
+
+    def stop_session(self):
+        self.stopped = True
+
+
+def drain(queue) -> list[dict]:
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+def test_replayed_finals_are_copied_without_original_queue_time():
+    session = ResumableSession(IdleInterface(), "lecture")
+    disconnected_at = time.perf_counter() - 20      # 20초 전에 큐에 들어간 뒤 소켓이 끊긴 결과
+    for seq in (1, 2, 3):
+        session.replay_buffer.append({'seq': seq, 'is_final': True, 'text': f"문장 {seq}", 'queued_at': disconnected_at})
+
+    _, queue, replayed = session.attach(last_seq=1)
+    items = drain(queue)
+
+    assert replayed == 2
+    assert [item['seq'] for item in items] == [2, 3]
+    assert all(item['replayed'] for item in items)
+    assert all(item['queued_at'] > disconnected_at for item in items)
+    # 링 버퍼의 원본은 그대로 (다음 재연결에서도 같은 결과)
+    assert all('replayed' not in item and item['queued_at'] == disconnected_at for item in session.replay_buffer)
+
+
+def test_scheduler_excludes_replayed_items_from_latency():
+    scheduler = OutboundScheduler(websocket=None, get_results=None, encode_item=None)
+    now = time.perf_counter()
+    items = [
+        {'seq': 1, 'is_final': True, 'queued_at': now - 20, 'replayed': True},
+        {'seq': 2, 'is_final': True, 'queued_at': now - 0.05},
+        {'seq': 3, 'is_final': False, 'queued_at': now - 0.02},
+    ]
+
+    scheduler._record(items, now, now)
+    stats = scheduler.get_stats()
+
+    assert stats['items_sent'] == 3
+    assert stats['replayed_sent'] == 1
+    assert stats['final_latency']['count'] == 1
+    assert stats['final_latency']['max_ms'] < 1000
+    assert stats['interim_latency']['count'] == 1
+
+
+def test_superseded_socket_closing_normally_keeps_resumed_session():
+    async def scenario():
+        registry = SessionRegistry()
+        interface = IdleInterface()
+        session = registry.create(interface, "single")
+
+        # 이전 소켓 연결 -> 네트워크 끊김(유예) -> 새 소켓 재연결
+        old_attachment, _, _ = session.attach()
+        registry.detach(session, old_attachment)
+        new_attachment, _, _ = session.attach(last_seq=0)
+
+        # 이전 소켓이 뒤늦게 정상 종료(1000) -> 무시
+        registry.close(session, old_attachment)
+        await asyncio.sleep(0)
+        assert not interface.stopped
+        assert not session.pump_task.done()
+        assert registry.resume(session.resume_token, "single") is session
+
+        # 현재 소켓의 정상 종료 -> 세션 종료
+        registry.close(session, new_attachment)
+        await asyncio.sleep(0)
+        assert interface.stopped
+        assert session.pump_task.cancelled()
+        assert registry.resume(session.resume_token, "single") is None
+
+    asyncio.run(scenario())
+
+
+def test_old_socket_closing_while_still_attached_closes_session():
+    async def scenario():
+        registry = SessionRegistry()
+        interface = IdleInterface()
+        session = registry.create(interface, "single")
+        attachment_id, _, _ = session.attach()
+
+        registry.close(session, attachment_id)
+        assert interface.stopped
+        assert registry.get_status()['sessions'] == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,55 @@
+# [tests/test_speech_service.py]
+# 음성 스트림 처리 : 디코딩할 수 없는 오디오 -> error 메시지 + 1003 종료 (재연결 대기 x)
+import asyncio
+import pytest
+
+pytest.importorskip("av")
+
+from src.app.interfaces.single_speech_translation_interface import SingleSpeechTranslationInterface
+from src.app.services.speech_service import UNSUPPORTED_DATA, process_audio_stream
+
+
+class UnusedTranslator:
+    """번역 호출 없는 시나리오용"""
+
+
+class ScriptedWebSocket:
+    """정해진 메시지를 순서대로 수신, 보낸 메시지 / 종료 코드 기록"""
+    def __init__(self, messages: list[dict]):
+        self.messages = list(messages)
+        self.sent = []
+        self.close_code = None
+
+    async def receive(self) -> dict:
+        if not self.messages:
+            return {'type': "websocket.disconnect", 'code': 1000}
+        return self.messages.pop(0)
+
+    async def send_json(self, data: dict):
+        self.sent.append(data)
+
+    async def close(self, code: int = 1000):
+        self.close_code = code
+
+
+def test_undecodable_audio_sends_error_and_closes_with_unsupported_data():
+    async def run():
+        interface = SingleSpeechTranslationInterface(translator=UnusedTranslator())
+        interface.set_input_codec("opus")
+        interface.is_active = True
+        websocket = ScriptedWebSocket([
+            {'type': "websocket.receive", 'bytes': b"RIFF\x00\x00\x00\x00WAVEfmt "},     # WAV를 opus로 전송
+            {'type': "websocket.receive", 'bytes': b"\x00" * 64},
+        ])
+        close_code = await process_audio_stream(websocket, interface, "single", None, None)
+        return close_code, websocket
+
+    close_code, websocket = asyncio.run(run())
+
+    assert close_code == UNSUPPORTED_DATA
+    assert websocket.close_code == UNSUPPORTED_DATA
+    assert len(websocket.sent) == 1
+    assert websocket.sent[0]['status'] == "error"
+    assert websocket.sent[0]['error_code'] == "UNSUPPORTED_AUDIO"
+    assert "Ogg 또는 WebM" in websocket.sent[0]['message']
+    assert len(websocket.messages) == 1          # 실패 후 나머지 청크는 읽지 않음
@@ -0,0 +1,37 @@
+# [tests/test_transcript_store.py]
+# 세션 원문 조회 : session_id + access_token이 모두 맞을 때만 반환
+from src.app.core.transcript_store import TranscriptStore
+
+
+def test_transcript_requires_matching_access_token():
+    store = TranscriptStore()
+    transcript = store.create("session-a")
+    transcript.append("안녕하세요", "ko-KR")
+    other = store.create("session-b")
+
+    assert store.get("session-a", transcript.access_token) is transcript
+    assert store.get("session-a", None) is None
+    assert store.get("session-a", "") is None
+    assert store.get("session-a", other.access_token) is None      # 다른 세션 토큰으로 조회 x
+    assert store.get("missing", transcript.access_token) is None
+    assert transcript.access_token != other.access_token
+
+
+def test_closed_transcript_stays_readable_with_token():
+    store = TranscriptStore()
+    transcript = store.create("session-a")
+    store.close("session-a")
+    assert store.get("session-a", transcript.access_token) is transcript
+
+
+def test_closed_transcript_is_evicted_after_retention(monkeypatch):
+    monkeypatch.setattr("src.app.core.transcript_store.TRANSCRIPT_RETENTION_SECONDS", 0)
+    store = TranscriptStore()
+    closed = store.create("session-a")
+    active = store.create("session-b")
+    store.close("session-a")
+    closed.closed_at -= 1
+
+    assert store.get("session-a", closed.access_token) is None
+    assert store.get("session-b", active.access_token) is active     # 진행 중인 세션은 유지
+    assert store.get_stats()['transcripts'] == 1
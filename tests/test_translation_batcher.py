@@ -0,0 +1,99 @@
+# [tests/test_translation_batcher.py]
+# 세션 간 번역 묶음 처리 : 세션 간 라운드 로빈 유지 / 결과 수 불일치 / 닫힌 이벤트 루프
+import asyncio
+import threading
+from src.app.modules.translation.translation_batcher import TranslationBatcher
+from src.app.modules.translation.translation_executor import FairTranslationExecutor
+
+
+class RecordingTranslator:
+    """묶음 호출 순서 기록"""
+    def __init__(self):
+        self.calls = []
+
+    def translate_batch(self, texts, target_language):
+        self.calls.append(list(texts))
+        return [{'target_lang': target_language, 'result_text': text} for text in texts]
+
+
+def blocked_executor() -> tuple[FairTranslationExecutor, threading.Event]:
+    """작업 스레드 1개를 gate가 열릴 때까지 붙잡아 둔 실행기 -> 대기열이 모두 쌓인 뒤 실행 순서 확인"""
+    executor = FairTranslationExecutor(1)
+    gate = threading.Event()
+    executor.submit("blocker", gate.wait, 5)
+    return executor, gate
+
+
+def test_two_sessions_alternate_when_batching_is_on():
+    async def scenario():
+        translator = RecordingTranslator()
+        executor, gate = blocked_executor()
+        batcher = TranslationBatcher(window_ms=1000, max_size=2, executor=executor)
+
+        # 세션 A가 문장 6개를 먼저 몰아서 보내고, 세션 B가 6개를 보냄 -> 묶음 크기 2로 바로 전송
+        futures = [batcher.submit("en", f"A{index}", translator.translate_batch, session_id="A") for index in range(6)]
+        futures += [batcher.submit("en", f"B{index}", translator.translate_batch, session_id="B") for index in range(6)]
+        gate.set()
+        results = await asyncio.gather(*futures)
+        return translator.calls, results
+
+    calls, results = asyncio.run(scenario())
+
+    assert [result['result_text'] for result in results] == [f"A{index}" for index in range(6)] + [f"B{index}" for index in range(6)]
+    # A 묶음 3개 뒤에 B 묶음 3개가 예약되어도 A / B 번갈아 실행 (B가 A 묶음 전체 뒤로 밀리지 않음)
+    assert [call[0][0] for call in calls] == ["A", "B", "A", "B", "A", "B"]
+
+
+def test_mixed_batch_is_scheduled_for_the_session_with_fewest_queued_batches():
+    async def scenario():
+        translator = RecordingTranslator()
+        executor, gate = blocked_executor()
+        batcher = TranslationBatcher(window_ms=1000, max_size=2, executor=executor)
+
+        # A 묶음 3개 예약 -> A 문장 1개 + B 문장 1개 묶음은 B 차례로 예약 (A 대기열 뒤에 붙지 않음)
+        futures = [batcher.submit("en", f"A{index}", translator.translate_batch, session_id="A") for index in range(7)]
+        futures.append(batcher.submit("en", "B0", translator.translate_batch, session_id="B"))
+        gate.set()
+        await asyncio.gather(*futures)
+        return translator.calls, batcher
+
+    calls, batcher = asyncio.run(scenario())
+
+    assert calls[1] == ["A6", "B0"]
+    assert batcher._outstanding == {}
+
+
+def test_batch_result_count_mismatch_resolves_every_request_as_failed():
+    async def scenario():
+        batcher = TranslationBatcher(window_ms=10, max_size=8, executor=FairTranslationExecutor(1))
+        short = lambda texts, target_language: [{'target_lang': target_language, 'result_text': texts[0]}]
+        futures = [batcher.submit("ja", f"문장 {index}", short, session_id="A") for index in range(3)]
+        return await asyncio.gather(*futures), batcher.get_stats()
+
+    results, stats = asyncio.run(scenario())
+
+    assert results == [None, None, None]
+    assert stats['errors'] == 1
+    assert stats['batches'] == 1
+    assert stats['flush_reasons']['window'] == 1
+
+
+def test_closed_loop_does_not_stop_delivery_to_other_requests():
+    batcher = TranslationBatcher(window_ms=10, max_size=8, executor=FairTranslationExecutor(1))
+    closed_loop = asyncio.new_event_loop()
+    closed_future = closed_loop.create_future()
+    closed_loop.close()
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        live_futures = [loop.create_future() for _ in range(2)]
+        items = [(0.0, closed_loop, closed_future, "끊긴 세션", "A")]
+        items += [(0.0, loop, future, f"문장 {index}", "B") for index, future in enumerate(live_futures)]
+        echo = lambda texts, target_language: [{'target_lang': target_language, 'result_text': text} for text in texts]
+        await asyncio.to_thread(batcher._run_batch, echo, "en", items)
+        return await asyncio.wait_for(asyncio.gather(*live_futures), 1)
+
+    results = asyncio.run(scenario())
+
+    assert [result['result_text'] for result in results] == ["문장 0", "문장 1"]
+    assert not closed_future.done()
@@ -0,0 +1,124 @@
+# [tests/test_translation_cache.py]
+# 번역 캐시 : 동일 요청 합치기 / TTL 만료 / 실패 결과 미저장 / LRU 제거 / 디스크 캐시 만료
+import asyncio
+import time
+import unicodedata
+from src.app.modules.translation.translation_cache import TranslationCache
+
+
+class SlowTranslator:
+    """호출 수 기록 + gate가 열릴 때까지 번역 지연 (동시에 진행 중인 요청 재현)"""
+    def __init__(self, result_text: str = "Hello"):
+        self.calls = 0
+        self.result_text = result_text
+        self.gate = asyncio.Event()
+
+    def request(self, target_language: str = "en"):
+        async def call():
+            self.calls += 1
+            await self.gate.wait()
+            return {'target_lang': target_language, 'result_text': self.result_text} if self.result_text else None
+        return call
+
+
+def test_concurrent_identical_requests_share_one_translation():
+    async def scenario():
+        cache = TranslationCache(max_entries=100, ttl=60, db_path="")
+        translator = SlowTranslator()
+        # 정규화 후 같은 문장 (공백 / 유니코드 조합형 차이)
+        texts = ["안녕하세요", "  안녕하세요 ", unicodedata.normalize("NFD", "안녕하세요")]
+        futures = [cache.translate(text, "ko-KR", "en", translator.request()) for text in texts]
+        futures.append(cache.translate("안녕하세요", "ko", "en", translator.request()))     # 'ko-KR'과 같은 원문 언어
+        await asyncio.sleep(0)
+        translator.gate.set()
+        results = await asyncio.gather(*futures)
+        hit = await cache.translate("안녕하세요", "ko-KR", "en", translator.request())
+        return translator.calls, results, hit, cache.get_stats()
+
+    calls, results, hit, stats = asyncio.run(scenario())
+
+    assert calls == 1
+    assert all(result == {'target_lang': "en", 'result_text': "Hello"} for result in results + [hit])
+    assert stats['misses'] == 1 and stats['coalesced'] == 3 and stats['hits'] == 1
+    assert stats['in_flight'] == 0
+
+
+def test_cancelled_waiter_does_not_cancel_shared_translation():
+    async def scenario():
+        cache = TranslationCache(max_entries=100, ttl=60, db_path="")
+        translator = SlowTranslator()
+        first = cache.translate("문장", "ko-KR", "en", translator.request())
+        second = cache.translate("문장", "ko-KR", "en", translator.request())
+        await asyncio.sleep(0)
+        first.cancel()                              # 한 세션이 먼저 종료
+        translator.gate.set()
+        return await second, translator.calls
+
+    result, calls = asyncio.run(scenario())
+
+    assert result['result_text'] == "Hello" and calls == 1
+
+
+def test_entry_expires_after_ttl():
+    async def scenario():
+        cache = TranslationCache(max_entries=100, ttl=0.05, db_path="")
+        translator = SlowTranslator()
+        translator.gate.set()
+        await cache.translate("문장", "ko-KR", "en", translator.request())
+        await cache.translate("문장", "ko-KR", "en", translator.request())     # 유효 시간 안 -> 캐시
+        await asyncio.sleep(0.1)
+        await cache.translate("문장", "ko-KR", "en", translator.request())     # 만료 -> 다시 번역
+        return translator.calls, cache.get_stats()
+
+    calls, stats = asyncio.run(scenario())
+
+    assert calls == 2
+    assert stats['hits'] == 1 and stats['expired'] == 1 and stats['misses'] == 2
+
+
+def test_failed_translation_is_not_cached_and_lru_evicts_oldest():
+    async def scenario():
+        cache = TranslationCache(max_entries=2, ttl=60, db_path="")
+        failing = SlowTranslator(result_text=None)
+        failing.gate.set()
+        assert await cache.translate("실패", "ko-KR", "en", failing.request()) is None
+        assert await cache.translate("실패", "ko-KR", "en", failing.request()) is None
+
+        translator = SlowTranslator()
+        translator.gate.set()
+        for text in ("하나", "둘"):
+            await cache.translate(text, "ko-KR", "en", translator.request())
+        await cache.translate("하나", "ko-KR", "en", translator.request())      # 최근 사용 -> 유지
+        await cache.translate("셋", "ko-KR", "en", translator.request())        # 가득 참 -> "둘" 제거
+        await cache.translate("하나", "ko-KR", "ja", translator.request("ja"))  # 번역 언어가 다르면 다른 항목
+        return failing.calls, cache
+
+    failing_calls, cache = asyncio.run(scenario())
+
+    assert failing_calls == 2
+    keys = [key[0] for key in cache._entries]
+    assert "둘" not in keys and "셋" in keys
+    assert cache.get_stats()['evictions'] == 2
+
+
+def test_disk_cache_survives_restart_until_ttl(tmp_path):
+    db_path = str(tmp_path / "cache" / "translations.db")
+
+    async def lookup(cache: TranslationCache, translator: SlowTranslator):
+        translator.gate.set()
+        return await cache.translate("문장", "ko-KR", "en", translator.request())
+
+    first = TranslationCache(max_entries=10, ttl=60, db_path=db_path)
+    first._disk_put(("문장", "ko", "en"), "Sentence")
+
+    restarted, translator = TranslationCache(max_entries=10, ttl=60, db_path=db_path), SlowTranslator()
+    assert asyncio.run(lookup(restarted, translator))['result_text'] == "Sentence"
+    assert translator.calls == 0 and restarted.get_stats()['disk_hits'] == 1
+
+    # 디스크 항목도 TTL 적용 (저장 시각이 오래된 항목은 무시)
+    with first._db_lock:
+        first._db.execute("UPDATE translations SET created_at = ?", (time.time() - 120,))
+        first._db.commit()
+    expired, translator = TranslationCache(max_entries=10, ttl=60, db_path=db_path), SlowTranslator()
+    assert asyncio.run(lookup(expired, translator))['result_text'] == "Hello"
+    assert translator.calls == 1
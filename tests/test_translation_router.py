@@ -0,0 +1,167 @@
+# [tests/test_translation_router.py]
+# 번역 경로 선택 / 제공자별 언어 코드 / failover / 헤징 : 로컬 stub 서버(benchmarks.translation_stub_server) 기준
+import asyncio
+import time
+import pytest
+
+pytest.importorskip("httpx")
+
+from benchmarks.translation_stub_server import StubConfig, start_stub_server
+from src.app.core.config import api_settings
+from src.app.modules.translation import translation_providers, translation_router
+from src.app.modules.translation.translation_batcher import TranslationBatcher
+from src.app.modules.translation.translation_executor import FairTranslationExecutor
+from src.app.modules.translation.translation_providers import DeepLProvider
+from src.app.modules.translation.translation_router import TranslationRouter, parse_routes
+
+
+@pytest.fixture
+def stubs(monkeypatch):
+    """Azure 형식 stub(주 제공자) + DeepL 형식 stub(보조 제공자) -> 제공자 엔드포인트 교체"""
+    configs = {'azure': StubConfig(latency_ms=5, jitter=0.0, seed=1), 'deepl': StubConfig(latency_ms=5, jitter=0.0, seed=2)}
+    servers = []
+    for name, config in configs.items():
+        server, url = start_stub_server(config)
+        servers.append(server)
+        monkeypatch.setattr(translation_providers, f"{name.upper()}_TRANSLATION_ENDPOINT", url)
+    monkeypatch.setattr(api_settings, "azure_translation_key", "stub")
+    monkeypatch.setattr(api_settings, "deepl_translation_key", "stub")
+    monkeypatch.setattr(translation_providers, "_providers", {})      # 다른 엔드포인트로 만든 제공자 재사용 x
+    yield configs
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def make_router(routes: str, hedge: bool = True, window_ms: int = 0) -> TranslationRouter:
+    executor = FairTranslationExecutor(4)
+    return TranslationRouter(routes, hedge, executor, TranslationBatcher(window_ms, executor=executor))
+
+
+def translate(router: TranslationRouter, text: str, source: str, target: str):
+    return asyncio.run(router.translate(text, source, target, session_id="session"))
+
+
+# [1] 경로 선택
+def test_route_lookup_order():
+    router = make_router("ko>en=deepl;*>en=azure;ko>*=google;*=azure,deepl")
+    assert router.providers_for("ko-KR", "en") == ("deepl",)             # (원문, 번역)
+    assert router.providers_for("ja-JP", "en") == ("azure",)             # (*, 번역)
+    assert router.providers_for("ko-KR", "ja") == ("google",)            # (원문, *)
+    assert router.providers_for("ja-JP", "ja") == ("azure", "deepl")     # (*, *)
+    assert parse_routes("ko>en=deepl")[("*", "*")] == ("google",)         # 기본 경로
+
+
+def test_route_rejects_unknown_provider():
+    with pytest.raises(ValueError):
+        parse_routes("*=papago")
+    with pytest.raises(ValueError):
+        parse_routes("ko>en=")
+
+
+def test_route_selects_provider_per_pair(stubs):
+    router = make_router("ko>en=deepl;*=azure")
+    assert translate(router, "안녕하세요", "ko-KR", "en")['result_text'] == "[EN-US] 안녕하세요"
+    assert translate(router, "こんにちは", "ja-JP", "en")['result_text'] == "[en] こんにちは"
+    assert stubs['deepl'].requests == 1
+    assert stubs['azure'].requests == 1
+
+
+# [2] 제공자별 언어 코드
+@pytest.mark.parametrize("target, azure_code, deepl_code", [
+    ("zh-CN", "zh-Hans", "ZH-HANS"),
+    ("zh-TW", "zh-Hant", "ZH-HANT"),
+    ("en", "en", "EN-US"),
+    ("pt", "pt", "PT-BR"),
+    ("pt-PT", "pt-PT", "PT-PT"),
+    ("ja", "ja", "JA"),
+])
+def test_language_code_mapping(stubs, target, azure_code, deepl_code):
+    assert translate(make_router("*=azure"), "문장", "ko-KR", target) == {'target_lang': target, 'result_text': f"[{azure_code}] 문장"}
+    assert translate(make_router("*=deepl"), "문장", "ko-KR", target) == {'target_lang': target, 'result_text': f"[{deepl_code}] 문장"}
+    assert DeepLProvider.language_code(target) == deepl_code
+
+
+# [3] failover
+def test_failover_when_primary_errors(stubs):
+    stubs['azure'].error_rate = 1.0
+    router = make_router("*=azure,deepl", hedge=False)
+    assert translate(router, "문장", "ko-KR", "zh-CN")['result_text'] == "[ZH-HANS] 문장"
+    stats = router.get_stats()
+    assert stats['failovers'] == 1
+    assert stats['failed'] == 0
+    assert stats['providers']['deepl']['wins'] == 1
+    assert translation_providers.get_provider("azure").errors == 1
+
+
+def test_all_providers_failing_returns_none(stubs):
+    stubs['azure'].error_rate = 1.0
+    stubs['deepl'].error_rate = 1.0
+    router = make_router("*=azure,deepl")
+    assert translate(router, "문장", "ko-KR", "en") is None
+    assert router.get_stats()['failed'] == 1
+
+
+# [4] 헤징
+def test_hedge_uses_secondary_and_cancels_slow_primary(stubs, monkeypatch):
+    stubs['azure'].tail_prob = 1.0
+    stubs['azure'].tail_ms = 1000
+    monkeypatch.setattr(translation_router, "TRANSLATION_HEDGE_DEFAULT_MS", 50)
+    router = make_router("*=azure,deepl")
+    submitted = []
+    submit = router._submit
+
+    def spy(*args):
+        future = submit(*args)
+        submitted.append((args[0], future))
+        return future
+    router._submit = spy
+
+    started = time.perf_counter()
+    result = translate(router, "문장", "ko-KR", "en")
+    elapsed = time.perf_counter() - started
+
+    assert result['result_text'] == "[EN-US] 문장"
+    assert elapsed < 0.5
+    stats = router.get_stats()
+    assert stats['hedged'] == 1
+    assert stats['hedge_wins'] == 1
+    assert [name for name, _ in submitted] == ["azure", "deepl"]
+    assert submitted[0][1].cancelled()                  # 늦은 주 제공자 요청은 취소
+    # 취소된 요청의 경과 시간은 최소 응답 시간으로 기록 (p95가 낮게 치우치지 않도록)
+    assert router.latency['azure'].count == 1
+    assert 0.05 <= router.latency['azure'].max < 0.5
+
+
+def test_no_hedge_before_primary_delay(stubs, monkeypatch):
+    monkeypatch.setattr(translation_router, "TRANSLATION_HEDGE_DEFAULT_MS", 500)
+    router = make_router("*=azure,deepl")
+    assert translate(router, "문장", "ko-KR", "en")['result_text'] == "[en] 문장"
+    assert router.get_stats()['hedged'] == 0
+    assert stubs['deepl'].requests == 0
+
+
+def test_hedge_disabled_waits_for_primary(stubs, monkeypatch):
+    stubs['azure'].tail_prob = 1.0
+    stubs['azure'].tail_ms = 200
+    monkeypatch.setattr(translation_router, "TRANSLATION_HEDGE_DEFAULT_MS", 50)
+    router = make_router("*=azure,deepl", hedge=False)
+    assert translate(router, "문장", "ko-KR", "en")['result_text'] == "[en] 문장"
+    assert router.get_stats()['hedged'] == 0
+    assert stubs['deepl'].requests == 0
+
+
+# [5] 묶음 처리 : 같은 제공자 / 번역 언어 요청은 API 1회 호출
+def test_batched_requests_share_one_call_per_provider(stubs):
+    router = make_router("*>en=deepl;*=azure", window_ms=20)
+
+    async def run():
+        texts = [f"문장 {index}" for index in range(10)]
+        return await asyncio.gather(*(router.translate(text, "ko-KR", target, session_id=index)
+                                      for index, text in enumerate(texts) for target in ("en", "zh-CN")))
+
+    results = asyncio.run(run())
+    assert len(results) == 20 and all(results)
+    assert {result['result_text'].split("]")[0] for result in results} == {"[EN-US", "[zh-Hans"}
+    assert stubs['deepl'].requests == 1
+    assert stubs['azure'].requests == 1
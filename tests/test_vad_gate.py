@@ -0,0 +1,74 @@
+# [tests/test_vad_gate.py]
+# 음성 구간 게이트 : hangover 동안 유지 후 닫힘 / 짧은 쉼은 같은 구간 / pre-roll / 짧은 잡음 무시 / keep-alive
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.app.modules.audio.vad_gate import VadGate, VAD_SAMPLE_RATE
+
+FRAME_BYTES = VAD_SAMPLE_RATE * 20 // 1000 * 2      # 20ms 프레임
+
+
+def tone(ms: int) -> bytes:
+    """-23 dBFS 정현파 (음성 대역)"""
+    t = np.arange(VAD_SAMPLE_RATE * ms // 1000) / VAD_SAMPLE_RATE
+    return (0.1 * np.sin(2 * np.pi * 440 * t) * 32767).astype("<i2").tobytes()
+
+
+def silence(ms: int) -> bytes:
+    return bytes(VAD_SAMPLE_RATE * ms // 1000 * 2)
+
+
+def feed(gate: VadGate, pcm: bytes, chunk_ms: int = 30) -> bytes:
+    """WebSocket 수신처럼 청크로 나눠 전달 (30ms : 프레임 경계와 어긋남)"""
+    chunk_bytes = VAD_SAMPLE_RATE * chunk_ms // 1000 * 2
+    return b"".join(gate.process(pcm[offset:offset + chunk_bytes]) for offset in range(0, len(pcm), chunk_bytes))
+
+
+def test_gate_stays_open_for_hangover_after_speech_then_closes():
+    gate = VadGate(hangover_ms=1000, preroll_ms=300, onset_ms=40, keepalive_interval_ms=0)
+
+    leading = feed(gate, silence(1000))
+    speech = feed(gate, tone(1000))
+    trailing_hangover = feed(gate, silence(1000))
+    after = feed(gate, silence(2000))
+
+    assert leading == b""
+    # 열릴 때 pre-roll(300ms) + onset 프레임 전달 -> 발화 시작이 잘리지 않음
+    assert len(speech) == 1000 // 20 * FRAME_BYTES + 300 // 20 * FRAME_BYTES
+    assert speech.endswith(tone(1000)[-FRAME_BYTES * 10:])
+    # 음성 종료 후 1초 동안 침묵 전달 (Azure가 문장을 확정할 수 있도록) -> 이후 닫힘
+    assert trailing_hangover == silence(1000)
+    assert after == b""
+    assert not gate.is_open
+    assert gate.get_stats()['speech_segments'] == 1
+
+
+def test_pause_shorter_than_hangover_keeps_one_segment():
+    gate = VadGate(hangover_ms=1000, keepalive_interval_ms=0)
+
+    output = feed(gate, silence(500) + tone(500) + silence(600) + tone(500) + silence(1500))
+
+    assert gate.get_stats()['speech_segments'] == 1
+    assert silence(600) + tone(500) in output          # 쉼 구간도 그대로 전달
+    assert not gate.is_open
+
+
+def test_short_click_below_onset_does_not_open_gate():
+    gate = VadGate(onset_ms=60, keepalive_interval_ms=0)
+
+    output = feed(gate, silence(500) + tone(40) + silence(500), chunk_ms=20)
+
+    assert output == b""
+    assert gate.get_stats()['speech_segments'] == 0
+
+
+def test_closed_gate_sends_keepalive_silence():
+    gate = VadGate(keepalive_interval_ms=1000, keepalive_ms=200)
+
+    output = feed(gate, silence(3000))
+
+    assert output == silence(200) * 3
+    stats = gate.get_stats()
+    assert stats['received_seconds'] == 3.0
+    assert stats['forwarded_seconds'] == 0.6